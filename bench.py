@@ -0,0 +1,65 @@
+#!/bin/python
+
+import sys
+import json
+import argparse
+
+import lang.sound
+import lang.compiler
+import lang.benchmark
+
+parser = argparse.ArgumentParser(description='Benchmark the compiler and the runtime on the example programs')
+parser.add_argument('-o', '--output', metavar='FILE', default=None,
+                    help='write the results as JSON to FILE')
+parser.add_argument('--baseline', metavar='FILE', default=None,
+                    help='compare with the results in FILE and fail on regressions')
+parser.add_argument('--threshold', type=float, default=0.25,
+                    help='fraction by which a metric may get worse than the baseline (default: %(default)s)')
+parser.add_argument('--output-dir', default='bench_output',
+                    help='directory for the compiled programs (default: %(default)s)')
+parser.add_argument('--steps', type=int, default=lang.benchmark.STEPS,
+                    help='opcodes each program runs (default: %(default)s)')
+parser.add_argument('--keys', default=lang.benchmark.KEYS,
+                    help='keys typed while the programs run (default: %(default)s)')
+parser.add_argument('--repeat', type=int, default=1,
+                    help='compile and run every program this many times, keeping the best (default: %(default)s)')
+parser.add_argument('--backend', choices=lang.compiler.BACKENDS, default=lang.compiler.BACKEND,
+                    help='backend of the compiler (default: %(default)s)')
+parser.add_argument('--format', choices=lang.compiler.OUTPUT_FORMATS, default=lang.compiler.OUTPUT_FORMAT,
+                    help='format of the compiled programs (default: %(default)s)')
+parser.add_argument('--bundle', action='store_true',
+                    help='compile to self-contained pages')
+args = parser.parse_args()
+
+# Sounds are kept as WAV: encoding them with lame would dominate the
+# compilation times, and needs lame.
+lang.sound.CONVERT_TO_MP3 = False
+lang.compiler.BACKEND = args.backend
+lang.compiler.OUTPUT_FORMAT = args.format
+lang.compiler.BUNDLE = args.bundle
+
+baseline = None
+if args.baseline is not None:
+    f = open(args.baseline, 'r')
+    baseline = json.load(f)
+    f.close()
+
+def report(name, program):
+    status = 'ok' if program['compile']['ok'] else 'FAILED'
+    sys.stderr.write('%-6s %s\n' % (status, name))
+
+results = lang.benchmark.benchmark(args.output_dir, args.steps, args.keys, args.repeat, report)
+results['settings'].update({'backend': args.backend, 'format': args.format, 'bundle': args.bundle})
+lang.benchmark.write_summary(results)
+
+if args.output is not None:
+    f = open(args.output, 'w')
+    json.dump(results, f, indent=2, sort_keys=True)
+    f.write('\n')
+    f.close()
+
+if baseline is not None:
+    regressions = lang.benchmark.compare(baseline, results, args.threshold)
+    lang.benchmark.write_regressions(regressions, args.threshold)
+    if regressions:
+        sys.exit(1)
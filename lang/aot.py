@@ -0,0 +1,423 @@
+import re
+
+from lang.ir import ControlFlowGraph, Label, DrawCommands, js_operand
+
+# Ahead-of-time backend: compiles the basic blocks of the linked program
+# (see lang.ir) to JavaScript functions, which the VM (runtime/vm.js) runs
+# instead of interpreting the opcodes one by one.
+#
+# The blocks are grouped in chunks, each a function with a switch (ip)
+# over the blocks it contains. Within a block, the values the opcodes
+# would push and pop are kept in JavaScript variables; the VM stack only
+# holds them across blocks and around the opcodes that use it directly
+# (GOSUB, RETURN, SUB calls, statements). A compiled block runs all its
+# opcodes or none, which lets the VM keep its slices exactly as long as
+# when interpreting: a block runs only if the remaining budget of the
+# slice covers it, and otherwise the VM interprets the opcodes of the
+# slice that are left. Statements that yield (SLEEP, INPUT, SYSTEM) return
+# to the VM with the IP and budget the interpreter would have.
+#
+# The opcode array is still emitted: it is used when the program is
+# resumed in the middle of a block (e.g. after INPUT) and at the end of
+# the slices.
+
+# Minimum number of opcodes per chunk.
+CHUNK_SIZE = 256
+
+# Operators computed inline when their arguments have the given types
+# ('number', or 'scalar' for a number or a string, both of the same type),
+# as runtime/builtins.js would compute them. Otherwise, and for the
+# values the primitive rejects (e.g. a zero divisor), the primitive is
+# called, so that errors and type coercions stay the same.
+INLINE_OPERATORS = {
+    ('+', 2): ('scalar', '%(x)s + %(y)s', None),
+    ('-', 2): ('number', '%(x)s - %(y)s', None),
+    ('-', 1): ('number', '-(%(x)s)', None),
+    ('*', 2): ('number', '%(x)s * %(y)s', None),
+    ('/', 2): ('number', '%(x)s / %(y)s', '%(y)s != 0'),
+    ('\\', 2): ('number', 'Math.floor(%(x)s / %(y)s)', '%(y)s != 0'),
+    ('MOD', 2): ('number', '%(x)s %% %(y)s', '%(y)s != 0'),
+    ('AND', 2): ('number', '%(x)s & %(y)s', None),
+    ('OR', 2): ('number', '%(x)s | %(y)s', None),
+    ('XOR', 2): ('number', '%(x)s ^ %(y)s', None),
+    ('EQV', 2): ('number', '%(x)s === %(y)s ? -1 : 0', None),
+    ('NOT', 1): ('number', '%(x)s == 0 ? -1 : 0', None),
+    ('=', 2): ('scalar', '%(x)s === %(y)s ? -1 : 0', None),
+    ('<>', 2): ('scalar', '%(x)s === %(y)s ? 0 : -1', None),
+    ('<', 2): ('scalar', '%(x)s < %(y)s ? -1 : 0', None),
+    ('>', 2): ('scalar', '%(x)s > %(y)s ? -1 : 0', None),
+    ('<=', 2): ('scalar', '%(x)s <= %(y)s ? -1 : 0', None),
+    ('>=', 2): ('scalar', '%(x)s >= %(y)s ? -1 : 0', None),
+}
+
+NUMBER_LITERAL = re.compile(r'^-?[0-9]+(\.[0-9]+)?(e[+-]?[0-9]+)?$')
+
+def literal_type(value):
+    """Type of a JavaScript literal, or None if value is not one."""
+    if value.startswith('"'):
+        return 'string'
+    elif NUMBER_LITERAL.match(value):
+        return 'number'
+    return None
+
+class BlockCompiler(object):
+
+    def __init__(self, code, labels, shared, mangle, constants, entry_points, comments):
+        self.code = code
+        self.labels = labels
+        self.shared = shared            # names of the SHARED variables
+        self.mangle = mangle
+        self.constants = constants      # list of hoisted JavaScript values
+        self.entry_points = entry_points  # list of (primitive, nargs) called
+        self.entry_point_numbers = {}
+        self.comments = comments
+        self.max_temps = 0
+
+    def operand(self, operand):
+        if isinstance(operand, Label):
+            # Pushed as a constant, e.g. for ON TIMER.
+            return self.address(operand)
+        if isinstance(operand, (DrawCommands, list)):
+            # Pushed (or passed) by reference, so it is created only once.
+            self.constants.append(js_operand(operand, self.mangle))
+            return 'K%u' % (len(self.constants) - 1,)
+        return js_operand(operand, self.mangle)
+
+    def get_ref(self, variable):
+        """Temporary holding the value of a variable, as get_ref() reads
+        it: a local (e.g. a SUB argument) hides a shared variable; unbound
+        variables read as 0."""
+        slot = self.operand(variable)
+        value = self.temp('state.locals[%s]' % (slot,))
+        self.emit('if (%s === undefined) %s = %s;' % (
+            value, value, 'state.shared[%s]' % (slot,) if variable.name in self.shared else '0'))
+        return value
+
+    def set_ref(self, variable, value):
+        # set_ref() with the name known.
+        self.emit('state.%s[%s] = %s;' % (
+            'shared' if variable.name in self.shared else 'locals', self.operand(variable), value))
+
+    def entry_point(self, primitive, nargs):
+        """Variable holding the entry point of the primitive for calls
+        with nargs arguments."""
+        key = (primitive.js(self.mangle), nargs)
+        if key not in self.entry_point_numbers:
+            self.entry_point_numbers[key] = len(self.entry_points)
+            self.entry_points.append(key)
+        return 'P%u' % (self.entry_point_numbers[key],)
+
+    def call(self, primitive, args):
+        return '%s(%s)' % (self.entry_point(primitive, len(args)), ', '.join(['state'] + args))
+
+    def address(self, label):
+        return '%u' % (self.labels[label.number],)
+
+    def temp(self, value):
+        name = 't%u' % (self.temps,)
+        self.temps += 1
+        self.max_temps = max(self.max_temps, self.temps)
+        self.emit('%s = %s;' % (name, value))
+        return name
+
+    def emit(self, line):
+        self.lines.append(line)
+
+    def push(self, value):
+        self.stack.append(value)
+
+    def pop(self):
+        if self.stack:
+            return self.stack.pop()
+        return self.temp('state.stack.pop()')
+
+    def pop_args(self, nargs):
+        args = [self.pop() for i in range(nargs)]
+        args.reverse()
+        return args
+
+    def flush(self):
+        if self.stack:
+            self.emit('state.stack.push(%s);' % (', '.join(self.stack),))
+            self.stack = []
+
+    def compile_block(self, block):
+        """Lines of the case of the switch that runs the block."""
+        self.lines = []
+        self.stack = []
+        self.temps = 0
+        self.emit('case %u:' % (block.start,))
+        self.emit('if (budget < %u) break;' % (len(block),))
+        self.emit('budget -= %u;' % (len(block),))
+        for position in range(block.start, block.end):
+            op = self.code[position]
+            if self.comments:
+                self.emit('/* :%u %s */' % (position, repr(op).replace('*/', '* /')))
+            getattr(self, 'compile_' + op.opcode)(position, block.end, *op.operands)
+        self.flush()
+        if self.code[block.end - 1].falls_through():
+            # To the next case, if it is in this chunk.
+            self.emit('ip = %u;' % (block.end,))
+        return self.lines
+
+    def set_ip(self, position):
+        # So that errors report the opcode that raised them.
+        self.emit('state.ip = %u;' % (position,))
+
+    def jump(self, address):
+        self.emit('ip = %s; continue;' % (address,))
+
+    def compile_PushConstant(self, position, end, constant):
+        self.push(self.operand(constant))
+
+    def compile_PushRetval(self, position, end, variable):
+        address = self.pop()
+        self.push(self.temp('state.locals[%s]' % (self.operand(variable),)))
+        self.push(address)
+
+    def compile_SetArrayRef(self, position, end, variable, nargs):
+        value = self.pop()
+        if nargs != 1:
+            # The indices are popped from the stack.
+            self.flush()
+            self.set_ip(position)
+            self.emit('set_array_ref_n(state, %s, %u, %s);' % (self.operand(variable), nargs, value))
+            return
+        index = self.pop()
+        self.set_ip(position)
+        self.emit('set_array_ref(state, %s, %s, %s);' % (self.operand(variable), index, value))
+
+    def compile_SetRef(self, position, end, variable):
+        self.set_ref(variable, self.pop())
+
+    def compile_GetRef(self, position, end, variable):
+        self.push(self.get_ref(variable))
+
+    def compile_MidAssign(self, position, end, variable, right_index):
+        replace = self.pop()
+        repl_length = self.pop() if right_index else 'null'
+        lower = self.pop()
+        self.set_ip(position)
+        self.emit('mid_assign(state, %s, %s - 1, %s, %s);' % (
+            self.operand(variable), lower, repl_length, replace))
+
+    def compile_MidArrayAssign(self, position, end, variable, right_index, nargs):
+        replace = self.pop()
+        repl_length = self.pop() if right_index else 'null'
+        lower = self.pop()
+        if nargs != 1:
+            self.flush()
+            self.set_ip(position)
+            self.emit('mid_array_assign_n(state, %s, %u, %s - 1, %s, %s);' % (
+                self.operand(variable), nargs, lower, repl_length, replace))
+            return
+        index = self.pop()
+        self.set_ip(position)
+        self.emit('mid_array_assign(state, %s, %s, %s - 1, %s, %s);' % (
+            self.operand(variable), index, lower, repl_length, replace))
+
+    def compile_GetArrayRef(self, position, end, variable, nargs):
+        if nargs != 1:
+            self.flush()
+            self.set_ip(position)
+            self.push(self.temp('get_array_ref_n(state, %s, %u)' % (self.operand(variable), nargs)))
+            return
+        index = self.pop()
+        self.set_ip(position)
+        self.push(self.temp('get_array_ref(state, %s, %s)' % (self.operand(variable), index)))
+
+    def compile_WaitIO(self, position, end, *operands):
+        pass
+
+    def compile_CallPrimitiveStatement(self, position, end, primitive, nargs):
+        if primitive.name == '_STACK_POP' and nargs == 0:
+            self.pop()
+            return
+        if primitive.name == '_STACK_DUP' and nargs == 0:
+            value = self.pop()
+            self.push(value)
+            self.push(value)
+            return
+        args = self.pop_args(nargs)
+        # Statements may use the stack (e.g. _RESET, INPUT).
+        self.flush()
+        self.set_ip(position)
+        self.emit('r = %s;' % (self.call(primitive, args),))
+        self.emit('if (r > VM_IO) { state.budget = budget + %u; return r; }' % (end - position - 1,))
+
+    def call_function(self, position, primitive, args):
+        """Temporary holding the result of a primitive function."""
+        self.set_ip(position)
+        call = self.call(primitive, args)
+        inline = INLINE_OPERATORS.get((primitive.name, len(args)))
+        if inline is None:
+            return self.temp(call)
+        arg_type, expression, valid = inline
+        names = dict(zip(['x', 'y'], args))
+        types = [literal_type(arg) for arg in args]
+        if primitive.arg_types is not None:
+            # Proven by lang.inference.
+            types = [t or proven for t, proven in zip(types, primitive.arg_types)]
+        conditions = []
+        if arg_type == 'number':
+            conditions += ["typeof %s == 'number'" % (arg,) for arg, t in zip(args, types) if t != 'number']
+            if 'string' in types:
+                return self.temp(call)
+        elif len(args) == 2:
+            # Both numbers or both strings.
+            if types[0] is not None and types[1] is not None:
+                if types[0] != types[1]:
+                    return self.temp(call)
+            elif types[0] is not None or types[1] is not None:
+                known, other = (types[0], args[1]) if types[0] is not None else (types[1], args[0])
+                conditions.append("typeof %s == '%s'" % (other, known))
+            else:
+                conditions.append("typeof %s == typeof %s" % (args[0], args[1]))
+                conditions.append("(typeof %s == 'number' || typeof %s == 'string')" % (args[0], args[0]))
+        if valid is not None:
+            conditions.append(valid % names)
+        if not conditions:
+            return self.temp(expression % names)
+        return self.temp('%s ? (%s) : %s' % (' && '.join(conditions), expression % names, call))
+
+    def compile_CallPrimitiveFunction(self, position, end, primitive, nargs):
+        args = [self.pop() for i in range(nargs)]
+        args.reverse()
+        self.push(self.call_function(position, primitive, args))
+
+    def compile_SetRefConstant(self, position, end, variable, constant):
+        self.set_ref(variable, self.operand(constant))
+
+    def compile_GetArrayRefConstant(self, position, end, variable, index):
+        self.set_ip(position)
+        self.push(self.temp('get_array_ref(state, %s, %s)' % (
+            self.operand(variable), self.operand(index))))
+
+    def compile_CallPrimitiveRefConstant(self, position, end, variable, constant, primitive):
+        x = self.get_ref(variable)
+        self.push(self.call_function(position, primitive, [x, self.operand(constant)]))
+
+    def compile_CallPrimitiveRefRef(self, position, end, variable1, variable2, primitive):
+        x = self.get_ref(variable1)
+        y = self.get_ref(variable2)
+        self.push(self.call_function(position, primitive, [x, y]))
+
+    def compile_JumpIfFalseRefConstant(self, position, end, variable, constant, primitive, label):
+        x = self.get_ref(variable)
+        condition = self.call_function(position, primitive, [x, self.operand(constant)])
+        self.flush()
+        self.emit('if (%s == 0) { ip = %s; continue; }' % (condition, self.address(label)))
+
+    def compile_Jump(self, position, end, label):
+        self.flush()
+        self.jump(self.address(label))
+
+    def compile_JumpIfFalse(self, position, end, label):
+        condition = self.pop()
+        self.flush()
+        self.emit('if (%s == 0) { ip = %s; continue; }' % (condition, self.address(label)))
+
+    def compile_Gosub(self, position, end, label):
+        self.flush()
+        self.emit('state.stack.push(%u);' % (position + 1,))
+        self.jump(self.address(label))
+
+    def compile_Return(self, position, end):
+        self.flush()
+        self.set_ip(position)
+        self.emit("if (state.stack.length == 0) throw new Exception('RETURN without GOSUB');")
+        self.jump('state.stack.pop()')
+
+    def compile_Enter(self, position, end, local_names):
+        self.flush()
+        self.set_ip(position)
+        self.emit('enter(state, %s);' % (self.operand(local_names),))
+
+    def compile_Leave(self, position, end):
+        self.emit('leave(state);')
+
+    def compile_ForStart(self, position, end, index, index_upper, index_step):
+        self.emit('state.locals[%s] = %s;' % (self.operand(index_step), self.pop()))
+        self.emit('state.locals[%s] = %s;' % (self.operand(index_upper), self.pop()))
+        self.emit('state.locals[%s] = %s;' % (self.operand(index), self.pop()))
+
+    def compile_ForCheck(self, position, end, index, index_upper, index_step, label):
+        self.flush()
+        self.emit('if (state.locals[%s] > 0 ? state.locals[%s] > state.locals[%s]'
+                  ' : state.locals[%s] < state.locals[%s]) { ip = %s; continue; }' % (
+            self.operand(index_step),
+            self.operand(index), self.operand(index_upper),
+            self.operand(index), self.operand(index_upper),
+            self.address(label),
+        ))
+
+    def compile_ForNext(self, position, end, index, index_step, label):
+        self.flush()
+        self.emit('state.locals[%s] = state.locals[%s] + state.locals[%s];' % (
+            self.operand(index), self.operand(index), self.operand(index_step)))
+        self.jump(self.address(label))
+
+    def compile_chunk(self, blocks):
+        self.max_temps = 0
+        cases = []
+        for block in blocks:
+            cases.extend(self.compile_block(block))
+        temps = ''.join([', t%u' % (i,) for i in range(self.max_temps)])
+        lines = [
+            'function (state) {',
+            '\tvar budget = state.budget, ip = state.ip, r%s;' % (temps,),
+            '\tfor (;;) {',
+            '\t\tswitch (ip) {',
+        ] + [
+            '\t\t' + ('' if line.startswith('case ') else '\t') + line for line in cases
+        ] + [
+            '\t\t}',
+            '\t\tstate.ip = ip;',
+            '\t\tstate.budget = budget;',
+            '\t\treturn VM_OK;',
+            '\t}',
+            '}',
+        ]
+        return lines
+
+def compile_blocks(code, labels, shared, mangle, comments=False):
+    """JavaScript expression for the blocks argument of the VM state: a
+    function of the state returning a sparse array that maps the start of
+    every basic block to the function that runs it."""
+    cfg = ControlFlowGraph(code, labels)
+    chunks = []
+    for block in cfg.blocks:
+        if not chunks or sum([len(b) for b in chunks[-1]]) >= CHUNK_SIZE:
+            chunks.append([])
+        chunks[-1].append(block)
+
+    constants = []
+    entry_points = []
+    compiler = BlockCompiler(code, labels, shared, mangle, constants, entry_points, comments)
+    functions = []
+    for number, blocks in enumerate(chunks):
+        lines = compiler.compile_chunk(blocks)
+        lines[0] = 'var chunk%u = %s' % (number, lines[0])
+        lines[-1] += ';'
+        functions.extend(lines)
+
+    lines = ['function (state) {']
+    lines += ['var K%u = %s;' % (i, constant) for i, constant in enumerate(constants)]
+    lines += ['var P%u = primitive_entry_point(state, %s, %u);' % (i, name, nargs)
+              for i, (name, nargs) in enumerate(entry_points)]
+    lines += functions
+    lines += [
+        'var blocks = [];',
+        'var chunks = [%s];' % (', '.join([
+            '[chunk%u, [%s]]' % (number, ','.join(['%u' % (block.start,) for block in blocks]))
+            for number, blocks in enumerate(chunks)
+        ]),),
+        'for (var i = 0; i < chunks.length; i++) {',
+        '\tfor (var j = 0; j < chunks[i][1].length; j++) {',
+        '\t\tblocks[chunks[i][1][j]] = chunks[i][0];',
+        '\t}',
+        '}',
+        'return blocks;',
+        '}',
+    ]
+    return '\n'.join([2 * '\t' + line for line in lines]).lstrip()
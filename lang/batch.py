@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import traceback
+import multiprocessing
+
+from lang.compiler import Compiler
+from lang.profiler import CompileProfiler
+
+# Entry points of chained programs (e.g. MENU.000, which RUNs the
+# EPISODn.LEV files) do not have a .bas extension.
+ENTRY_POINT_EXTENSIONS = ['.bas', '.000']
+
+class BatchJob(object):
+
+    def __init__(self, in_fn, out_fn):
+        self.in_fn = in_fn
+        self.out_fn = out_fn
+
+    def __repr__(self):
+        return '<job %s -> %s>' % (self.in_fn, self.out_fn)
+
+class BatchResult(object):
+
+    def __init__(self, job, ok, elapsed, error=None, profile=None, opcodes=None):
+        self.job = job
+        self.ok = ok
+        self.elapsed = elapsed
+        self.error = error
+        self.profile = profile
+        self.opcodes = opcodes      # (before, after) optimization
+
+def output_filename(in_fn, out_dir='output'):
+    name = os.path.basename(in_fn.lower())
+    if name.endswith('.bas'):
+        name = name[:-4]
+    return os.path.join(out_dir, name + '.html')
+
+def directory_output_filename(in_fn, out_dir='output'):
+    # Programs found while scanning a directory are named after the file
+    # if it is a .bas source, and after the directory otherwise
+    # (jet/MENU.000 -> jet.html).
+    if in_fn.lower().endswith('.bas'):
+        return output_filename(in_fn, out_dir)
+    name = os.path.basename(os.path.dirname(os.path.abspath(in_fn))).lower()
+    return os.path.join(out_dir, name + '.html')
+
+def find_jobs(paths, out_dir='output'):
+    jobs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for fn in sorted(os.listdir(path)):
+                full_fn = os.path.join(path, fn)
+                ext = os.path.splitext(fn)[1].lower()
+                if os.path.isfile(full_fn) and ext in ENTRY_POINT_EXTENSIONS:
+                    jobs.append(BatchJob(full_fn, directory_output_filename(full_fn, out_dir)))
+        else:
+            jobs.append(BatchJob(path, output_filename(path, out_dir)))
+
+    unique_jobs = []
+    outputs = {}
+    for job in jobs:
+        if os.path.abspath(job.in_fn) == os.path.abspath(outputs.get(job.out_fn, '')):
+            # The same program was named twice (e.g. also through its directory).
+            continue
+        if job.out_fn in outputs:
+            raise Exception('Both %s and %s would be compiled to %s.' % (
+                outputs[job.out_fn], job.in_fn, job.out_fn))
+        outputs[job.out_fn] = job.in_fn
+        unique_jobs.append(job)
+    return unique_jobs
+
+def compile_job(job, cache_dir=None, quiet=False, profile=None):
+    """Compile a single program.
+
+    profile, if given, is a (use_cprofile, use_tracemalloc) pair; the
+    compilation is then profiled and the report is attached to the result.
+    """
+    start = time.time()
+    stdout = sys.stdout
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+    profiler = None
+    try:
+        if profile is not None:
+            profiler = CompileProfiler(*profile)
+        opcodes = Compiler(cache_dir=cache_dir).compile_file(job.in_fn, job.out_fn, profiler)
+        return BatchResult(job, True, time.time() - start,
+                           profile=profiler.report() if profiler is not None else None,
+                           opcodes=opcodes)
+    except Exception, e:
+        return BatchResult(job, False, time.time() - start,
+                           error='%s\n%s' % (e, traceback.format_exc()))
+    finally:
+        if quiet:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+def _compile_job_in_worker(args):
+    job, cache_dir, profile = args
+    return compile_job(job, cache_dir, quiet=True, profile=profile)
+
+def compile_batch(jobs, cache_dir=None, processes=None, report=None, profile=None):
+    """Compile independent programs in parallel.
+
+    Results are returned in completion order; report, if given, is called
+    with each of them as soon as it is available.
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = max(1, min(processes, len(jobs)))
+    pool = multiprocessing.Pool(processes)
+    results = []
+    try:
+        for result in pool.imap_unordered(_compile_job_in_worker,
+                                          [(job, cache_dir, profile) for job in jobs]):
+            if report is not None:
+                report(result)
+            results.append(result)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
+
+def print_summary(jobs, results, elapsed, out=sys.stdout):
+    by_input = dict([(result.job.in_fn, result) for result in results])
+    out.write('\n%-6s %8s %15s  %s\n' % ('status', 'time', 'opcodes', 'program'))
+    for job in jobs:
+        result = by_input[job.in_fn]
+        if result.opcodes is not None:
+            opcodes = '%u -> %u' % result.opcodes
+        else:
+            opcodes = '-'
+        out.write('%-6s %7.2fs %15s  %s -> %s\n' % (
+            'ok' if result.ok else 'FAILED',
+            result.elapsed,
+            opcodes,
+            job.in_fn,
+            job.out_fn,
+        ))
+    failed = len([result for result in results if not result.ok])
+    out.write('%u programs, %u failed, %.2fs total (%.2fs of compilation)\n' % (
+        len(results),
+        failed,
+        elapsed,
+        sum([result.elapsed for result in results]),
+    ))
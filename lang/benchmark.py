@@ -0,0 +1,189 @@
+import os
+import sys
+import json
+import subprocess
+import multiprocessing
+
+import lang.batch
+
+# End-to-end benchmark of the example programs: each of them is compiled
+# (in a process of its own, so that its peak memory is its own) and then
+# run headlessly for a fixed number of opcodes with runtime/headless.js.
+# Results are dicts that can be stored as JSON and compared with those of
+# an earlier run.
+
+SOURCE_DIRS = [
+    'examples/source/misc',
+    'examples/source/jet',
+    'examples/source/jet2',
+]
+
+HEADLESS = 'runtime/headless.js'
+RUNTIME_DIR = 'runtime'
+
+# Opcodes each program runs, and keys typed meanwhile (see parse_keys in
+# runtime/headless.js): answers for the menus and prompts of the examples.
+STEPS = 2000000
+KEYS = '1{ENTER} {ENTER}2{ENTER}a{ENTER}'
+
+# (section, metric, whether a larger value is better, smallest change
+# that counts) for comparisons. The smallest changes keep the noise of
+# short timings out of the regressions.
+METRICS = [
+    ('compile', 'time_s', False, 0.05),
+    ('compile', 'peak_rss_kb', False, 0),
+    ('compile', 'output_bytes', False, 0),
+    ('compile', 'opcodes', False, 0),
+    ('run', 'ops_per_second', True, 0),
+    ('run', 'first_frame_ms', False, 50),
+    ('run', 'draw_calls', False, 0),
+]
+
+def program_name(in_fn):
+    # examples/source/jet/MENU.000 -> jet/MENU.000
+    return '/'.join(os.path.normpath(in_fn).split(os.sep)[-2:])
+
+def find_programs(out_dir):
+    return lang.batch.find_jobs(SOURCE_DIRS, out_dir)
+
+def _compile_in_worker(job):
+    return lang.batch.compile_job(job, quiet=True, profile=(False, False))
+
+def compile_programs(jobs, repeat=1):
+    """Compile every job repeat times, each time in a new process, and
+    return {name: compile results}, keeping the fastest compilation."""
+    results = {}
+    pool = multiprocessing.Pool(1, maxtasksperchild=1)
+    try:
+        for i in range(repeat):
+            for job in jobs:
+                result = pool.apply(_compile_in_worker, (job,))
+                name = program_name(job.in_fn)
+                if not result.ok:
+                    results[name] = {'ok': False, 'error': result.error.split('\n')[0]}
+                    continue
+                compiled = {
+                    'ok': True,
+                    'time_s': result.profile['total_s'],
+                    'peak_rss_kb': result.profile['peak_rss_kb'],
+                    'output_bytes': os.path.getsize(job.out_fn),
+                    'opcodes': result.opcodes[1],
+                }
+                if name not in results or compiled['time_s'] < results[name]['time_s']:
+                    results[name] = compiled
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
+
+def run_program(out_fn, steps=STEPS, keys=KEYS):
+    """Result of runtime/headless.js for the compiled page out_fn."""
+    command = ['node', HEADLESS, '--runtime', RUNTIME_DIR,
+               '--steps', str(steps), '--keys', keys, out_fn]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    if process.returncode not in (0, 1):
+        raise Exception('%s failed:\n%s' % (' '.join(command), err))
+    result = json.loads(out)
+    first_frame = result['first_frame']
+    return {
+        'stopped': result['stopped'],
+        'error': result['error'],
+        'ops': result['ops'],
+        'virtual_ms': result['virtual_ms'],
+        'ops_per_second': result['ops_per_second'],
+        'first_frame_ms': first_frame['wall_ms'] if first_frame is not None else None,
+        'draw_calls': result['draw_calls'],
+    }
+
+def run_programs(jobs, compiled, steps=STEPS, keys=KEYS, repeat=1):
+    """Run every compiled job repeat times and return {name: run
+    results}, keeping the fastest run."""
+    results = {}
+    for i in range(repeat):
+        for job in jobs:
+            name = program_name(job.in_fn)
+            if not compiled[name]['ok']:
+                continue
+            result = run_program(job.out_fn, steps, keys)
+            if name not in results or result['ops_per_second'] > results[name]['ops_per_second']:
+                results[name] = result
+    return results
+
+def benchmark(out_dir, steps=STEPS, keys=KEYS, repeat=1, report=None):
+    """Compile and run the example programs, writing the pages to out_dir."""
+    jobs = find_programs(out_dir)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    compiled = compile_programs(jobs, repeat)
+    ran = run_programs(jobs, compiled, steps, keys, repeat)
+    programs = {}
+    for job in jobs:
+        name = program_name(job.in_fn)
+        programs[name] = {'compile': compiled[name], 'run': ran.get(name)}
+        if report is not None:
+            report(name, programs[name])
+    return {
+        'settings': {'steps': steps, 'keys': keys, 'repeat': repeat},
+        'programs': programs,
+    }
+
+def value(results, name, section, metric):
+    program = results['programs'].get(name)
+    if program is None or program[section] is None:
+        return None
+    return program[section].get(metric)
+
+def compare(baseline, results, threshold):
+    """Regressions of results with respect to baseline by more than the
+    fraction threshold, as (name, section, metric, old, new)."""
+    regressions = []
+    for name in sorted(baseline['programs']):
+        if baseline['programs'][name]['compile']['ok'] and \
+           not results['programs'].get(name, {}).get('compile', {}).get('ok', False):
+            regressions.append((name, 'compile', 'ok', True, False))
+            continue
+        for section, metric, larger_is_better, slack in METRICS:
+            old = value(baseline, name, section, metric)
+            new = value(results, name, section, metric)
+            if old is None or new is None:
+                continue
+            if metric == 'ops_per_second' and \
+               (value(baseline, name, 'run', 'stopped') != 'steps' or
+                value(results, name, 'run', 'stopped') != 'steps'):
+                # Programs that end before the given number of opcodes do
+                # not run long enough to be timed.
+                continue
+            if larger_is_better:
+                regressed = new < old * (1 - threshold) and old - new > slack
+            else:
+                regressed = new > old * (1 + threshold) and new - old > slack
+            if regressed:
+                regressions.append((name, section, metric, old, new))
+    return regressions
+
+def write_summary(results, out=sys.stdout):
+    out.write('%-20s %8s %9s %9s %8s %12s %9s %6s  %s\n' % (
+        'program', 'compile', 'peak RSS', 'bytes', 'opcodes', 'ops/s', '1st frame', 'draws', 'stopped'))
+    for name, program in sorted(results['programs'].items()):
+        compiled = program['compile']
+        if not compiled['ok']:
+            out.write('%-20s FAILED: %s\n' % (name, compiled['error']))
+            continue
+        ran = program['run']
+        out.write('%-20s %7.2fs %6u KiB %9u %8u %12.0f %7.0fms %6u  %s\n' % (
+            name, compiled['time_s'], compiled['peak_rss_kb'], compiled['output_bytes'],
+            compiled['opcodes'], ran['ops_per_second'],
+            ran['first_frame_ms'] if ran['first_frame_ms'] is not None else -1,
+            ran['draw_calls'], ran['error'] or ran['stopped']))
+
+def write_regressions(regressions, threshold, out=sys.stdout):
+    if not regressions:
+        out.write('No regressions beyond %.0f%%.\n' % (100 * threshold,))
+        return
+    out.write('Regressions beyond %.0f%%:\n' % (100 * threshold,))
+    for name, section, metric, old, new in regressions:
+        out.write('  %-20s %s.%s: %s -> %s\n' % (name, section, metric, old, new))
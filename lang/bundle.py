@@ -0,0 +1,325 @@
+import os
+import re
+
+# Single-file output.
+#
+# The page written by lang.compiler loads the runtime with one
+# <script src='../runtime/...'> per module, so it only works next to the
+# runtime/ directory and always carries all of it. bundle() inlines
+# those scripts instead, keeping only what the program can reach:
+#
+#   - The primitives of runtime/builtins.js that the program does not
+#     call are dropped from global_primitives.
+#   - The cases of the interpreter loop of runtime/vm.js for opcodes
+#     the program does not use are dropped.
+#   - The top-level declarations (function f / var v) of the runtime
+#     modules are kept only if the inline scripts of the page refer to
+#     them, directly or through other kept declarations. So are the
+#     members of the constructors (that.m = function) and their inner
+#     functions (function f), which the rest of the declaration does not
+#     need: a kept Screen carries CIRCLE only if the program draws one.
+#   - What remains is minified: comments, indentation and the blanks
+#     between tokens are removed. Line breaks are kept where automatic
+#     semicolon insertion could depend on them.
+
+RUNTIME_PREFIX = '../runtime/'
+RUNTIME_DIR = 'runtime'
+
+SCRIPT_RE = re.compile(
+    r"<script type='text/javascript'(?: src='([^']*)')?>(.*?)</script>", re.DOTALL)
+DECLARATION_RE = re.compile(r'^(?:function|var)\s+([A-Za-z_$][\w$]*)', re.MULTILINE)
+PRIMITIVE_RE = re.compile(r"^    primitives\['((?:[^'\\]|\\.)*)'\] = ", re.MULTILINE)
+MEMBER_RE = re.compile(r'^    (?:that\.([A-Za-z_$][\w$]*) = function\b|function ([A-Za-z_$][\w$]*))', re.MULTILINE)
+MEMBER_END_RE = re.compile(r'^    \};?\n', re.MULTILINE)
+CASE_RE = re.compile(r'^ +(?:case \d+: /\* (OP_\w+) \*/|default:)\n', re.MULTILINE)
+WORD_RE = re.compile(r'[A-Za-z0-9_$.]')
+
+PUNCTUATORS = [
+    '>>>=', '===', '!==', '>>>', '<<=', '>>=',
+    '==', '!=', '<=', '>=', '&&', '||', '++', '--', '<<', '>>',
+    '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=',
+]
+
+# Members that are kept even if the page does not refer to them: the
+# ones JavaScript calls implicitly and the ones runtime/headless.js calls.
+HOST_MEMBERS = ['toString', 'stats', 'text_rows']
+
+# Tokens after which a slash starts a regular expression, not a division.
+REGEXP_PREFIXES = set(['return', 'typeof', 'case', 'do', 'else', 'in', 'new', 'throw', 'void'])
+
+# ------------------------------------------------------------------------
+# Minification
+
+def tokenize(source):
+    """Split JavaScript source into (token, newline_before) pairs, where
+    token is a string or regexp literal, a word (identifier, keyword or
+    number) or a punctuator. Comments and blanks are dropped."""
+    tokens = []
+    newline = False
+    i = 0
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c == '\n':
+            newline = True
+            i += 1
+        elif c.isspace():
+            i += 1
+        elif source.startswith('//', i):
+            while i < n and source[i] != '\n':
+                i += 1
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            if end == -1:
+                raise Exception('Unterminated comment in runtime')
+            if '\n' in source[i:end]:
+                newline = True
+            i = end + 2
+        elif c in '\'"' or (c == '/' and starts_regexp(tokens)):
+            j = i + 1
+            in_class = False
+            while j < n and (source[j] != c or in_class):
+                if source[j] == '\\':
+                    j += 1
+                elif c == '/' and source[j] == '[':
+                    in_class = True
+                elif c == '/' and source[j] == ']':
+                    in_class = False
+                elif source[j] == '\n':
+                    raise Exception('Unterminated literal in runtime')
+                j += 1
+            j += 1
+            if c == '/':
+                while j < n and source[j].isalpha():
+                    j += 1
+            tokens.append((source[i:j], newline))
+            newline = False
+            i = j
+        elif WORD_RE.match(c):
+            j = i + 1
+            while j < n and WORD_RE.match(source[j]):
+                j += 1
+            tokens.append((source[i:j], newline))
+            newline = False
+            i = j
+        else:
+            j = i + 1
+            for punctuator in PUNCTUATORS:
+                if source.startswith(punctuator, i):
+                    j = i + len(punctuator)
+                    break
+            tokens.append((source[i:j], newline))
+            newline = False
+            i = j
+    return tokens
+
+def starts_regexp(tokens):
+    if not tokens:
+        return True
+    previous = tokens[-1][0]
+    if previous in REGEXP_PREFIXES:
+        return True
+    return not is_word(previous) and previous not in (')', ']', '}') and previous[0] not in '\'"/'
+
+def is_word(token):
+    return WORD_RE.match(token[0]) is not None and token[0] not in '.'
+
+def keeps_newline(previous, token):
+    # A line break can end a statement only after a word, a literal or
+    # a closing bracket, and only before something that can start one.
+    if previous[-1] not in ')]}' and not is_word(previous) and previous[0] not in '\'"/' \
+       and previous not in ('++', '--'):
+        return False
+    return token not in (')', ']', '}', ',', ';', '.', ':', '?')
+
+def minify(source):
+    """Minified JavaScript source."""
+    out = []
+    previous = None
+    for token, newline in tokenize(source):
+        if previous is not None:
+            if newline and keeps_newline(previous, token):
+                out.append('\n')
+            elif is_word(previous) and is_word(token):
+                out.append(' ')
+            elif previous[-1] in '+-' and token[0] == previous[-1]:
+                out.append(' ')
+            elif previous[-1] == '/' and token[0] in '/*':
+                out.append(' ')
+        out.append(token)
+        previous = token
+    return ''.join(out)
+
+def identifiers(source):
+    """Words referred to by (already minified) JavaScript source, not
+    counting the contents of its literals."""
+    words = set()
+    for token, newline in tokenize(source):
+        if WORD_RE.match(token[0]):
+            words.update(token.split('.'))
+    return words
+
+# ------------------------------------------------------------------------
+# Tree shaking
+
+def shake_primitives(source, primitives):
+    """Source of runtime/builtins.js without the primitives that are not
+    in primitives."""
+    kept = []
+    position = 0
+    matches = list(PRIMITIVE_RE.finditer(source))
+    for match in matches:
+        name = match.group(1).replace("\\'", "'").replace('\\\\', '\\')
+        end = source.index('\n    );\n', match.start()) + len('\n    );\n')
+        kept.append(source[position:match.start()])
+        if name in primitives:
+            kept.append(source[match.start():end])
+        position = end
+    kept.append(source[position:])
+    return ''.join(kept)
+
+def shake_cases(source, opcodes):
+    """Source of runtime/vm.js without the cases of the interpreter loop
+    for the opcodes (OP_ names) that are not in opcodes."""
+    kept = []
+    position = 0
+    matches = list(CASE_RE.finditer(source))
+    for i, match in enumerate(matches):
+        if match.group(1) is None or match.group(1) in opcodes:
+            continue
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(source)
+        kept.append(source[position:match.start()])
+        position = end
+    kept.append(source[position:])
+    return ''.join(kept)
+
+def opcode_name(opcode):
+    """OP_ name in runtime/vm.js of an opcode of lang.ir ('MidAssign' is
+    OP_MID_ASSIGN)."""
+    return 'OP_' + re.sub(r'(?<=[a-z])([A-Z])', r'_\1', opcode).upper()
+
+def split_members(source):
+    """List of (name, source) of the pieces of a top-level declaration:
+    its members and inner functions, with their names, and the text
+    between them, with None."""
+    pieces = []
+    position = 0
+    for match in MEMBER_RE.finditer(source):
+        if match.start() < position:
+            continue
+        end = MEMBER_END_RE.search(source, match.end()).end()
+        pieces.append((None, source[position:match.start()]))
+        pieces.append((match.group(1) or match.group(2), source[match.start():end]))
+        position = end
+    pieces.append((None, source[position:]))
+    return pieces
+
+def split_declarations(source):
+    """List of (name, source) of the top-level declarations of a runtime
+    module, in order."""
+    matches = list(DECLARATION_RE.finditer(source))
+    declarations = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(source)
+        declarations.append((match.group(1), source[match.start():end]))
+    return declarations
+
+class Bundle(object):
+    """A self-contained page, with the size of each runtime component
+    (a module of runtime/, or 'program' for the inline scripts)."""
+
+    def __init__(self, html, sizes):
+        self.html = html
+        self.sizes = sizes
+
+    def size(self):
+        return len(self.html)
+
+def read_runtime(src):
+    if not src.startswith(RUNTIME_PREFIX):
+        raise Exception('Cannot bundle script "%s"' % (src,))
+    fn = os.path.join(RUNTIME_DIR, src[len(RUNTIME_PREFIX):])
+    f = open(fn, 'r')
+    source = f.read()
+    f.close()
+    return source
+
+def bundle(html, primitives, opcodes):
+    """Inline the runtime scripts loaded by the page in html, keeping
+    only the declarations it needs, the given primitives and the cases
+    of the given opcodes (names of lang.ir)."""
+    opcodes = set([opcode_name(opcode) for opcode in opcodes])
+    scripts = []
+    for match in SCRIPT_RE.finditer(html):
+        src, inline = match.groups()
+        if src is None:
+            scripts.append((match, None, [], minify(inline)))
+            continue
+        source = read_runtime(src)
+        if src == RUNTIME_PREFIX + 'builtins.js':
+            source = shake_primitives(source, primitives)
+        elif src == RUNTIME_PREFIX + 'vm.js':
+            source = shake_cases(source, opcodes)
+        declarations = [
+            (name, [(member, minify(piece)) for member, piece in split_members(text)])
+            for name, text in split_declarations(source)
+        ]
+        scripts.append((match, src[len(RUNTIME_PREFIX):], declarations, None))
+
+    # The text of each declaration outside its members, and the members
+    # of every declaration by name.
+    defined = {}
+    members = {}
+    for match, component, declarations, inline in scripts:
+        for name, pieces in declarations:
+            defined[name] = ''.join([piece for member, piece in pieces if member is None])
+            for member, piece in pieces:
+                if member is not None:
+                    members.setdefault(member, []).append(piece)
+
+    # Declarations and members reachable from the inline scripts.
+    reached = set()
+    reached_members = set()
+    pending = list(HOST_MEMBERS)
+    for match, component, declarations, inline in scripts:
+        if inline is not None:
+            pending.extend(identifiers(inline))
+    while pending:
+        name = pending.pop()
+        if name in defined and name not in reached:
+            reached.add(name)
+            pending.extend(identifiers(defined[name]))
+        if name in members and name not in reached_members:
+            reached_members.add(name)
+            for piece in members[name]:
+                pending.extend(identifiers(piece))
+
+    out = []
+    sizes = []
+    position = 0
+    program_size = 0
+    for match, component, declarations, inline in scripts:
+        if inline is None:
+            text = '\n'.join([
+                '\n'.join([
+                    piece
+                    for member, piece in pieces
+                    if piece and (member is None or member in reached_members)
+                ])
+                for name, pieces in declarations
+                if name in reached
+            ])
+            if text:
+                sizes.append((component, len(text)))
+        else:
+            text = inline
+            program_size += len(text)
+        out.append(html[position:match.start()])
+        if text:
+            out.append("<script type='text/javascript'>%s</script>" % (text,))
+        position = match.end()
+    out.append(html[position:])
+    sizes.append(('program', program_size))
+
+    page = re.sub(r'\n\s*\n', '\n', ''.join(out))
+    return Bundle(page, sizes)
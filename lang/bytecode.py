@@ -0,0 +1,89 @@
+import base64
+import struct
+
+from lang.ir import Label, js_operand
+
+# Packed bytecode output (see Bytecode in runtime/vm.js).
+#
+# Instead of one new OpX(...) per opcode, the program is written as a
+# base64 string of little-endian 32-bit words plus a constant pool, a
+# JavaScript array with every distinct operand (numbers, strings,
+# variable and primitive names, label addresses, sounds, ...). The first
+# word of an instruction holds the opcode number in its low 8 bits and
+# the pool index of the first operand, if any, in the other 24; each
+# further operand takes a word with its pool index. Labels are resolved
+# to their addresses, so the page declares no label variables.
+
+# Opcode numbers: the OP_* numbers of runtime/vm.js, in order, with the
+# number of operands of each opcode (OPCODE_ARITY there).
+OPCODES = [
+    ('PushConstant', 1),
+    ('PushRetval', 1),
+    ('SetArrayRef', 2),
+    ('SetRef', 1),
+    ('GetRef', 1),
+    ('MidAssign', 2),
+    ('MidArrayAssign', 3),
+    ('GetArrayRef', 2),
+    ('WaitIO', 1),
+    ('CallPrimitiveStatement', 2),
+    ('CallPrimitiveFunction', 2),
+    ('SetRefConstant', 2),
+    ('GetArrayRefConstant', 2),
+    ('CallPrimitiveRefConstant', 3),
+    ('CallPrimitiveRefRef', 3),
+    ('JumpIfFalseRefConstant', 4),
+    ('Jump', 1),
+    ('JumpIfFalse', 1),
+    ('Gosub', 1),
+    ('Return', 0),
+    ('Enter', 1),
+    ('Leave', 0),
+    ('ForStart', 3),
+    ('ForCheck', 4),
+    ('ForNext', 3),
+]
+
+OPCODE_NUMBERS = dict([(opcode, number) for number, (opcode, arity) in enumerate(OPCODES)])
+OPCODE_ARITY = dict(OPCODES)
+
+MAX_POOL_INDEX = 2 ** 24 - 1
+
+class ConstantPool(object):
+    """Distinct operands, as JavaScript values, in order of appearance."""
+
+    def __init__(self, mangle):
+        self.mangle = mangle
+        self.values = []
+        self._index = {}
+
+    def index(self, value):
+        if value not in self._index:
+            self._index[value] = len(self.values)
+            self.values.append(value)
+        return self._index[value]
+
+    def js(self):
+        return '[%s]' % (', '.join(self.values),)
+
+def encode(code, labels, mangle):
+    """Encode the code of a linked program. Returns the base64 string of
+    the instructions and the constant pool."""
+    pool = ConstantPool(mangle)
+    words = []
+    for op in code:
+        if OPCODE_ARITY.get(op.opcode) != len(op.operands):
+            raise Exception('Cannot encode %r.' % (op,))
+        indices = []
+        for operand in op.operands:
+            if isinstance(operand, Label):
+                value = '%u' % (labels[operand.number],)
+            else:
+                value = js_operand(operand, mangle)
+            indices.append(pool.index(value))
+        if indices and indices[0] > MAX_POOL_INDEX:
+            raise Exception('Too many constants.')
+        words.append(OPCODE_NUMBERS[op.opcode] | (indices[0] << 8 if indices else 0))
+        words.extend(indices[1:])
+    data = base64.b64encode(struct.pack('<%uI' % (len(words),), *words))
+    return data, pool
@@ -0,0 +1,65 @@
+import os
+import hashlib
+import tempfile
+import cPickle as pickle
+
+class CompileCache(object):
+    """On-disk cache of compiled modules.
+
+    Every module reached through RUN is stored as a ModuleFragment, keyed
+    by the hash of its source and of the compiler that produced it, so
+    that only the modules that changed have to be parsed again.
+    """
+
+    def __init__(self, directory, fingerprint):
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, module, contents):
+        h = hashlib.sha1()
+        h.update(self.fingerprint)
+        h.update('\0' + module + '\0')
+        h.update(contents)
+        return h.hexdigest()
+
+    def _path(self, module, contents):
+        return os.path.join(self.directory, self.key(module, contents) + '.frag')
+
+    def load(self, module, contents):
+        path = self._path(module, contents)
+        try:
+            f = open(path, 'rb')
+        except IOError:
+            self.misses += 1
+            return None
+        try:
+            fragment = pickle.load(f)
+        except Exception:
+            # Corrupt or stale entry: just compile the module again.
+            fragment = None
+        finally:
+            f.close()
+        if fragment is None or fragment.module != module:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return fragment
+
+    def store(self, module, contents, fragment):
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):
+                    raise
+        # Write to a temporary file first, so that concurrent compilers
+        # never see a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        f = os.fdopen(fd, 'wb')
+        try:
+            pickle.dump(fragment, f, pickle.HIGHEST_PROTOCOL)
+        finally:
+            f.close()
+        os.rename(tmp_path, self._path(module, contents))
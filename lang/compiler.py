@@ -1,17 +1,70 @@
 import os
-from lang.utils import take_while_in, ALPHA, SIGIL, DIGIT, IDENT
+import re
+import hashlib
 import lang.sound
 import lang.draw
+import lang.cache
+import lang.profiler
+import lang.folding
+import lang.ir
+import lang.optimizer
+import lang.fusion
+import lang.inference
+import lang.aot
+import lang.bytecode
+import lang.bundle
+from lang.ir import Instruction, Label, Var, Sound, Primitive, DrawCommands, escape_string
 
 #DEBUG = False
 DEBUG = True
 
+# Run the peephole optimizer (lang.optimizer) on the linked program.
+OPTIMIZE = True
+
+# Fuse common sequences of opcodes into superinstructions (lang.fusion)
+# after optimizing.
+FUSE = True
+
+# Call the primitives whose arguments are proven to have the right types
+# (lang.inference) without checking them at runtime.
+INFER_TYPES = True
+
+# Either 'vm', to interpret the opcodes, or 'aot', to also compile the
+# basic blocks to JavaScript (lang.aot).
+BACKENDS = ['vm', 'aot']
+BACKEND = 'vm'
+
+# Either 'opcodes', to write the program as a list of new OpX(...), or
+# 'bytecode', to pack it into a string and a constant pool (lang.bytecode).
+OUTPUT_FORMATS = ['opcodes', 'bytecode']
+OUTPUT_FORMAT = 'opcodes'
+
+# Write a self-contained page with the parts of the runtime the program
+# uses inlined and minified (lang.bundle), instead of loading the whole
+# runtime from ../runtime/.
+BUNDLE = False
+
 DEFAULT_SAMPLES_PER_SECOND = 8000
 
-def eat_whitespace(string, i):
-    while i < len(string) and string[i] in ' \t\r':
-        i += 1
-    return i
+COMPILER_VERSION = '0.2'
+
+def compiler_fingerprint():
+    # Identifies the compiler and its settings, so that cached modules
+    # are discarded whenever either of them changes.
+    h = hashlib.sha1()
+    h.update('%s:%s:%s:%s' % (
+        COMPILER_VERSION,
+        DEBUG,
+        DEFAULT_SAMPLES_PER_SECOND,
+        lang.sound.CONVERT_TO_MP3,
+    ))
+    lang_dir = os.path.dirname(os.path.abspath(__file__))
+    for fn in sorted(os.listdir(lang_dir)):
+        if fn.endswith('.py'):
+            f = open(os.path.join(lang_dir, fn), 'rb')
+            h.update(f.read())
+            f.close()
+    return h.hexdigest()
 
 def initial_value_for(var):
     if var[-1] == '$':
@@ -19,34 +72,35 @@ def initial_value_for(var):
     else:
         return 0
 
-def escape_string(string):
-    res = ''
-    for c in string:
-        if c == '\\':
-            res += '\\\\'
-        elif 32 <= ord(c) <= 127:
-            res += c
-        else:
-            res += '\\x%.2x' % (ord(c),)
-    return res
+def type_suffix(var):
+    """Suffix of a variable name that gives its type, or ''."""
+    if var[-1] in '%&!#$':
+        return var[-1]
+    return ''
 
 class Token(object):
 
-    def __init__(self, type, val):
+    __slots__ = ('type', 'val', 'line', 'col')
+
+    def __init__(self, type, val, line=0, col=0):
         self.type = type
         self.val = val
-        self.type_val = type, val
+        self.line = line
+        self.col = col
+
+    @property
+    def type_val(self):
+        return self.type, self.val
 
     def __repr__(self):
-        return '<token %s %s>' % (self.type, self.val)
+        return '<token %s %s at %u:%u>' % (self.type, self.val, self.line, self.col)
 
     def is_label(self):
         return self.type == 'num' or self.type == 'label'
 
 def normalize_identifier(identifier):
-    for i in range(len(identifier)):
-        if identifier[i] in SIGIL and i != len(identifier) - 1:
-            raise Exception('Malformed identifier: %s' % (identifier,))
+    if MALFORMED_IDENTIFIER.search(identifier):
+        raise Exception('Malformed identifier: %s' % (identifier,))
     if identifier[-1] == '!':
         identifier = identifier[:-1]
     return identifier.lower()
@@ -57,116 +111,161 @@ def has_offending_if(line):
            'then' in line and \
            not line.endswith('then')
 
-def preprocess(string):
-    new_lines = []
-    for line in string.split('\n'):
-        new_lines.append(line)
-        if has_offending_if(line):
-            new_lines.append('END IF')
-    return '\n'.join(new_lines)
+MALFORMED_IDENTIFIER = re.compile(r'[%&!#$:].')
+
+# A single regular expression recognizes every token, together with the
+# blanks that precede it. The alternatives are sorted by frequency.
+TOKEN_REGEX = re.compile(r'''
+    [ \t\r]*
+    (?:
+          (?P<rem>[Rr][Ee][Mm]!?(?![A-Za-z0-9.%&!#$:])[^\n]*)
+        | (?P<id>[A-Za-z][A-Za-z0-9.%&!#$:]*)
+        | (?P<symbol>[<>]=|<>|[<>=()+\-*/\\^,;\#])
+        | (?P<eol>\n)
+        | (?P<num>[0-9.]+)
+        | (?P<string>"[^"]*"?)
+        | (?P<colon>:)
+        | (?P<comment>'[^\n]*)
+        | (?P<error>.)
+    )
+''', re.VERBOSE)
+
+OPERATOR_KEYWORDS = frozenset(['mod', 'not', 'and', 'or', 'xor', 'eqv', 'imp'])
+
+BLOCK_KEYWORDS = frozenset([
+    'if', 'then', 'elseif', 'else', 'end',
+    'sub', 'function', 'do', 'loop', 'while',
+    'until', 'wend', 'exit', 'call',
+])
+
+def identifier_token(identifier):
+    # Returns the (type, val) of the token for an identifier, once
+    # normalized: the operator keywords are their own type, and a name
+    # followed by ":" is a 'label' (see tokenize for when it is not).
+    identifier = normalize_identifier(identifier)
+    if identifier in OPERATOR_KEYWORDS:
+        return identifier, identifier
+    elif identifier[-1] == ':':
+        return 'label', identifier
+    else:
+        return 'id', identifier
 
 def tokenize(string):
-    curline = 1
-    i = 0
-    keywords = [
-        'if', 'then', 'elseif', 'else', 'end',
-        'sub', 'function', 'do', 'loop', 'while',
-        'until', 'wend', 'exit', 'call',
-    ]
-    while i < len(string):
-        i = eat_whitespace(string, i)
-
-        if string[i] in '\n':
-            yield Token('EOL', 'EOL')
-            i += 1
-            curline += 1
-            continue
-
-        if string[i] == "'":
-            # eat comments
-            while i < len(string) and string[i] != '\n':
-                i += 1
-        elif string[i] in ALPHA:
-            i, identifier = take_while_in(string, i, IDENT)
-            identifier = normalize_identifier(identifier)
-            if identifier == 'rem':
-                # eat comments
-                while i < len(string) and string[i] != '\n':
-                    i += 1
-            elif identifier in ['mod', 'not', 'and', 'or', 'xor', 'eqv', 'imp']:
-                yield Token(identifier, identifier)
-            elif identifier[-1] == ':':
-                if identifier[:-1] in keywords:
-                    yield Token('id', identifier[:-1])
-                    yield Token('EOL', 'EOL')
+    """Split a module into a list of tokens.
+
+    Single-line IF statements ("IF c THEN s") get an implicit END IF, and
+    "name:" is only read as a label at the start of a statement or after
+    GOTO/GOSUB; anywhere else it is an identifier followed by ":".
+    """
+    tokens = []
+    append = tokens.append
+    # The frequent tokens (identifiers, symbols, numbers and ":") are made
+    # below without calling Token.__init__, which would cost about as much
+    # as everything else the loop does.
+    new_token = object.__new__
+    identifiers = {}
+    line = 1
+    line_start = -1     # position of the "\n" that ends the previous line
+    line_first_token = 0
+    for match in TOKEN_REGEX.finditer(string):
+        kind = match.lastgroup
+        start, end = match.span(kind)
+        if kind == 'id':
+            try:
+                type, val = identifiers[string[start:end]]
+            except KeyError:
+                type, val = identifiers[string[start:end]] = identifier_token(string[start:end])
+            if type == 'label':
+                col = start - line_start
+                previous = tokens[-1] if tokens else None
+                if val[:-1] not in BLOCK_KEYWORDS and \
+                   (previous is None or previous.type == 'EOL' or
+                    (previous.type == 'id' and previous.val in ('goto', 'gosub'))):
+                    append(Token('label', val, line, col))
                 else:
-                    yield Token('label', identifier)
-            else:
-                yield Token('id', identifier)
-        elif string[i] == '"':
-            i += 1
-            took = ''
-            while i < len(string) and string[i] != '"':
-                took += string[i]
-                i += 1
-            i += 1
-            yield Token('string', took)
-        elif string[i] in DIGIT + '.':
-            i, number = take_while_in(string, i, DIGIT + '.')
-            yield Token('num', number)
-        elif string[i] == ':':
-            yield Token('EOL', 'EOL')
-            i += 1
-        else:
-            kws = ['>=', '<=', '<>', '<', '>', '=',
-                   '(', ')', '+', '-', '*', '/', '\\', '^', ',', ';', ':', '#']
-            for kw in kws:
-                if string[i:i + len(kw)] == kw:
-                    yield Token(kw, kw)
-                    i += len(kw)
-                    break
+                    append(Token('id', val[:-1], line, col))
+                    append(Token('EOL', 'EOL', line, col + len(val) - 1))
+                continue
+        elif kind == 'symbol':
+            type = val = string[start:end]
+        elif kind == 'num':
+            type = 'num'
+            val = string[start:end]
+        elif kind == 'eol':
+            col = start - line_start
+            append(Token('EOL', 'EOL', line, col))
+            if len(tokens) > line_first_token + 1 and \
+               tokens[line_first_token].val == 'if' and \
+               tokens[line_first_token].type == 'id' and \
+               has_offending_if(string[line_start + 1:start]):
+                append(Token('id', 'end', line, col))
+                append(Token('id', 'if', line, col))
+                append(Token('EOL', 'EOL', line, col))
+            line += 1
+            line_start = start
+            line_first_token = len(tokens)
+            continue
+        elif kind == 'string':
+            if end - start > 1 and string[end - 1] == '"':
+                literal = string[start + 1:end - 1]
             else:
-                raise Exception('Unrecognized token: %s' % (string[i:i+10],))
-                break
-    yield Token('EOF', 'EOF')
-
-def fix_token_stream(stream):
-    pre_label_tokens = [
-        ('EOL', 'EOL'),
-        ('id', 'gosub'),
-        ('id', 'goto'),
-    ]
-    previous = Token('EOL', 'EOL') 
-    for tok in stream:
-        if tok.type == 'label' and previous.type_val not in pre_label_tokens:
-            yield Token('id', tok.val[:-1])
-            yield Token('EOL', 'EOL')
-            previous = Token('EOL', 'EOL')
+                literal = string[start + 1:end]
+            append(Token('string', literal, line, start - line_start))
+            if '\n' in literal:
+                line += literal.count('\n')
+                line_start = start + 1 + literal.rindex('\n')
+            continue
+        elif kind == 'colon':
+            type = val = 'EOL'
+        elif kind == 'error':
+            raise Exception('Unrecognized token at line %u, column %u: %s' % (
+                line, start - line_start, string[start:start + 10]))
         else:
-            yield tok 
-            previous = tok
+            # Comments.
+            continue
+        tok = new_token(Token)
+        tok.type = type
+        tok.val = val
+        tok.line = line
+        tok.col = start - line_start
+        append(tok)
+
+    col = len(string) - line_start
+    if len(tokens) > line_first_token and \
+       tokens[line_first_token].type_val == ('id', 'if') and \
+       has_offending_if(string[line_start + 1:]):
+        append(Token('EOL', 'EOL', line, col))
+        append(Token('id', 'end', line, col))
+        append(Token('id', 'if', line, col))
+    append(Token('EOF', 'EOF', line, col))
+    return tokens
 
 def is_terminator(tok):
-    return tok.type == 'EOL' or tok.type_val == ('id', 'else')
+    return tok.type == 'EOL' or (tok.type == 'id' and tok.val == 'else')
 
 class TokenStream(object):
 
     def __init__(self, string):
-        self._tokens = fix_token_stream(tokenize(preprocess(string)))
-        self._current = None
+        self._tokens = tokenize(string)
+        self._position = 0
 
     def peek(self):
-        if self._current is None:
-            self._current = self._tokens.next()
-        return self._current
+        return self._tokens[self._position]
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def ahead(self):
+        """The tokens from the current one on, without consuming them."""
+        position = self._position
+        while position < len(self._tokens):
+            yield self._tokens[position]
+            position += 1
 
     def next(self):
-        if self._current is None:
-            tok = self._tokens.next()
-        else:
-            tok = self._current
-            self._current = None
-        print tok
+        tok = self._tokens[self._position]
+        if tok.type != 'EOF':
+            self._position += 1
         return tok
 
     def __repr__(self):
@@ -176,6 +275,11 @@ class CodeGenerator(object):
 
     def __init__(self):
         self._code = []
+        # (module, line) of the statement being compiled.
+        self._source = None
+        # Position of the last label, for constant folding.
+        self._last_label_position = 0
+        self._folded = 0
 
         self._routines = {}
         self._routines['sub'] = {}
@@ -184,11 +288,14 @@ class CodeGenerator(object):
 
         self._last_label = 0
         self._labels = {}
+        self._symbols = {}
+        self._label_details = {}
 
         self._used_screens = set([0])
 
+        # Variable -> slot in the frames and in the shared storage of the
+        # VM, numbered as the variables are mangled.
         self._var_names = {}
-        self._last_var = 0
 
         self._soundgen = lang.sound.SoundGenerator(DEFAULT_SAMPLES_PER_SECOND)
 
@@ -208,15 +315,15 @@ class CodeGenerator(object):
         return last
 
     def mangle(self, var):
+        if var not in self._var_names:
+            self._var_names[var] = len(self._var_names)
         if DEBUG:
-            return '"%s"' % (var,)
+            return '%u /* %s */' % (self._var_names[var], var)
         else:
-            if var in self._var_names:
-                return self._var_names[var]
-            else:
-                self._last_var += 1
-                self._var_names[var] = self._last_var
-                return self._last_var
+            return 'V%u' % (self._var_names[var],)
+
+    def set_source(self, module, line):
+        self._source = (module, line)
 
     def set_label_at_current_position(self, label):
         if label not in self._labels:
@@ -224,104 +331,100 @@ class CodeGenerator(object):
         if self._labels[label] is not None:
             raise Exception('Label "L%s" was already previously set.' % (label,))
         self._labels[label] = len(self._code)
+        self._last_label_position = len(self._code)
 
-    def produce_op(self, op):
-        if DEBUG:
-            lineno = ' /* :%u */' % (len(self._code),)
-        else:
-            lineno = ''
-        self._code.append(op + lineno)
+    def produce_op(self, opcode, *operands):
+        self._code.append(Instruction(opcode, operands, self._source))
 
     def call_primitive_statement(self, stmt, nargs=0):
-        self.produce_op("new OpCallPrimitiveStatement('%s', %u)" % (stmt.upper(), nargs))
+        self.produce_op('CallPrimitiveStatement', Primitive(stmt.upper()), nargs)
 
     def call_primitive_function(self, func, nargs=0):
-        self.produce_op("new OpCallPrimitiveFunction('%s', %u)" % (func.upper().replace('\\', '\\\\'), nargs))
+        if self.fold_primitive_function(func.upper(), nargs):
+            return
+        self.produce_op('CallPrimitiveFunction', Primitive(func.upper()), nargs)
 
     def jump(self, label):
-        self.produce_op("new OpJump(L%u)" % (label,))
+        self.produce_op('Jump', Label(label))
 
     def jump_if_false(self, label):
-        self.produce_op("new OpJumpIfFalse(L%u)" % (label,))
+        self.produce_op('JumpIfFalse', Label(label))
 
     def jump_gosub(self, label):
-        self.produce_op("new OpGosub(L%u)" % (label,))
+        self.produce_op('Gosub', Label(label))
 
     def jump_return(self):
-        self.produce_op("new OpReturn()")
+        self.produce_op('Return')
+
+    def fold_primitive_function(self, name, nargs):
+        # Replace the pushes of the arguments and the call by a push of
+        # the result, if all the arguments are constants. No label may
+        # point in between, since the arguments are not pushed when
+        # jumping there.
+        start = len(self._code) - nargs
+        if not lang.folding.is_foldable(name) or start < self._last_label_position:
+            return False
+        args = []
+        for op in self._code[start:]:
+            if not op.is_constant():
+                return False
+            args.append(op.operands[0])
+        value = lang.folding.fold(name, args)
+        if value is lang.folding.NOT_FOLDABLE:
+            return False
+        del self._code[start:]
+        self._folded += nargs
+        self.produce_op('PushConstant', value)
+        return True
 
     def push_constant(self, value):
-        if isinstance(value, str):
-            self.produce_op("new OpPushConstant(\"%s\")" % (escape_string(value),))
-        else:
-            self.produce_op("new OpPushConstant(%s)" % (value,))
+        self.produce_op('PushConstant', lang.folding.js_value(value))
 
     def push_label(self, label):
-        self.produce_op("new OpPushConstant(L%u)" % (label,))
+        self.produce_op('PushConstant', Label(label))
 
     def push_sound_constant(self, sound_id):
-        self.produce_op("new OpPushConstant(SND_%u)" % (sound_id,))
+        self.produce_op('PushConstant', Sound(sound_id))
 
     def push_draw_command(self, cmds):
-        self.produce_op("new OpPushConstant([%s])" % (
-            ', '.join([
-                '["%s", %s]' % (cmd_args[0], ', '.join(map(str, cmd_args[1:])))
-                for cmd_args in cmds
-            ]),)
-        )
+        self.produce_op('PushConstant', DrawCommands(cmds))
 
-    def set_array_ref(self, var):
-        self.produce_op("new OpSetArrayRef(%s)" % (self.mangle(var),))
+    def set_array_ref(self, var, nargs):
+        self.produce_op('SetArrayRef', Var(var), nargs)
 
     def set_ref(self, var):
-        self.produce_op("new OpSetRef(%s)" % (self.mangle(var),))
+        self.produce_op('SetRef', Var(var))
 
     def get_ref(self, var):
-        self.produce_op("new OpGetRef(%s)" % (self.mangle(var),))
+        self.produce_op('GetRef', Var(var))
 
     def get_array_ref(self, var, nargs):
-        self.produce_op("new OpGetArrayRef(%s, %u)" % (self.mangle(var), nargs))
+        self.produce_op('GetArrayRef', Var(var), nargs)
 
     def mid_assign(self, var, right_index):
-        self.produce_op("new OpMidAssign(%s, %s)" % (self.mangle(var), 'true' if right_index else 'false'))
+        self.produce_op('MidAssign', Var(var), bool(right_index))
 
-    def mid_array_assign(self, var, right_index):
-        self.produce_op("new OpMidArrayAssign(%s, %s)" % (self.mangle(var), 'true' if right_index else 'false'))
+    def mid_array_assign(self, var, right_index, nargs):
+        self.produce_op('MidArrayAssign', Var(var), bool(right_index), nargs)
 
     def enter_routine(self, params):
-        self.produce_op("new OpEnter([%s])" % (','.join([str(self.mangle(param)) for param in params]),))
+        self.produce_op('Enter', [Var(param) for param in params])
 
     def leave_routine(self):
-        self.produce_op("new OpLeave()")
+        self.produce_op('Leave')
 
     def push_retval(self, function_name):
         # note: we consider the function_name as a variable
-        self.produce_op("new OpPushRetval(%s)" % (self.mangle(function_name),))
+        self.produce_op('PushRetval', Var(function_name))
 
     def for_start(self, index):
-        self.produce_op("new OpForStart(%s, %s, %s)" % (
-                self.mangle(index),
-                self.mangle(index + ':upper'),
-                self.mangle(index + ':step'),
-            )
-        )
+        self.produce_op('ForStart', Var(index), Var(index + ':upper'), Var(index + ':step'))
 
     def for_check(self, index, address):
-        self.produce_op("new OpForCheck(%s, %s, %s, L%s)" % (
-                self.mangle(index),
-                self.mangle(index + ':upper'),
-                self.mangle(index + ':step'),
-                address
-            )
-        )
+        self.produce_op('ForCheck', Var(index), Var(index + ':upper'), Var(index + ':step'), Label(address))
 
     def for_next(self, index, address):
-        self.produce_op("new OpForNext(%s, %s, L%s)" % (
-                self.mangle(index),
-                self.mangle(index + ':step'),
-                address
-            )
-        )
+        self.produce_op('ForNext', Var(index), Var(index + ':step'), Label(address))
 
     def stack_dup(self):
         self.call_primitive_statement('_stack_dup')
@@ -344,14 +447,95 @@ class CodeGenerator(object):
         self.push_sound_constant(sound_id)
         self.call_primitive_statement('_PLAY_SOUND', 1)
 
-    def write_output(self, out_fn, original_names={}):
+    def fragment(self, module, symbols, label_details, run_modules):
+        return ModuleFragment(
+            module=module,
+            code=self._code,
+            labels=self._labels,
+            symbols=symbols,
+            label_details=label_details,
+            shared=self._shared,
+            used_screens=self._used_screens,
+            sounds=self._soundgen.sounds(),
+            run_modules=run_modules,
+            folded=self._folded,
+        )
+
+    def control_flow_graph(self):
+        return lang.ir.ControlFlowGraph(self._code, self._labels)
+
+    def optimize(self):
+        self._code, self._labels = lang.optimizer.optimize(self._code, self._labels)
+
+    def fuse(self):
+        self._code, self._labels, fused = lang.fusion.fuse(self._code, self._labels)
+        return fused
+
+    def infer_types(self):
+        self._code, proven = lang.inference.infer_types(self._code, self._labels, self._shared)
+        return proven
+
+    def opcode_count(self):
+        return len(self._code)
+
+    def used_primitives(self):
+        return set([
+            operand.name
+            for op in self._code
+            for operand in op.operands
+            if isinstance(operand, Primitive)
+        ])
+
+    def used_opcodes(self):
+        return set([op.opcode for op in self._code])
+
+    def link_fragment(self, fragment):
+        # Give every label and sound of the fragment a program-wide
+        # number. Labels are shared between modules by their
+        # full name ("MODULE:name"), so that RUN "MODULE" can refer to a
+        # module that has not been linked yet.
+        label_relocations = {}
+        sound_relocations = {}
+        names = dict([(label, full_name) for full_name, label in fragment.symbols.items()])
+        for label in sorted(fragment.labels):
+            full_name = names.get(label)
+            if full_name is None:
+                new_label = self.make_label()
+            elif full_name in self._symbols:
+                new_label = self._symbols[full_name]
+            else:
+                new_label = self.make_label()
+                self._symbols[full_name] = new_label
+            label_relocations[label] = new_label
+            if label in fragment.label_details:
+                self._label_details[new_label] = fragment.label_details[label]
+
+        for label, target in sorted(fragment.labels.items()):
+            if target is not None:
+                new_label = label_relocations[label]
+                if self._labels[new_label] is not None:
+                    raise Exception('Label "%s" is defined by more than one module.' % (
+                        self._label_details.get(new_label, 'L%u' % (new_label,)),)
+                    )
+                self._labels[new_label] = len(self._code) + target
+
+        for sound_id, definition in fragment.sounds:
+            sound_relocations[sound_id] = self._soundgen.register_sound(definition)
+
+        for op in fragment.code:
+            self._code.append(op.relocate(label_relocations, sound_relocations))
+
+        self._shared.update(fragment.shared)
+        self._used_screens.update(fragment.used_screens)
+
+    def write_output(self, out_fn):
         f = open('lang/template.html', 'r')
         template = f.read()
         f.close()
         
         label_decls = []
         for label_name, target in self._labels.items():
-            orig = original_names.get(label_name, '<internal label>')
+            orig = self._label_details.get(label_name, '<internal label>')
             if target is None:
                 raise Exception('label "L%u" ("%s") has no target' % (label_name, orig))
             if DEBUG and orig != '<internal label>':
@@ -360,21 +544,59 @@ class CodeGenerator(object):
                 detail = ''
             label_decls.append('var L%u = %u;%s' % (label_name, target, detail))
 
-        shared = 'var shared = {' + ','.join(['%s: 1' % (self.mangle(var),) for var in self._shared]) + '};'
+        # Variables get their numbers as they are mangled, so the opcodes
+        # have to be serialized before declaring them.
+        if OUTPUT_FORMAT == 'bytecode':
+            # Labels are resolved in the bytecode.
+            label_decls = []
+            with lang.profiler.phase('bytecode'):
+                data, pool = lang.bytecode.encode(self._code, self._labels, self.mangle)
+            code = 'new Bytecode(\n\t\t\t"%s",\n\t\t\t%s\n\t\t)' % (data, pool.js())
+        else:
+            if DEBUG:
+                opcodes = ',\n'.join([
+                    3 * '\t' + '%s /* :%u%s */' % (
+                        op.js(self.mangle),
+                        i,
+                        ' %s:%u' % op.source if op.source is not None else '',
+                    )
+                    for i, op in enumerate(self._code)
+                ])
+            else:
+                opcodes = ',\n'.join([3 * '\t' + op.js(self.mangle) for op in self._code])
+            code = '[\n' + opcodes + '\n\t\t]'
+
+        shared = 'var shared = [%s];' % (', '.join([self.mangle(var) for var in sorted(self._shared)]),)
         labels = '\n'.join([2 * '\t' + decl for decl in label_decls])
-        opcodes = ',\n'.join([3 * '\t' + op for op in self._code])
+
+        if BACKEND == 'aot':
+            with lang.profiler.phase('aot'):
+                blocks = lang.aot.compile_blocks(self._code, self._labels, self._shared, self.mangle, comments=DEBUG)
+        else:
+            blocks = 'null'
+
+        # Every variable has been mangled by now.
+        variables = sorted(self._var_names.items(), key=lambda item: item[1])
+        if DEBUG:
+            names = ['"%s"' % (var,) for var, var_id in variables]
+            var_decls = []
+        else:
+            names = ['"V%u"' % (var_id,) for var, var_id in variables]
+            var_decls = ['var V%u = %u;' % (var_id, var_id) for var, var_id in variables]
+        var_decls.append('var variables = [%s];' % (', '.join(names),))
+        shared = '\n'.join([2 * '\t' + decl for decl in var_decls]) + '\n' + 2 * '\t' + shared
 
         contents = template
 
         screens = '\n'.join([
             "\t<script type='text/javascript' src='../runtime/fonts/screen%u.js'></script>" % (screen,)
-            for screen in self._used_screens
+            for screen in sorted(self._used_screens)
         ])
 
         available_screens = '[\n' + \
             ',\n'.join([
                 "\t\t\t{'number': %u, 'data': SCREEN%u_DATA}" % (screen, screen)
-                for screen in self._used_screens
+                for screen in sorted(self._used_screens)
             ]) + \
             '\n\t\t]'
 
@@ -388,12 +610,46 @@ class CodeGenerator(object):
         contents = contents.replace('/*$SHARED*/', shared)
         contents = contents.replace('/*$LABELS*/', '\n' + labels)
         contents = contents.replace('/*$SOUNDS*/', '\n' + sounds)
-        contents = contents.replace('/*$OPCODES*/', '\n' + opcodes + '\n\t\t')
+        contents = contents.replace('/*$CODE*/', code)
+        contents = contents.replace('/*$BLOCKS*/', blocks)
+
+        if BUNDLE:
+            with lang.profiler.phase('bundle'):
+                bundle = lang.bundle.bundle(contents, self.used_primitives(), self.used_opcodes())
+            print 'Bundle: %u bytes' % (bundle.size(),)
+            for component, size in bundle.sizes:
+                print '  %-20s %7u' % (component, size)
+            lang.profiler.count('bundle_bytes', bundle.size())
+            contents = bundle.html
 
         f = open(out_fn, 'w')
         f.write(contents)
         f.close()
 
+class ModuleFragment(object):
+    """The compiled code of a single module (a file reached through RUN).
+
+    Labels, sounds and variables are numbered locally to the module and
+    get relocated when the fragment is linked into a program, so that a
+    fragment can be reused regardless of the modules around it.
+    """
+
+    def __init__(self, module, code, labels, symbols, label_details,
+                 shared, used_screens, sounds, run_modules, folded=0):
+        self.module = module
+        self.code = code                    # list of lang.ir.Instruction
+        self.labels = labels                # label -> position (None if external)
+        self.symbols = symbols              # "MODULE:name" -> label
+        self.label_details = label_details  # label -> name for diagnostics
+        self.shared = shared
+        self.used_screens = used_screens
+        self.sounds = sounds
+        self.run_modules = run_modules
+        self.folded = folded                # number of ops removed by constant folding
+
+    def __repr__(self):
+        return '<fragment %s: %u ops>' % (self.module, len(self.code))
+
 class Block(object):
 
     def __init__(self, kind, labels):
@@ -405,8 +661,9 @@ class Block(object):
 
 class Parser(object):
 
-    def __init__(self):
-        self._codegen = CodeGenerator()
+    def __init__(self, cache=None):
+        self._cache = cache
+        self._program = CodeGenerator()
         self._operators = [
             ('binary', ['imp']),
             ('binary', ['eqv']),
@@ -422,6 +679,14 @@ class Parser(object):
             ('unary', ['-']),
             ('binary', ['^']),
         ]
+        # Operator -> precedence level (its index in self._operators),
+        # for the precedence climbing expression parser.
+        self._binary_operators = {}
+        self._unary_operators = {}
+        for level, (fixity, ops) in enumerate(self._operators):
+            table = self._unary_operators if fixity == 'unary' else self._binary_operators
+            for op in ops:
+                table[op] = level
         self._builtin_subs = [
             'cls',
             'color',
@@ -457,10 +722,7 @@ class Parser(object):
             'ucase$',
             'val',
         ]
-        self._label_names = {}
-        self._original_label_names = {}
-        self._current_routine = '_main'
-        self._blocks = []
+        self._statement_parsers = self.statement_parsers()
 
         self._current_module = None
         self._already_parsed_modules = set([])
@@ -563,7 +825,8 @@ class Parser(object):
             raise Exception('Invalid parameter declaration: %s' % (self._stream,))
 
     def parse_variable_declaration(self, shared=False):
-        # id {|(expr1)|(expr1 TO expr2)}
+        # id {|(bounds [, bounds]*)}
+        # where bounds is expr1 or expr1 TO expr2
         var = self.parse_identifier().val
         if shared:
             self._codegen.declare_shared(var)
@@ -571,21 +834,61 @@ class Parser(object):
         initial_value = initial_value_for(var)
 
         if self.peek().type == '(':
+            # _MKARRAY(initial value, suffix, lower, upper [, lower, upper]*)
             self.parse_symbol('(')
             self._codegen.push_constant(initial_value)
-            self.parse_expression()
-            if self.peek().type_val == ('id', 'to'):
-                self.parse_keyword('to')
-                self.parse_expression()
-                self._codegen.call_primitive_function('_mkarray', 3)
-            else:
-                self._codegen.call_primitive_function('_mkarray', 2)
+            self._codegen.push_constant(type_suffix(var))
+            dimensions = 0
+            while True:
+                self.parse_array_bounds()
+                dimensions += 1
+                if self.peek().type != ',':
+                    break
+                self.next()
+            if dimensions > lang.ir.MAX_ARRAY_DIMENSIONS:
+                raise Exception('Array "%s" has more than %u dimensions.' % (
+                    var, lang.ir.MAX_ARRAY_DIMENSIONS))
+            self._codegen.call_primitive_function('_mkarray', 2 + 2 * dimensions)
             self._codegen.set_ref(var)
             self.parse_symbol(')')
         else:
             self._codegen.push_constant(initial_value)
             self._codegen.set_ref(var)
 
+    def parse_array_bounds(self):
+        # expr1 TO expr2, or expr2 with expr1 = 0: pushes both.
+        if not self.bounds_have_lower():
+            self._codegen.push_constant(0)
+        self.parse_expression()
+        if self.peek().type_val == ('id', 'to'):
+            self.parse_keyword('to')
+            self.parse_expression()
+
+    def bounds_have_lower(self):
+        depth = 0
+        for tok in self._stream.ahead():
+            if tok.type == '(':
+                depth += 1
+            elif tok.type == ')' and depth > 0:
+                depth -= 1
+            elif depth == 0 and tok.type_val == ('id', 'to'):
+                return True
+            elif (depth == 0 and tok.type in (',', ')')) or tok.type in ('EOL', 'EOF'):
+                return False
+        return False
+
+    def parse_index_list(self):
+        """Parse (expr [, expr]*), returning the number of indices."""
+        self.parse_symbol('(')
+        nargs = 1
+        self.parse_expression()
+        while self.peek().type == ',':
+            self.next()
+            self.parse_expression()
+            nargs += 1
+        self.parse_symbol(')')
+        return nargs
+
     def parse_variable_declaration_list(self, shared=False):
         # variable_declaration [, variable_declaration]*
         self.parse_variable_declaration(shared)
@@ -614,9 +917,10 @@ class Parser(object):
         #self.parse_eol()
 
     def parse_atomic_expression(self):
-        if self.peek().type == 'string':
+        tok = self.peek()
+        if tok.type == 'string':
             self._codegen.push_constant(self.parse_string())
-        elif self.peek().type == 'id':
+        elif tok.type == 'id':
             var = self.next().val
             subindex = False
             nargs = 0
@@ -640,7 +944,7 @@ class Parser(object):
                 self._codegen.get_ref(var)
             else:
                 self._codegen.get_array_ref(var, nargs)
-        elif self.peek().type == '(':
+        elif tok.type == '(':
             self.next()
             self.parse_expression()
             if self.next().type != ')':
@@ -649,30 +953,34 @@ class Parser(object):
             self._codegen.push_constant(self.parse_number())
 
     def parse_expression(self, level=0):
-        if level == len(self._operators):
-            self.parse_atomic_expression()
+        """Parse an expression made of operators of the given precedence
+        level or above (see self._operators) by precedence climbing.
+
+        Emits the same code as descending through every level would: a
+        prefix operator is only recognized at or above its own level, so
+        e.g. "a + NOT b" is rejected, and its operand extends over the
+        operators that bind tighter than it.
+        """
+        stream = self._stream
+        opr = stream.peek().type
+        unary_level = self._unary_operators.get(opr)
+        if unary_level is not None and unary_level >= level:
+            stream.next()
+            self.parse_expression(unary_level + 1)
+            self._codegen.call_primitive_function(opr, 1)
         else:
-            fixity, ops = self._operators[level]
-            if fixity == 'unary':
-                self.parse_expression_unary_op(ops, level)
-            else:
-                self.parse_expression_binary_op(ops, level)
+            self.parse_atomic_expression()
 
-    def parse_expression_binary_op(self, ops, level):
-        self.parse_expression(level=level + 1)
-        while self.peek().type in ops:
-            opr = self.next().type
-            self.parse_expression(level=level + 1)
+        binary_operators = self._binary_operators
+        while True:
+            opr = stream.peek().type
+            binary_level = binary_operators.get(opr)
+            if binary_level is None or binary_level < level:
+                break
+            stream.next()
+            self.parse_expression(binary_level + 1)
             self._codegen.call_primitive_function(opr, 2)
 
-    def parse_expression_unary_op(self, ops, level):
-        if self.peek().type in ops:
-            opr = self.next().type
-            self.parse_expression(level=level + 1)
-            self._codegen.call_primitive_function(opr, 1)
-        else:
-            self.parse_expression(level=level + 1)
-
     def parse_print(self):
         self.parse_keyword('print')
         if is_terminator(self.peek()):
@@ -758,16 +1066,13 @@ class Parser(object):
         if self.peek().type_val != ('id', 'mid$'):
             return False
 
-        is_array = False
+        nindices = 0
         self.parse_keyword('mid$')
         self.parse_symbol('(')
 
         var = self.parse_identifier().val
         if self.peek().type == '(':
-            self.parse_symbol('(')
-            self.parse_expression()
-            self.parse_symbol(')')
-            is_array = True
+            nindices = self.parse_index_list()
 
         self.parse_symbol(',')
         self.parse_expression()
@@ -781,8 +1086,8 @@ class Parser(object):
         self.parse_symbol('=')
         self.parse_expression()
 
-        if is_array:
-            self._codegen.mid_array_assign(var, right_index)
+        if nindices > 0:
+            self._codegen.mid_array_assign(var, right_index, nindices)
         else:
             self._codegen.mid_assign(var, right_index)
         return True
@@ -809,16 +1114,12 @@ class Parser(object):
             self._codegen.set_ref(identifier)
             return
 
-        nargs = 1
-
         array = False
         if self.peek().type == '(':
             array = True
-            self.next()
-            self.parse_expression()
-            if self.next().type != ')':
-                raise Exception('Expected ")".')
+            nargs = self.parse_index_list()
         else:
+            nargs = 1
             self.parse_expression()
 
         if self.peek().type == '=':
@@ -828,7 +1129,7 @@ class Parser(object):
             self.next()
             self.parse_expression()
             #self.parse_eol()
-            self._codegen.set_array_ref(identifier)
+            self._codegen.set_array_ref(identifier, nargs)
             return
 
         while not is_terminator(self.peek()):
@@ -1126,8 +1427,7 @@ class Parser(object):
         fn = self.parse_string()
         self._codegen.call_primitive_function('_RESET')
         self._codegen.jump(self.label_for('_main', module=fn))
-        if fn not in self._already_parsed_modules:
-            self._pending_modules.add(fn)
+        self._run_modules.add(fn)
 
     def parse_on(self):
         self.parse_keyword('on')
@@ -1248,84 +1548,87 @@ class Parser(object):
         self._codegen.push_draw_command(lang.draw.parse_draw_commands(string))
         self._codegen.call_primitive_statement('_draw', 1)
 
+    def statement_parsers(self):
+        return {
+            'declare': self.parse_routine_declaration,
+            'common': self.parse_dim_declaration,
+            'dim': self.parse_dim_declaration,
+            'print': self.parse_print,
+            'goto': self.parse_goto,
+            'gosub': self.parse_gosub,
+            'return': self.parse_return,
+            'end': self.parse_end,
+            'sub': self.parse_routine_definition,
+            'function': self.parse_routine_definition,
+            'call': self.parse_call,
+            'if': self.parse_if,
+            'elseif': self.parse_elseif,
+            'else': self.parse_else,
+            'exit': self.parse_exit,
+            'do': self.parse_do,
+            'loop': self.parse_loop,
+            'while': self.parse_while,
+            'wend': self.parse_wend,
+            'for': self.parse_for,
+            'next': self.parse_next,
+            'select': self.parse_select,
+            'case': self.parse_case,
+            'open': self.parse_open,
+            'input': self.parse_input,
+            'screen': self.parse_screen,
+            'run': self.parse_run,
+            'on': self.parse_on,
+            'timer': self.parse_timer,
+            'line': self.parse_line,
+            'circle': self.parse_circle,
+            'beep': self.parse_beep,
+            'play': self.parse_play,
+            'preset': self.parse_preset,
+            'paint': self.parse_paint,
+            'draw': self.parse_draw,
+        }
+
     def parse_statement(self):
         self.parse_maybe_label()
-        if self.peek().type_val == ('id', 'declare'):
-            self.parse_routine_declaration()
-        elif self.peek().type_val in [('id', 'common'), ('id', 'dim')]:
-            self.parse_dim_declaration()
-        elif self.peek().type_val == ('id', 'print'):
-            self.parse_print()
-        elif self.peek().type_val == ('id', 'goto'):
-            self.parse_goto()
-        elif self.peek().type_val == ('id', 'gosub'):
-            self.parse_gosub()
-        elif self.peek().type_val == ('id', 'return'):
-            self.parse_return()
-        elif self.peek().type_val == ('id', 'end'):
-            self.parse_end()
-        elif self.peek().type_val in [('id', 'sub'), ('id', 'function')]:
-            self.parse_routine_definition()
-        elif self.peek().type_val == ('id', 'call'):
-            self.parse_call()
-        elif self.peek().type_val == ('id', 'if'):
-            self.parse_if()
-        elif self.peek().type_val == ('id', 'elseif'):
-            self.parse_elseif()
-        elif self.peek().type_val == ('id', 'else'):
-            self.parse_else()
-        elif self.peek().type_val == ('id', 'exit'):
-            self.parse_exit()
-        elif self.peek().type_val == ('id', 'do'):
-            self.parse_do()
-        elif self.peek().type_val == ('id', 'loop'):
-            self.parse_loop()
-        elif self.peek().type_val == ('id', 'while'):
-            self.parse_while()
-        elif self.peek().type_val == ('id', 'wend'):
-            self.parse_wend()
-        elif self.peek().type_val == ('id', 'for'):
-            self.parse_for()
-        elif self.peek().type_val == ('id', 'next'):
-            self.parse_next()
-        elif self.peek().type_val == ('id', 'select'):
-            self.parse_select()
-        elif self.peek().type_val == ('id', 'case'):
-            self.parse_case()
-        elif self.peek().type_val == ('id', 'open'):
-            self.parse_open()
-        elif self.peek().type_val == ('id', 'input'):
-            self.parse_input() # TODO
-        elif self.peek().type_val == ('id', 'screen'):
-            self.parse_screen()
-        elif self.peek().type_val == ('id', 'run'):
-            self.parse_run()
-        elif self.peek().type_val == ('id', 'on'):
-            self.parse_on()
-        elif self.peek().type_val == ('id', 'timer'):
-            self.parse_timer()
-        elif self.peek().type_val == ('id', 'line'):
-            self.parse_line()
-        elif self.peek().type_val == ('id', 'circle'):
-            self.parse_circle()
-        elif self.peek().type_val == ('id', 'beep'):
-            self.parse_beep()
-        elif self.peek().type_val == ('id', 'play'):
-            self.parse_play()
-        elif self.peek().type_val == ('id', 'preset'):
-            self.parse_preset()
-        elif self.peek().type_val == ('id', 'paint'):
-            self.parse_paint()
-        elif self.peek().type_val == ('id', 'draw'):
-            self.parse_draw()
-        # after every other identifier
-        elif self.peek().type_val == ('id', 'let') or self.peek().type == 'id':
-            self.parse_assignment_or_call()
-        elif self.peek().type == 'EOL':
+        tok = self.peek()
+        self._codegen.set_source(self._current_module, tok.line)
+        if tok.type == 'id':
+            if tok.val in self._statement_parsers:
+                self._statement_parsers[tok.val]()
+            else:
+                # after every other identifier
+                self.parse_assignment_or_call()
+        elif tok.type == 'EOL':
             # empty statement
             self.next()
         else:
-            raise Exception('Unknown statement: %s' % (self.peek(),))
+            raise Exception('Unknown statement: %s' % (tok,))
+
+    def parse_module(self, module, contents):
+        self._codegen = CodeGenerator()
+        self._label_names = {}
+        self._original_label_names = {}
+        self._current_routine = '_main'
+        self._blocks = []
+        self._run_modules = set([])
+
+        with lang.profiler.phase('tokenize'):
+            self._stream = TokenStream(contents)
+        lang.profiler.count('tokens', len(self._stream))
+
+        with lang.profiler.phase('parse'):
+            self._current_module = module
+            self._codegen.set_label_at_current_position(self.label_for('_main'))
+            while self.peek().type != 'EOF':
+                self.parse_statement()
+            self._codegen.call_primitive_statement('system')
+
+        return self._codegen.fragment(
+            module,
+            self._label_names,
+            self._original_label_names,
+            self._run_modules
+        )
 
     def parse_program(self, root_fn):
         self._pending_modules.add(os.path.basename(root_fn))
@@ -1340,25 +1643,82 @@ class Parser(object):
             print 80 * '-'
             print in_fn 
 
-            f = open(in_fn)
-            contents = f.read()
-            f.close()
-            self._stream = TokenStream(contents)
+            module = os.path.basename(in_fn)
+            self._already_parsed_modules.add(module)
+
+            with lang.profiler.module(module):
+                with lang.profiler.phase('read'):
+                    f = open(in_fn)
+                    contents = f.read()
+                    f.close()
+
+                fragment = None
+                if self._cache is not None:
+                    with lang.profiler.phase('cache load'):
+                        fragment = self._cache.load(module, contents)
+                if fragment is None:
+                    fragment = self.parse_module(module, contents)
+                    if self._cache is not None:
+                        with lang.profiler.phase('cache store'):
+                            self._cache.store(module, contents, fragment)
+                else:
+                    print '(cached)'
+                    lang.profiler.count('cached')
 
-            self._current_module = os.path.basename(in_fn)
-            self._already_parsed_modules.add(self._current_module)
-            self._codegen.set_label_at_current_position(self.label_for('_main'))
-            while self.peek().type != 'EOF':
-                self.parse_statement()
-            self._codegen.call_primitive_statement('system')
+                lang.profiler.count('opcodes', len(fragment.code))
+                lang.profiler.count('labels', len(fragment.labels))
+                lang.profiler.count('sounds', len(fragment.sounds))
+                lang.profiler.count('folded', fragment.folded)
+
+                with lang.profiler.phase('link'):
+                    self._program.link_fragment(fragment)
+
+            for fn in fragment.run_modules:
+                if fn not in self._already_parsed_modules:
+                    self._pending_modules.add(fn)
 
     def write_output(self, out_fn):
-        self._codegen.write_output(out_fn, self._original_label_names)
+        """Optimize the program and write it to out_fn. Returns the
+        number of opcodes before and after optimization."""
+        before = self._program.opcode_count()
+        if OPTIMIZE:
+            with lang.profiler.phase('optimize'):
+                self._program.optimize()
+                if FUSE:
+                    lang.profiler.count('fused', self._program.fuse())
+        after = self._program.opcode_count()
+        print 'Opcodes: %u before optimization, %u after' % (before, after)
+        lang.profiler.count('opcodes', after)
+        lang.profiler.count('optimized', before - after)
+        if INFER_TYPES:
+            with lang.profiler.phase('types'):
+                lang.profiler.count('unchecked', self._program.infer_types())
+
+        if lang.profiler.active().enabled:
+            with lang.profiler.phase('cfg'):
+                cfg = self._program.control_flow_graph()
+            lang.profiler.count('blocks', len(cfg.blocks))
+        with lang.profiler.phase('write_output'):
+            self._program.write_output(out_fn)
+        return before, after
 
 class Compiler(object):
 
-    def compile_file(self, in_fn, out_fn):
-        parser = Parser()
-        parser.parse_program(in_fn)
-        parser.write_output(out_fn)
-
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            self._cache = None
+        else:
+            self._cache = lang.cache.CompileCache(cache_dir, compiler_fingerprint())
+
+    def compile_file(self, in_fn, out_fn, profiler=None):
+        """Compile the program in in_fn into out_fn. Returns the number
+        of opcodes before and after optimization."""
+        if profiler is not None:
+            profiler.start()
+        try:
+            parser = Parser(self._cache)
+            parser.parse_program(in_fn)
+            return parser.write_output(out_fn)
+        finally:
+            if profiler is not None:
+                profiler.stop()
@@ -0,0 +1,288 @@
+import math
+
+from lang.ir import MAX_SAFE_INTEGER
+
+# Constant folding of primitive function calls.
+#
+# The folded values must be exactly those the runtime would compute
+# (runtime/builtins.js), so numbers are JavaScript doubles (Python floats)
+# and strings are byte strings whose characters are the JavaScript char
+# codes. Whenever the runtime would raise an error (wrong argument types,
+# division by zero, ...) or its result depends on something Python cannot
+# reproduce bit for bit (Math.log, Number.prototype.toString, Unicode case
+# mappings), the call is not folded and is left for the runtime.
+
+NOT_FOLDABLE = object()
+
+# Do not inline strings longer than this (e.g. STRING$(10000, "-")).
+MAX_FOLDED_STRING_LENGTH = 1024
+
+def js_value(value):
+    """Value the runtime sees for a constant emitted by push_constant."""
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, float):
+        # push_constant writes floats with str(), i.e. 12 significant digits.
+        return float('%s' % (value,))
+    else:
+        return float(value)
+
+def is_number(x):
+    return isinstance(x, float)
+
+def is_string(x):
+    return isinstance(x, str)
+
+def is_scalar(x):
+    return is_number(x) or is_string(x)
+
+def is_finite(x):
+    return not (math.isinf(x) or math.isnan(x))
+
+def from_boolean(b):
+    return -1.0 if b else 0.0
+
+def to_int32(x):
+    if not is_finite(x):
+        return 0
+    n = int(x) % 2 ** 32
+    if n >= 2 ** 31:
+        n -= 2 ** 32
+    return n
+
+def to_integer(x):
+    # ToIntegerOrInfinity, as used by String.prototype.substring.
+    if math.isnan(x):
+        return 0
+    elif math.isinf(x):
+        return x
+    return int(x)
+
+def substring(s, start, end):
+    start = min(max(to_integer(start), 0), len(s))
+    end = min(max(to_integer(end), 0), len(s))
+    if start > end:
+        start, end = end, start
+    return s[int(start):int(end)]
+
+def repetitions(n):
+    # for (var i = 0; i < n; i++) runs ceil(n) times.
+    if n <= 0:
+        return 0
+    return int(math.ceil(n))
+
+def is_char_code(x):
+    return x.is_integer() and 0 <= x < 256
+
+def is_ascii(s):
+    return all([ord(c) < 128 for c in s])
+
+def power(x, y):
+    # utilities.js power(): exponentiation by squaring.
+    if y == 0:
+        return 1.0
+    if y < 0:
+        if x == 0:
+            return NOT_FOLDABLE
+        x = 1 / x
+        y = -y
+    res = 1.0
+    while y > 0:
+        if y % 2 == 1:
+            res = res * x
+        x = x * x
+        y = math.floor(y / 2)
+    return res
+
+def fold_abs(x):
+    return abs(x)
+
+def fold_asc(s):
+    if len(s) == 0:
+        return NOT_FOLDABLE
+    return float(ord(s[0]))
+
+def fold_chr(x):
+    if not is_char_code(x):
+        return NOT_FOLDABLE
+    return chr(int(x))
+
+def fold_int(x):
+    return math.floor(x)
+
+def fold_lcase(s):
+    if not is_ascii(s):
+        return NOT_FOLDABLE
+    return s.lower()
+
+def fold_ucase(s):
+    if not is_ascii(s):
+        return NOT_FOLDABLE
+    return s.upper()
+
+def fold_left(s, n):
+    if n > len(s):
+        n = len(s)
+    return substring(s, 0, n)
+
+def fold_right(s, n):
+    if n > len(s):
+        n = len(s)
+    return substring(s, len(s) - n, len(s))
+
+def fold_mid(s, i, j=None):
+    i = i - 1
+    if j is None:
+        j = len(s) - i
+    i = 0 if i < 0 else i
+    i = len(s) if i > len(s) else i
+    j = 0 if j < 0 else j
+    j = len(s) - i if i + j > len(s) else j
+    return substring(s, i, i + j)
+
+def fold_len(s):
+    return float(len(s))
+
+def fold_ltrim(s):
+    return s.lstrip(' ')
+
+def fold_rtrim(s):
+    return s.rstrip(' ')
+
+def repeat(s, n):
+    if len(s) * repetitions(n) > MAX_FOLDED_STRING_LENGTH:
+        return NOT_FOLDABLE
+    return s * repetitions(n)
+
+def fold_space(n):
+    return repeat(' ', n)
+
+def fold_string(n, x):
+    if is_number(x):
+        if not is_char_code(x):
+            return NOT_FOLDABLE
+        x = chr(int(x))
+    return repeat(x, n)
+
+def fold_str(x):
+    # Number.prototype.toString only agrees with Python on integers.
+    if not x.is_integer() or abs(x) >= MAX_SAFE_INTEGER:
+        return NOT_FOLDABLE
+    return '%d' % (x,)
+
+def fold_eqv(x, y):
+    return from_boolean(x == y)
+
+def fold_xor(x, y):
+    return float(to_int32(x) ^ to_int32(y))
+
+def fold_or(x, y):
+    return float(to_int32(x) | to_int32(y))
+
+def fold_and(x, y):
+    return float(to_int32(x) & to_int32(y))
+
+def fold_not(x):
+    return from_boolean(x == 0)
+
+def fold_comparison(compare):
+    def fold(x, y):
+        if type(x) != type(y):
+            # Mixed comparisons follow JavaScript's coercion rules.
+            return NOT_FOLDABLE
+        return from_boolean(compare(x, y))
+    return fold
+
+def fold_add(x, y):
+    if type(x) != type(y):
+        # Number.prototype.toString() is involved.
+        return NOT_FOLDABLE
+    return x + y
+
+def fold_mod(x, y):
+    if y == 0:
+        return NOT_FOLDABLE
+    return math.fmod(x, y)
+
+def fold_integer_division(x, y):
+    if y == 0:
+        return NOT_FOLDABLE
+    return math.floor(x / y)
+
+def fold_multiply(x, y):
+    return x * y
+
+def fold_divide(x, y):
+    if y == 0:
+        return NOT_FOLDABLE
+    return x / y
+
+def fold_subtract(x, y=None):
+    if y is None:
+        return -x
+    return x - y
+
+def fold_power(x, y):
+    if not y.is_integer() or to_int32(y) != y:
+        # Math.exp(Math.log(x) * y)
+        return NOT_FOLDABLE
+    return power(x, y)
+
+# Name -> (mandatory argument types, optional argument types, function).
+# Only pure primitives are here: RND, TIMER, INKEY$, etc. are not.
+FOLDABLE_PRIMITIVES = {
+    'ABS': ([is_number], [], fold_abs),
+    'ASC': ([is_string], [], fold_asc),
+    'CHR$': ([is_number], [], fold_chr),
+    'INT': ([is_number], [], fold_int),
+    'LCASE$': ([is_string], [], fold_lcase),
+    'UCASE$': ([is_string], [], fold_ucase),
+    'LEFT$': ([is_string, is_number], [], fold_left),
+    'RIGHT$': ([is_string, is_number], [], fold_right),
+    'MID$': ([is_string, is_number], [is_number], fold_mid),
+    'LEN': ([is_string], [], fold_len),
+    'LTRIM$': ([is_string], [], fold_ltrim),
+    'RTRIM$': ([is_string], [], fold_rtrim),
+    'SPACE$': ([is_number], [], fold_space),
+    'STRING$': ([is_number, is_scalar], [], fold_string),
+    'STR$': ([is_number], [], fold_str),
+    'EQV': ([is_number, is_number], [], fold_eqv),
+    'XOR': ([is_number, is_number], [], fold_xor),
+    'OR': ([is_number, is_number], [], fold_or),
+    'AND': ([is_number, is_number], [], fold_and),
+    'NOT': ([is_number], [], fold_not),
+    '=': ([is_scalar, is_scalar], [], fold_comparison(lambda x, y: x == y)),
+    '>': ([is_scalar, is_scalar], [], fold_comparison(lambda x, y: x > y)),
+    '<': ([is_scalar, is_scalar], [], fold_comparison(lambda x, y: x < y)),
+    '<>': ([is_scalar, is_scalar], [], fold_comparison(lambda x, y: x != y)),
+    '<=': ([is_scalar, is_scalar], [], fold_comparison(lambda x, y: x <= y)),
+    '>=': ([is_scalar, is_scalar], [], fold_comparison(lambda x, y: x >= y)),
+    '+': ([is_scalar, is_scalar], [], fold_add),
+    'MOD': ([is_number, is_number], [], fold_mod),
+    '\\': ([is_number, is_number], [], fold_integer_division),
+    '*': ([is_number, is_number], [], fold_multiply),
+    '/': ([is_number, is_number], [], fold_divide),
+    '-': ([is_number], [is_number], fold_subtract),
+    '^': ([is_number, is_number], [], fold_power),
+}
+
+def is_foldable(name):
+    return name in FOLDABLE_PRIMITIVES
+
+def fold(name, args):
+    """Value of the primitive function applied to constant arguments
+    (as returned by js_value), or NOT_FOLDABLE."""
+    mandatory, optional, function = FOLDABLE_PRIMITIVES[name]
+    if not len(mandatory) <= len(args) <= len(mandatory) + len(optional):
+        return NOT_FOLDABLE
+    for arg_type, arg in zip(mandatory + optional, args):
+        if not arg_type(arg) or (is_number(arg) and not is_finite(arg)):
+            return NOT_FOLDABLE
+    value = function(*args)
+    if value is NOT_FOLDABLE:
+        return NOT_FOLDABLE
+    if is_number(value) and not is_finite(value):
+        return NOT_FOLDABLE
+    if is_string(value) and len(value) > MAX_FOLDED_STRING_LENGTH:
+        return NOT_FOLDABLE
+    return value
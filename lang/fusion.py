@@ -0,0 +1,91 @@
+from lang.ir import Instruction
+import lang.folding
+import lang.optimizer
+
+# Superinstructions: common sequences of opcodes are replaced by a single
+# opcode that the runtime (runtime/vm.js) implements directly, so that the
+# VM dispatches fewer opcodes and pushes and pops less values.
+#
+#   PushConstant c; SetRef v                    -> SetRefConstant(v, c)
+#   PushConstant c; GetArrayRef(v, 1)           -> GetArrayRefConstant(v, c)
+#   GetRef v; PushConstant c; f(2)              -> CallPrimitiveRefConstant(v, c, f)
+#   GetRef v; GetRef w; f(2)                    -> CallPrimitiveRefRef(v, w, f)
+#   GetRef v; PushConstant c; f(2); JumpIfFalse -> JumpIfFalseRefConstant(v, c, f, L)
+#
+# where f is a binary operator (a pure primitive, see lang.folding), which
+# cannot observe that its arguments were not taken from the stack.
+#
+# A sequence is fused only if no label points inside it, so control never
+# lands in the middle of a superinstruction.
+
+def is_constant(op):
+    return op.is_constant()
+
+def is_get_ref(op):
+    return op.opcode == 'GetRef'
+
+def is_binary_operator(op):
+    return op.opcode == 'CallPrimitiveFunction' and op.operands[1] == 2 \
+       and lang.folding.is_foldable(op.operands[0].name)
+
+def is_set_ref(op):
+    return op.opcode == 'SetRef'
+
+def is_get_array_ref(op):
+    return op.opcode == 'GetArrayRef' and op.operands[1] == 1
+
+def is_jump_if_false(op):
+    return op.opcode == 'JumpIfFalse'
+
+# (sequence of predicates, opcode, operands of the fused opcode), longest
+# sequences first.
+PATTERNS = [
+    ([is_get_ref, is_constant, is_binary_operator, is_jump_if_false],
+     'JumpIfFalseRefConstant',
+     lambda ops: (ops[0].operands[0], ops[1].operands[0], ops[2].operands[0], ops[3].operands[0])),
+    ([is_get_ref, is_constant, is_binary_operator],
+     'CallPrimitiveRefConstant',
+     lambda ops: (ops[0].operands[0], ops[1].operands[0], ops[2].operands[0])),
+    ([is_get_ref, is_get_ref, is_binary_operator],
+     'CallPrimitiveRefRef',
+     lambda ops: (ops[0].operands[0], ops[1].operands[0], ops[2].operands[0])),
+    ([is_constant, is_set_ref],
+     'SetRefConstant',
+     lambda ops: (ops[1].operands[0], ops[0].operands[0])),
+    ([is_constant, is_get_array_ref],
+     'GetArrayRefConstant',
+     lambda ops: (ops[1].operands[0], ops[0].operands[0])),
+]
+
+def match(code, position, label_positions):
+    """The fused instruction for the sequence starting at position and
+    its length, or (None, 1)."""
+    for predicates, opcode, operands in PATTERNS:
+        end = position + len(predicates)
+        if end > len(code):
+            continue
+        if any([p in label_positions for p in range(position + 1, end)]):
+            continue
+        ops = code[position:end]
+        if all([predicate(op) for predicate, op in zip(predicates, ops)]):
+            return Instruction(opcode, operands(ops), ops[0].source), len(ops)
+    return None, 1
+
+def fuse(code, labels):
+    """Replace the common sequences of opcodes by superinstructions,
+    returning the new code and label positions and the number of
+    sequences fused. The given code and labels are not modified."""
+    code = list(code)
+    label_positions = set([position for position in labels.values() if position is not None])
+    removed = set()
+    fused = 0
+    position = 0
+    while position < len(code):
+        op, length = match(code, position, label_positions)
+        if op is not None:
+            code[position] = op
+            removed.update(range(position + 1, position + length))
+            fused += 1
+        position += length
+    code, labels = lang.optimizer.remove(code, labels, removed)
+    return code, labels, fused
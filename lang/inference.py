@@ -0,0 +1,455 @@
+from lang.ir import ControlFlowGraph, Instruction, Label, Primitive, MAX_ARRAY_DIMENSIONS
+
+# Static types of the values computed by the linked program, used to call
+# the primitives whose arguments are known to be valid through their
+# unchecked entry points (see make_entry_point in runtime/vm.js), which
+# skip the type checks of runtime/builtins.js.
+#
+# A value is a number, a string, an array (of numbers, strings, or of
+# unknown values) or unknown. Type suffixes do not restrict what can be
+# assigned to a variable, so a variable has the type of its suffix ($ for
+# strings, numbers otherwise) only if every value assigned to it anywhere
+# in the program has that type; the types of the variables, of the
+# elements of the arrays and of the values on the stack at the beginning
+# of the basic blocks are computed together, starting from the suffixes
+# and keeping whatever no assignment contradicts.
+#
+# Reading a variable that is not bound gives 0, or undefined for SHARED
+# variables, so a read is only typed when the variable is surely bound at
+# that point (or, for local numbers, always): that is computed from the
+# assignments on every path from the start of the program, of the timer
+# routines, or of the SUB or FUNCTION the code belongs to.
+
+# Values followed on the stack across blocks, from the top.
+MAX_STACK_DEPTH = 16
+
+NUMBER = 'number'
+STRING = 'string'
+
+def array_of(element):
+    return ('array', element)
+
+def is_array(value):
+    return isinstance(value, tuple)
+
+def join(x, y):
+    return x if x == y else None
+
+def suffix_type(name):
+    return STRING if name.endswith('$') else NUMBER
+
+def constant_type(constant):
+    if isinstance(constant, float) or isinstance(constant, Label):
+        return NUMBER
+    elif isinstance(constant, str):
+        return STRING
+    return None
+
+# Argument domains, as the FUNCTION types of runtime/builtins.js; None is
+# a domain that is never proven (ENUM).
+ANY = 'any'
+SCALAR = 'scalar'
+
+def add_type(args):
+    if args[0] == args[1] == NUMBER:
+        return NUMBER
+    elif STRING in args and None not in args:
+        return STRING
+    return None
+
+def mkarray_type(args):
+    return array_of(args[0] if args[0] in (NUMBER, STRING) else None)
+
+# Name -> (mandatory domains, optional domains, type of the result or a
+# function of the argument types computing it). Primitives not listed
+# here are always called through their checked entry points.
+SIGNATURES = {
+    '_MKARRAY': ([ANY, STRING, NUMBER, NUMBER],
+                 [NUMBER] * (2 * (MAX_ARRAY_DIMENSIONS - 1)), mkarray_type),
+    '_STACK_POP': ([], [], None),
+    '_RESET': ([], [], NUMBER),
+    '_INPUT': ([], [], None),
+    '_STACK_DUP': ([], [], None),
+    '_ON_TIMER_GOSUB': ([NUMBER, NUMBER], [], None),
+    '_ON_TIMER_GOTO': ([NUMBER, NUMBER], [], None),
+    '_TIMER_ON': ([], [], None),
+    '_TIMER_OFF': ([], [], None),
+    '_DRAW': ([ANY], [], None),
+    'ABS': ([NUMBER], [], NUMBER),
+    'ASC': ([STRING], [], NUMBER),
+    'CHR$': ([NUMBER], [], STRING),
+    'CIRCLE': ([NUMBER, NUMBER, NUMBER], [NUMBER, NUMBER, NUMBER, NUMBER], None),
+    'CLS': ([], [], None),
+    'COLOR': ([NUMBER], [NUMBER], None),
+    'DATE$': ([], [], STRING),
+    'INKEY$': ([], [], STRING),
+    'INT': ([NUMBER], [], NUMBER),
+    'LCASE$': ([STRING], [], STRING),
+    'LEFT$': ([STRING, NUMBER], [], STRING),
+    'LEN': ([STRING], [], NUMBER),
+    'LINE': ([NUMBER, NUMBER, NUMBER, NUMBER], [NUMBER, None], None),
+    'LOCATE': ([], [NUMBER, NUMBER], None),
+    'LTRIM$': ([STRING], [], STRING),
+    'MID$': ([STRING, NUMBER], [NUMBER], STRING),
+    '_PLAY_SOUND': ([ANY], [], None),
+    'SOUND': ([NUMBER, NUMBER], [], None),
+    'PAINT': ([NUMBER, NUMBER], [NUMBER, NUMBER], None),
+    'PRESET': ([NUMBER, NUMBER], [NUMBER], None),
+    'PRINT': ([ANY], [], None),
+    'PRINT;': ([ANY], [], None),
+    'PRINT,': ([ANY], [], None),
+    'RANDOMIZE': ([NUMBER], [], None),
+    'RIGHT$': ([STRING, NUMBER], [], STRING),
+    'RND': ([], [], NUMBER),
+    'RTRIM$': ([STRING], [], STRING),
+    '_SCREEN': ([NUMBER], [], None),
+    'SLEEP': ([], [NUMBER], None),
+    'STR$': ([NUMBER], [], STRING),
+    'SPACE$': ([NUMBER], [], STRING),
+    'STRING$': ([NUMBER, SCALAR], [], STRING),
+    'SYSTEM': ([], [], None),
+    'TIME$': ([], [], STRING),
+    'TIMER': ([], [], NUMBER),
+    'UCASE$': ([STRING], [], STRING),
+    'VAL': ([ANY], [], NUMBER),
+    'EQV': ([NUMBER, NUMBER], [], NUMBER),
+    'XOR': ([NUMBER, NUMBER], [], NUMBER),
+    'OR': ([NUMBER, NUMBER], [], NUMBER),
+    'AND': ([NUMBER, NUMBER], [], NUMBER),
+    'NOT': ([NUMBER], [], NUMBER),
+    '=': ([SCALAR, SCALAR], [], NUMBER),
+    '>': ([SCALAR, SCALAR], [], NUMBER),
+    '<': ([SCALAR, SCALAR], [], NUMBER),
+    '<>': ([SCALAR, SCALAR], [], NUMBER),
+    '<=': ([SCALAR, SCALAR], [], NUMBER),
+    '>=': ([SCALAR, SCALAR], [], NUMBER),
+    '+': ([SCALAR, SCALAR], [], add_type),
+    'MOD': ([NUMBER, NUMBER], [], NUMBER),
+    '\\': ([NUMBER, NUMBER], [], NUMBER),
+    '*': ([NUMBER, NUMBER], [], NUMBER),
+    '/': ([NUMBER, NUMBER], [], NUMBER),
+    '-': ([NUMBER], [NUMBER], NUMBER),
+    '^': ([NUMBER, NUMBER], [], NUMBER),
+}
+
+def in_domain(domain, value):
+    if domain == ANY:
+        return True
+    elif domain == SCALAR:
+        return value in (NUMBER, STRING)
+    return domain is not None and domain == value
+
+def proven(name, args):
+    """Whether the primitive accepts any arguments of the given types."""
+    if name not in SIGNATURES:
+        return False
+    mandatory, optional, result = SIGNATURES[name]
+    if not len(mandatory) <= len(args) <= len(mandatory) + len(optional):
+        return False
+    return all([in_domain(domain, arg) for domain, arg in zip(mandatory + optional, args)])
+
+def result_type(name, args):
+    if name not in SIGNATURES:
+        return None
+    result = SIGNATURES[name][2]
+    if callable(result):
+        return result(args)
+    return result
+
+class Bindings(object):
+    """Variables surely bound at some point: in the frame of the running
+    routine, and in the SHARED storage."""
+
+    __slots__ = ('local', 'shared')
+
+    def __init__(self, local=frozenset(), shared=frozenset()):
+        self.local = local
+        self.shared = shared
+
+    def __eq__(self, other):
+        return self.local == other.local and self.shared == other.shared
+
+    def __ne__(self, other):
+        return not self == other
+
+    def meet(self, other):
+        return Bindings(self.local & other.local, self.shared & other.shared)
+
+class TypeInference(object):
+
+    def __init__(self, code, labels, shared):
+        self.code = code
+        self.labels = labels
+        self.shared = shared
+        self.cfg = ControlFlowGraph(code, labels)
+        # Blocks entered from anywhere, with nothing known: the start of
+        # the program and the addresses pushed for ON TIMER.
+        self.roots = set([0]) if code else set()
+        for op in code:
+            if op.opcode == 'PushConstant' and isinstance(op.operands[0], Label):
+                position = labels.get(op.operands[0].number)
+                if position is not None and position < len(code):
+                    self.roots.add(position)
+        # Variables (and arrays) assigned a value that does not have the
+        # type of their suffix.
+        self.demoted = set()
+        self.demoted_elements = set()
+        self.bindings = self.bound_variables()
+
+    # Bindings
+
+    def bind(self, bindings, op):
+        """Bindings after op."""
+        local, shared = bindings.local, bindings.shared
+        if op.opcode in ('SetRef', 'SetRefConstant'):
+            name = op.operands[0].name
+            if name in self.shared:
+                shared = shared | set([name])
+            else:
+                local = local | set([name])
+        elif op.opcode == 'ForStart':
+            local = local | set([var.name for var in op.operands])
+        elif op.opcode == 'Enter':
+            local = frozenset([var.name for var in op.operands[0]])
+        elif op.opcode == 'Leave':
+            local = frozenset()
+        elif op.opcode in ('CallPrimitiveStatement', 'CallPrimitiveFunction') \
+             and op.operands[0].name == '_RESET':
+            local, shared = frozenset(), frozenset()
+        else:
+            return bindings
+        return Bindings(frozenset(local), frozenset(shared))
+
+    def bound_variables(self):
+        """Bindings at the start of every block."""
+        entry = {}
+        for position in self.roots:
+            entry[position] = Bindings()
+        pending = sorted(entry)
+        while pending:
+            block = self.cfg.block_at(pending.pop())
+            bindings = entry[block.start]
+            for op in self.cfg.instructions(block):
+                bindings = self.bind(bindings, op)
+            for successor in block.successors:
+                if successor.start in self.roots:
+                    continue
+                if successor.start in entry:
+                    met = entry[successor.start].meet(bindings)
+                    if met == entry[successor.start]:
+                        continue
+                    bindings_at = met
+                else:
+                    bindings_at = bindings
+                entry[successor.start] = bindings_at
+                pending.append(successor.start)
+        return entry
+
+    # Variables
+
+    def variable_type(self, name):
+        if name in self.demoted:
+            return None
+        return suffix_type(name)
+
+    def element_type(self, name):
+        if name in self.demoted_elements:
+            return None
+        return suffix_type(name)
+
+    def read(self, bindings, name):
+        """Type of the value get_ref() reads."""
+        value = self.variable_type(name)
+        if value is None:
+            return None
+        if value == NUMBER and name not in self.shared:
+            # An unbound local reads as 0.
+            return NUMBER
+        if name in bindings.local or (name in self.shared and name in bindings.shared):
+            return value
+        return None
+
+    def assign(self, name, value):
+        if value != self.variable_type(name):
+            self.demoted.add(name)
+        if not is_array(value) or value[1] != self.element_type(name):
+            # Arrays of elements of an unknown type, or values that
+            # might be arrays (e.g. SUB arguments).
+            if value is None or is_array(value):
+                self.demoted_elements.add(name)
+
+    def assign_element(self, name, value):
+        if value != self.element_type(name):
+            self.demoted_elements.add(name)
+
+    # Stack
+
+    def run(self, block, stack, annotate):
+        """Run the block over the types of the values on the stack,
+        returning the stack at its end. If annotate, the primitive calls
+        proven to be valid are replaced by unchecked ones."""
+        stack = list(stack)
+        bindings = self.bindings.get(block.start, Bindings())
+
+        def pop():
+            return stack.pop() if stack else None
+
+        def call(position, primitive, args):
+            if proven(primitive.name, args) and annotate:
+                op = self.code[position]
+                operands = list(op.operands)
+                operands[operands.index(primitive)] = Primitive(primitive.name, tuple(args))
+                self.code[position] = Instruction(op.opcode, operands, op.source)
+            return result_type(primitive.name, args)
+
+        for position in range(block.start, block.end):
+            op = self.code[position]
+            operands = op.operands
+            if op.opcode == 'PushConstant':
+                stack.append(constant_type(operands[0]))
+            elif op.opcode == 'PushRetval':
+                address = pop()
+                stack.append(None)
+                stack.append(address)
+            elif op.opcode == 'SetArrayRef':
+                value = pop()
+                for i in range(operands[1]):
+                    pop()
+                self.assign_element(operands[0].name, value)
+            elif op.opcode == 'SetRef':
+                self.assign(operands[0].name, pop())
+            elif op.opcode == 'GetRef':
+                stack.append(self.read(bindings, operands[0].name))
+            elif op.opcode in ('MidAssign', 'MidArrayAssign'):
+                for i in range(3 if operands[1] else 2):
+                    pop()
+                if op.opcode == 'MidArrayAssign':
+                    for i in range(operands[2]):
+                        pop()
+                    self.assign_element(operands[0].name, STRING)
+                else:
+                    self.assign(operands[0].name, STRING)
+            elif op.opcode == 'GetArrayRef':
+                for i in range(operands[1]):
+                    pop()
+                stack.append(self.element_type(operands[0].name))
+            elif op.opcode in ('CallPrimitiveStatement', 'CallPrimitiveFunction'):
+                primitive, nargs = operands
+                args = [pop() for i in range(nargs)]
+                args.reverse()
+                result = call(position, primitive, args)
+                if primitive.name == '_RESET':
+                    stack = []
+                if op.opcode == 'CallPrimitiveFunction':
+                    stack.append(result)
+                elif primitive.name == '_STACK_POP':
+                    pop()
+                elif primitive.name == '_STACK_DUP':
+                    value = pop()
+                    stack.extend([value, value])
+                elif primitive.name == '_INPUT':
+                    # Pushed by the VM once the string is read.
+                    stack.append(STRING)
+            elif op.opcode == 'SetRefConstant':
+                self.assign(operands[0].name, constant_type(operands[1]))
+            elif op.opcode == 'GetArrayRefConstant':
+                stack.append(self.element_type(operands[0].name))
+            elif op.opcode == 'CallPrimitiveRefConstant':
+                variable, constant, primitive = operands
+                args = [self.read(bindings, variable.name), constant_type(constant)]
+                stack.append(call(position, primitive, args))
+            elif op.opcode == 'CallPrimitiveRefRef':
+                variable1, variable2, primitive = operands
+                args = [self.read(bindings, variable1.name), self.read(bindings, variable2.name)]
+                stack.append(call(position, primitive, args))
+            elif op.opcode == 'JumpIfFalseRefConstant':
+                variable, constant, primitive, label = operands
+                call(position, primitive, [self.read(bindings, variable.name), constant_type(constant)])
+            elif op.opcode == 'JumpIfFalse':
+                pop()
+            elif op.opcode == 'Gosub':
+                stack.append(NUMBER)
+            elif op.opcode == 'Return':
+                pop()
+            elif op.opcode == 'Enter':
+                address = pop()
+                params = operands[0]
+                for i in range(len(params), 0, -1):
+                    self.assign(params[i - 1].name, pop())
+                stack.append(address)
+            elif op.opcode == 'ForStart':
+                index, index_upper, index_step = operands
+                self.assign(index_step.name, pop())
+                self.assign(index_upper.name, pop())
+                self.assign(index.name, pop())
+            elif op.opcode == 'ForNext':
+                index, index_step, label = operands
+                if self.variable_type(index.name) == self.variable_type(index_step.name) == NUMBER:
+                    # A number or undefined plus a number.
+                    self.assign(index.name, NUMBER)
+                else:
+                    self.assign(index.name, None)
+            bindings = self.bind(bindings, op)
+        return stack
+
+    def entry_stack(self, block, exits):
+        """Types on the stack at the start of a block, as left by its
+        predecessors; only the values every predecessor agrees on are
+        kept."""
+        if block.start in self.roots:
+            return []
+        stacks = []
+        for predecessor in block.predecessors:
+            last = self.code[predecessor.end - 1]
+            if last.opcode == 'Gosub' and block.start == predecessor.end:
+                # Where RETURN lands: the routine may have changed the
+                # stack (e.g. pushed the result of a FUNCTION).
+                return []
+            if predecessor.index in exits:
+                stacks.append(exits[predecessor.index])
+        if not stacks:
+            return []
+        depth = min([len(stack) for stack in stacks])
+        stack = []
+        for i in range(depth, 0, -1):
+            value = stacks[0][-i]
+            for other in stacks[1:]:
+                value = join(value, other[-i])
+            stack.append(value)
+        return stack
+
+    def solve(self):
+        """Types on the stack at the end of every block, once the types
+        of the variables are settled."""
+        exits = {}
+        while True:
+            demoted = (len(self.demoted), len(self.demoted_elements))
+            changed = True
+            while changed:
+                changed = False
+                for block in self.cfg.blocks:
+                    stack = self.run(block, self.entry_stack(block, exits), False)
+                    stack = stack[-MAX_STACK_DEPTH:]
+                    if exits.get(block.index) != stack:
+                        exits[block.index] = stack
+                        changed = True
+            if demoted == (len(self.demoted), len(self.demoted_elements)):
+                return exits
+
+    def annotate(self):
+        exits = self.solve()
+        proven = 0
+        for block in self.cfg.blocks:
+            self.run(block, self.entry_stack(block, exits), True)
+        for op in self.code:
+            proven += len([operand for operand in op.operands
+                           if isinstance(operand, Primitive) and operand.arg_types is not None])
+        return proven
+
+def infer_types(code, labels, shared):
+    """Mark the primitive calls of a linked program whose arguments are
+    known to be valid as unchecked, returning the new code and the number
+    of calls marked. The given code is not modified."""
+    code = list(code)
+    proven = TypeInference(code, labels, shared).annotate()
+    return code, proven
@@ -0,0 +1,329 @@
+import math
+
+# Intermediate representation of the compiled code.
+#
+# The code generator produces a list of Instructions, one per VM opcode
+# (runtime/vm.js), whose operands are plain Python values or the operand
+# classes below. Instructions are turned into JavaScript (new OpX(...))
+# only when writing the output, so optimization passes and other backends
+# can work on the code without parsing it back.
+
+# Largest integer such that every integer up to it is a double.
+MAX_SAFE_INTEGER = 2 ** 53
+
+def escape_string(string):
+    res = ''
+    for c in string:
+        if c == '\\':
+            res += '\\\\'
+        elif c == '"':
+            res += '\\"'
+        elif 32 <= ord(c) <= 127:
+            res += c
+        else:
+            res += '\\x%.2x' % (ord(c),)
+    return res
+
+def js_number(value):
+    """JavaScript literal for a number (a double)."""
+    if value == 0 and math.copysign(1, value) < 0:
+        return '-0'
+    elif value.is_integer() and abs(value) < MAX_SAFE_INTEGER:
+        return '%d' % (value,)
+    else:
+        return repr(value)
+
+class Label(object):
+    """Reference to a label, i.e. to a position in the code."""
+
+    __slots__ = ('number',)
+
+    def __init__(self, number):
+        self.number = number
+
+    def __eq__(self, other):
+        return isinstance(other, Label) and self.number == other.number
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.number)
+
+    def __repr__(self):
+        return 'L%u' % (self.number,)
+
+    def js(self, mangle):
+        return 'L%u' % (self.number,)
+
+class Var(object):
+    """Reference to a variable, by its (normalized) name."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Var) and self.name == other.name
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return self.name
+
+    def js(self, mangle):
+        return mangle(self.name)
+
+class Sound(object):
+    """Reference to a compiled sound (SND_n)."""
+
+    __slots__ = ('number',)
+
+    def __init__(self, number):
+        self.number = number
+
+    def __repr__(self):
+        return 'SND_%u' % (self.number,)
+
+    def js(self, mangle):
+        return 'SND_%u' % (self.number,)
+
+# Most dimensions of an array (see _MKARRAY in runtime/builtins.js).
+MAX_ARRAY_DIMENSIONS = 8
+
+# Suffix of the names of the unchecked entry points of the primitives
+# (see make_entry_point in runtime/vm.js).
+UNCHECKED_SUFFIX = '!'
+
+class Primitive(object):
+    """Name of a primitive of the runtime (builtins.js).
+
+    arg_types, if not None, are the types of the arguments of the call, as
+    proven by lang.inference; the call then skips the type checks.
+    """
+
+    __slots__ = ('name', 'arg_types')
+
+    def __init__(self, name, arg_types=None):
+        self.name = name
+        self.arg_types = arg_types
+
+    def __eq__(self, other):
+        return isinstance(other, Primitive) and self.name == other.name \
+           and self.arg_types == other.arg_types
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return self.name + (UNCHECKED_SUFFIX if self.arg_types is not None else '')
+
+    def js(self, mangle):
+        return "'%s'" % (repr(self).replace('\\', '\\\\'),)
+
+class DrawCommands(object):
+    """Parsed argument of DRAW (see lang.draw)."""
+
+    __slots__ = ('commands',)
+
+    def __init__(self, commands):
+        self.commands = commands
+
+    def __repr__(self):
+        return 'DRAW%r' % (self.commands,)
+
+    def js(self, mangle):
+        return '[%s]' % (
+            ', '.join([
+                '["%s", %s]' % (cmd_args[0], ', '.join(map(str, cmd_args[1:])))
+                for cmd_args in self.commands
+            ]),
+        )
+
+def js_operand(operand, mangle):
+    if isinstance(operand, bool):
+        return 'true' if operand else 'false'
+    elif isinstance(operand, (int, long)):
+        return '%d' % (operand,)
+    elif isinstance(operand, float):
+        return js_number(operand)
+    elif isinstance(operand, str):
+        return '"%s"' % (escape_string(operand),)
+    elif isinstance(operand, list):
+        return '[%s]' % (','.join([js_operand(x, mangle) for x in operand]),)
+    else:
+        return operand.js(mangle)
+
+# Opcodes that transfer control, and the index of their target operand.
+JUMP_TARGET = {
+    'Jump': 0,
+    'JumpIfFalse': 0,
+    'JumpIfFalseRefConstant': 3,
+    'Gosub': 0,
+    'ForCheck': 3,
+    'ForNext': 2,
+}
+
+# Opcodes after which execution does not continue with the next one.
+UNCONDITIONAL = set(['Jump', 'ForNext', 'Return'])
+
+class Instruction(object):
+    """A VM opcode with its operands.
+
+    source is the (module, line) the instruction was compiled from, if
+    known.
+    """
+
+    __slots__ = ('opcode', 'operands', 'source')
+
+    def __init__(self, opcode, operands=(), source=None):
+        self.opcode = opcode
+        self.operands = tuple(operands)
+        self.source = source
+
+    def __repr__(self):
+        return '%s(%s)' % (self.opcode, ', '.join([repr(operand) for operand in self.operands]))
+
+    def is_constant(self):
+        # Whether it pushes a number or a string (and not e.g. a label).
+        return self.opcode == 'PushConstant' and isinstance(self.operands[0], (float, str))
+
+    def target(self):
+        """Label this instruction jumps to, if any."""
+        if self.opcode in JUMP_TARGET:
+            return self.operands[JUMP_TARGET[self.opcode]]
+        return None
+
+    def falls_through(self):
+        if self.opcode in UNCONDITIONAL:
+            return False
+        if self.opcode == 'CallPrimitiveStatement' and self.operands[0].name == 'SYSTEM':
+            return False
+        return True
+
+    def ends_block(self):
+        return self.target() is not None or not self.falls_through()
+
+    def labels(self):
+        """Labels referred to by this instruction."""
+        return [operand for operand in self.operands if isinstance(operand, Label)]
+
+    def relocate(self, labels, sounds):
+        """Copy of this instruction with its labels and sounds renumbered
+        according to the given mappings."""
+        operands = []
+        for operand in self.operands:
+            if isinstance(operand, Label):
+                operand = Label(labels[operand.number])
+            elif isinstance(operand, Sound):
+                operand = Sound(sounds[operand.number])
+            operands.append(operand)
+        return Instruction(self.opcode, operands, self.source)
+
+    def js(self, mangle):
+        return 'new Op%s(%s)' % (
+            self.opcode,
+            ', '.join([js_operand(operand, mangle) for operand in self.operands]),
+        )
+
+class BasicBlock(object):
+    """Maximal run of instructions that is only entered at its first one
+    and only left after its last one.
+
+    Timer events (ON TIMER) may still interrupt a block between slices of
+    the VM; successors only describe the static control flow.
+    """
+
+    def __init__(self, index, start, end):
+        self.index = index
+        self.start = start              # position of the first instruction
+        self.end = end                  # position after the last instruction
+        self.labels = []                # labels pointing at the start
+        self.successors = []
+        self.predecessors = []
+
+    def __repr__(self):
+        return '<block %u [%u:%u] -> %s>' % (
+            self.index, self.start, self.end,
+            ', '.join([str(block.index) for block in self.successors]),
+        )
+
+    def __len__(self):
+        return self.end - self.start
+
+class ControlFlowGraph(object):
+    """Basic blocks of a list of instructions.
+
+    labels maps label numbers to positions in the code. A block starts at
+    the beginning of the code, at every label position (which includes
+    every address that can be pushed, e.g. for ON TIMER) and after every
+    jump, so that the instruction after a GOSUB, where RETURN lands,
+    starts a block too.
+    """
+
+    def __init__(self, code, labels):
+        self.code = code
+
+        leaders = set([0])
+        labels_at = {}
+        for label, position in labels.items():
+            if position is not None and position < len(code):
+                leaders.add(position)
+                labels_at.setdefault(position, []).append(label)
+        for position, op in enumerate(code):
+            if op.ends_block() and position + 1 < len(code):
+                leaders.add(position + 1)
+        if not code:
+            leaders = set()
+
+        starts = sorted(leaders)
+        self.blocks = []
+        self._block_at = {}
+        for index, start in enumerate(starts):
+            end = starts[index + 1] if index + 1 < len(starts) else len(code)
+            block = BasicBlock(index, start, end)
+            block.labels = sorted(labels_at.get(start, []))
+            self.blocks.append(block)
+            self._block_at[start] = block
+
+        for block in self.blocks:
+            last = code[block.end - 1]
+            targets = []
+            if last.falls_through() and block.end < len(code):
+                targets.append(block.end)
+            target = last.target()
+            if target is not None and labels.get(target.number) is not None \
+               and labels[target.number] < len(code):
+                targets.append(labels[target.number])
+            for position in targets:
+                successor = self._block_at[position]
+                if successor not in block.successors:
+                    block.successors.append(successor)
+                    successor.predecessors.append(block)
+
+    def __repr__(self):
+        return '<cfg: %u instructions, %u blocks>' % (len(self.code), len(self.blocks))
+
+    def block_at(self, position):
+        """The block starting at the given position."""
+        return self._block_at[position]
+
+    def instructions(self, block):
+        return self.code[block.start:block.end]
+
+    def dump(self, out):
+        for block in self.blocks:
+            out.write('%s%s\n' % (
+                ''.join(['L%u: ' % (label,) for label in block.labels]),
+                block,
+            ))
+            for position in range(block.start, block.end):
+                out.write('    %5u  %r\n' % (position, self.code[position]))
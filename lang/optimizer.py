@@ -0,0 +1,157 @@
+from lang.ir import Instruction, Label, Primitive, ControlFlowGraph
+
+# Peephole optimizer over the linked program (see lang.ir).
+#
+# Every pass keeps the observable behaviour of the program: jumps are
+# retargeted or removed only when control ends up at the same place, and
+# only instructions that cannot run or have no effect are removed. Labels
+# pointing at a removed instruction move to the next remaining one.
+
+def is_statement(op, name):
+    return op.opcode == 'CallPrimitiveStatement' and op.operands[0].name == name
+
+def stack_pop():
+    return Instruction('CallPrimitiveStatement', (Primitive('_STACK_POP'), 0))
+
+def thread_jumps(code, labels):
+    """Make jumps to a jump go to its destination instead, and turn
+    jumps to a RETURN into a RETURN."""
+
+    def final_target(label):
+        seen = set()
+        while label not in seen:
+            seen.add(label)
+            position = labels.get(label.number)
+            if position is None or position >= len(code) or code[position].opcode != 'Jump':
+                break
+            label = code[position].operands[0]
+        return label
+
+    changed = 0
+    for position, op in enumerate(code):
+        label = op.target()
+        if label is None:
+            continue
+        target = final_target(label)
+        if op.opcode == 'Jump' and labels.get(target.number) is not None \
+           and labels[target.number] < len(code) and code[labels[target.number]].opcode == 'Return':
+            code[position] = Instruction('Return', (), op.source)
+            changed += 1
+        elif target != label:
+            operands = list(op.operands)
+            operands[operands.index(label)] = target
+            code[position] = Instruction(op.opcode, operands, op.source)
+            changed += 1
+    return changed
+
+def unreachable(code, labels):
+    """Positions of the instructions that cannot be executed.
+
+    The program starts at position 0; besides that, only the addresses
+    that are pushed as constants (ON TIMER routines) can be jumped to
+    dynamically. RETURN lands after a GOSUB, which is a successor of it.
+    """
+    cfg = ControlFlowGraph(code, labels)
+    if not cfg.blocks:
+        return set()
+    reachable = set()
+    pending = [cfg.block_at(0)]
+    while pending:
+        block = pending.pop()
+        if block.index in reachable:
+            continue
+        reachable.add(block.index)
+        pending.extend(block.successors)
+        for op in cfg.instructions(block):
+            if op.opcode == 'PushConstant' and isinstance(op.operands[0], Label):
+                position = labels.get(op.operands[0].number)
+                if position is not None and position < len(code):
+                    pending.append(cfg.block_at(position))
+    dead = set()
+    for block in cfg.blocks:
+        if block.index not in reachable:
+            dead.update(range(block.start, block.end))
+    return dead
+
+def redundant(code, labels):
+    """Positions of the instructions that have no effect: jumps to the
+    next instruction and values pushed only to be popped right away."""
+    label_positions = set(labels.values())
+    removed = set()
+    position = 0
+    while position < len(code):
+        op = code[position]
+        target = op.target()
+        if target is not None and labels.get(target.number) == position + 1:
+            if op.opcode == 'Jump':
+                removed.add(position)
+            elif op.opcode == 'JumpIfFalse':
+                # The condition still has to be popped.
+                code[position] = Instruction('CallPrimitiveStatement', stack_pop().operands, op.source)
+        elif position + 1 < len(code) and position + 1 not in label_positions \
+             and is_statement(code[position + 1], '_STACK_POP') \
+             and (is_statement(op, '_STACK_DUP') or op.opcode == 'PushConstant'):
+            removed.add(position)
+            removed.add(position + 1)
+            position += 1
+        position += 1
+    return removed
+
+def remove(code, labels, positions):
+    """Remove the instructions at the given positions, moving the labels
+    that pointed at them to the next remaining instruction."""
+    new_position = []
+    new_code = []
+    for position, op in enumerate(code):
+        new_position.append(len(new_code))
+        if position not in positions:
+            new_code.append(op)
+    new_position.append(len(new_code))
+    new_labels = {}
+    for label, position in labels.items():
+        new_labels[label] = new_position[position] if position is not None else None
+    return new_code, new_labels
+
+def collapse_labels(code, labels):
+    """Make all the jumps to a position use the same label, and drop the
+    labels that are no longer referred to."""
+    canonical = {}
+    for label, position in sorted(labels.items()):
+        if position is not None:
+            canonical.setdefault(position, label)
+
+    referenced = set()
+    for position, op in enumerate(code):
+        operands = []
+        changed = False
+        for operand in op.operands:
+            if isinstance(operand, Label) and labels.get(operand.number) is not None:
+                label = Label(canonical[labels[operand.number]])
+                changed = changed or label != operand
+                operand = label
+            operands.append(operand)
+        if changed:
+            code[position] = Instruction(op.opcode, operands, op.source)
+        referenced.update([label.number for label in code[position].labels()])
+
+    # Unresolved labels are kept, so that write_output reports them.
+    return dict([
+        (label, position) for label, position in labels.items()
+        if position is None or label in referenced
+    ])
+
+def optimize(code, labels):
+    """Optimize the code of a program, returning the new code and label
+    positions. The given code and labels are not modified."""
+    code = list(code)
+    labels = dict(labels)
+    while True:
+        size = len(code)
+        changed = thread_jumps(code, labels)
+        positions = unreachable(code, labels) | redundant(code, labels)
+        if positions:
+            code, labels = remove(code, labels, positions)
+        if not changed and len(code) == size:
+            break
+    labels = collapse_labels(code, labels)
+    return code, labels
@@ -0,0 +1,276 @@
+import sys
+import time
+import json
+import resource
+
+try:
+    import cProfile
+    import pstats
+except ImportError:
+    cProfile = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+PROGRAM = '<program>'
+
+class NullProfiler(object):
+    """Profiler used when profiling is off: every hook does nothing."""
+
+    enabled = False
+
+    def phase(self, name):
+        return NULL_PHASE
+
+    def module(self, name):
+        return NULL_PHASE
+
+    def count(self, name, n=1):
+        pass
+
+class NullPhase(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+NULL_PHASE = NullPhase()
+
+_active = NullProfiler()
+
+def active():
+    return _active
+
+def phase(name):
+    return _active.phase(name)
+
+def module(name):
+    return _active.module(name)
+
+def count(name, n=1):
+    _active.count(name, n)
+
+class Phase(object):
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.profiler._leave()
+        return False
+
+class ModuleScope(object):
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.previous = self.profiler._module
+        self.profiler._module = self.name
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.profiler._module = self.previous
+        return False
+
+class CompileProfiler(object):
+    """Times the phases of a compilation, per module.
+
+    Phases nest (e.g. "lame" runs inside "sound synthesis", which runs
+    inside "parse"); the report ranks them by self time, i.e. excluding
+    the time spent in nested phases. Counters (tokens, opcodes, ...) are
+    also kept per module. Optionally, the whole compilation runs under
+    cProfile, and memory is traced: with tracemalloc where the Python has
+    it, and otherwise by how much each phase raises the peak RSS.
+    """
+
+    enabled = True
+
+    def __init__(self, use_cprofile=False, use_tracemalloc=False):
+        if use_cprofile and cProfile is None:
+            raise Exception('cProfile is not available.')
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc and tracemalloc is not None
+        self.use_rss = use_tracemalloc and tracemalloc is None
+        self._module = PROGRAM
+        self._stack = []
+        self._phases = {}       # (module, phase) -> [calls, inclusive, self]
+        self._phase_order = []
+        self._rss = {}          # (module, phase) -> [inclusive, self] KiB
+        self._counters = {}     # module -> {name: n}
+        self._cprofile = None
+        self._memory_snapshot = None
+        self._memory_peak = None
+        self._start = None
+        self._elapsed = None
+
+    def phase(self, name):
+        return Phase(self, name)
+
+    def module(self, name):
+        return ModuleScope(self, name)
+
+    def count(self, name, n=1):
+        counters = self._counters.setdefault(self._module, {})
+        counters[name] = counters.get(name, 0) + n
+
+    def _enter(self, name):
+        rss = peak_rss_kb() if self.use_rss else 0
+        self._stack.append([self._module, name, time.time(), 0.0, rss, 0])
+
+    def _leave(self):
+        module, name, start, children, rss_start, rss_children = self._stack.pop()
+        elapsed = time.time() - start
+        key = (module, name)
+        if key not in self._phases:
+            self._phases[key] = [0, 0.0, 0.0]
+            self._phase_order.append(key)
+        stats = self._phases[key]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - children
+        if self._stack:
+            self._stack[-1][3] += elapsed
+        if self.use_rss:
+            growth = peak_rss_kb() - rss_start
+            rss = self._rss.setdefault(key, [0, 0])
+            rss[0] += growth
+            rss[1] += growth - rss_children
+            if self._stack:
+                self._stack[-1][5] += growth
+
+    def start(self):
+        global _active
+        _active = self
+        if self.use_tracemalloc:
+            tracemalloc.start()
+        if self.use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._start = time.time()
+
+    def stop(self):
+        global _active
+        self._elapsed = time.time() - self._start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self.use_tracemalloc:
+            self._memory_peak = tracemalloc.get_traced_memory()[1]
+            self._memory_snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+        _active = NullProfiler()
+
+    def report(self, top=20):
+        phases = []
+        for module, name in self._phase_order:
+            calls, inclusive, self_time = self._phases[(module, name)]
+            phases.append({
+                'module': module,
+                'phase': name,
+                'calls': calls,
+                'inclusive_s': inclusive,
+                'self_s': self_time,
+            })
+        phases.sort(key=lambda phase: -phase['self_s'])
+
+        report = {
+            'total_s': self._elapsed,
+            'phases': phases,
+            'counters': self._counters,
+            'peak_rss_kb': peak_rss_kb(),
+        }
+
+        if self._cprofile is not None:
+            stats = pstats.Stats(self._cprofile)
+            functions = []
+            for (fn, lineno, func), (cc, nc, tt, ct, callers) in stats.stats.items():
+                functions.append({
+                    'function': '%s:%u(%s)' % (fn, lineno, func),
+                    'calls': nc,
+                    'tottime_s': tt,
+                    'cumtime_s': ct,
+                })
+            functions.sort(key=lambda function: -function['tottime_s'])
+            report['cprofile'] = functions[:top]
+
+        if self._memory_snapshot is not None:
+            report['tracemalloc'] = {
+                'peak_bytes': self._memory_peak,
+                'top': [
+                    {'location': str(stat.traceback), 'size_bytes': stat.size, 'count': stat.count}
+                    for stat in self._memory_snapshot.statistics('lineno')[:top]
+                ],
+            }
+
+        if self.use_rss:
+            growths = []
+            for module, name in self._phase_order:
+                if (module, name) not in self._rss:
+                    continue
+                inclusive, self_growth = self._rss[(module, name)]
+                growths.append({
+                    'module': module,
+                    'phase': name,
+                    'inclusive_kb': inclusive,
+                    'self_kb': self_growth,
+                })
+            growths.sort(key=lambda growth: -growth['self_kb'])
+            report['rss_growth'] = growths[:top]
+        return report
+
+def peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def write_json_report(reports, out):
+    json.dump(reports, out, indent=2, sort_keys=True)
+    out.write('\n')
+
+def write_text_report(program, report, out=sys.stderr):
+    total = report['total_s'] or 1e-9
+    out.write('Profile of %s: %.3fs, peak RSS %u KiB\n' % (
+        program, report['total_s'], report['peak_rss_kb']))
+
+    out.write('\n  %8s %8s %6s %6s  %s\n' % ('self', 'incl', '%', 'calls', 'phase'))
+    for phase in report['phases']:
+        out.write('  %7.3fs %7.3fs %5.1f%% %6u  %s [%s]\n' % (
+            phase['self_s'],
+            phase['inclusive_s'],
+            100.0 * phase['self_s'] / total,
+            phase['calls'],
+            phase['phase'],
+            phase['module'],
+        ))
+
+    names = sorted(set([name for counters in report['counters'].values() for name in counters]))
+    if names:
+        out.write('\n  %-16s' % ('module',) + ''.join(['%10s' % (name,) for name in names]) + '\n')
+        for module, counters in sorted(report['counters'].items()):
+            out.write('  %-16s' % (module,) + ''.join(['%10u' % (counters.get(name, 0),) for name in names]) + '\n')
+
+    if 'cprofile' in report:
+        out.write('\n  %8s %8s %8s  %s\n' % ('tottime', 'cumtime', 'calls', 'function'))
+        for function in report['cprofile']:
+            out.write('  %7.3fs %7.3fs %8u  %s\n' % (
+                function['tottime_s'], function['cumtime_s'], function['calls'], function['function']))
+
+    if 'tracemalloc' in report:
+        out.write('\n  peak traced memory: %u KiB\n' % (report['tracemalloc']['peak_bytes'] // 1024,))
+        for stat in report['tracemalloc']['top']:
+            out.write('  %8u KiB %8u  %s\n' % (stat['size_bytes'] // 1024, stat['count'], stat['location']))
+
+    if 'rss_growth' in report:
+        out.write('\n  %12s %12s  %s\n' % ('self RSS', 'incl RSS', 'phase'))
+        for growth in report['rss_growth']:
+            out.write('  %8u KiB %8u KiB  %s [%s]\n' % (
+                growth['self_kb'], growth['inclusive_kb'], growth['phase'], growth['module']))
+    out.write('\n')
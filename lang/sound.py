@@ -1,9 +1,12 @@
 import os
 import base64
+import shutil
+import tempfile
 import struct
 import math
 
 from lang.utils import take_while_in, DIGIT
+import lang.profiler
 
 CONVERT_TO_MP3 = True
 
@@ -35,14 +38,21 @@ def duration_for(tempo, duration):
     return (4.0 / duration) * (60.0 / tempo)
 
 def wav_to_mp3(wav_data):
-    # XXX: hack :-)
-    f = open('_tmp_.wav', 'w')
-    f.write(wav_data)
-    f.close()
-    os.system('lame --preset standard _tmp_.wav _tmp_.mp3')
-    f = open('_tmp_.mp3', 'r')
-    mp3_data = f.read()
-    f.close()
+    # Use a private directory, so that several compilers can run at once.
+    tmp_dir = tempfile.mkdtemp(prefix='qbc_')
+    wav_fn = os.path.join(tmp_dir, 'sound.wav')
+    mp3_fn = os.path.join(tmp_dir, 'sound.mp3')
+    try:
+        f = open(wav_fn, 'wb')
+        f.write(wav_data)
+        f.close()
+        with lang.profiler.phase('lame'):
+            os.system('lame --quiet --preset standard %s %s' % (wav_fn, mp3_fn))
+        f = open(mp3_fn, 'rb')
+        mp3_data = f.read()
+        f.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
     return mp3_data
 
 class SoundGenerator(object):
@@ -146,10 +156,10 @@ class SoundGenerator(object):
                 self.octave = int(octave_string)
             elif string[i] == '<':
                 i += 1
-                self.octave = (octave - 1) % 6
+                self.octave = (self.octave - 1) % 6
             elif string[i] == '>':
                 i += 1
-                self.octave = (octave + 1) % 6
+                self.octave = (self.octave + 1) % 6
             elif string[i] in 'm':
                 i += 1
                 if not (i < len(string) and string[i] in 'snlbf'):
@@ -176,16 +186,27 @@ class SoundGenerator(object):
         if sound in self._sound_table:
             return self._sound_table[sound]
         else:
-            if isinstance(sound, tuple):
-                (dur_s, freq_hz) = sound
-                sound_samples = self.sine_sq_wave(dur_s, freq_hz)
-            else:
-                sound_samples = self.melody(sound)
-            sound_id = len(self._compiled_sounds)
-            self._compiled_sounds.append((sound_id, self._sound_definition(sound_samples)))
-            self._sound_table[sound] = sound_id
+            with lang.profiler.phase('sound synthesis'):
+                if isinstance(sound, tuple):
+                    (dur_s, freq_hz) = sound
+                    sound_samples = self.sine_sq_wave(dur_s, freq_hz)
+                else:
+                    sound_samples = self.melody(sound)
+                sound_id = len(self._compiled_sounds)
+                self._compiled_sounds.append((sound_id, self._sound_definition(sound_samples)))
+                self._sound_table[sound] = sound_id
             return sound_id
 
+    def register_sound(self, definition):
+        # Add an already compiled sound (e.g. from a cached module),
+        # sharing the id of an identical one if it was already present.
+        for sound_id, known_definition in self._compiled_sounds:
+            if known_definition == definition:
+                return sound_id
+        sound_id = len(self._compiled_sounds)
+        self._compiled_sounds.append((sound_id, definition))
+        return sound_id
+
     def sounds(self):
         return self._compiled_sounds
 
@@ -2,21 +2,109 @@
 
 import os
 import sys
+import time
+import argparse
 
 from lang.compiler import Compiler
+import lang.compiler
+import lang.batch
+import lang.profiler
 
-if len(sys.argv) != 2:
-    sys.stderr.write('QBasic to JavaScript converter\n')
-    sys.stderr.write('Usage: %s <file.bas>\n' % (sys.argv[0],))
-    sys.exit(1)
+CACHE_DIR = '.qbc_cache'
+
+parser = argparse.ArgumentParser(description='QBasic to JavaScript converter')
+parser.add_argument('inputs', metavar='file.bas|directory', nargs='+',
+                    help='programs to compile; directories are scanned for .bas/.000 entry points')
+parser.add_argument('-o', '--output-dir', default='output',
+                    help='directory for the generated HTML files (default: output)')
+parser.add_argument('-j', '--jobs', type=int, default=None,
+                    help='number of parallel compilers in batch mode (default: one per core)')
+parser.add_argument('--no-cache', action='store_true',
+                    help='do not reuse previously compiled modules')
+parser.add_argument('--no-optimize', action='store_true',
+                    help='do not run the peephole optimizer on the generated code')
+parser.add_argument('--no-fuse', action='store_true',
+                    help='do not fuse common opcode sequences into superinstructions')
+parser.add_argument('--no-infer-types', action='store_true',
+                    help='check the types of the arguments of every primitive call at runtime')
+parser.add_argument('--backend', choices=lang.compiler.BACKENDS, default=lang.compiler.BACKEND,
+                    help='vm to interpret the opcodes, aot to also compile them to JavaScript (default: %(default)s)')
+parser.add_argument('--format', choices=lang.compiler.OUTPUT_FORMATS, default=lang.compiler.OUTPUT_FORMAT,
+                    help='write the program as opcode constructors or as packed bytecode (default: %(default)s)')
+parser.add_argument('--bundle', action='store_true',
+                    help='write self-contained pages with only the parts of the runtime each program uses')
+parser.add_argument('--profile', action='store_true',
+                    help='print the time spent in each compilation phase to stderr')
+parser.add_argument('--profile-json', metavar='FILE', default=None,
+                    help='write the profile report(s) as JSON to FILE (- for stdout)')
+parser.add_argument('--cprofile', action='store_true',
+                    help='include the hottest functions (cProfile) in the profile')
+parser.add_argument('--tracemalloc', action='store_true',
+                    help='include the largest allocations (tracemalloc) in the profile, or, in Pythons '
+                         'without tracemalloc, how much each phase raises the peak RSS')
+args = parser.parse_args()
+
+cache_dir = None if args.no_cache else CACHE_DIR
+if args.no_optimize:
+    lang.compiler.OPTIMIZE = False
+if args.no_fuse:
+    lang.compiler.FUSE = False
+if args.no_infer_types:
+    lang.compiler.INFER_TYPES = False
+lang.compiler.BACKEND = args.backend
+lang.compiler.OUTPUT_FORMAT = args.format
+lang.compiler.BUNDLE = args.bundle
+
+# With the JSON report on stdout, everything else the compiler prints
+# goes to stderr, so that stdout stays valid JSON.
+json_out = sys.stdout
+if args.profile_json == '-':
+    sys.stdout = sys.stderr
 
-in_fn = sys.argv[1]
+profile = None
+if args.profile or args.profile_json or args.cprofile or args.tracemalloc:
+    profile = (args.cprofile, args.tracemalloc)
 
-out_fn = 'output/' + os.path.basename(in_fn.lower())
-if out_fn.endswith('.bas'):
-    out_fn = out_fn[:-4]
-out_fn += '.html'
+def write_profiles(reports):
+    if args.profile or not args.profile_json:
+        for program, report in reports:
+            lang.profiler.write_text_report(program, report)
+    if args.profile_json == '-':
+        lang.profiler.write_json_report(dict(reports), json_out)
+    elif args.profile_json:
+        f = open(args.profile_json, 'w')
+        lang.profiler.write_json_report(dict(reports), f)
+        f.close()
 
-compiler = Compiler()
-compiler.compile_file(in_fn, out_fn)
+try:
+    jobs = lang.batch.find_jobs(args.inputs, args.output_dir)
+    if not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+except Exception, e:
+    sys.stderr.write('%s\n' % (e,))
+    sys.exit(1)
+
+if len(args.inputs) == 1 and len(jobs) == 1 and jobs[0].in_fn == args.inputs[0]:
+    # Single program: compile in this process, with the full trace.
+    profiler = None
+    if profile is not None:
+        profiler = lang.profiler.CompileProfiler(*profile)
+    compiler = Compiler(cache_dir=cache_dir)
+    compiler.compile_file(jobs[0].in_fn, jobs[0].out_fn, profiler)
+    if profiler is not None:
+        write_profiles([(jobs[0].in_fn, profiler.report())])
+    sys.exit(0)
 
+def report(result):
+    status = 'ok' if result.ok else 'FAILED'
+    sys.stderr.write('%-6s %7.2fs  %s\n' % (status, result.elapsed, result.job.in_fn))
+    if not result.ok:
+        sys.stderr.write(result.error)
+
+start = time.time()
+results = lang.batch.compile_batch(jobs, cache_dir, args.jobs, report, profile)
+lang.batch.print_summary(jobs, results, time.time() - start, sys.stdout)
+if profile is not None:
+    write_profiles([(result.job.in_fn, result.profile) for result in results if result.ok])
+if not all([result.ok for result in results]):
+    sys.exit(1)
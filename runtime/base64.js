@@ -28,6 +28,39 @@ function Base64() {
         return output;
     };
 
+    /* Bytes encoded in base64, as a Uint8Array. */
+    that.decode_bytes = function (input) {
+        var bytes = new Uint8Array(Math.floor(input.replace(/=+$/, '').length * 3 / 4));
+        var word = 0, nbits = 0, nbytes = 0;
+        var values = new Int8Array(128);
+        for (var i = 0; i < 128; i++) {
+            values[i] = code.indexOf(String.fromCharCode(i));
+        }
+        for (var i = 0; i < input.length; i++) {
+            var value = values[input.charCodeAt(i) & 0x7f];
+            if (value < 0 || value == 64) {
+                continue;
+            }
+            word = (word << 6) | value;
+            nbits += 6;
+            if (nbits >= 8) {
+                nbits -= 8;
+                bytes[nbytes++] = (word >> nbits) & 0xff;
+            }
+        }
+        return bytes;
+    };
+
+    /* Little-endian 32-bit words encoded in base64 (see lang/bytecode.py). */
+    that.decode_words = function (input) {
+        var bytes = that.decode_bytes(input);
+        var words = new Int32Array(bytes.length >> 2);
+        for (var i = 0; i < words.length; i++) {
+            words[i] = bytes[4 * i] | (bytes[4 * i + 1] << 8) | (bytes[4 * i + 2] << 16) | (bytes[4 * i + 3] << 24);
+        }
+        return words;
+    };
+
     that._utf8_encode = function (string) {
         string = string.replace(/\r\n/g,"\n");
         var utftext = "";
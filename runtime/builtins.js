@@ -1,30 +1,32 @@
 
+/* Arguments of _MKARRAY: the initial value of the elements, the suffix of
+ * the name of the array and the lower and upper bounds of each of its
+ * dimensions (see BasicArray in vm.js). */
+function mkarray_domain() {
+    var bounds = [NUMBER, NUMBER];
+    for (var i = 1; i < MAX_ARRAY_DIMENSIONS; i++) {
+        bounds = [NUMBER, NUMBER, bounds];
+    }
+    return FUNCTION([ANY, STRING].concat(bounds));
+}
+
 function global_primitives() {
     var primitives = {};
 
     primitives['_MKARRAY'] = fix_type(
-        FUNCTION([ANY, NUMBER, [NUMBER]]),
-        function (state, args) {
-            var lower;
-            var upper;
-            if (args.length == 2) {
-                lower = 0;
-                upper = args[1];
-            } else {
-                lower = args[1];
-                upper = args[2];
+        mkarray_domain(),
+        function (state, value, suffix) {
+            var bounds = [];
+            for (var i = 3; i < arguments.length; i++) {
+                bounds.push(arguments[i]);
             }
-            var res = new Array();
-            for (var i = lower; i <= upper; i++) {
-                res[i] = args[0];
-            }
-            return res;
+            return new BasicArray(value, suffix, bounds);
         }
     );
 
     primitives['_STACK_POP'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             state.stack.pop();
             return VM_OK;
         }
@@ -32,7 +34,7 @@ function global_primitives() {
 
     primitives['_RESET'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             state.reset();
             return VM_OK;
         }
@@ -40,14 +42,14 @@ function global_primitives() {
 
     primitives['_INPUT'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             return VM_INPUT;
         }
     );
 
     primitives['_STACK_DUP'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             var x = state.stack.pop();
             state.stack.push(x);
             state.stack.push(x);
@@ -57,9 +59,9 @@ function global_primitives() {
 
     primitives['_ON_TIMER_GOSUB'] = fix_type(
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            state.timer_interval = 1000 * args[0];
-            state.timer_routine = args[1];
+        function (state, interval, routine) {
+            state.timer_interval = 1000 * interval;
+            state.timer_routine = routine;
             state.timer_gosub = true;
             return VM_OK;
         }
@@ -67,9 +69,9 @@ function global_primitives() {
 
     primitives['_ON_TIMER_GOTO'] = fix_type(
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            state.timer_interval = 1000 * args[0];
-            state.timer_routine = args[1];
+        function (state, interval, routine) {
+            state.timer_interval = 1000 * interval;
+            state.timer_routine = routine;
             state.timer_gosub = false;
             return VM_OK;
         }
@@ -77,7 +79,7 @@ function global_primitives() {
 
     primitives['_TIMER_ON'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             state.timer_on = true;
             state.timer_last = new Date().getTime();
             return VM_OK;
@@ -86,7 +88,7 @@ function global_primitives() {
 
     primitives['_TIMER_OFF'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             state.timer_on = false;
             return VM_OK;
         }
@@ -94,33 +96,32 @@ function global_primitives() {
 
     primitives['_DRAW'] = fix_type(
         FUNCTION([ANY]),
-        function (state, args) {
-            state.screen.draw(args[0]);
+        function (state, commands) {
+            state.screen.draw(commands);
             return VM_OK;
         }
     );
 
     primitives['ABS'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER]),
-        function (state, args) {
-            return Math.abs(args[0]);
+        function (state, x) {
+            return Math.abs(x);
         }
     );
 
     primitives['ASC'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING]),
-        function (state, args) {
-            if (args[0].length == 0) {
+        function (state, s) {
+            if (s.length == 0) {
                 throw new Exception("Illegal function call");
             }
-            return args[0].charCodeAt(0);
+            return s.charCodeAt(0);
         }
     );
 
     primitives['CHR$'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER]),
-        function (state, args) {
-            var code = args[0];
+        function (state, code) {
             if (code < 0 || code >= 256) {
                 throw new Exception("Illegal function call");
             }
@@ -129,22 +130,20 @@ function global_primitives() {
     );
 
     primitives['CIRCLE'] = fix_type(
-        FUNCTION([NUMBER, NUMBER, NUMBER, [NUMBER, [NUMBER, [NUMBER]]]]),
-        function (state, args) {
-            var x = args[0];
-            var y = args[1];
-            var radius = args[2];
-            var color = args.length > 3 ? args[3] : state.screen.current_fg();
-            var start = args.length > 4 ? args[4] : 0;
-            var end = args.length > 5 ? args[5] : 2 * Math.PI;
-            state.screen.circle(x, y, radius, color, start, end);
+        FUNCTION([NUMBER, NUMBER, NUMBER, [NUMBER, [NUMBER, [NUMBER, [NUMBER]]]]]),
+        function (state, x, y, radius, color, start, end, aspect) {
+            color = color !== undefined ? color : state.screen.current_fg();
+            start = start !== undefined ? start : 0;
+            end = end !== undefined ? end : 2 * Math.PI;
+            aspect = aspect !== undefined ? aspect : state.screen.default_aspect();
+            state.screen.circle(x, y, radius, color, start, end, aspect);
             return VM_IO;
         }
     );
 
     primitives['CLS'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             state.screen.cls();
             return VM_IO;
         }
@@ -152,9 +151,8 @@ function global_primitives() {
 
     primitives['COLOR'] = fix_type(
         FUNCTION([NUMBER, [NUMBER]]),
-        function (state, args) {
-            var fg = args[0];
-            var bg = args.length == 2 ? args[1] : state.screen.current_bg();
+        function (state, fg, bg) {
+            bg = bg !== undefined ? bg : state.screen.current_bg();
             state.screen.color(fg, bg);
             return VM_OK;
         }
@@ -162,7 +160,7 @@ function global_primitives() {
 
     primitives['DATE$'] = fix_type( /* EXPRESSION */
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             var now = new Date();
             var day = now.getDate();
             var month = now.getMonth() + 1;
@@ -176,30 +174,28 @@ function global_primitives() {
 
     primitives['INKEY$'] = fix_type( /* EXPRESSION */
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             return state.input.inkey();
         }
     );
 
     primitives['INT'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER]),
-        function (state, args) {
-            return Math.floor(args[0]);
+        function (state, x) {
+            return Math.floor(x);
         }
     );
 
     primitives['LCASE$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING]),
-        function (state, args) {
-            return args[0].toLowerCase();
+        function (state, s) {
+            return s.toLowerCase();
         }
     );
 
     primitives['LEFT$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING, NUMBER]),
-        function (state, args) {
-            var s = args[0];
-            var n = args[1];
+        function (state, s, n) {
             if (n > s.length) {
                 n = s.length;
             }
@@ -209,20 +205,16 @@ function global_primitives() {
 
     primitives['LEN'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING]),
-        function (state, args) {
-            return args[0].length;
+        function (state, s) {
+            return s.length;
         }
     );
 
     primitives['LINE'] = fix_type(
         FUNCTION([NUMBER, NUMBER, NUMBER, NUMBER, [NUMBER, [ENUM(['', 'B', 'BF'])]]]),
-        function (state, args) {
-            var x0 = args[0];
-            var y0 = args[1];
-            var x1 = args[2];
-            var y1 = args[3];
-            var color = args.length > 4 ? args[4] : state.screen.current_fg();
-            var fill = args.length > 5 ? args[5] : '';
+        function (state, x0, y0, x1, y1, color, fill) {
+            color = color !== undefined ? color : state.screen.current_fg();
+            fill = fill !== undefined ? fill : '';
             if (fill == '') {
                 state.screen.line(x0, y0, x1, y1, color);
             } else if (fill == 'B') {
@@ -236,9 +228,9 @@ function global_primitives() {
 
     primitives['LOCATE'] = fix_type(
         FUNCTION([[NUMBER, [NUMBER]]]),
-        function (state, args) {
-            var row = args.length >= 1 ? args[0] : state.screen.current_row();
-            var col = args.length == 2 ? args[1] : state.screen.current_col();
+        function (state, row, col) {
+            row = row !== undefined ? row : state.screen.current_row();
+            col = col !== undefined ? col : state.screen.current_col();
             state.screen.locate(row, col);
             return VM_OK;
         }
@@ -246,9 +238,8 @@ function global_primitives() {
 
     primitives['LTRIM$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING]),
-        function (state, args) {
+        function (state, s) {
             var i = 0;
-            var s = args[0];
             while (i < s.length && s[i] == ' ') {
                 i++;
             }
@@ -258,12 +249,11 @@ function global_primitives() {
 
     primitives['MID$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING, NUMBER, [NUMBER]]),
-        function (state, args) {
-            var s = args[0];
-            var i = args[1] - 1;
+        function (state, s, start, length) {
+            var i = start - 1;
             var j;
-            if (args.length == 3) {
-                j = args[2];
+            if (length !== undefined) {
+                j = length;
             } else {
                 j = s.length - i;
             }
@@ -277,15 +267,15 @@ function global_primitives() {
 
     primitives['_PLAY_SOUND'] = fix_type(
         FUNCTION([ANY]),
-        function (state, args) {
-            args[0].play()
+        function (state, sound) {
+            sound.play()
             return VM_OK;
         }
     );
 
     primitives['SOUND'] = fix_type(
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
+        function (state, frequency, duration) {
             /* XXX: not implemented */
             return VM_OK;
         }
@@ -293,11 +283,8 @@ function global_primitives() {
 
     primitives['PAINT'] = fix_type(
         FUNCTION([NUMBER, NUMBER, [NUMBER, [NUMBER]]]),
-        function (state, args) {
-            var color;
-            if (args.length == 3) {
-                color = args[2];
-            } else {
+        function (state, x, y, color, border) {
+            if (color === undefined) {
                 color = state.screen.current_bg();
             }
             /* XXX: not implemented */
@@ -305,8 +292,7 @@ function global_primitives() {
         }
     );
 
-    function primitive_print(state, args, sep) {
-        var x = args[0];
+    function primitive_print(state, x, sep) {
         if (typeof x == 'string') {
             state.screen.print(x, sep);
         } else if (typeof x == 'number') {
@@ -322,46 +308,42 @@ function global_primitives() {
 
     primitives['PRESET'] = fix_type(
         FUNCTION([NUMBER, NUMBER, [NUMBER]]),
-        function (state, args) {
-            var color;
-            if (args.length == 3) {
-                color = args[2];
-            } else {
+        function (state, x, y, color) {
+            if (color === undefined) {
                 color = state.screen.current_bg();
             }
-            state.screen.preset(args[0], args[1], color);
+            state.screen.preset(x, y, color);
             return VM_IO;
         }
     );
 
     primitives['PRINT'] = fix_type(
         FUNCTION([ANY]),
-        function (state, args) {
-            primitive_print(state, args, SCREEN_PRINT_SEP_ENTER);
+        function (state, x) {
+            primitive_print(state, x, SCREEN_PRINT_SEP_ENTER);
             return VM_IO;
         }
     );
 
     primitives['PRINT;'] = fix_type(
         FUNCTION([ANY]),
-        function (state, args) {
-            primitive_print(state, args, SCREEN_PRINT_SEP_CONCAT);
+        function (state, x) {
+            primitive_print(state, x, SCREEN_PRINT_SEP_CONCAT);
             return VM_IO;
         }
     );
 
     primitives['PRINT,'] = fix_type(
         FUNCTION([ANY]),
-        function (state, args) {
-            primitive_print(state, args, SCREEN_PRINT_SEP_TAB);
+        function (state, x) {
+            primitive_print(state, x, SCREEN_PRINT_SEP_TAB);
             return VM_IO;
         }
     );
 
     primitives['RANDOMIZE'] = fix_type(
         FUNCTION([NUMBER]),
-        function (state, args) {
-            var value = args[0];
+        function (state, value) {
             state.rng.randomize(value);
             return VM_OK;
         }
@@ -369,9 +351,7 @@ function global_primitives() {
 
     primitives['RIGHT$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING, NUMBER]),
-        function (state, args) {
-            var s = args[0];
-            var n = args[1];
+        function (state, s, n) {
             if (n > s.length) {
                 n = s.length;
             }
@@ -381,16 +361,14 @@ function global_primitives() {
 
     primitives['RND'] = fix_type( /* EXPRESSION */
         FUNCTION([]),
-        function (state, args) {
-            var value = args[0];
+        function (state) {
             return state.rng.rnd();
         }
     );
 
     primitives['RTRIM$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING]),
-        function (state, args) {
-            var s = args[0];
+        function (state, s) {
             var i = s.length - 1;
             while (i >= 0 && s[i] == ' ') {
                 i--;
@@ -401,23 +379,23 @@ function global_primitives() {
 
     primitives['_SCREEN'] = fix_type(
         FUNCTION([NUMBER]),
-        function (state, args) {
-            state.screen.init_screen(args[0]);
+        function (state, mode) {
+            state.screen.init_screen(mode);
             return VM_IO;
         }
     );
 
     primitives['SCREEN'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return state.screen.at(args[0], args[1]);
+        function (state, row, col) {
+            return state.screen.at(row, col);
         }
     );
 
     primitives['SLEEP'] = fix_type(
         FUNCTION([[NUMBER]]),
-        function (state, args) {
-            var delay = (args.length == 1) ? 1000 * args[0] : 24 * 60 * 60 * 1000;
+        function (state, seconds) {
+            var delay = seconds !== undefined ? 1000 * seconds : 24 * 60 * 60 * 1000;
             state.sleep_wakeup = new Date().getTime() + delay;
             return VM_SLEEP;
         }
@@ -425,16 +403,16 @@ function global_primitives() {
 
     primitives['STR$'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER]),
-        function (state, args) {
-            return args[0].toString();
+        function (state, x) {
+            return x.toString();
         }
     );
 
     primitives['SPACE$'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER]),
-        function (state, args) {
+        function (state, n) {
             var res = '';
-            for (var i = 0; i < args[0]; i++) {
+            for (var i = 0; i < n; i++) {
                 res = res + ' '; 
             }
             return res;
@@ -443,15 +421,15 @@ function global_primitives() {
 
     primitives['STRING$'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, SCALAR]),
-        function (state, args) {
+        function (state, n, c) {
             var res = '';
             var rep;
-            if (typeof args[1] == 'string') {
-                rep = args[1];
+            if (typeof c == 'string') {
+                rep = c;
             } else {
-                rep = String.fromCharCode(args[1]);
+                rep = String.fromCharCode(c);
             }
-            for (var i = 0; i < args[0]; i++) {
+            for (var i = 0; i < n; i++) {
                 res = res + rep; 
             }
             return res;
@@ -460,7 +438,7 @@ function global_primitives() {
 
     primitives['SYSTEM'] = fix_type(
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             state.error_handler.message('Execution finished.');
             return VM_EXIT;
         }
@@ -468,7 +446,7 @@ function global_primitives() {
 
     primitives['TIME$'] = fix_type( /* EXPRESSION */
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             var now = new Date().getTime();
             var seconds = Math.floor(now / 1000);
             var minutes = Math.floor(seconds / 60);
@@ -485,7 +463,7 @@ function global_primitives() {
 
     primitives['TIMER'] = fix_type( /* EXPRESSION */
         FUNCTION([]),
-        function (state, args) {
+        function (state) {
             var now = new Date();
             var start = new Date(now.getFullYear(), now.getMonth(), now.getDate(), 0, 0, 0);
             return (now.getTime() - start.getTime()) / 1000.0;
@@ -494,15 +472,15 @@ function global_primitives() {
 
     primitives['UCASE$'] = fix_type( /* EXPRESSION */
         FUNCTION([STRING]),
-        function (state, args) {
-            return args[0].toUpperCase();
+        function (state, s) {
+            return s.toUpperCase();
         }
     );
 
     primitives['VAL'] = fix_type( /* EXPRESSION */
         FUNCTION([ANY]),
-        function (state, args) {
-            return Number(args[0]);
+        function (state, x) {
+            return Number(x);
         }
     );
 
@@ -518,157 +496,157 @@ function global_primitives() {
 
     primitives['XOR'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return from_boolean(!(args[0] === args[1]));
+        function (state, x, y) {
+            return from_boolean(!(x === y));
         }
     );
 
     primitives['EQV'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return from_boolean(args[0] === args[1]);
+        function (state, x, y) {
+            return from_boolean(x === y);
         }
     );
 
     primitives['XOR'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return args[0] ^ args[1];
+        function (state, x, y) {
+            return x ^ y;
         }
     );
 
     primitives['OR'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return args[0] | args[1];
+        function (state, x, y) {
+            return x | y;
         }
     );
 
     primitives['AND'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return args[0] & args[1];
+        function (state, x, y) {
+            return x & y;
         }
     );
 
     primitives['NOT'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER]),
-        function (state, args) {
-            return from_boolean(!to_boolean(args[0]));
+        function (state, x) {
+            return from_boolean(!to_boolean(x));
         }
     );
 
     primitives['='] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            return from_boolean(args[0] === args[1]);
+        function (state, x, y) {
+            return from_boolean(x === y);
         }
     );
 
     primitives['>'] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            return from_boolean(args[0] > args[1]);
+        function (state, x, y) {
+            return from_boolean(x > y);
         }
     );
 
     primitives['<'] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            return from_boolean(args[0] < args[1]);
+        function (state, x, y) {
+            return from_boolean(x < y);
         }
     );
 
     primitives['<>'] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            return from_boolean(!(args[0] === args[1]));
+        function (state, x, y) {
+            return from_boolean(!(x === y));
         }
     );
 
     primitives['<='] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            return from_boolean(args[0] <= args[1]);
+        function (state, x, y) {
+            return from_boolean(x <= y);
         }
     );
 
     primitives['>='] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            return from_boolean(args[0] >= args[1]);
+        function (state, x, y) {
+            return from_boolean(x >= y);
         }
     );
 
     primitives['+'] = fix_type( /* EXPRESSION */
         FUNCTION([SCALAR, SCALAR]),
-        function (state, args) {
-            if (typeof args[0] != typeof args[1]) {
-                args[0] = args[0].toString();
-                args[1] = args[1].toString();
+        function (state, x, y) {
+            if (typeof x != typeof y) {
+                x = x.toString();
+                y = y.toString();
             }
-            return args[0] + args[1];
+            return x + y;
         }
     );
 
     primitives['MOD'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            if (args[1] == 0) {
+        function (state, x, y) {
+            if (y == 0) {
                 throw new Exception('Zero division error.');
             } else {
-                return args[0] % args[1];
+                return x % y;
             }
         }
     );
 
     primitives['\\'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            if (args[1] == 0) {
+        function (state, x, y) {
+            if (y == 0) {
                 throw new Exception('Zero division error.');
             } else {
-                return Math.floor(args[0] / args[1]);
+                return Math.floor(x / y);
             }
         }
     );
 
     primitives['*'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            return args[0] * args[1];
+        function (state, x, y) {
+            return x * y;
         }
     );
 
     primitives['/'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            if (args[1] == 0) {
+        function (state, x, y) {
+            if (y == 0) {
                 throw new Exception('Zero division error.');
             } else {
-                return args[0] / args[1];
+                return x / y;
             }
         }
     );
 
     primitives['-'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, [NUMBER]]),
-        function (state, args) {
-            if (args.length == 2) {
-                return args[0] - args[1];
+        function (state, x, y) {
+            if (y !== undefined) {
+                return x - y;
             } else {
-                return -args[0];
+                return -x;
             }
         }
     );
      
     primitives['^'] = fix_type( /* EXPRESSION */
         FUNCTION([NUMBER, NUMBER]),
-        function (state, args) {
-            if (args[1] === (args[1] | 0)) {
-                return power(args[0], args[1]);
+        function (state, x, y) {
+            if (y === (y | 0)) {
+                return power(x, y);
             } else {
-                return Math.exp(Math.log(args[0]) * args[1]);
+                return Math.exp(Math.log(x) * y);
             }
         }
     );
@@ -1,258 +1,3 @@
-var SCREEN0_DATA = [
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[1,3,6],[0,4,1],[7,4,1],[0,5,1],[2,5,1],[5,5,1],[7,5,1],[0,6,1],[7,6,1],[0,7,1],[7,7,1],[0,8,1],[2,8,4],[7,8,1],[0,9,1],[3,9,2],[7,9,1],[0,10,1],[7,10,1],[0,11,1],[7,11,1],[1,12,6]],
-[[1,3,6],[0,4,8],[0,5,2],[3,5,2],[6,5,2],[0,6,8],[0,7,8],[0,8,2],[6,8,2],[0,9,3],[5,9,3],[0,10,8],[0,11,8],[1,12,6]],
-[[1,4,2],[4,4,2],[0,5,7],[0,6,7],[0,7,7],[0,8,7],[1,9,5],[2,10,3],[3,11,1]],
-[[3,4,1],[2,5,3],[1,6,5],[0,7,7],[1,8,5],[2,9,3],[3,10,1]],
-[[3,3,2],[2,4,4],[2,5,4],[0,6,3],[5,6,3],[0,7,3],[5,7,3],[0,8,3],[5,8,3],[3,9,2],[3,10,2],[2,11,4]],
-[[3,3,2],[2,4,4],[1,5,6],[0,6,8],[0,7,8],[1,8,6],[3,9,2],[3,10,2],[2,11,4]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,3],[5,6,3],[0,7,2],[6,7,2],[0,8,2],[6,8,2],[0,9,3],[5,9,3],[0,10,8],[0,11,8],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[1,3,7],[1,4,2],[6,4,2],[1,5,7],[1,6,2],[6,6,2],[1,7,2],[6,7,2],[1,8,2],[6,8,2],[1,9,2],[6,9,2],[1,10,2],[5,10,3],[0,11,3],[5,11,3],[0,12,3],[5,12,2],[0,13,2]],
-[[3,3,2],[3,4,2],[0,5,2],[3,5,2],[6,5,2],[2,6,4],[0,7,3],[5,7,3],[2,8,4],[0,9,2],[3,9,2],[6,9,2],[3,10,2],[3,11,2]],
-[[0,2,1],[0,3,2],[0,4,3],[0,5,4],[0,6,5],[0,7,7],[0,8,5],[0,9,4],[0,10,3],[0,11,2],[0,12,1]],
-[[6,2,1],[5,3,2],[4,4,3],[3,5,4],[2,6,5],[0,7,7],[2,8,5],[3,9,4],[4,10,3],[5,11,2],[6,12,1]],
-[[3,3,2],[2,4,4],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[1,9,6],[2,10,4],[3,11,2]],
-[[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2]],
-[[1,3,7],[0,4,2],[3,4,2],[6,4,2],[0,5,2],[3,5,2],[6,5,2],[0,6,2],[3,6,2],[6,6,2],[1,7,4],[6,7,2],[3,8,2],[6,8,2],[3,9,2],[6,9,2],[3,10,2],[6,10,2],[3,11,2],[6,11,2],[3,12,2],[6,12,2]],
-[[1,1,5],[0,2,2],[5,2,2],[1,3,2],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[1,8,2],[4,8,2],[2,9,3],[4,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,9,7],[0,10,7],[0,11,7],[0,12,7]],
-[[3,3,2],[2,4,4],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[1,9,6],[2,10,4],[3,11,2],[1,12,6]],
-[[3,3,2],[2,4,4],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2]],
-[[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[1,10,6],[2,11,4],[3,12,2]],
-[[3,5,2],[4,6,2],[0,7,7],[4,8,2],[3,9,2]],
-[[2,5,2],[1,6,2],[0,7,7],[1,8,2],[2,9,2]],
-[],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[],
-[[3,3,2],[2,4,4],[2,5,4],[2,6,4],[3,7,2],[3,8,2],[3,9,2],[3,11,2],[3,12,2]],
-[[1,1,2],[5,1,2],[1,2,2],[5,2,2],[1,3,2],[5,3,2],[2,4,1],[5,4,1]],
-[[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,7],[1,7,2],[4,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[0,10,7],[1,11,2],[4,11,2],[1,12,2],[4,12,2]],
-[[3,1,2],[3,2,2],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[1,7,5],[5,8,2],[5,9,2],[0,10,1],[5,10,2],[0,11,2],[5,11,2],[1,12,5],[3,13,2],[3,14,2]],
-[[0,5,2],[6,5,1],[0,6,2],[5,6,2],[4,7,2],[3,8,2],[2,9,2],[1,10,2],[0,11,2],[5,11,2],[0,12,1],[5,12,2]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3],[1,7,3],[5,7,2],[0,8,2],[3,8,3],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[2,3,2],[2,4,2],[2,5,2],[1,6,2]],
-[[4,3,2],[3,4,2],[2,5,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[3,11,2],[4,12,2]],
-[[2,3,2],[3,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[4,10,2],[3,11,2],[2,12,2]],
-[[1,6,2],[5,6,2],[2,7,4],[0,8,8],[2,9,4],[1,10,2],[5,10,2]],
-[[3,6,2],[3,7,2],[1,8,6],[3,9,2],[3,10,2]],
-[[3,11,2],[3,12,2],[3,13,2],[2,14,2]],
-[[0,8,7]],
-[[3,11,2],[3,12,2]],
-[[6,5,1],[5,6,2],[4,7,2],[3,8,2],[2,9,2],[1,10,2],[0,11,2],[0,12,1]],
-[[2,3,3],[1,4,2],[4,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[3,7,1],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,2],[4,11,2],[2,12,3]],
-[[3,3,2],[2,4,3],[1,5,4],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[1,12,6]],
-[[1,3,5],[0,4,2],[5,4,2],[5,5,2],[4,6,2],[3,7,2],[2,8,2],[1,9,2],[0,10,2],[0,11,2],[5,11,2],[0,12,7]],
-[[1,3,5],[0,4,2],[5,4,2],[5,5,2],[5,6,2],[2,7,4],[5,8,2],[5,9,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[4,3,2],[3,4,3],[2,5,4],[1,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,7],[4,9,2],[4,10,2],[4,11,2],[3,12,4]],
-[[0,3,7],[0,4,2],[0,5,2],[0,6,2],[0,7,6],[5,8,2],[5,9,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[2,3,3],[1,4,2],[0,5,2],[0,6,2],[0,7,6],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,3,7],[0,4,2],[5,4,2],[5,5,2],[5,6,2],[4,7,2],[3,8,2],[2,9,2],[2,10,2],[2,11,2],[2,12,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[1,7,6],[5,8,2],[5,9,2],[5,10,2],[4,11,2],[1,12,4]],
-[[3,6,2],[3,7,2],[3,11,2],[3,12,2]],
-[[3,6,2],[3,7,2],[3,11,2],[3,12,2],[2,13,2]],
-[[5,4,2],[4,5,2],[3,6,2],[2,7,2],[1,8,2],[2,9,2],[3,10,2],[4,11,2],[5,12,2]],
-[[1,6,6],[1,9,6]],
-[[1,4,2],[2,5,2],[3,6,2],[4,7,2],[5,8,2],[4,9,2],[3,10,2],[2,11,2],[1,12,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[4,6,2],[3,7,2],[3,8,2],[3,9,2],[3,11,2],[3,12,2]],
-[[1,4,5],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[3,7,4],[0,8,2],[3,8,4],[0,9,2],[3,9,4],[0,10,2],[3,10,3],[0,11,2],[1,12,5]],
-[[3,3,1],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,5],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[0,12,6]],
-[[2,3,4],[1,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[6,10,1],[1,11,2],[5,11,2],[2,12,4]],
-[[0,3,5],[1,4,2],[4,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[4,11,2],[0,12,5]],
-[[0,3,7],[1,4,2],[5,4,2],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,4],[1,8,2],[4,8,1],[1,9,2],[1,10,2],[6,10,1],[1,11,2],[5,11,2],[0,12,7]],
-[[0,3,7],[1,4,2],[5,4,2],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,4],[1,8,2],[4,8,1],[1,9,2],[1,10,2],[1,11,2],[0,12,4]],
-[[2,3,4],[1,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[0,7,2],[0,8,2],[3,8,4],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,2],[5,11,2],[2,12,3],[6,12,1]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,7],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[2,3,4],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[3,3,4],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,4]],
-[[0,3,3],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,4],[1,8,4],[1,9,2],[4,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[0,12,3],[5,12,2]],
-[[0,3,4],[1,4,2],[1,5,2],[1,6,2],[1,7,2],[1,8,2],[1,9,2],[1,10,2],[6,10,1],[1,11,2],[5,11,2],[0,12,7]],
-[[0,3,2],[5,3,2],[0,4,3],[4,4,3],[0,5,7],[0,6,7],[0,7,2],[3,7,1],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[0,3,2],[5,3,2],[0,4,3],[5,4,2],[0,5,4],[5,5,2],[0,6,7],[0,7,2],[3,7,4],[0,8,2],[4,8,3],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,5],[1,8,2],[1,9,2],[1,10,2],[1,11,2],[0,12,4]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,4],[1,12,5],[4,13,2],[4,14,3]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,5],[1,8,2],[4,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[0,12,3],[5,12,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[2,7,3],[4,8,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[1,3,6],[1,4,6],[1,5,1],[3,5,2],[6,5,1],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,2],[4,10,2],[2,11,3],[3,12,1]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[3,7,1],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,7],[0,11,3],[4,11,3],[1,12,2],[4,12,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,5],[2,7,3],[2,8,3],[1,9,5],[1,10,2],[4,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[2,7,4],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[0,3,7],[0,4,2],[5,4,2],[0,5,1],[5,5,2],[4,6,2],[3,7,2],[2,8,2],[1,9,2],[0,10,2],[6,10,1],[0,11,2],[5,11,2],[0,12,7]],
-[[2,3,4],[2,4,2],[2,5,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[2,11,2],[2,12,4]],
-[[0,4,1],[0,5,2],[0,6,3],[1,7,3],[2,8,3],[3,9,3],[4,10,3],[5,11,2],[6,12,1]],
-[[2,3,4],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[4,10,2],[4,11,2],[2,12,4]],
-[[2,0,3],[1,1,2],[4,1,2]],
-[[0,13,8]],
-[[2,0,2],[3,1,2]],
-[[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[0,3,3],[1,4,2],[1,5,2],[1,6,4],[1,7,2],[4,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,5]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,2],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[3,3,3],[4,4,2],[4,5,2],[2,6,4],[1,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[3,3,3],[2,4,2],[5,4,2],[2,5,2],[6,5,1],[2,6,2],[1,7,4],[2,8,2],[2,9,2],[2,10,2],[2,11,2],[1,12,4]],
-[[1,6,3],[5,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,5],[4,13,2],[0,14,2],[4,14,2],[1,15,4]],
-[[0,3,3],[1,4,2],[1,5,2],[1,6,2],[4,6,2],[1,7,3],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[0,12,3],[5,12,2]],
-[[3,3,2],[3,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[5,3,2],[5,4,2],[4,6,3],[5,7,2],[5,8,2],[5,9,2],[5,10,2],[5,11,2],[5,12,2],[1,13,2],[5,13,2],[1,14,2],[5,14,2],[2,15,4]],
-[[0,3,3],[1,4,2],[1,5,2],[1,6,2],[5,6,2],[1,7,2],[4,7,2],[1,8,4],[1,9,4],[1,10,2],[4,10,2],[1,11,2],[5,11,2],[0,12,3],[5,12,2]],
-[[2,3,3],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[0,6,3],[4,6,2],[0,7,7],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2],[0,12,2],[5,12,2]],
-[[0,6,2],[3,6,3],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,6,2],[3,6,3],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,5],[1,13,2],[1,14,2],[0,15,4]],
-[[1,6,3],[5,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,5],[4,13,2],[4,14,2],[3,15,4]],
-[[0,6,2],[3,6,3],[1,7,3],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[1,10,2],[1,11,2],[0,12,4]],
-[[1,6,5],[0,7,2],[5,7,2],[1,8,2],[2,9,3],[4,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[3,3,1],[2,4,2],[2,5,2],[0,6,6],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[2,11,2],[5,11,2],[3,12,3]],
-[[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,2],[4,11,2],[2,12,3]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[3,10,1],[5,10,2],[0,11,7],[1,12,2],[4,12,2]],
-[[0,6,2],[5,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[2,10,3],[1,11,2],[4,11,2],[0,12,2],[5,12,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,6],[5,13,2],[4,14,2],[0,15,5]],
-[[0,6,7],[0,7,2],[4,7,2],[3,8,2],[2,9,2],[1,10,2],[0,11,2],[5,11,2],[0,12,7]],
-[[4,3,3],[3,4,2],[3,5,2],[3,6,2],[1,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[4,12,3]],
-[[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2]],
-[[1,3,3],[3,4,2],[3,5,2],[3,6,2],[4,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[1,12,3]],
-[[1,0,3],[5,0,2],[0,1,2],[3,1,3]],
-[[3,6,1],[2,7,3],[1,8,2],[4,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,7]],
-[[2,3,4],[1,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[6,10,1],[1,11,2],[5,11,2],[2,12,4],[3,13,2],[4,14,2],[1,15,4]],
-[[0,4,2],[4,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[5,2,2],[4,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[3,2,1],[2,3,3],[1,4,2],[4,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[0,4,2],[4,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[0,2,2],[1,3,2],[2,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[2,2,3],[1,3,2],[4,3,2],[2,4,3],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,2],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5],[3,13,2],[4,14,2],[1,15,4]],
-[[3,2,1],[2,3,3],[1,4,2],[4,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,4,2],[5,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[1,2,2],[2,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[1,4,2],[5,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[3,2,2],[2,3,4],[1,4,2],[5,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[1,2,2],[2,3,2],[3,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[0,1,2],[5,1,2],[3,3,1],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[2,0,3],[1,1,2],[4,1,2],[2,2,3],[3,3,1],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[4,0,2],[3,1,2],[0,3,7],[1,4,2],[5,4,2],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,4],[1,8,2],[4,8,1],[1,9,2],[1,10,2],[6,10,1],[1,11,2],[5,11,2],[0,12,7]],
-[[0,6,3],[4,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2],[1,9,6],[0,10,2],[3,10,2],[0,11,2],[3,11,2],[1,12,2],[4,12,3]],
-[[2,3,5],[1,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,2],[4,6,2],[0,7,7],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,3]],
-[[3,2,1],[2,3,3],[1,4,2],[4,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,4,2],[5,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[1,2,2],[2,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[2,2,2],[1,3,4],[0,4,2],[4,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[0,2,2],[1,3,2],[2,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[0,4,2],[5,4,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,6],[5,13,2],[4,14,2],[0,15,5]],
-[[0,1,2],[5,1,2],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,1,2],[5,1,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[3,3,2],[3,4,2],[1,5,5],[0,6,2],[5,6,2],[0,7,2],[0,8,2],[0,9,2],[5,9,2],[1,10,5],[3,11,2],[3,12,2]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[5,5,1],[1,6,2],[0,7,4],[1,8,2],[1,9,2],[1,10,2],[1,11,2],[5,11,2],[0,12,6]],
-[[1,3,2],[5,3,2],[1,4,2],[5,4,2],[2,5,4],[3,6,2],[1,7,6],[3,8,2],[1,9,6],[3,10,2],[3,11,2],[3,12,2]],
-[[0,3,5],[0,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,5],[0,7,2],[5,7,1],[0,8,2],[4,8,2],[0,9,2],[3,9,4],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[5,12,2]],
-[[4,3,3],[3,4,2],[6,4,2],[3,5,2],[3,6,2],[1,7,6],[3,8,2],[3,9,2],[3,10,2],[0,11,2],[3,11,2],[1,12,3]],
-[[4,2,2],[3,3,2],[2,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[5,2,2],[4,3,2],[3,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[2,12,4]],
-[[5,2,2],[4,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[4,2,2],[3,3,2],[2,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,3],[5,12,2]],
-[[1,3,3],[5,3,2],[0,4,2],[3,4,3],[0,6,2],[3,6,3],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2]],
-[[1,0,3],[5,0,2],[0,1,2],[3,1,3],[0,3,2],[5,3,2],[0,4,3],[5,4,2],[0,5,4],[5,5,2],[0,6,7],[0,7,2],[3,7,4],[0,8,2],[4,8,3],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2]],
-[[2,3,4],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,2],[5,6,2],[1,8,6]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3],[1,8,5]],
-[[2,3,2],[2,4,2],[2,6,2],[2,7,2],[1,8,2],[0,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,5]],
-[[0,6,7],[0,7,2],[0,8,2],[0,9,2],[0,10,2]],
-[[0,6,7],[5,7,2],[5,8,2],[5,9,2],[5,10,2]],
-[[1,1,2],[0,2,3],[1,3,2],[6,3,1],[1,4,2],[5,4,2],[1,5,2],[4,5,2],[3,6,2],[2,7,2],[1,8,2],[0,9,2],[3,9,3],[0,10,1],[5,10,2],[4,11,2],[3,12,2],[2,13,5]],
-[[1,1,2],[0,2,3],[1,3,2],[6,3,1],[1,4,2],[5,4,2],[1,5,2],[4,5,2],[3,6,2],[2,7,2],[1,8,2],[5,8,2],[0,9,2],[4,9,3],[0,10,1],[3,10,2],[6,10,1],[2,11,6],[5,12,2],[5,13,2]],
-[[3,3,2],[3,4,2],[3,6,2],[3,7,2],[3,8,2],[2,9,4],[2,10,4],[2,11,4],[3,12,2]],
-[[2,8,2],[5,8,2],[1,9,2],[4,9,2],[0,10,2],[3,10,2],[1,11,2],[4,11,2],[2,12,2],[5,12,2]],
-[[0,8,2],[3,8,2],[1,9,2],[4,9,2],[2,10,2],[5,10,2],[1,11,2],[4,11,2],[0,12,2],[3,12,2]],
-[[3,0,1],[7,0,1],[1,1,1],[5,1,1],[3,2,1],[7,2,1],[1,3,1],[5,3,1],[3,4,1],[7,4,1],[1,5,1],[5,5,1],[3,6,1],[7,6,1],[1,7,1],[5,7,1],[3,8,1],[7,8,1],[1,9,1],[5,9,1],[3,10,1],[7,10,1],[1,11,1],[5,11,1],[3,12,1],[7,12,1],[1,13,1],[5,13,1],[3,14,1],[7,14,1],[1,15,1],[5,15,1]],
-[[1,0,1],[3,0,1],[5,0,1],[7,0,1],[0,1,1],[2,1,1],[4,1,1],[6,1,1],[1,2,1],[3,2,1],[5,2,1],[7,2,1],[0,3,1],[2,3,1],[4,3,1],[6,3,1],[1,4,1],[3,4,1],[5,4,1],[7,4,1],[0,5,1],[2,5,1],[4,5,1],[6,5,1],[1,6,1],[3,6,1],[5,6,1],[7,6,1],[0,7,1],[2,7,1],[4,7,1],[6,7,1],[1,8,1],[3,8,1],[5,8,1],[7,8,1],[0,9,1],[2,9,1],[4,9,1],[6,9,1],[1,10,1],[3,10,1],[5,10,1],[7,10,1],[0,11,1],[2,11,1],[4,11,1],[6,11,1],[1,12,1],[3,12,1],[5,12,1],[7,12,1],[0,13,1],[2,13,1],[4,13,1],[6,13,1],[1,14,1],[3,14,1],[5,14,1],[7,14,1],[0,15,1],[2,15,1],[4,15,1],[6,15,1]],
-[[0,0,2],[3,0,3],[7,0,1],[1,1,3],[5,1,3],[0,2,2],[3,2,3],[7,2,1],[1,3,3],[5,3,3],[0,4,2],[3,4,3],[7,4,1],[1,5,3],[5,5,3],[0,6,2],[3,6,3],[7,6,1],[1,7,3],[5,7,3],[0,8,2],[3,8,3],[7,8,1],[1,9,3],[5,9,3],[0,10,2],[3,10,3],[7,10,1],[1,11,3],[5,11,3],[0,12,2],[3,12,3],[7,12,1],[1,13,3],[5,13,3],[0,14,2],[3,14,3],[7,14,1],[1,15,3],[5,15,3]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,5],[3,6,2],[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,4],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,7,7],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,5,5],[3,6,2],[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,2],[5,6,2],[0,7,4],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,5,7],[5,6,2],[0,7,4],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,2],[5,6,2],[0,7,7]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,7]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,5],[3,6,2],[0,7,5]],
-[[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,5]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,8]],
-[[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,7,8]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,5],[3,6,2],[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,3],[2,6,2],[2,7,6]],
-[[2,5,6],[2,6,2],[2,7,2],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,3],[0,7,8]],
-[[0,5,8],[0,7,4],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,3],[2,6,2],[2,7,2],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,5,8],[0,7,8]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,3],[0,7,4],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,8],[0,7,8]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,8]],
-[[0,5,8],[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,7,8],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,6]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,5],[3,6,2],[3,7,5]],
-[[3,5,5],[3,6,2],[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,7,6],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,8],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,8],[3,6,2],[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,5]],
-[[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8],[0,7,8],[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[0,7,8],[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[0,0,4],[0,1,4],[0,2,4],[0,3,4],[0,4,4],[0,5,4],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[0,10,4],[0,11,4],[0,12,4],[0,13,4],[0,14,4],[0,15,4]],
-[[4,0,4],[4,1,4],[4,2,4],[4,3,4],[4,4,4],[4,5,4],[4,6,4],[4,7,4],[4,8,4],[4,9,4],[4,10,4],[4,11,4],[4,12,4],[4,13,4],[4,14,4],[4,15,4]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8]],
-[[1,6,3],[5,6,2],[0,7,2],[3,7,3],[0,8,2],[3,8,2],[0,9,2],[3,9,2],[0,10,2],[3,10,2],[0,11,2],[3,11,3],[1,12,3],[5,12,2]],
-[[1,3,4],[0,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,2],[4,6,2],[0,7,2],[3,7,2],[0,8,2],[4,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[4,12,2]],
-[[0,3,7],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[0,11,2],[0,12,2]],
-[[0,6,7],[1,7,2],[4,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[1,12,2],[4,12,2]],
-[[0,3,7],[0,4,2],[5,4,2],[1,5,2],[2,6,2],[3,7,2],[3,8,2],[2,9,2],[1,10,2],[0,11,2],[5,11,2],[0,12,7]],
-[[1,6,6],[0,7,2],[3,7,2],[0,8,2],[3,8,2],[0,9,2],[3,9,2],[0,10,2],[3,10,2],[0,11,2],[3,11,2],[1,12,3]],
-[[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,5],[1,13,2],[1,14,2],[0,15,2]],
-[[1,6,3],[5,6,2],[0,7,2],[3,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2]],
-[[1,3,6],[3,4,2],[2,5,4],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[2,10,4],[3,11,2],[1,12,6]],
-[[2,3,3],[1,4,2],[4,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,7],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,2],[4,11,2],[2,12,3]],
-[[2,3,3],[1,4,2],[4,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,3],[4,12,3]],
-[[3,3,4],[2,4,2],[3,5,2],[4,6,2],[2,7,5],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[2,12,4]],
-[[1,6,6],[0,7,2],[3,7,2],[6,7,2],[0,8,2],[3,8,2],[6,8,2],[0,9,2],[3,9,2],[6,9,2],[1,10,6]],
-[[6,4,2],[5,5,2],[1,6,6],[0,7,2],[3,7,2],[6,7,2],[0,8,2],[3,8,2],[6,8,2],[0,9,4],[6,9,2],[1,10,6],[1,11,2],[0,12,2]],
-[[3,3,3],[2,4,2],[1,5,2],[1,6,2],[1,7,5],[1,8,2],[1,9,2],[1,10,2],[2,11,2],[3,12,3]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,4,7],[0,7,7],[0,10,7]],
-[[3,4,2],[3,5,2],[1,6,6],[3,7,2],[3,8,2],[1,11,6]],
-[[2,4,2],[3,5,2],[4,6,2],[5,7,2],[4,8,2],[3,9,2],[2,10,2],[1,12,6]],
-[[4,4,2],[3,5,2],[2,6,2],[1,7,2],[2,8,2],[3,9,2],[4,10,2],[1,12,6]],
-[[4,3,3],[3,4,2],[6,4,2],[3,5,2],[6,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[0,9,2],[3,9,2],[0,10,2],[3,10,2],[0,11,2],[3,11,2],[1,12,3]],
-[[3,5,2],[1,7,6],[3,9,2]],
-[[1,5,3],[5,5,2],[0,6,2],[3,6,3],[1,8,3],[5,8,2],[0,9,2],[3,9,3]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3]],
-[[3,8,2],[3,9,2]],
-[[3,8,2]],
-[[4,2,4],[4,3,2],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[0,8,3],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[4,10,2],[2,11,4],[3,12,3]],
-[[1,3,2],[4,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2]],
-[[2,3,4],[1,4,2],[5,4,2],[4,5,2],[3,6,2],[2,7,2],[6,7,1],[1,8,6]],
-[[1,5,6],[1,6,6],[1,7,6],[1,8,6],[1,9,6],[1,10,6],[1,11,6]],
-[]
-];
+/* Font of SCREEN 0 (screen_data_gen/fonts/generate.py): 256 glyphs
+ * of 8x16 pixels, packed one bit per pixel. */
+var SCREEN0_DATA = "AAAAxsZsfDg4fGzGxgAAAAAAAH6BpYGBvZmBgX4AAAAAAAB+/9v//8Pn//9+AAAAAAAAAGz+/v7+fDgQAAAAAAAAAAAQOHz+fDgQAAAAAAAAAAAYPDzn5+cYGDwAAAAAAAAAGDx+//9+GBg8AAAAAAAAAMbGbHw4OHxsxsYAAAD////////nw8Pn////////AAAAxsZsfDg4fGzGxgAAAAAAAMbGbHw4OHxsxsYAAAAAAADGxmx8ODh8bMbGAAAAAAAAxsZsfDg4fGzGxgAAAAAAAMbGbHw4OHxsxsYAAAAAAAB/Y39jY2NjZ+fmwAAAAAAAGBjbPOc82xgYAAAAAAAAgMDg8Pj++PDgwIAAAAAAAAIGDh4+/j4eDgYCAAAAAAAAGDx+GBgYfjwYAAAAAAAAAGZmZmZmZmYAZmYAAAAAAAB/29vbexsbGxsbAAAAAHzGYDhsxsZsOAzGfAAAAAAAAAAAAAAAAP7+/v4AAAAAAAAYPH4YGBh+PBh+AAAAAAAAGDx+GBgYGBgYGAAAAAAAABgYGBgYGBh+PBgAAAAAAAAAABgM/gwYAAAAAAAAAAAAAAAwYP5gMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADGxmx8ODh8bMbGAAAAAAAAxsZsfDg4fGzGxgAAAAAAAMbGbHw4OHxsxsYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGDw8PBgYGAAYGAAAAABmZmYkAAAAAAAAAAAAAAAAAAAAbGz+bGxs/mxsAAAAABgYfMbCwHwGBobGfBgYAAAAAAAAwsYMGDBgxoYAAAAAAAA4bGw4dtzMzMx2AAAAAAAAMDAwYAAAAAAAAAAAAAAAAAwYMDAwMDAwGAwAAAAAAAAwGAwMDAwMDBgwAAAAAAAAAAAAZjz/PGYAAAAAAAAAAAAAABgYfhgYAAAAAAAAAAAAAAAAAAAAABgYGDAAAAAAAAAAAAD+AAAAAAAAAAAAAAAAAAAAAAAAGBgAAAAAAAAAAAIGDBgwYMCAAAAAAAAAOGzGxtbWxsZsOAAAAAAAABg4eBgYGBgYGH4AAAAAAAB8xgYMGDBgwMb+AAAAAAAAfMYGBjwGBgbGfAAAAAAAAAwcPGzM/gwMDB4AAAAAAAD+wMDA/AYGBsZ8AAAAAAAAOGDAwPzGxsbGfAAAAAAAAP7GBgYMGDAwMDAAAAAAAAB8xsbGfMbGxsZ8AAAAAAAAfMbGxn4GBgYMeAAAAAAAAAAAABgYAAAAGBgAAAAAAAAAAAAYGAAAABgYMAAAAAAAAAYMGDBgMBgMBgAAAAAAAAAAAH4AAH4AAAAAAAAAAAAAYDAYDAYMGDBgAAAAAAAAfMbGDBgYGAAYGAAAAAAAAAB8xsbe3t7cwHwAAAAAAAAQOGzGxv7GxsbGAAAAAAAA/GZmZnxmZmZm/AAAAAAAADxmwsDAwMDCZjwAAAAAAAD4bGZmZmZmZmz4AAAAAAAA/mZiaHhoYGJm/gAAAAAAAP5mYmh4aGBgYPAAAAAAAAA8ZsLAwN7GxmY6AAAAAAAAxsbGxv7GxsbGxgAAAAAAADwYGBgYGBgYGDwAAAAAAAAeDAwMDAzMzMx4AAAAAAAA5mZmbHh4bGZm5gAAAAAAAPBgYGBgYGBiZv4AAAAAAADG7v7+1sbGxsbGAAAAAAAAxub2/t7OxsbGxgAAAAAAAHzGxsbGxsbGxnwAAAAAAAD8ZmZmfGBgYGDwAAAAAAAAfMbGxsbGxtbefAwOAAAAAPxmZmZ8bGZmZuYAAAAAAAB8xsZgOAwGxsZ8AAAAAAAAfn5aGBgYGBgYPAAAAAAAAMbGxsbGxsbGxnwAAAAAAADGxsbGxsbGbDgQAAAAAAAAxsbGxtbW1v7ubAAAAAAAAMbGbHw4OHxsxsYAAAAAAABmZmZmPBgYGBg8AAAAAAAA/saGDBgwYMLG/gAAAAAAADwwMDAwMDAwMDwAAAAAAAAAgMDgcDgcDgYCAAAAAAAAPAwMDAwMDAwMPAAAADhsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/wAAMBgAAAAAAAAAAAAAAAAAAAAAAAAAAHgMfMzMzHYAAAAAAADgYGB4bGZmZmZ8AAAAAAAAAAAAfMbAwMDGfAAAAAAAABwMDDxszMzMzHYAAAAAAAAAAAB8xv7AwMZ8AAAAAAAAHDYyMHgwMDAweAAAAAAAAAAAAHbMzMzMzHwMzHgAAADgYGBsdmZmZmbmAAAAAAAAGBgAOBgYGBgYPAAAAAAAAAYGAA4GBgYGBgZmZjwAAADgYGBmbHh4bGbmAAAAAAAAOBgYGBgYGBgYPAAAAAAAAAAAAOz+1tbW1sYAAAAAAAAAAADcZmZmZmZmAAAAAAAAAAAAfMbGxsbGfAAAAAAAAAAAANxmZmZmZnxgYPAAAAAAAAB2zMzMzMx8DAweAAAAAAAA3HZmYGBg8AAAAAAAAAAAAHzGYDgMxnwAAAAAAAAQMDD8MDAwMDYcAAAAAAAAAAAAzMzMzMzMdgAAAAAAAAAAAMbGxsbGbDgAAAAAAAAAAADGxtbW1v5sAAAAAAAAAAAAxmw4ODhsxgAAAAAAAAAAAMbGxsbGxn4GDPgAAAAAAAD+zBgwYMb+AAAAAAAADhgYGHAYGBgYDgAAAAAAABgYGBgYGBgYGBgAAAAAAABwGBgYDhgYGBhwAAAAdtwAAAAAAAAAAAAAAAAAAAAAAAAAABA4bMbGxv4AAAAAAAA8ZsLAwMDAwmY8GAx4AAAAAMwAzMzMzMzMdgAAAAAABgwYAHzG/sDAxnwAAAAAABA4bAB4DHzMzMx2AAAAAAAAAMwAeAx8zMzMdgAAAAAAwGAwAHgMfMzMzHYAAAAAADhsOAB4DHzMzMx2AAAAAAAAAAAAfMbAwMDGfBgMeAAAEDhsAHzG/sDAxnwAAAAAAAAAxgB8xv7AwMZ8AAAAAABgMBgAfMb+wMDGfAAAAAAAAABmADgYGBgYGDwAAAAAABg8ZgA4GBgYGBg8AAAAAABgMBgAOBgYGBgYPAAAAADGABA4bMbG/sbGxsYAAAA4bDgQOGzGxv7GxsbGAAAADBgA/mZiaHhoYGJm/gAAAAAAAAAAAOw2Nn7Y2G4AAAAAAAA+bMzM/szMzMzOAAAAAAAQOGwAfMbGxsbGfAAAAAAAAADGAHzGxsbGxnwAAAAAAGAwGAB8xsbGxsZ8AAAAAAAweMwAzMzMzMzMdgAAAAAAwGAwAMzMzMzMzHYAAAAAAAAAxgDGxsbGxsZ+Bgz4AMYAfMbGxsbGxsbGfAAAAADGAMbGxsbGxsbGxnwAAAAAAAAYGHzGwMDGfBgYAAAAAAAAOGxkYPBgYGBm/AAAAAAAAGZmPBh+GH4YGBgAAAAAAAD4zMz4xMzezMzGAAAAAAAADhsYGH4YGBjYcAAAAAAADBgwAHgMfMzMzHYAAAAAAAYMGAA4GBgYGBg8AAAAAAAGDBgAfMbGxsbGfAAAAAAADBgwAMzMzMzMzHYAAAAAAAB23ADcZmZmZmZmAAAAdtwAxub2/t7OxsbGxgAAAAAAADxsbDYAfgAAAAAAAAAAAAA4bGw4AHwAAAAAAAAAAAAAMDAAMDBgwMbGfAAAAAAAAAAAAP7AwMDAAAAAAAAAAAAAAAD+BgYGBgAAAAAAAGDgYmZsGDBg3IYMGD4AAABg4GJmbBgwZs6aPwYGAAAAAAAYGAAYGBg8PDwYAAAAAAAAAAAAAAA2bNhsNgAAAAAAAAAAAAAA2Gw2bNgAAAARRBFEEUQRRBFEEUQRRBFEVapVqlWqVapVqlWqVapVqt133Xfdd9133Xfdd9133XcYGBgYGBgYGBgYGBgYGBgYGBgYGBgYGPgYGBgYGBgYGBgYGBgY+Bj4GBgYGBgYGBg2NjY2NjY29jY2NjY2NjY2AAAAAAAAAP42NjY2NjY2NgAAAAAA+Bj4GBgYGBgYGBg2NjY2NvYG9jY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NgAAAAAA/gb2NjY2NjY2NjY2NjY2NvYG/gAAAAAAAAAANjY2NjY2Nv4AAAAAAAAAABgYGBgY+Bj4AAAAAAAAAAAAAAAAAAAA+BgYGBgYGBgYGBgYGBgYGB8AAAAAAAAAABgYGBgYGBj/AAAAAAAAAAAAAAAAAAAA/xgYGBgYGBgYGBgYGBgYGB8YGBgYGBgYGAAAAAAAAAD/AAAAAAAAAAAYGBgYGBgY/xgYGBgYGBgYGBgYGBgfGB8YGBgYGBgYGDY2NjY2NjY3NjY2NjY2NjY2NjY2NjcwPwAAAAAAAAAAAAAAAAA/MDc2NjY2NjY2NjY2NjY29wD/AAAAAAAAAAAAAAAAAP8A9zY2NjY2NjY2NjY2NjY3MDc2NjY2NjY2NgAAAAAA/wD/AAAAAAAAAAA2NjY2NvcA9zY2NjY2NjY2GBgYGBj/AP8AAAAAAAAAADY2NjY2Njb/AAAAAAAAAAAAAAAAAP8A/xgYGBgYGBgYAAAAAAAAAP82NjY2NjY2NjY2NjY2NjY/AAAAAAAAAAAYGBgYGB8YHwAAAAAAAAAAAAAAAAAfGB8YGBgYGBgYGAAAAAAAAAA/NjY2NjY2NjY2NjY2NjY2/zY2NjY2NjY2GBgYGBj/GP8YGBgYGBgYGBgYGBgYGBj4AAAAAAAAAAAAAAAAAAAAHxgYGBgYGBgY/////////////////////wAAAAAAAAD////////////w8PDw8PDw8PDw8PDw8PDwDw8PDw8PDw8PDw8PDw8PD/////////8AAAAAAAAAAAAAAAAAAAB23NjY2Nx2AAAAAAAAeMzMzNjMxsbGzAAAAAAAAP7GxsDAwMDAwMAAAAAAAAAAAAD+bGxsbGxsAAAAAAAA/sZgMBgYMGDG/gAAAAAAAAAAAH7Y2NjY2HAAAAAAAAAAAABmZmZmZmZ8YGDAAAAAAAAAdtwYGBgYGAAAAAAAAH4YPGZmZmY8GH4AAAAAAAA4bMbG/sbGxmw4AAAAAAAAOGzGxsZsbGxs7gAAAAAAAB4wGAw+ZmZmZjwAAAAAAAAAAAB+29vbfgAAAAAAAAAAAAMGftvb835gwAAAAAAAABwwYGB8YGBgMBwAAAAAAAB8xsbGxsbGxsYAAAAAAAAAAP4AAP4AAP4AAAAAAAAAAAAYGH4YGAAAfgAAAAAAAAAAMBgMBgwYMAB+AAAAAAAAAAwYMGAwGAwAfgAAAAAAAA4bGxgYGBgYGBgYGBgYGBgYGBgYGBjY2NhwAAAAAAAAAAAYAH4AGAAAAAAAAAAAAAAAdtwAdtwAAAAAAAAAAAA4bGw4AAAAAAAAAAAAAAAAAAAAAAAYGAAAAAAAAAAAAAAAAAAAGAAAAAAAAAAAAA8MDAwMDOxsbDwcAAAAAAAAbDY2NjY2AAAAAAAAAAAAADxmDBgyfgAAAAAAAAAAAAAAAH5+fn5+fn4AAAAAAAAAAAAAAAAAAAAAAAAAAA==";
@@ -1,258 +1,3 @@
-var SCREEN1_DATA = [
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[2,0,12],[2,1,12],[0,2,2],[14,2,2],[0,3,2],[14,3,2],[0,4,2],[4,4,2],[10,4,2],[14,4,2],[0,5,2],[4,5,2],[10,5,2],[14,5,2],[0,6,2],[14,6,2],[0,7,2],[14,7,2],[0,8,2],[4,8,8],[14,8,2],[0,9,2],[4,9,8],[14,9,2],[0,10,2],[6,10,4],[14,10,2],[0,11,2],[6,11,4],[14,11,2],[0,12,2],[14,12,2],[0,13,2],[14,13,2],[2,14,12],[2,15,12]],
-[[2,0,12],[2,1,12],[0,2,16],[0,3,16],[0,4,4],[6,4,4],[12,4,4],[0,5,4],[6,5,4],[12,5,4],[0,6,16],[0,7,16],[0,8,4],[12,8,4],[0,9,4],[12,9,4],[0,10,6],[10,10,6],[0,11,6],[10,11,6],[0,12,16],[0,13,16],[2,14,12],[2,15,12]],
-[[2,0,4],[8,0,4],[2,1,4],[8,1,4],[0,2,14],[0,3,14],[0,4,14],[0,5,14],[0,6,14],[0,7,14],[2,8,10],[2,9,10],[4,10,6],[4,11,6],[6,12,2],[6,13,2]],
-[[6,0,2],[6,1,2],[4,2,6],[4,3,6],[2,4,10],[2,5,10],[0,6,14],[0,7,14],[2,8,10],[2,9,10],[4,10,6],[4,11,6],[6,12,2],[6,13,2]],
-[[4,0,6],[4,1,6],[2,2,10],[2,3,10],[4,4,6],[4,5,6],[0,6,14],[0,7,14],[0,8,14],[0,9,14],[0,10,4],[6,10,2],[10,10,4],[0,11,4],[6,11,2],[10,11,4],[6,12,2],[6,13,2],[4,14,6],[4,15,6]],
-[[6,0,2],[6,1,2],[4,2,6],[4,3,6],[2,4,10],[2,5,10],[0,6,14],[0,7,14],[0,8,14],[0,9,14],[2,10,10],[2,11,10],[6,12,2],[6,13,2],[4,14,6],[4,15,6]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,0,16],[0,1,16],[0,2,16],[0,3,16],[0,4,6],[10,4,6],[0,5,6],[10,5,6],[0,6,4],[12,6,4],[0,7,4],[12,7,4],[0,8,4],[12,8,4],[0,9,4],[12,9,4],[0,10,6],[10,10,6],[0,11,6],[10,11,6],[0,12,16],[0,13,16],[0,14,16],[0,15,16]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[2,0,14],[2,1,14],[2,2,4],[12,2,4],[2,3,4],[12,3,4],[2,4,14],[2,5,14],[2,6,4],[12,6,4],[2,7,4],[12,7,4],[2,8,4],[12,8,4],[2,9,4],[12,9,4],[2,10,4],[10,10,6],[2,11,4],[10,11,6],[0,12,6],[10,12,4],[0,13,6],[10,13,4],[0,14,4],[0,15,4]],
-[[6,0,4],[6,1,4],[0,2,4],[6,2,4],[12,2,4],[0,3,4],[6,3,4],[12,3,4],[4,4,8],[4,5,8],[0,6,6],[10,6,6],[0,7,6],[10,7,6],[0,8,6],[10,8,6],[0,9,6],[10,9,6],[4,10,8],[4,11,8],[0,12,4],[6,12,4],[12,12,4],[0,13,4],[6,13,4],[12,13,4],[6,14,4],[6,15,4]],
-[[0,0,2],[0,1,2],[0,2,6],[0,3,6],[0,4,10],[0,5,10],[0,6,14],[0,7,14],[0,8,10],[0,9,10],[0,10,6],[0,11,6],[0,12,2],[0,13,2]],
-[[12,0,2],[12,1,2],[8,2,6],[8,3,6],[4,4,10],[4,5,10],[0,6,14],[0,7,14],[4,8,10],[4,9,10],[8,10,6],[8,11,6],[12,12,2],[12,13,2]],
-[[6,0,4],[6,1,4],[4,2,8],[4,3,8],[2,4,12],[2,5,12],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[2,10,12],[2,11,12],[4,12,8],[4,13,8],[6,14,4],[6,15,4]],
-[[2,0,4],[10,0,4],[2,1,4],[10,1,4],[2,2,4],[10,2,4],[2,3,4],[10,3,4],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4]],
-[[2,0,14],[2,1,14],[0,2,4],[6,2,4],[12,2,4],[0,3,4],[6,3,4],[12,3,4],[0,4,4],[6,4,4],[12,4,4],[0,5,4],[6,5,4],[12,5,4],[2,6,8],[12,6,4],[2,7,8],[12,7,4],[6,8,4],[12,8,4],[6,9,4],[12,9,4],[6,10,4],[12,10,4],[6,11,4],[12,11,4],[6,12,4],[12,12,4],[6,13,4],[12,13,4]],
-[[4,0,10],[4,1,10],[2,2,4],[14,2,2],[2,3,4],[14,3,2],[4,4,8],[4,5,8],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[4,10,8],[4,11,8],[0,12,2],[10,12,4],[0,13,2],[10,13,4],[2,14,10],[2,15,10]],
-[[2,8,12],[2,9,12],[2,10,12],[2,11,12],[2,12,12],[2,13,12]],
-[[6,0,4],[6,1,4],[4,2,8],[4,3,8],[2,4,12],[2,5,12],[6,6,4],[6,7,4],[2,8,12],[2,9,12],[4,10,8],[4,11,8],[6,12,4],[6,13,4],[0,14,16],[0,15,16]],
-[[6,0,4],[6,1,4],[4,2,8],[4,3,8],[2,4,12],[2,5,12],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[2,8,12],[2,9,12],[4,10,8],[4,11,8],[6,12,4],[6,13,4]],
-[[6,2,4],[6,3,4],[8,4,4],[8,5,4],[0,6,14],[0,7,14],[8,8,4],[8,9,4],[6,10,4],[6,11,4]],
-[[4,2,4],[4,3,4],[2,4,4],[2,5,4],[0,6,14],[0,7,14],[2,8,4],[2,9,4],[4,10,4],[4,11,4]],
-[],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[],
-[[6,2,4],[6,3,4],[4,4,8],[4,5,8],[4,6,8],[4,7,8],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,14,4],[6,15,4]],
-[[2,2,4],[10,2,4],[2,3,4],[10,3,4],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[4,6,2],[10,6,2],[4,7,2],[10,7,2]],
-[[2,2,4],[8,2,4],[2,3,4],[8,3,4],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[0,6,14],[0,7,14],[2,8,4],[8,8,4],[2,9,4],[8,9,4],[0,10,14],[0,11,14],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[2,14,4],[8,14,4],[2,15,4],[8,15,4]],
-[[6,2,4],[6,3,4],[4,4,10],[4,5,10],[2,6,4],[2,7,4],[4,8,8],[4,9,8],[10,10,4],[10,11,4],[2,12,10],[2,13,10],[6,14,4],[6,15,4]],
-[[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[8,6,4],[0,7,4],[8,7,4],[6,8,4],[6,9,4],[4,10,4],[4,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[4,6,6],[4,7,6],[2,8,6],[10,8,4],[2,9,6],[10,9,4],[0,10,4],[6,10,6],[0,11,4],[6,11,6],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[6,2,4],[6,3,4],[6,4,4],[6,5,4],[4,6,4],[4,7,4]],
-[[8,2,4],[8,3,4],[6,4,4],[6,5,4],[4,6,4],[4,7,4],[4,8,4],[4,9,4],[4,10,4],[4,11,4],[6,12,4],[6,13,4],[8,14,4],[8,15,4]],
-[[4,2,4],[4,3,4],[6,4,4],[6,5,4],[8,6,4],[8,7,4],[8,8,4],[8,9,4],[8,10,4],[8,11,4],[6,12,4],[6,13,4],[4,14,4],[4,15,4]],
-[[2,4,4],[10,4,4],[2,5,4],[10,5,4],[4,6,8],[4,7,8],[0,8,16],[0,9,16],[4,10,8],[4,11,8],[2,12,4],[10,12,4],[2,13,4],[10,13,4]],
-[[6,4,4],[6,5,4],[6,6,4],[6,7,4],[2,8,12],[2,9,12],[6,10,4],[6,11,4],[6,12,4],[6,13,4]],
-[[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,4],[4,15,4]],
-[[2,8,12],[2,9,12]],
-[[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[10,2,4],[10,3,4],[8,4,4],[8,5,4],[6,6,4],[6,7,4],[4,8,4],[4,9,4],[2,10,4],[2,11,4],[0,12,4],[0,13,4],[0,14,2],[0,15,2]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[6,8,2],[10,8,4],[0,9,4],[6,9,2],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[4,14,6],[4,15,6]],
-[[6,2,4],[6,3,4],[4,4,6],[4,5,6],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[2,14,12],[2,15,12]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[10,6,4],[10,7,4],[6,8,6],[6,9,6],[4,10,4],[4,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,14],[0,15,14]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[10,6,4],[10,7,4],[4,8,8],[4,9,8],[10,10,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[6,2,6],[6,3,6],[4,4,8],[4,5,8],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,14],[0,11,14],[8,12,4],[8,13,4],[6,14,8],[6,15,8]],
-[[0,2,14],[0,3,14],[0,4,4],[0,5,4],[0,6,4],[0,7,4],[0,8,12],[0,9,12],[10,10,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[4,2,6],[4,3,6],[2,4,4],[2,5,4],[0,6,4],[0,7,4],[0,8,12],[0,9,12],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[0,2,14],[0,3,14],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[8,6,4],[8,7,4],[6,8,4],[6,9,4],[4,10,4],[4,11,4],[4,12,4],[4,13,4],[4,14,4],[4,15,4]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[2,8,10],[2,9,10],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[2,8,12],[2,9,12],[10,10,4],[10,11,4],[8,12,4],[8,13,4],[2,14,8],[2,15,8]],
-[[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,4],[4,15,4]],
-[[10,2,4],[10,3,4],[8,4,4],[8,5,4],[6,6,4],[6,7,4],[4,8,4],[4,9,4],[6,10,4],[6,11,4],[8,12,4],[8,13,4],[10,14,4],[10,15,4]],
-[[2,6,12],[2,7,12],[2,12,12],[2,13,12]],
-[[2,2,4],[2,3,4],[4,4,4],[4,5,4],[6,6,4],[6,7,4],[8,8,4],[8,9,4],[6,10,4],[6,11,4],[4,12,4],[4,13,4],[2,14,4],[2,15,4]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[8,6,4],[8,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,14,4],[6,15,4]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[6,6,8],[0,7,4],[6,7,8],[0,8,4],[6,8,8],[0,9,4],[6,9,8],[0,10,4],[6,10,8],[0,11,4],[6,11,8],[0,12,4],[0,13,4],[2,14,8],[2,15,8]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,14],[0,9,14],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,12],[0,3,12],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,10],[2,9,10],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,12],[0,15,12]],
-[[4,2,8],[4,3,8],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[0,10,4],[0,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[4,14,8],[4,15,8]],
-[[0,2,10],[0,3,10],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[0,14,10],[0,15,10]],
-[[0,2,14],[0,3,14],[2,4,4],[12,4,2],[2,5,4],[12,5,2],[2,6,4],[8,6,2],[2,7,4],[8,7,2],[2,8,8],[2,9,8],[2,10,4],[8,10,2],[2,11,4],[8,11,2],[2,12,4],[12,12,2],[2,13,4],[12,13,2],[0,14,14],[0,15,14]],
-[[0,2,14],[0,3,14],[2,4,4],[12,4,2],[2,5,4],[12,5,2],[2,6,4],[8,6,2],[2,7,4],[8,7,2],[2,8,8],[2,9,8],[2,10,4],[8,10,2],[2,11,4],[8,11,2],[2,12,4],[2,13,4],[0,14,8],[0,15,8]],
-[[4,2,8],[4,3,8],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[0,10,4],[8,10,6],[0,11,4],[8,11,6],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[4,14,6],[12,14,2],[4,15,6],[12,15,2]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,14],[0,9,14],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[4,2,8],[4,3,8],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[6,2,8],[6,3,8],[8,4,4],[8,5,4],[8,6,4],[8,7,4],[8,8,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,8],[2,15,8]],
-[[0,2,6],[10,2,4],[0,3,6],[10,3,4],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[2,8,8],[2,9,8],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,6],[10,14,4],[0,15,6],[10,15,4]],
-[[0,2,8],[0,3,8],[2,4,4],[2,5,4],[2,6,4],[2,7,4],[2,8,4],[2,9,4],[2,10,4],[12,10,2],[2,11,4],[12,11,2],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,14],[0,15,14]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,6],[8,4,6],[0,5,6],[8,5,6],[0,6,14],[0,7,14],[0,8,14],[0,9,14],[0,10,4],[6,10,2],[10,10,4],[0,11,4],[6,11,2],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,6],[10,4,4],[0,5,6],[10,5,4],[0,6,8],[10,6,4],[0,7,8],[10,7,4],[0,8,4],[6,8,8],[0,9,4],[6,9,8],[0,10,4],[8,10,6],[0,11,4],[8,11,6],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[0,2,12],[0,3,12],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,10],[2,9,10],[2,10,4],[2,11,4],[2,12,4],[2,13,4],[0,14,8],[0,15,8]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[8,10,6],[0,11,4],[8,11,6],[2,12,10],[2,13,10],[8,14,6],[8,15,6]],
-[[0,2,12],[0,3,12],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,10],[2,9,10],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,6],[10,14,4],[0,15,6],[10,15,4]],
-[[4,2,8],[4,3,8],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[4,6,4],[4,7,4],[6,8,4],[6,9,4],[8,10,4],[8,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[4,14,8],[4,15,8]],
-[[2,2,12],[2,3,12],[2,4,12],[2,5,12],[2,6,2],[6,6,4],[12,6,2],[2,7,2],[6,7,4],[12,7,2],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[4,14,6],[4,15,6]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[6,8,2],[10,8,4],[0,9,4],[6,9,2],[10,9,4],[0,10,4],[6,10,2],[10,10,4],[0,11,4],[6,11,2],[10,11,4],[0,12,14],[0,13,14],[2,14,4],[8,14,4],[2,15,4],[8,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[2,2,4],[10,2,4],[2,3,4],[10,3,4],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[4,8,8],[4,9,8],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[0,2,14],[0,3,14],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,2],[8,6,4],[0,7,2],[8,7,4],[6,8,4],[6,9,4],[4,10,4],[12,10,2],[4,11,4],[12,11,2],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,14],[0,15,14]],
-[[4,2,8],[4,3,8],[4,4,4],[4,5,4],[4,6,4],[4,7,4],[4,8,4],[4,9,4],[4,10,4],[4,11,4],[4,12,4],[4,13,4],[4,14,8],[4,15,8]],
-[[0,2,4],[0,3,4],[2,4,4],[2,5,4],[4,6,4],[4,7,4],[6,8,4],[6,9,4],[8,10,4],[8,11,4],[10,12,4],[10,13,4],[12,14,2],[12,15,2]],
-[[4,2,8],[4,3,8],[8,4,4],[8,5,4],[8,6,4],[8,7,4],[8,8,4],[8,9,4],[8,10,4],[8,11,4],[8,12,4],[8,13,4],[4,14,8],[4,15,8]],
-[[6,0,2],[6,1,2],[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4]],
-[[0,14,16],[0,15,16]],
-[[4,0,4],[4,1,4],[6,2,4],[6,3,4],[8,4,4],[8,5,4]],
-[[2,6,8],[2,7,8],[8,8,4],[8,9,4],[2,10,10],[2,11,10],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[0,2,6],[0,3,6],[2,4,4],[2,5,4],[2,6,10],[2,7,10],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,4],[6,14,6],[0,15,4],[6,15,6]],
-[[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[0,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[6,2,6],[6,3,6],[8,4,4],[8,5,4],[2,6,10],[2,7,10],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[0,13,4],[2,14,10],[2,15,10]],
-[[4,2,8],[4,3,8],[2,4,4],[10,4,4],[2,5,4],[10,5,4],[2,6,4],[2,7,4],[0,8,10],[0,9,10],[2,10,4],[2,11,4],[2,12,4],[2,13,4],[0,14,8],[0,15,8]],
-[[2,6,6],[10,6,4],[2,7,6],[10,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[2,10,10],[2,11,10],[8,12,4],[8,13,4],[0,14,10],[0,15,10]],
-[[0,2,6],[0,3,6],[2,4,4],[2,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[2,8,6],[10,8,4],[2,9,6],[10,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,6],[10,14,4],[0,15,6],[10,15,4]],
-[[6,2,4],[6,3,4],[4,6,6],[4,7,6],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[10,2,4],[10,3,4],[10,6,4],[10,7,4],[10,8,4],[10,9,4],[10,10,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[4,14,8],[4,15,8]],
-[[0,2,6],[0,3,6],[2,4,4],[2,5,4],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,4],[8,8,4],[2,9,4],[8,9,4],[2,10,8],[2,11,8],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[0,14,6],[10,14,4],[0,15,6],[10,15,4]],
-[[4,2,6],[4,3,6],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[0,6,6],[8,6,4],[0,7,6],[8,7,4],[0,8,14],[0,9,14],[0,10,4],[6,10,2],[10,10,4],[0,11,4],[6,11,2],[10,11,4],[0,12,4],[6,12,2],[10,12,4],[0,13,4],[6,13,2],[10,13,4],[0,14,4],[6,14,2],[10,14,4],[0,15,4],[6,15,2],[10,15,4]],
-[[0,6,4],[6,6,6],[0,7,4],[6,7,6],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[2,14,4],[10,14,4],[2,15,4],[10,15,4]],
-[[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[0,6,4],[6,6,6],[0,7,4],[6,7,6],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,10,10],[2,11,10],[2,12,4],[2,13,4],[0,14,8],[0,15,8]],
-[[2,6,6],[10,6,4],[2,7,6],[10,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[2,10,10],[2,11,10],[8,12,4],[8,13,4],[6,14,8],[6,15,8]],
-[[0,6,4],[6,6,6],[0,7,4],[6,7,6],[2,8,6],[10,8,4],[2,9,6],[10,9,4],[2,10,4],[2,11,4],[2,12,4],[2,13,4],[0,14,8],[0,15,8]],
-[[2,6,12],[2,7,12],[0,8,4],[0,9,4],[2,10,10],[2,11,10],[10,12,4],[10,13,4],[0,14,12],[0,15,12]],
-[[4,2,4],[4,3,4],[4,4,4],[4,5,4],[0,6,12],[0,7,12],[4,8,4],[4,9,4],[4,10,4],[4,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[6,14,6],[6,15,6]],
-[[0,6,4],[8,6,4],[0,7,4],[8,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[4,14,6],[4,15,6]],
-[[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[6,8,2],[10,8,4],[0,9,4],[6,9,2],[10,9,4],[0,10,4],[6,10,2],[10,10,4],[0,11,4],[6,11,2],[10,11,4],[0,12,14],[0,13,14],[2,14,4],[8,14,4],[2,15,4],[8,15,4]],
-[[0,6,4],[10,6,4],[0,7,4],[10,7,4],[2,8,4],[8,8,4],[2,9,4],[8,9,4],[4,10,6],[4,11,6],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[2,10,12],[2,11,12],[10,12,4],[10,13,4],[0,14,12],[0,15,12]],
-[[2,6,12],[2,7,12],[8,8,4],[8,9,4],[6,10,4],[6,11,4],[4,12,4],[4,13,4],[2,14,12],[2,15,12]],
-[[8,2,6],[8,3,6],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[2,8,6],[2,9,6],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[8,14,6],[8,15,6]],
-[[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[2,2,6],[2,3,6],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[8,8,6],[8,9,6],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[2,14,6],[2,15,6]],
-[[2,0,6],[10,0,4],[2,1,6],[10,1,4],[0,2,4],[6,2,6],[0,3,4],[6,3,6]],
-[[6,4,2],[6,5,2],[4,6,6],[4,7,6],[2,8,4],[8,8,4],[2,9,4],[8,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,14],[0,15,14]],
-[[4,0,8],[4,1,8],[2,2,4],[10,2,4],[2,3,4],[10,3,4],[0,4,4],[0,5,4],[0,6,4],[0,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[4,10,8],[4,11,8],[6,12,4],[6,13,4],[2,14,6],[2,15,6]],
-[[0,2,4],[8,2,4],[0,3,4],[8,3,4],[0,6,4],[8,6,4],[0,7,4],[8,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[8,0,4],[8,1,4],[6,2,4],[6,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[0,13,4],[2,14,10],[2,15,10]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[2,6,8],[2,7,8],[8,8,4],[8,9,4],[2,10,10],[2,11,10],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[0,2,4],[8,2,4],[0,3,4],[8,3,4],[2,6,8],[2,7,8],[8,8,4],[8,9,4],[2,10,10],[2,11,10],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[2,0,4],[2,1,4],[4,2,4],[4,3,4],[2,6,8],[2,7,8],[8,8,4],[8,9,4],[2,10,10],[2,11,10],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[4,4,6],[4,5,6],[2,6,8],[2,7,8],[8,8,4],[8,9,4],[2,10,10],[2,11,10],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[0,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[2,10,10],[2,11,10],[6,12,4],[6,13,4],[2,14,6],[2,15,6]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[0,13,4],[2,14,10],[2,15,10]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[0,13,4],[2,14,10],[2,15,10]],
-[[4,0,4],[4,1,4],[6,2,4],[6,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[0,13,4],[2,14,10],[2,15,10]],
-[[2,2,4],[10,2,4],[2,3,4],[10,3,4],[4,6,6],[4,7,6],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[4,6,6],[4,7,6],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[4,0,4],[4,1,4],[6,2,4],[6,3,4],[4,6,6],[4,7,6],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[0,0,4],[10,0,4],[0,1,4],[10,1,4],[6,2,2],[6,3,2],[4,4,6],[4,5,6],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[4,4,6],[4,5,6],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,14],[0,11,14],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[8,0,4],[8,1,4],[6,2,4],[6,3,4],[0,4,14],[0,5,14],[0,6,4],[0,7,4],[0,8,10],[0,9,10],[0,10,4],[0,11,4],[0,12,4],[0,13,4],[0,14,14],[0,15,14]],
-[[0,6,6],[8,6,4],[0,7,6],[8,7,4],[4,8,4],[10,8,4],[4,9,4],[10,9,4],[2,10,12],[2,11,12],[0,12,4],[6,12,4],[0,13,4],[6,13,4],[2,14,4],[8,14,6],[2,15,4],[8,15,6]],
-[[4,2,10],[4,3,10],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[0,6,4],[8,6,4],[0,7,4],[8,7,4],[0,8,14],[0,9,14],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[0,14,4],[8,14,6],[0,15,4],[8,15,6]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[4,0,4],[4,1,4],[6,2,4],[6,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[2,0,8],[2,1,8],[0,2,4],[8,2,4],[0,3,4],[8,3,4],[0,6,4],[8,6,4],[0,7,4],[8,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[2,0,4],[2,1,4],[4,2,4],[4,3,4],[0,6,4],[8,6,4],[0,7,4],[8,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[0,2,4],[10,2,4],[0,3,4],[10,3,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[2,10,12],[2,11,12],[10,12,4],[10,13,4],[0,14,12],[0,15,12]],
-[[0,0,4],[10,0,4],[0,1,4],[10,1,4],[4,4,6],[4,5,6],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[4,14,6],[4,15,6]],
-[[0,0,4],[10,0,4],[0,1,4],[10,1,4],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[2,4,12],[2,5,12],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[2,10,12],[2,11,12],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[4,0,6],[4,1,6],[2,2,4],[8,2,4],[2,3,4],[8,3,4],[2,4,4],[10,4,2],[2,5,4],[10,5,2],[0,6,8],[0,7,8],[2,8,4],[2,9,4],[2,10,4],[2,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,12],[0,15,12]],
-[[2,0,4],[10,0,4],[2,1,4],[10,1,4],[2,2,4],[10,2,4],[2,3,4],[10,3,4],[4,4,8],[4,5,8],[2,6,12],[2,7,12],[6,8,4],[6,9,4],[2,10,12],[2,11,12],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[0,0,10],[0,1,10],[0,2,4],[8,2,4],[0,3,4],[8,3,4],[0,4,4],[8,4,4],[0,5,4],[8,5,4],[0,6,10],[12,6,2],[0,7,10],[12,7,2],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[8,10,8],[0,11,4],[8,11,8],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[10,14,6],[0,15,4],[10,15,6]],
-[[8,0,6],[8,1,6],[6,2,4],[12,2,4],[6,3,4],[12,3,4],[6,4,4],[6,5,4],[4,6,8],[4,7,8],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[0,12,4],[6,12,4],[0,13,4],[6,13,4],[2,14,6],[2,15,6]],
-[[6,0,4],[6,1,4],[4,2,4],[4,3,4],[2,6,8],[2,7,8],[8,8,4],[8,9,4],[2,10,10],[2,11,10],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[8,0,4],[8,1,4],[6,2,4],[6,3,4],[4,6,6],[4,7,6],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[4,14,8],[4,15,8]],
-[[8,0,4],[8,1,4],[6,2,4],[6,3,4],[2,6,10],[2,7,10],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[6,0,4],[6,1,4],[4,2,4],[4,3,4],[0,6,4],[8,6,4],[0,7,4],[8,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[2,0,6],[10,0,4],[2,1,6],[10,1,4],[0,2,4],[6,2,6],[0,3,4],[6,3,6],[0,6,4],[6,6,6],[0,7,4],[6,7,6],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[2,14,4],[10,14,4],[2,15,4],[10,15,4]],
-[[2,0,6],[10,0,4],[2,1,6],[10,1,4],[0,2,4],[6,2,6],[0,3,4],[6,3,6],[0,6,6],[10,6,4],[0,7,6],[10,7,4],[0,8,8],[10,8,4],[0,9,8],[10,9,4],[0,10,4],[6,10,8],[0,11,4],[6,11,8],[0,12,4],[8,12,6],[0,13,4],[8,13,6],[0,14,4],[10,14,4],[0,15,4],[10,15,4]],
-[[4,2,8],[4,3,8],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,4],[10,8,4],[4,9,4],[10,9,4],[2,12,12],[2,13,12]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6],[2,12,10],[2,13,10]],
-[[4,2,4],[4,3,4],[4,6,4],[4,7,4],[4,8,4],[4,9,4],[2,10,4],[2,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[2,14,10],[2,15,10]],
-[[0,6,14],[0,7,14],[0,8,4],[0,9,4],[0,10,4],[0,11,4]],
-[[0,6,14],[0,7,14],[10,8,4],[10,9,4],[10,10,4],[10,11,4]],
-[[2,0,4],[12,0,4],[2,1,4],[12,1,4],[0,2,6],[10,2,4],[0,3,6],[10,3,4],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[2,6,12],[2,7,12],[4,8,4],[12,8,4],[4,9,4],[12,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[0,12,4],[8,12,4],[0,13,4],[8,13,4],[8,14,8],[8,15,8]],
-[[2,0,4],[12,0,4],[2,1,4],[12,1,4],[0,2,6],[10,2,4],[0,3,6],[10,3,4],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[2,6,8],[12,6,2],[2,7,8],[12,7,2],[4,8,4],[10,8,4],[4,9,4],[10,9,4],[2,10,4],[8,10,2],[12,10,2],[2,11,4],[8,11,2],[12,11,2],[0,12,4],[6,12,10],[0,13,4],[6,13,10],[10,14,4],[10,15,4]],
-[[6,2,4],[6,3,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[4,10,8],[4,11,8],[4,12,8],[4,13,8],[6,14,4],[6,15,4]],
-[[4,6,4],[12,6,4],[4,7,4],[12,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[0,10,4],[8,10,4],[0,11,4],[8,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[4,14,4],[12,14,4],[4,15,4],[12,15,4]],
-[[0,6,4],[8,6,4],[0,7,4],[8,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[4,10,4],[12,10,4],[4,11,4],[12,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[0,14,4],[8,14,4],[0,15,4],[8,15,4]],
-[[4,0,2],[12,0,2],[4,1,2],[12,1,2],[0,2,2],[8,2,2],[0,3,2],[8,3,2],[4,4,2],[12,4,2],[4,5,2],[12,5,2],[0,6,2],[8,6,2],[0,7,2],[8,7,2],[4,8,2],[12,8,2],[4,9,2],[12,9,2],[0,10,2],[8,10,2],[0,11,2],[8,11,2],[4,12,2],[12,12,2],[4,13,2],[12,13,2],[0,14,2],[8,14,2],[0,15,2],[8,15,2]],
-[[2,0,2],[6,0,2],[10,0,2],[14,0,2],[2,1,2],[6,1,2],[10,1,2],[14,1,2],[0,2,2],[4,2,2],[8,2,2],[12,2,2],[0,3,2],[4,3,2],[8,3,2],[12,3,2],[2,4,2],[6,4,2],[10,4,2],[14,4,2],[2,5,2],[6,5,2],[10,5,2],[14,5,2],[0,6,2],[4,6,2],[8,6,2],[12,6,2],[0,7,2],[4,7,2],[8,7,2],[12,7,2],[2,8,2],[6,8,2],[10,8,2],[14,8,2],[2,9,2],[6,9,2],[10,9,2],[14,9,2],[0,10,2],[4,10,2],[8,10,2],[12,10,2],[0,11,2],[4,11,2],[8,11,2],[12,11,2],[2,12,2],[6,12,2],[10,12,2],[14,12,2],[2,13,2],[6,13,2],[10,13,2],[14,13,2],[0,14,2],[4,14,2],[8,14,2],[12,14,2],[0,15,2],[4,15,2],[8,15,2],[12,15,2]],
-[[2,0,6],[10,0,6],[2,1,6],[10,1,6],[0,2,4],[6,2,6],[14,2,2],[0,3,4],[6,3,6],[14,3,2],[2,4,6],[10,4,6],[2,5,6],[10,5,6],[0,6,4],[6,6,6],[14,6,2],[0,7,4],[6,7,6],[14,7,2],[2,8,6],[10,8,6],[2,9,6],[10,9,6],[0,10,4],[6,10,6],[14,10,2],[0,11,4],[6,11,6],[14,11,2],[2,12,6],[10,12,6],[2,13,6],[10,13,6],[0,14,4],[6,14,6],[14,14,2],[0,15,4],[6,15,6],[14,15,2]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[0,8,10],[0,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[0,4,10],[0,5,10],[6,6,4],[6,7,4],[0,8,10],[0,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[0,8,8],[10,8,4],[0,9,8],[10,9,4],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[0,8,14],[0,9,14],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[0,4,10],[0,5,10],[6,6,4],[6,7,4],[0,8,10],[0,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[0,4,8],[10,4,4],[0,5,8],[10,5,4],[10,6,4],[10,7,4],[0,8,8],[10,8,4],[0,9,8],[10,9,4],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[4,8,4],[10,8,4],[4,9,4],[10,9,4],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[0,4,14],[0,5,14],[10,6,4],[10,7,4],[0,8,8],[10,8,4],[0,9,8],[10,9,4],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[0,4,8],[10,4,4],[0,5,8],[10,5,4],[10,6,4],[10,7,4],[0,8,14],[0,9,14]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[0,8,14],[0,9,14]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[0,4,10],[0,5,10],[6,6,4],[6,7,4],[0,8,10],[0,9,10]],
-[[0,8,10],[0,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,10],[6,9,10]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[0,8,16],[0,9,16]],
-[[0,8,16],[0,9,16],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,10],[6,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[0,8,16],[0,9,16]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[0,8,16],[0,9,16],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,10],[6,5,10],[6,6,4],[6,7,4],[6,8,10],[6,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[4,8,4],[10,8,6],[4,9,4],[10,9,6],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,6],[4,5,4],[10,5,6],[4,6,4],[4,7,4],[4,8,12],[4,9,12]],
-[[4,4,12],[4,5,12],[4,6,4],[4,7,4],[4,8,4],[10,8,6],[4,9,4],[10,9,6],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[0,4,8],[10,4,6],[0,5,8],[10,5,6],[0,8,16],[0,9,16]],
-[[0,4,16],[0,5,16],[0,8,8],[10,8,6],[0,9,8],[10,9,6],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,6],[4,5,4],[10,5,6],[4,6,4],[4,7,4],[4,8,4],[10,8,6],[4,9,4],[10,9,6],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[0,4,16],[0,5,16],[0,8,16],[0,9,16]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[0,4,8],[10,4,6],[0,5,8],[10,5,6],[0,8,8],[10,8,6],[0,9,8],[10,9,6],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[0,4,16],[0,5,16],[0,8,16],[0,9,16]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[0,8,16],[0,9,16]],
-[[0,4,16],[0,5,16],[0,8,16],[0,9,16],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[0,8,16],[0,9,16],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[4,8,12],[4,9,12]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,10],[6,5,10],[6,6,4],[6,7,4],[6,8,10],[6,9,10]],
-[[6,4,10],[6,5,10],[6,6,4],[6,7,4],[6,8,10],[6,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[4,8,12],[4,9,12],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[4,0,4],[10,0,4],[4,1,4],[10,1,4],[4,2,4],[10,2,4],[4,3,4],[10,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[0,8,16],[0,9,16],[4,10,4],[10,10,4],[4,11,4],[10,11,4],[4,12,4],[10,12,4],[4,13,4],[10,13,4],[4,14,4],[10,14,4],[4,15,4],[10,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[0,4,16],[0,5,16],[6,6,4],[6,7,4],[0,8,16],[0,9,16],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[0,8,10],[0,9,10]],
-[[6,8,10],[6,9,10],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[0,0,16],[0,1,16],[0,2,16],[0,3,16],[0,4,16],[0,5,16],[0,6,16],[0,7,16],[0,8,16],[0,9,16],[0,10,16],[0,11,16],[0,12,16],[0,13,16],[0,14,16],[0,15,16]],
-[[0,8,16],[0,9,16],[0,10,16],[0,11,16],[0,12,16],[0,13,16],[0,14,16],[0,15,16]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8],[0,7,8],[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[8,0,8],[8,1,8],[8,2,8],[8,3,8],[8,4,8],[8,5,8],[8,6,8],[8,7,8],[8,8,8],[8,9,8],[8,10,8],[8,11,8],[8,12,8],[8,13,8],[8,14,8],[8,15,8]],
-[[0,0,16],[0,1,16],[0,2,16],[0,3,16],[0,4,16],[0,5,16],[0,6,16],[0,7,16]],
-[[2,6,6],[10,6,4],[2,7,6],[10,7,4],[0,8,4],[6,8,6],[0,9,4],[6,9,6],[0,10,4],[8,10,2],[0,11,4],[8,11,2],[0,12,4],[6,12,6],[0,13,4],[6,13,6],[2,14,6],[10,14,4],[2,15,6],[10,15,4]],
-[[2,2,8],[2,3,8],[0,4,4],[8,4,4],[0,5,4],[8,5,4],[0,6,4],[6,6,4],[0,7,4],[6,7,4],[0,8,4],[8,8,4],[0,9,4],[8,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,4],[8,14,4],[0,15,4],[8,15,4]],
-[[0,2,14],[0,3,14],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[0,10,4],[0,11,4],[0,12,4],[0,13,4],[0,14,4],[0,15,4]],
-[[0,6,14],[0,7,14],[2,8,4],[8,8,4],[2,9,4],[8,9,4],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[2,14,4],[8,14,4],[2,15,4],[8,15,4]],
-[[0,2,14],[0,3,14],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[2,6,4],[2,7,4],[4,8,4],[4,9,4],[2,10,4],[2,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4],[0,14,14],[0,15,14]],
-[[2,6,12],[2,7,12],[0,8,4],[6,8,4],[0,9,4],[6,9,4],[0,10,4],[6,10,4],[0,11,4],[6,11,4],[0,12,4],[6,12,4],[0,13,4],[6,13,4],[2,14,6],[2,15,6]],
-[[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,10],[2,13,10],[0,14,4],[0,15,4]],
-[[2,6,6],[10,6,4],[2,7,6],[10,7,4],[0,8,4],[6,8,6],[0,9,4],[6,9,6],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[2,0,12],[2,1,12],[6,2,4],[6,3,4],[4,4,8],[4,5,8],[2,6,4],[10,6,4],[2,7,4],[10,7,4],[2,8,4],[10,8,4],[2,9,4],[10,9,4],[4,10,8],[4,11,8],[6,12,4],[6,13,4],[2,14,12],[2,15,12]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,14],[0,9,14],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[4,14,6],[4,15,6]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[2,12,4],[8,12,4],[2,13,4],[8,13,4],[0,14,6],[8,14,6],[0,15,6],[8,15,6]],
-[[8,2,6],[8,3,6],[6,4,4],[6,5,4],[8,6,4],[8,7,4],[4,8,10],[4,9,10],[2,10,4],[10,10,4],[2,11,4],[10,11,4],[2,12,4],[10,12,4],[2,13,4],[10,13,4],[4,14,8],[4,15,8]],
-[[2,4,12],[2,5,12],[0,6,4],[6,6,4],[12,6,4],[0,7,4],[6,7,4],[12,7,4],[0,8,4],[6,8,4],[12,8,4],[0,9,4],[6,9,4],[12,9,4],[2,10,12],[2,11,12]],
-[[10,0,4],[10,1,4],[8,2,4],[8,3,4],[2,4,12],[2,5,12],[0,6,4],[6,6,4],[12,6,4],[0,7,4],[6,7,4],[12,7,4],[0,8,4],[6,8,4],[12,8,4],[0,9,4],[6,9,4],[12,9,4],[2,10,12],[2,11,12],[2,12,4],[2,13,4],[0,14,4],[0,15,4]],
-[[6,2,8],[6,3,8],[4,4,4],[4,5,4],[2,6,4],[2,7,4],[2,8,12],[2,9,12],[2,10,4],[2,11,4],[4,12,4],[4,13,4],[6,14,8],[6,15,8]],
-[[2,2,10],[2,3,10],[0,4,4],[10,4,4],[0,5,4],[10,5,4],[0,6,4],[10,6,4],[0,7,4],[10,7,4],[0,8,4],[10,8,4],[0,9,4],[10,9,4],[0,10,4],[10,10,4],[0,11,4],[10,11,4],[0,12,4],[10,12,4],[0,13,4],[10,13,4]],
-[[0,4,14],[0,5,14],[0,8,14],[0,9,14],[0,12,14],[0,13,14]],
-[[6,2,4],[6,3,4],[6,4,4],[6,5,4],[2,6,12],[2,7,12],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[2,14,12],[2,15,12]],
-[[4,2,4],[4,3,4],[6,4,4],[6,5,4],[8,6,4],[8,7,4],[6,8,4],[6,9,4],[4,10,4],[4,11,4],[2,14,12],[2,15,12]],
-[[8,2,4],[8,3,4],[6,4,4],[6,5,4],[4,6,4],[4,7,4],[6,8,4],[6,9,4],[8,10,4],[8,11,4],[2,14,12],[2,15,12]],
-[[8,0,6],[8,1,6],[6,2,4],[12,2,4],[6,3,4],[12,3,4],[6,4,4],[12,4,4],[6,5,4],[12,5,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[6,10,4],[6,11,4],[6,12,4],[6,13,4],[6,14,4],[6,15,4]],
-[[6,0,4],[6,1,4],[6,2,4],[6,3,4],[6,4,4],[6,5,4],[6,6,4],[6,7,4],[6,8,4],[6,9,4],[0,10,4],[6,10,4],[0,11,4],[6,11,4],[0,12,4],[6,12,4],[0,13,4],[6,13,4],[2,14,6],[2,15,6]],
-[[6,4,4],[6,5,4],[2,8,12],[2,9,12],[6,12,4],[6,13,4]],
-[[2,4,6],[10,4,4],[2,5,6],[10,5,4],[0,6,4],[6,6,6],[0,7,4],[6,7,6],[2,10,6],[10,10,4],[2,11,6],[10,11,4],[0,12,4],[6,12,6],[0,13,4],[6,13,6]],
-[[4,2,6],[4,3,6],[2,4,4],[8,4,4],[2,5,4],[8,5,4],[2,6,4],[8,6,4],[2,7,4],[8,7,4],[4,8,6],[4,9,6]],
-[[6,8,4],[6,9,4],[6,10,4],[6,11,4]],
-[[6,8,4],[6,9,4]],
-[[8,0,8],[8,1,8],[8,2,4],[8,3,4],[8,4,4],[8,5,4],[8,6,4],[8,7,4],[0,8,6],[8,8,4],[0,9,6],[8,9,4],[2,10,4],[8,10,4],[2,11,4],[8,11,4],[4,12,8],[4,13,8],[6,14,6],[6,15,6]],
-[[2,2,4],[8,2,4],[2,3,4],[8,3,4],[4,4,4],[10,4,4],[4,5,4],[10,5,4],[4,6,4],[10,6,4],[4,7,4],[10,7,4],[4,8,4],[10,8,4],[4,9,4],[10,9,4],[4,10,4],[10,10,4],[4,11,4],[10,11,4]],
-[[2,2,8],[2,3,8],[8,4,4],[8,5,4],[6,6,4],[6,7,4],[4,8,4],[4,9,4],[2,10,10],[2,11,10]],
-[[4,4,8],[4,5,8],[4,6,8],[4,7,8],[4,8,8],[4,9,8],[4,10,8],[4,11,8]],
-[]
-];
+/* Font of SCREEN 1 (screen_data_gen/fonts/generate.py): 256 glyphs
+ * of 16x16 pixels, packed one bit per pixel. */
+var SCREEN1_DATA = "AAAAAPA88DzwPPA8PPA88A/AD8A88Dzw8DzwPPA88Dw//D/8wAPAA8wzzDPAA8ADz/PP88PDw8PAA8ADP/w//D/8P/z/////88/zz//////wD/AP/D/8P/////8//D/8PPA88P/8//z//P/8//z//D/wP/APwA/AAwADAAAAAAADAAMAD8APwD/wP/D//P/8P/A/8A/AD8ADAAMAAAAAAA/AD8A/8D/wD8APwP/8//z//P/88zzzPAMAAwAPwA/AAwADAA/AD8A/8D/w//z//P/8//w/8D/wAwADAA/AD8AAAAAA8DzwPPA88Dw88DzwD8APwDzwPPDwPPA88DzwPP///////////D/8P/AP8A/wD/AP/D/8P///////////AAAAAPA88DzwPPA8PPA88A/AD8A88Dzw8DzwPPA88DwAAAAA8DzwPPA88Dw88DzwD8APwDzwPPDwPPA88DzwPAAAAADwPPA88DzwPDzwPPAPwA/APPA88PA88DzwPPA8AAAAAPA88DzwPPA8PPA88A/AD8A88Dzw8DzwPPA88DwAAAAA8DzwPPA88Dw88DzwD8APwDzwPPDwPPA88DzwPD//P/88DzwPP/8//zwPPA88DzwPPD88P/w8/DzwAPAAA8ADwPPP888P8A/w/D/8P/w//D8P8A/w88/zzwPAA8DAAMAA/AD8AP/A/8D//P/8/8D/wPwA/ADAAMAAAAAAAAAMAAwA/AD8D/wP/P/8//wP/A/8APwA/AAMAAwAAAAAA8ADwA/wD/A//D/8A8ADwAPAA8A//D/8D/AP8APAA8A8PDw8PDw8PDw8PDw8PDw8PDw8PAAAAAA8PDw8AAAAAD//P//zz/PP88/zzz/PP88DzwPPA88DzwPPA88AAAAAD/wP/DwDPAMP8A/wPDw8PDw8PDwP8A/wwDzAPD/wP/AAAAAAAAAAAAAAAAAAAAAAP/w//D/8P/w//D/8AAAAAAPAA8AP8A/wP/w//APAA8A//D/8D/AP8APAA8D/////A8ADwA/wD/A//D/8A8ADwAPAA8ADwAPAA8ADwAAAAAADwAPAA8ADwAPAA8ADwAPAP/w//A/wD/ADwAPAAAAAAAAAAAADwAPAAPAA8P/8//wA8ADwA8ADwAAAAAAAAAAAAAAAAA8ADwA8ADwA//z//DwAPAAPAA8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADwPPA88DzwPDzwPPAPwA/APPA88PA88DzwPPA8AAAAAPA88DzwPPA8PPA88A/AD8A88Dzw8DzwPPA88DwAAAAA8DzwPPA88Dw88DzwD8APwDzwPPDwPPA88DzwPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPAA8AP8A/wD/AP8APAA8ADwAPAAAAAAAPAA8AAAAAAPDw8PDw8PDwMMAwwAAAAAAAAAAAAAAAAAAAAAAAAAAA88DzwPPA88P/8//w88Dzw//z//DzwPPA88DzwAAAAAAPAA8AP/A/8PAA8AA/wD/AAPAA8P/A/8APAA8AAAAAAAAAAAPA88Dzw8PDwA8ADwA8ADwA8PDw88DzwPAAAAAAPwA/APPA88A/AD8A/PD888/Dz8PDw8PA/PD88AAAAAAPAA8ADwAPADwAPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPAA8APAA8APAA8ADwAPAA8ADwADwAPAAPAA8AAAAAAPAA8AA8ADwADwAPAA8ADwAPAA8APAA8APAA8AAAAAAAAAAAA8PDw8D/AP8P////8P8A/wPDw8PAAAAAAAAAAAAAAAAAPAA8ADwAPAP/w//APAA8ADwAPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8ADwAPAA8APAA8AAAAAAAAAAAAAAAAAAAAAAD/8P/wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADwAPAA8ADwAAAAAAAPAA8APAA8APAA8APAA8APAA8APAA8ADAAMAAAAAAAA/AD8A88Dzw8DzwPPM88zzwPPA8PPA88A/AD8AAAAAAA8ADwA/AD8ADwAPAA8ADwAPAA8ADwAPAP/w//AAAAAA/8D/w8DzwPAA8ADwD8APwDwAPADw8PDz//P/8AAAAAD/wP/DwPPA8ADwAPA/wD/AAPAA88DzwPD/wP/AAAAAAA/AD8A/wD/A88Dzw8PDw8P/8//wA8ADwA/wD/AAAAAD//P/88ADwAPAA8AD/8P/wADwAPPA88Dw/8D/wAAAAAA/AD8A8ADwA8ADwAP/w//DwPPA88DzwPD/wP/AAAAAA//z//PA88DwA8ADwA8ADwA8ADwAPAA8ADwAPAAAAAAA/8D/w8DzwPPA88Dw/8D/w8DzwPPA88Dw/8D/wAAAAAD/wP/DwPPA88DzwPD/8P/wAPAA8APAA8D/AP8AAAAAAAAAAAAPAA8ADwAPAAAAAAAAAAAADwAPAA8ADwAAAAAADwAPAA8ADwAAAAAAAAAAAA8ADwAPAA8APAA8AAAAAAAA8ADwA8ADwA8ADwA8ADwADwAPAAPAA8AA8ADwAAAAAAAAAAAAAAAA//D/8AAAAAAAAAAA//D/8AAAAAAAAAAA8ADwADwAPAAPAA8AA8ADwA8ADwA8ADwA8ADwAAAAAAD/wP/DwPPA8APAA8APAA8ADwAPAAAAAAAPAA8AAAAAAP/A/8PA88Dzz/PP88/zz/PP88/zwAPAAP8A/wAAAAAAPwA/APPA88PA88Dz//P/88DzwPPA88DzwPPA8AAAAAP/w//A8PDw8PDw8PD/wP/A8PDw8PDw8PP/w//AAAAAAD/AP8Dw8PDzwAPAA8ADwAPAA8AA8PDw8D/AP8AAAAAD/wP/APPA88Dw8PDw8PDw8PDw8PDzwPPD/wP/AAAAAAP/8//w8DDwMPMA8wD/AP8A8wDzAPAw8DP/8//wAAAAA//z//DwMPAw8wDzAP8A/wDzAPMA8ADwA/wD/AAAAAAAP8A/wPDw8PPAA8ADwAPAA8Pzw/Dw8PDwPzA/MAAAAAPA88DzwPPA88DzwPP/8//zwPPA88DzwPPA88DwAAAAAD/AP8APAA8ADwAPAA8ADwAPAA8ADwAPAD/AP8AAAAAAD/AP8APAA8ADwAPAA8ADw8PDw8PDw8PA/wD/AAAAAAPw8/Dw8PDw8PPA88D/AP8A88DzwPDw8PPw8/DwAAAAA/wD/ADwAPAA8ADwAPAA8ADwMPAw8PDw8//z//AAAAADwPPA8/Pz8/P/8//z//P/88zzzPPA88DzwPPA8AAAAAPA88Dz8PPw8/zz/PPP88/zw/PD88DzwPPA88DwAAAAAP/A/8PA88DzwPPA88DzwPPA88DzwPPA8P/A/8AAAAAD/8P/wPDw8PDw8PDw/8D/wPAA8ADwAPAD/AP8AAAAAAD/wP/DwPPA88DzwPPA88Dzw/PD8P/A/8AD8APwAAAAA//D/8Dw8PDw8PDw8P/A/8DzwPPA8PDw8/Dz8PAAAAAAP8A/wPDw8PA8ADwADwAPAAPAA8Dw8PDwP8A/wAAAAAD/8P/w//D/8M8wzzAPAA8ADwAPAA8ADwA/wD/AAAAAA8DzwPPA88DzwPPA88DzwPPA88DzwPPA8P/A/8AAAAADwPPA88DzwPPA88DzwPPA88DzwPDzwPPAPwA/AAAAAAPA88DzwPPA88DzwPPM88zzzPPM8//z//DzwPPAAAAAA8DzwPPA88Dw88DzwD8APwDzwPPDwPPA88DzwPAAAAAA8PDw8PDw8PDw8PDwP8A/wA8ADwAPAA8AP8A/wAAAAAP/8//zwPPA8wPDA8APAA8APDA8MPDw8PP/8//wAAAAAD/AP8A8ADwAPAA8ADwAPAA8ADwAPAA8AD/AP8AAAAADwAPAAPAA8AA8ADwADwAPAAPAA8AA8ADwADAAMAAAAAA/wD/AA8ADwAPAA8ADwAPAA8ADwAPAA8A/wD/ADAAMAD8APwDzwPPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/////DwAPAAPAA8AA8ADwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/wD/AAPAA8D/wP/Dw8PDwPzw/PAAAAAD8APwAPAA8AD/wP/A8PDw8PDw8PDw8PDzz8PPwAAAAAAAAAAAAAAAAP/A/8PA88DzwAPAA8DzwPD/wP/AAAAAAA/AD8ADwAPA/8D/w8PDw8PDw8PDw8PDwPzw/PAAAAAAAAAAAAAAAAD/wP/DwPPA8//z//PAA8AA/8D/wAAAAAA/wD/A8PDw8PAA8AP/A/8A8ADwAPAA8AP8A/wAAAAAAAAAAAAAAAAA/PD888PDw8D/wP/AA8ADw/8D/wAAAAAD8APwAPAA8ADzwPPA/PD88PDw8PDw8PDz8PPw8AAAAAAPAA8AAAAAAD8APwAPAA8ADwAPAA8ADwA/wD/AAAAAAADwAPAAAAAAAPAA8ADwAPAA8ADw8PDw8D/AP8AAAAAD8APwAPAA8ADw8PDw88DzwP8A/wDzwPPD8PPw8AAAAAA/AD8ADwAPAA8ADwAPAA8ADwAPAA8ADwA/wD/AAAAAAAAAAAAAAAAD88Pzw//z//PM88zzzPPM88zzzPAAAAAAAAAAAAAAAAPPw8/A8PDw8PDw8PDw8PDw8PDw8AAAAAAAAAAAAAAAAP/A/8PA88DzwPPA88DzwPD/wP/AAAAAAAAAAAAAAAADz8PPwPDw8PD/wP/A8ADwA/wD/AAAAAAAAAAAAAAAAAD88Pzzw8PDwP/A/8ADwAPAD/AP8AAAAAAAAAAAAAAAA8/Dz8D88Pzw8ADwAPAA8AP8A/wAAAAAAAAAAAAAAAAA//D/88ADwAD/wP/AAPAA8//D/8AAAAAAPAA8ADwAPAP/w//APAA8ADwAPAA88DzwD8APwAAAAAAAAAAAAAAAA8PDw8PDw8PDw8PDw8PDw8D88PzwAAAAAAAAAAAAAAADwPPA88DzwPPA88Dw88DzwD8APwAAAAAAAAAAAAAAAAPA88DzzPPM88zzzPP/8//w88DzwAAAAAAAAAAAAAAAA8DzwPDzwPPAPwA/APPA88PA88DwAAAAAAAAAAAAAAADwPPA88DzwPD/8P/wAPAA8//D/8AAAAAAAAAAAAAAAAD/8P/wA8ADwA8ADwA8ADwA//D/8AAAAAAD8APwDwAPAA8ADwD8APwADwAPAA8ADwAD8APwAAAAAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAAAAAA/AD8AA8ADwAPAA8AA/AD8A8ADwAPAA8A/AD8APzw/PPPw8/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMAAwAPwA/APPA88PA88DzwPPA8//z//A/wD/A8PDw88ADwAPAA8AA8PDw8D/AP8APAA8A/AD8AAAAAAPDw8PAAAAAA8PDw8PDw8PDw8PDw8PDw8D88PzwA8ADwA8ADwAAAAAA/8D/w8DzwPP/8//zwAPAAP/A/8A/AD8A88DzwAAAAAD/AP8AA8ADwP/A/8PDw8PA/PD88AAAAAPDw8PAAAAAAP8A/wADwAPA/8D/w8PDw8D88Pzw8ADwADwAPAAAAAAA/wD/AAPAA8D/wP/Dw8PDwPzw/PA/AD8A88DzwD8APwD/AP8AA8ADwP/A/8PDw8PA/PD88AAAAAD/wP/DwPPA88ADwAPA88Dw/8D/wA8ADwD8APwAPwA/APPA88AAAAAA/8D/w8DzwPP/8//zwAPAAP/A/8AAAAADwPPA8AAAAAD/wP/DwPPA8//z//PAA8AA/8D/wDwAPAAPAA8AAAAAAP/A/8PA88Dz//P/88ADwAD/wP/AAAAAAPDw8PAAAAAAPwA/AA8ADwAPAA8ADwAPAD/AP8A/AD8A88DzwAAAAAA/AD8ADwAPAA8ADwAPAA8AP8A/wDwAPAAPAA8AAAAAAD8APwAPAA8ADwAPAA8ADwA/wD/DwPPA8AwADAA/AD8A88Dzw8DzwPP/8//zwPPA88DzwPA/AD8A88DzwD8APwD/wP/DwPPA8//z//PA88DzwPPA8APAA8APAA8D//P/88ADwAP/A/8DwAPAA8ADwAP/8//wAAAAAAAAAAAAAAAD88PzwDzwPPD/8P/zzwPPAPPw8/AAAAAAP/A/8PPA88PDw8PD//P/88PDw8PDw8PDw/PD8D8APwDzwPPAAAAAAP/A/8PA88DzwPPA88DzwPD/wP/AAAAAA8DzwPAAAAAA/8D/w8DzwPPA88DzwPPA8P/A/8A8ADwADwAPAAAAAAD/wP/DwPPA88DzwPPA88Dw/8D/wP8A/wPDw8PAAAAAA8PDw8PDw8PDw8PDw8PDw8D88Pzw8ADwADwAPAAAAAADw8PDw8PDw8PDw8PDw8PDwPzw/PAAAAADwPPA8AAAAAPA88DzwPPA8P/w//AA8ADz/8P/w8DzwPAAAAAAPwA/APPA88PA88DzwPPA8PPA88A/AD8DwPPA8AAAAAPA88DzwPPA88DzwPPA88DzwPPA8P/A/8APAA8ADwAPAP/w//PAA8ADwAPAAP/w//APAA8ADwAPAD8APwDzwPPA8MDww/wD/ADwAPAA8ADwAPDw8PP/w//A8PDw8PDw8PA/wD/A//D/8A8ADwD/8P/wDwAPAA8ADwP/A/8Dw8PDw8PDw8P/M/8zwPPA88P/w//A88DzwP/A/APwA/APPA88DwAPAD/AP8APAA8ADwAPA88DzwD8APwADwAPADwAPAAAAAAA/wD/AAPAA8D/wP/Dw8PDwPzw/PADwAPADwAPAAAAAAA/AD8ADwAPAA8ADwAPAA8AP8A/wAPAA8APAA8AAAAAAP/A/8PA88DzwPPA88DzwPD/wP/ADwAPADwAPAAAAAADw8PDw8PDw8PDw8PDw8PDwPzw/PD88Pzzz8PPwAAAAAPPw8/A8PDw8PDw8PDw8PDw8PDw8Pzw/PPPw8/AAAAAA/Dz8PP88/zzz/PP88Pzw/PA88DwAAAAAD/AP8DzwPPA88DzwDzwPPAAAAAA//D/8AAAAAAAAAAAPwA/APPA88DzwPPAPwA/AAAAAAD/wP/AAAAAAAAAAAA8ADwAAAAAADwAPAA8ADwA8ADwA8DzwPD/wP/AAAAAAAAAAAAAAAAD//P/88ADwAPAA8AAAAAAAAAAAAAAAAAAAAAAAAAAAAP/8//wAPAA8ADwAPAAAAAAAAAAAPA88D/w8/Dw88DzwP/w//A8PDw88PDw88PDw8AD/AP88DzwP/Dz8PDzwPPA/zD/MDzwPPDzMPMzz//P/ADwAPAAAAAADwAPAAAAAAAPAA8ADwAPAD/AP8A/wD/ADwAPAAAAAAAAAAAAAAAAADw8PDzw8PDzw8PDwPDw8PA8PDw8AAAAAAAAAAAAAAADw8PDwPDw8PA8PDw88PDw88PDw8AwMDAzAwMDADAwMDMDAwMAMDAwMwMDAwAwMDAzAwMDAMzMzM8zMzMwzMzMzzMzMzDMzMzPMzMzMMzMzM8zMzMw/Pz8/8/Pz8z8/Pz/z8/PzPz8/P/Pz8/M/Pz8/8/Pz8wPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwP/A/8ADwAPAA8ADwAPAA8ADwAPAA8ADwP/A/8ADwAPA/8D/wAPAA8ADwAPAA8ADwA88DzwPPA88DzwPPA88Dzz/PP88DzwPPA88DzwPPA88AAAAAAAAAAAAAAAAAAAAAP/8//wPPA88DzwPPA88DzwAAAAAAAAAAP/A/8ADwAPA/8D/wAPAA8ADwAPAA8ADwA88DzwPPA88/zz/PAA8ADz/PP88DzwPPA88DzwPPA88DzwPPA88DzwPPA88DzwPPA88DzwPPA88DzwPPA88DzwAAAAAAAAAAP/8//wAPAA8/zz/PA88DzwPPA88DzwPPA88DzwPPA88/zz/PAA8ADz//P/8AAAAAAAAAAAAAAAADzwPPA88DzwPPA88DzwPPP/8//wAAAAAAAAAAAAAAAADwAPAA8ADwP/A/8ADwAPA/8D/wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/wP/AA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAP/A/8AAAAAAAAAAAAAAAADwAPAA8ADwAPAA8ADwAPA/////wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/////A8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAP/A/8DwAPAA8ADwAPAA8AAAAAAAAAAAAAAAAAAAAAA/////wAAAAAAAAAAAAAAAAPAA8ADwAPAA8ADwAPAA8D/////A8ADwAPAA8ADwAPAA8ADwAPAA8AD/wP/A8ADwAP/A/8DwAPAA8ADwAPAA8APPA88DzwPPA88DzwPPA88Dz8PPw88DzwPPA88DzwPPA88DzwPPA88Dz8PPw8ADwAP/w//AAAAAAAAAAAAAAAAAAAAAAAAAAAP/w//DwAPAA8/Dz8PPA88DzwPPA88DzwPPA88DzwPPP8//z8AAAAA/////wAAAAAAAAAAAAAAAAAAAAAAAAAA/////wAAAAD/P/8/DzwPPA88DzwPPA88DzwPPA88DzwPPw8/DwAPAA8/Dz8PPA88DzwPPA88DzwAAAAAAAAAAP////8AAAAA/////wAAAAAAAAAAAAAAAA88DzwPPA88/z//PwAAAAD/P/8/DzwPPA88DzwPPA88A8ADwAPAA8D/////AAAAAP////8AAAAAAAAAAAAAAAAPPA88DzwPPA88DzwPPA88/////wAAAAAAAAAAAAAAAAAAAAAAAAAA/////wAAAAD/////A8ADwAPAA8ADwAPAAAAAAAAAAAAAAAAAAAAAAP////8PPA88DzwPPA88DzwPPA88DzwPPA88DzwPPA88D/8P/wAAAAAAAAAAAAAAAAPAA8ADwAPAA/8D/wPAA8AD/wP/AAAAAAAAAAAAAAAAAAAAAAAAAAAD/wP/A8ADwAP/A/8DwAPAA8ADwAPAA8AAAAAAAAAAAAAAAAAAAAAAD/8P/w88DzwPPA88DzwPPA88DzwPPA88DzwPPA88Dzz/////DzwPPA88DzwPPA88A8ADwAPAA8D/////A8ADwP////8DwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPA/8D/wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/wP/A8ADwAPAA8ADwAPA//////////////////////////////////////////8AAAAAAAAAAAAAAAAAAAAA//////////////////////8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8AAP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP8A/wD/AP//////////////////////AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD88Pzzz8PPw8MDwwPPw8/A/PD88AAAAAD/AP8Dw8PDw88DzwPDw8PDwPPA88DzwPPDw8PAAAAAA//z//PA88DzwAPAA8ADwAPAA8ADwAPAA8ADwAAAAAAAAAAAAAAAAAP/8//w88DzwPPA88DzwPPA88DzwAAAAAP/8//zwPPA8PAA8AA8ADwA8ADwA8DzwPP/8//wAAAAAAAAAAAAAAAA//D/888DzwPPA88DzwPPAPwA/AAAAAAAAAAAAAAAAADw8PDw8PDw8PDw8PD/wP/DwAPAAAAAAAAAAAAAAAAAAPzw/PPPw8/ADwAPAA8ADwAPAA8A//D/8A8ADwA/wD/A8PDw8PDw8PA/wD/ADwAPAP/w//AAAAAAPwA/APPA88PA88Dz//P/88DzwPDzwPPAPwA/AAAAAAA/AD8A88Dzw8DzwPPA88Dw88DzwPPA88Pz8/PwAAAAAAPwA/APAA8AA8ADwD/wP/Dw8PDw8PDw8D/AP8AAAAAAAAAAAP/w//PPP88/zz/PPP/w//AAAAAAAAAAAADwAPADwAPA//D/888/zz/PP888//D/8PAA8APAA8AAAAAAAA/wD/A8ADwA8ADwAP/w//DwAPAAPAA8AA/wD/AAAAAA/8D/w8DzwPPA88DzwPPA88DzwPPA88DwAAAAAAAAAAAAAAAD//P/8AAAAAP/8//wAAAAA//z//AAAAAAAAAAAA8ADwAPAA8A//D/8A8ADwAPAA8AAAAAAP/w//AAAAAAPAA8AA8ADwADwAPADwAPADwAPAAAAAAA//D/8AAAAAADwAPADwAPADwAPAAPAA8AA8ADwAAAAAD/8P/wA/AD8A88DzwPPA88DwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPAA8ADwAPA88DzwPPA88A/AD8AAAAAAAAAAAADwAPAAAAAAD/8P/wAAAAAA8ADwAAAAAAAAAAAAAAAAD88Pzzz8PPwAAAAAD88Pzzz8PPwAAAAAAAAAAAPwA/APPA88DzwPPAPwA/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPAA8ADwAPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8ADwAAAAAAAAAAAAAAAAAD/AP8A8ADwAPAA8ADwAPD88PzwPPA88A/wD/AD8APwAAAAADzwPPAPPA88DzwPPA88DzwPPA88AAAAAAAAAAAAAAAAP8A/wADwAPADwAPADwAPAD/wP/AAAAAAAAAAAAAAAAAAAAAAD/AP8A/wD/AP8A/wD/AP8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=";
@@ -1,258 +1,3 @@
-var SCREEN10_DATA = [
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[1,3,6],[0,4,1],[7,4,1],[0,5,1],[2,5,1],[5,5,1],[7,5,1],[0,6,1],[7,6,1],[0,7,1],[7,7,1],[0,8,1],[2,8,4],[7,8,1],[0,9,1],[3,9,2],[7,9,1],[0,10,1],[7,10,1],[1,11,6]],
-[[1,3,6],[0,4,8],[0,5,2],[3,5,2],[6,5,2],[0,6,8],[0,7,8],[0,8,2],[6,8,2],[0,9,3],[5,9,3],[0,10,8],[1,11,6]],
-[[1,4,2],[4,4,2],[0,5,7],[0,6,7],[0,7,7],[0,8,7],[1,9,5],[2,10,3],[3,11,1]],
-[[3,4,1],[2,5,3],[1,6,5],[0,7,7],[1,8,5],[2,9,3],[3,10,1]],
-[[3,3,2],[2,4,4],[2,5,4],[0,6,3],[5,6,3],[0,7,3],[5,7,3],[0,8,3],[5,8,3],[3,9,2],[3,10,2],[2,11,4]],
-[[3,3,2],[2,4,4],[1,5,6],[0,6,8],[0,7,8],[1,8,6],[3,9,2],[3,10,2],[2,11,4]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,3],[5,6,3],[0,7,2],[6,7,2],[0,8,2],[6,8,2],[0,9,3],[5,9,3],[0,10,8],[0,11,8],[0,12,8],[0,13,8]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[1,3,7],[1,4,2],[6,4,2],[1,5,7],[1,6,2],[6,6,2],[1,7,2],[6,7,2],[1,8,2],[6,8,2],[1,9,2],[5,9,3],[0,10,3],[5,10,3],[0,11,3],[5,11,2],[0,12,2]],
-[[3,3,2],[3,4,2],[0,5,2],[3,5,2],[6,5,2],[2,6,4],[0,7,3],[5,7,3],[2,8,4],[0,9,2],[3,9,2],[6,9,2],[3,10,2],[3,11,2]],
-[[0,3,1],[0,4,2],[0,5,3],[0,6,5],[0,7,7],[0,8,5],[0,9,3],[0,10,2],[0,11,1]],
-[[6,3,1],[5,4,2],[4,5,3],[2,6,5],[0,7,7],[2,8,5],[4,9,3],[5,10,2],[6,11,1]],
-[[3,3,2],[2,4,4],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[1,9,6],[2,10,4],[3,11,2]],
-[[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2]],
-[[1,3,7],[0,4,2],[3,4,2],[6,4,2],[0,5,2],[3,5,2],[6,5,2],[0,6,2],[3,6,2],[6,6,2],[1,7,4],[6,7,2],[3,8,2],[6,8,2],[3,9,2],[6,9,2],[3,10,2],[6,10,2],[3,11,2],[6,11,2]],
-[[1,1,5],[0,2,2],[5,2,2],[1,3,2],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[1,7,2],[4,7,2],[2,8,3],[4,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,11,7],[0,12,7],[0,13,7]],
-[[3,3,2],[2,4,4],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[1,9,6],[2,10,4],[3,11,2],[1,12,6]],
-[[3,3,2],[2,4,4],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2]],
-[[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[1,9,6],[2,10,4],[3,11,2]],
-[[3,5,2],[4,6,2],[0,7,7],[4,8,2],[3,9,2]],
-[[2,5,2],[1,6,2],[0,7,7],[1,8,2],[2,9,2]],
-[],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[],
-[[3,3,2],[2,4,4],[2,5,4],[2,6,4],[3,7,2],[3,8,2],[3,10,2],[3,11,2]],
-[[1,1,2],[5,1,2],[1,2,2],[5,2,2],[1,3,2],[5,3,2],[2,4,1],[5,4,1]],
-[[1,3,2],[4,3,2],[1,4,2],[4,4,2],[0,5,7],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[1,8,2],[4,8,2],[0,9,7],[1,10,2],[4,10,2],[1,11,2],[4,11,2]],
-[[3,1,2],[3,2,2],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[1,7,5],[5,8,2],[0,9,1],[5,9,2],[0,10,2],[5,10,2],[1,11,5],[3,12,2],[3,13,2]],
-[[0,5,2],[6,5,1],[0,6,2],[5,6,2],[4,7,2],[3,8,2],[2,9,2],[1,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3],[1,7,3],[5,7,2],[0,8,2],[3,8,3],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[3,3,2],[3,4,2],[3,5,2],[2,6,2]],
-[[4,3,2],[3,4,2],[2,5,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[3,10,2],[4,11,2]],
-[[2,3,2],[3,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[3,10,2],[2,11,2]],
-[[1,5,2],[5,5,2],[2,6,4],[0,7,8],[2,8,4],[1,9,2],[5,9,2]],
-[[3,5,2],[3,6,2],[1,7,6],[3,8,2],[3,9,2]],
-[[3,10,2],[3,11,2],[2,12,2]],
-[[0,7,7]],
-[[3,10,2],[3,11,2]],
-[[6,3,1],[5,4,2],[4,5,2],[3,6,2],[2,7,2],[1,8,2],[0,9,2],[0,10,1]],
-[[2,3,3],[1,4,2],[4,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[3,7,1],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,2],[4,10,2],[2,11,3]],
-[[3,3,2],[2,4,3],[1,5,4],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[1,11,6]],
-[[1,3,5],[0,4,2],[5,4,2],[5,5,2],[4,6,2],[3,7,2],[2,8,2],[1,9,2],[0,10,2],[5,10,2],[0,11,7]],
-[[1,3,5],[0,4,2],[5,4,2],[5,5,2],[5,6,2],[2,7,4],[5,8,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[4,3,2],[3,4,3],[2,5,4],[1,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,7],[4,9,2],[4,10,2],[3,11,4]],
-[[0,3,7],[0,4,2],[0,5,2],[0,6,2],[0,7,6],[5,8,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[2,3,3],[1,4,2],[0,5,2],[0,6,2],[0,7,6],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,3,7],[0,4,2],[5,4,2],[5,5,2],[4,6,2],[3,7,2],[2,8,2],[2,9,2],[2,10,2],[2,11,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[1,7,6],[5,8,2],[5,9,2],[4,10,2],[1,11,4]],
-[[3,5,2],[3,6,2],[3,10,2],[3,11,2]],
-[[3,5,2],[3,6,2],[3,10,2],[3,11,2],[2,12,2]],
-[[4,3,2],[3,4,2],[2,5,2],[1,6,2],[0,7,2],[1,8,2],[2,9,2],[3,10,2],[4,11,2]],
-[[1,6,6],[1,9,6]],
-[[1,3,2],[2,4,2],[3,5,2],[4,6,2],[5,7,2],[4,8,2],[3,9,2],[2,10,2],[1,11,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[4,6,2],[3,7,2],[3,8,2],[3,10,2],[3,11,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[3,6,4],[0,7,2],[3,7,4],[0,8,2],[3,8,4],[0,9,2],[3,9,3],[0,10,2],[1,11,5]],
-[[3,3,1],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,5],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[0,11,6]],
-[[2,3,4],[1,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[6,9,1],[1,10,2],[5,10,2],[2,11,4]],
-[[0,3,5],[1,4,2],[4,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[4,10,2],[0,11,5]],
-[[0,3,7],[1,4,2],[5,4,2],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,4],[1,8,2],[4,8,1],[1,9,2],[6,9,1],[1,10,2],[5,10,2],[0,11,7]],
-[[0,3,7],[1,4,2],[5,4,2],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,4],[1,8,2],[4,8,1],[1,9,2],[1,10,2],[0,11,4]],
-[[2,3,4],[1,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[0,7,2],[0,8,2],[3,8,4],[0,9,2],[5,9,2],[1,10,2],[5,10,2],[2,11,3],[6,11,1]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,7],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[2,3,4],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[3,3,4],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,4]],
-[[0,3,3],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[4,5,2],[1,6,2],[4,6,2],[1,7,4],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[5,10,2],[0,11,3],[5,11,2]],
-[[0,3,4],[1,4,2],[1,5,2],[1,6,2],[1,7,2],[1,8,2],[1,9,2],[6,9,1],[1,10,2],[5,10,2],[0,11,7]],
-[[0,3,2],[5,3,2],[0,4,3],[4,4,3],[0,5,7],[0,6,2],[3,6,1],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[0,3,2],[5,3,2],[0,4,3],[5,4,2],[0,5,4],[5,5,2],[0,6,7],[0,7,2],[3,7,4],[0,8,2],[4,8,3],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,5],[1,8,2],[1,9,2],[1,10,2],[0,11,4]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[3,10,4],[1,11,5],[4,12,3]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,5],[1,8,2],[4,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[0,11,3],[5,11,2]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[2,7,3],[4,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[1,3,6],[1,4,6],[1,5,1],[3,5,2],[6,5,1],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[1,9,2],[4,9,2],[2,10,3],[3,11,1]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[3,7,1],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,7],[1,10,2],[4,10,2],[1,11,2],[4,11,2]],
-[[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,5],[2,7,3],[1,8,5],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[2,7,4],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[0,3,7],[0,4,2],[5,4,2],[0,5,1],[4,5,2],[3,6,2],[2,7,2],[1,8,2],[0,9,2],[6,9,1],[0,10,2],[5,10,2],[0,11,7]],
-[[2,3,4],[2,4,2],[2,5,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[2,11,4]],
-[[0,3,1],[0,4,2],[0,5,3],[1,6,3],[2,7,3],[3,8,3],[4,9,3],[5,10,2],[6,11,1]],
-[[2,3,4],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[4,10,2],[2,11,4]],
-[[2,0,3],[1,1,2],[4,1,2]],
-[[0,12,8]],
-[[2,0,2],[3,1,2]],
-[[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[0,3,3],[1,4,2],[1,5,2],[1,6,4],[1,7,2],[4,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,5]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,2],[0,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[3,3,3],[4,4,2],[4,5,2],[2,6,4],[1,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[3,3,3],[2,4,2],[5,4,2],[2,5,2],[6,5,1],[2,6,2],[1,7,5],[2,8,2],[2,9,2],[2,10,2],[1,11,4]],
-[[1,6,3],[5,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,5],[4,12,2],[1,13,4]],
-[[0,3,3],[1,4,2],[1,5,2],[1,6,2],[4,6,2],[1,7,3],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[0,11,3],[5,11,2]],
-[[3,3,2],[3,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[5,3,2],[5,4,2],[4,6,3],[5,7,2],[5,8,2],[5,9,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[2,13,4]],
-[[0,3,3],[1,4,2],[1,5,2],[1,6,2],[5,6,2],[1,7,2],[4,7,2],[1,8,4],[1,9,2],[4,9,2],[1,10,2],[5,10,2],[0,11,3],[5,11,2]],
-[[2,3,3],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[0,6,3],[4,6,2],[0,7,7],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2]],
-[[0,6,2],[3,6,3],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,6,2],[3,6,3],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,5],[1,12,2],[0,13,4]],
-[[1,6,3],[5,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,5],[4,12,2],[3,13,4]],
-[[0,6,2],[3,6,3],[1,7,3],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[1,10,2],[0,11,4]],
-[[1,6,5],[0,7,2],[5,7,2],[1,8,3],[3,9,3],[0,10,2],[5,10,2],[1,11,5]],
-[[3,3,1],[2,4,2],[2,5,2],[0,6,6],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[5,10,2],[3,11,3]],
-[[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[1,9,2],[4,9,2],[2,10,3],[3,11,1]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,7],[1,11,2],[4,11,2]],
-[[0,6,2],[5,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[0,11,2],[5,11,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,6],[5,12,2],[1,13,5]],
-[[0,6,7],[0,7,2],[4,7,2],[3,8,2],[2,9,2],[1,10,2],[5,10,2],[0,11,7]],
-[[4,3,3],[3,4,2],[3,5,2],[3,6,2],[1,7,3],[3,8,2],[3,9,2],[3,10,2],[4,11,3]],
-[[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2]],
-[[1,3,3],[3,4,2],[3,5,2],[3,6,2],[4,7,3],[3,8,2],[3,9,2],[3,10,2],[1,11,3]],
-[[1,0,3],[5,0,2],[0,1,2],[3,1,3]],
-[[3,6,1],[2,7,3],[1,8,2],[4,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,7]],
-[[2,3,4],[1,4,2],[5,4,2],[0,5,2],[6,5,1],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[6,9,1],[1,10,2],[5,10,2],[2,11,4],[3,12,2],[1,13,3]],
-[[0,4,2],[4,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[5,2,2],[4,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[3,2,1],[2,3,3],[1,4,2],[4,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[0,4,2],[4,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[0,2,2],[1,3,2],[2,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[2,2,3],[1,3,2],[4,3,2],[2,4,3],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[1,6,5],[0,7,2],[5,7,2],[0,8,2],[0,9,2],[0,10,2],[5,10,2],[1,11,5],[3,12,2],[1,13,3]],
-[[3,2,1],[2,3,3],[1,4,2],[4,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,4,2],[5,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[1,2,2],[2,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[1,4,2],[5,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[3,2,2],[2,3,4],[1,4,2],[5,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[1,2,2],[2,3,2],[3,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[0,1,2],[5,1,2],[3,3,1],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[2,0,3],[1,1,2],[4,1,2],[2,2,3],[3,3,1],[2,4,3],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[4,0,2],[3,1,2],[0,3,7],[1,4,2],[5,4,2],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,4],[1,8,2],[4,8,1],[1,9,2],[6,9,1],[1,10,2],[5,10,2],[0,11,7]],
-[[0,6,3],[4,6,2],[2,7,2],[5,7,2],[1,8,3],[5,8,2],[0,9,2],[3,9,3],[0,10,2],[3,10,2],[1,11,2],[4,11,3]],
-[[2,3,5],[1,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,2],[4,6,2],[0,7,7],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,3]],
-[[3,2,1],[2,3,3],[1,4,2],[4,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,4,2],[5,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[1,2,2],[2,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[2,2,2],[1,3,4],[0,4,2],[4,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[0,2,2],[1,3,2],[2,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[0,4,2],[5,4,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,6],[5,12,2],[1,13,5]],
-[[0,1,2],[5,1,2],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,1,2],[5,1,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[3,3,2],[3,4,2],[1,5,5],[0,6,2],[5,6,2],[0,7,2],[0,8,2],[5,8,2],[1,9,5],[3,10,2],[3,11,2]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[5,5,1],[1,6,2],[0,7,4],[1,8,2],[1,9,2],[1,10,2],[5,10,2],[0,11,6]],
-[[1,3,2],[5,3,2],[1,4,2],[5,4,2],[2,5,4],[3,6,2],[1,7,6],[3,8,2],[1,9,6],[3,10,2],[3,11,2]],
-[[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,5],[1,7,2],[6,7,1],[1,8,2],[5,8,2],[1,9,2],[4,9,4],[1,10,2],[5,10,2],[0,11,4],[6,11,2]],
-[[4,3,3],[3,4,2],[6,4,2],[3,5,2],[3,6,2],[1,7,6],[3,8,2],[3,9,2],[0,10,2],[3,10,2],[1,11,3]],
-[[4,2,2],[3,3,2],[2,4,2],[1,6,4],[4,7,2],[1,8,5],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[5,2,2],[4,3,2],[3,4,2],[2,6,3],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[2,11,4]],
-[[5,2,2],[4,3,2],[3,4,2],[1,6,5],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[4,2,2],[3,3,2],[2,4,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[1,11,3],[5,11,2]],
-[[1,3,3],[5,3,2],[0,4,2],[3,4,3],[0,6,2],[3,6,3],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2]],
-[[1,0,3],[5,0,2],[0,1,2],[3,1,3],[0,3,2],[5,3,2],[0,4,3],[5,4,2],[0,5,4],[5,5,2],[0,6,7],[0,7,2],[3,7,4],[0,8,2],[4,8,3],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2]],
-[[2,3,4],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,2],[5,6,2],[1,8,6]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3],[1,8,5]],
-[[2,3,2],[2,4,2],[2,6,2],[2,7,2],[1,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[1,11,5]],
-[[0,6,7],[0,7,2],[0,8,2],[0,9,2]],
-[[0,6,7],[5,7,2],[5,8,2],[5,9,2]],
-[[1,1,2],[0,2,3],[1,3,2],[6,3,2],[1,4,2],[5,4,2],[1,5,2],[4,5,2],[3,6,2],[2,7,2],[1,8,2],[4,8,3],[0,9,2],[6,9,2],[5,10,2],[4,11,2],[3,12,5]],
-[[1,1,2],[0,2,3],[1,3,2],[6,3,2],[1,4,2],[5,4,2],[1,5,2],[4,5,2],[3,6,2],[2,7,2],[5,7,2],[1,8,2],[4,8,3],[0,9,2],[3,9,2],[6,9,1],[2,10,6],[5,11,2],[5,12,2]],
-[[3,3,2],[3,4,2],[3,6,2],[3,7,2],[2,8,4],[2,9,4],[2,10,4],[3,11,2]],
-[[2,7,2],[5,7,2],[1,8,2],[4,8,2],[0,9,2],[3,9,2],[1,10,2],[4,10,2],[2,11,2],[5,11,2]],
-[[0,7,2],[3,7,2],[1,8,2],[4,8,2],[2,9,2],[5,9,2],[1,10,2],[4,10,2],[0,11,2],[3,11,2]],
-[[3,0,1],[7,0,1],[1,1,1],[5,1,1],[3,2,1],[7,2,1],[1,3,1],[5,3,1],[3,4,1],[7,4,1],[1,5,1],[5,5,1],[3,6,1],[7,6,1],[1,7,1],[5,7,1],[3,8,1],[7,8,1],[1,9,1],[5,9,1],[3,10,1],[7,10,1],[1,11,1],[5,11,1],[3,12,1],[7,12,1],[1,13,1],[5,13,1]],
-[[1,0,1],[3,0,1],[5,0,1],[7,0,1],[0,1,1],[2,1,1],[4,1,1],[6,1,1],[1,2,1],[3,2,1],[5,2,1],[7,2,1],[0,3,1],[2,3,1],[4,3,1],[6,3,1],[1,4,1],[3,4,1],[5,4,1],[7,4,1],[0,5,1],[2,5,1],[4,5,1],[6,5,1],[1,6,1],[3,6,1],[5,6,1],[7,6,1],[0,7,1],[2,7,1],[4,7,1],[6,7,1],[1,8,1],[3,8,1],[5,8,1],[7,8,1],[0,9,1],[2,9,1],[4,9,1],[6,9,1],[1,10,1],[3,10,1],[5,10,1],[7,10,1],[0,11,1],[2,11,1],[4,11,1],[6,11,1],[1,12,1],[3,12,1],[5,12,1],[7,12,1],[0,13,1],[2,13,1],[4,13,1],[6,13,1]],
-[[0,0,2],[3,0,3],[7,0,1],[1,1,3],[5,1,3],[0,2,2],[3,2,3],[7,2,1],[1,3,3],[5,3,3],[0,4,2],[3,4,3],[7,4,1],[1,5,3],[5,5,3],[0,6,2],[3,6,3],[7,6,1],[1,7,3],[5,7,3],[0,8,2],[3,8,3],[7,8,1],[1,9,3],[5,9,3],[0,10,2],[3,10,3],[7,10,1],[1,11,3],[5,11,3],[0,12,2],[3,12,3],[7,12,1],[1,13,3],[5,13,3]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,5],[3,6,2],[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,4],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[0,7,7],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[0,5,5],[3,6,2],[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,2],[5,6,2],[0,7,4],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[0,5,7],[5,6,2],[0,7,4],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,2],[5,6,2],[0,7,7]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,7]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,5],[3,6,2],[0,7,5]],
-[[0,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,5]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,8]],
-[[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[0,7,8]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,5],[3,6,2],[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,3],[2,6,2],[2,7,6]],
-[[2,5,6],[2,6,2],[2,7,2],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,3],[0,7,8]],
-[[0,5,8],[0,7,4],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,3],[2,6,2],[2,7,2],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[0,5,8],[0,7,8]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[0,5,4],[5,5,3],[0,7,4],[5,7,3],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,8],[0,7,8]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,8]],
-[[0,5,8],[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[0,7,8],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,6]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,5],[3,6,2],[3,7,5]],
-[[3,5,5],[3,6,2],[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[2,7,6],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[0,7,8],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[0,5,8],[3,6,2],[0,7,8],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[0,7,5]],
-[[3,7,5],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8],[0,7,8],[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8]],
-[[0,7,8],[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8]],
-[[0,0,4],[0,1,4],[0,2,4],[0,3,4],[0,4,4],[0,5,4],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[0,10,4],[0,11,4],[0,12,4],[0,13,4]],
-[[4,0,4],[4,1,4],[4,2,4],[4,3,4],[4,4,4],[4,5,4],[4,6,4],[4,7,4],[4,8,4],[4,9,4],[4,10,4],[4,11,4],[4,12,4],[4,13,4]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8]],
-[[1,6,3],[5,6,2],[0,7,2],[3,7,3],[0,8,2],[3,8,2],[0,9,2],[3,9,2],[0,10,2],[3,10,3],[1,11,3],[5,11,2]],
-[[1,3,4],[0,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,2],[3,6,2],[0,7,2],[4,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[4,11,2]],
-[[0,3,7],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[0,11,2]],
-[[0,6,7],[1,7,2],[4,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[4,10,2],[1,11,2],[4,11,2]],
-[[0,3,7],[0,4,2],[5,4,2],[1,5,2],[2,6,2],[3,7,2],[2,8,2],[1,9,2],[0,10,2],[5,10,2],[0,11,7]],
-[[1,6,6],[0,7,2],[3,7,2],[0,8,2],[3,8,2],[0,9,2],[3,9,2],[0,10,2],[3,10,2],[1,11,3]],
-[[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,5],[1,12,2],[0,13,2]],
-[[1,6,3],[5,6,2],[0,7,2],[3,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2]],
-[[1,3,6],[3,4,2],[2,5,4],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[2,9,4],[3,10,2],[1,11,6]],
-[[2,3,3],[1,4,2],[4,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,7],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,2],[4,10,2],[2,11,3]],
-[[2,3,3],[1,4,2],[4,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[4,10,2],[0,11,3],[4,11,3]],
-[[3,3,4],[2,4,2],[3,5,2],[4,6,2],[2,7,5],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[2,11,4]],
-[[1,5,6],[0,6,2],[3,6,2],[6,6,2],[0,7,2],[3,7,2],[6,7,2],[1,8,6]],
-[[6,3,2],[5,4,2],[1,5,6],[0,6,2],[3,6,2],[6,6,2],[0,7,2],[3,7,2],[6,7,2],[0,8,4],[6,8,2],[1,9,6],[1,10,2],[0,11,2]],
-[[3,3,4],[2,4,2],[1,5,2],[1,6,2],[1,7,6],[1,8,2],[1,9,2],[2,10,2],[3,11,4]],
-[[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2]],
-[[0,4,7],[0,7,7],[0,10,7]],
-[[3,3,2],[3,4,2],[1,5,6],[3,6,2],[3,7,2],[1,10,6]],
-[[2,3,2],[3,4,2],[4,5,2],[5,6,2],[4,7,2],[3,8,2],[2,9,2],[1,11,6]],
-[[4,3,2],[3,4,2],[2,5,2],[1,6,2],[2,7,2],[3,8,2],[4,9,2],[1,11,6]],
-[[4,2,3],[3,3,2],[6,3,2],[3,4,2],[6,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[0,8,2],[3,8,2],[0,9,2],[3,9,2],[1,10,3]],
-[[3,5,2],[1,7,6],[3,9,2]],
-[[1,5,3],[5,5,2],[0,6,2],[3,6,3],[1,8,3],[5,8,2],[0,9,2],[3,9,3]],
-[[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3]],
-[[3,7,2],[3,8,2]],
-[[3,7,2]],
-[[4,2,4],[4,3,2],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[0,8,3],[4,8,2],[1,9,2],[4,9,2],[2,10,4],[3,11,3]],
-[[1,3,2],[4,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2]],
-[[2,3,4],[1,4,2],[5,4,2],[4,5,2],[3,6,2],[2,7,2],[6,7,1],[1,8,6]],
-[[1,5,6],[1,6,6],[1,7,6],[1,8,6],[1,9,6],[1,10,6]],
-[]
-];
+/* Font of SCREEN 10 (screen_data_gen/fonts/generate.py): 256 glyphs
+ * of 8x14 pixels, packed one bit per pixel. */
+var SCREEN10_DATA = "AAAAxsbGfDh8xsbGAAAAAAB+gaWBgb2ZgX4AAAAAAH7/2///w+f/fgAAAAAAAGz+/v7+fDgQAAAAAAAAEDh8/nw4EAAAAAAAABg8POfn5xgYPAAAAAAAGDx+//9+GBg8AAAAAADGxsZ8OHzGxsYAAP///////+fDw+f/////AAAAxsbGfDh8xsbGAAAAAADGxsZ8OHzGxsYAAAAAAMbGxnw4fMbGxgAAAAAAxsbGfDh8xsbGAAAAAADGxsZ8OHzGxsYAAAAAAH9jf2NjY2fn5sAAAAAAGBjbPOc82xgYAAAAAACAwOD4/vjgwIAAAAAAAAIGDj7+Pg4GAgAAAAAAGDx+GBgYfjwYAAAAAABmZmZmZmYAZmYAAAAAAH/b29t7GxsbGwAAAHzGYDhsxmw4DMZ8AAAAAAAAAAAAAAAAAP7+/gAAABg8fhgYGH48GH4AAAAAGDx+GBgYGBgYAAAAAAAYGBgYGBh+PBgAAAAAAAAAGAz+DBgAAAAAAAAAAAAwYP5gMAAAAAAAAAAAAAAAAAAAAAAAAAAAAMbGxnw4fMbGxgAAAAAAxsbGfDh8xsbGAAAAAADGxsZ8OHzGxsYAAAAAAAAAAAAAAAAAAAAAAAAAGDw8PBgYABgYAAAAZmZmJAAAAAAAAAAAAAAAAGxs/mxsbP5sbAAAABgYfMbCwHwGhsZ8GBgAAAAAAMLGDBgwZsYAAAAAADhsbDh23MzMdgAAAAAAGBgYMAAAAAAAAAAAAAAMGDAwMDAwGAwAAAAAADAYDAwMDAwYMAAAAAAAAABmPP88ZgAAAAAAAAAAABgYfhgYAAAAAAAAAAAAAAAAAAAYGDAAAAAAAAAAAP4AAAAAAAAAAAAAAAAAAAAAGBgAAAAAAAIGDBgwYMCAAAAAAAAAOGzGxtbGxmw4AAAAAAAYOHgYGBgYGH4AAAAAAHzGBgwYMGDG/gAAAAAAfMYGBjwGBsZ8AAAAAAAMHDxszP4MDB4AAAAAAP7AwMD8BgbGfAAAAAAAOGDAwPzGxsZ8AAAAAAD+xgYMGDAwMDAAAAAAAHzGxsZ8xsbGfAAAAAAAfMbGxn4GBgx4AAAAAAAAABgYAAAAGBgAAAAAAAAAGBgAAAAYGDAAAAAADBgwYMBgMBgMAAAAAAAAAAB+AAB+AAAAAAAAAGAwGAwGDBgwYAAAAAAAfMbGDBgYABgYAAAAAAB8xsbe3t7cwHwAAAAAABA4bMbG/sbGxgAAAAAA/GZmZnxmZmb8AAAAAAA8ZsLAwMDCZjwAAAAAAPhsZmZmZmZs+AAAAAAA/mZiaHhoYmb+AAAAAAD+ZmJoeGhgYPAAAAAAADxmwsDA3sZmOgAAAAAAxsbGxv7GxsbGAAAAAAA8GBgYGBgYGDwAAAAAAB4MDAwMDMzMeAAAAAAA5mZsbHhsbGbmAAAAAADwYGBgYGBiZv4AAAAAAMbu/tbGxsbGxgAAAAAAxub2/t7OxsbGAAAAAAB8xsbGxsbGxnwAAAAAAPxmZmZ8YGBg8AAAAAAAfMbGxsbG1t58DgAAAAD8ZmZmfGxmZuYAAAAAAHzGxmA4DMbGfAAAAAAAfn5aGBgYGBg8AAAAAADGxsbGxsbGxnwAAAAAAMbGxsbGxmw4EAAAAAAAxsbGxtbW/mxsAAAAAADGxsZ8OHzGxsYAAAAAAGZmZmY8GBgYPAAAAAAA/saMGDBgwsb+AAAAAAA8MDAwMDAwMDwAAAAAAIDA4HA4HA4GAgAAAAAAPAwMDAwMDAw8AAA4bAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP8AMBgAAAAAAAAAAAAAAAAAAAAAAAB4DHzMzHYAAAAAAOBgYHhsZmZmfAAAAAAAAAAAfMbAwMZ8AAAAAAAcDAw8bMzMzHYAAAAAAAAAAHzG/sDGfAAAAAAAHDYyMHwwMDB4AAAAAAAAAAB2zMzMzHwMeAAAAOBgYGx2ZmZm5gAAAAAAGBgAOBgYGBg8AAAAAAAGBgAOBgYGBmZmPAAAAOBgYGZseGxm5gAAAAAAOBgYGBgYGBg8AAAAAAAAAADs/tbW1tYAAAAAAAAAANxmZmZmZgAAAAAAAAAAfMbGxsZ8AAAAAAAAAADcZmZmZnxg8AAAAAAAAHbMzMzMfAweAAAAAAAA3HZmYGDwAAAAAAAAAAB8xnAcxnwAAAAAABAwMPwwMDA2HAAAAAAAAAAAzMzMzMx2AAAAAAAAAADGxsZsOBAAAAAAAAAAAMbG1tb+bAAAAAAAAAAAxmw4OGzGAAAAAAAAAADGxsbGxn4GfAAAAAAAAP7MGDBm/gAAAAAADhgYGHAYGBgOAAAAAAAYGBgYGBgYGBgAAAAAAHAYGBgOGBgYcAAAdtwAAAAAAAAAAAAAAAAAAAAAAAAQOGzGxv4AAAAAADxmwsDAwMJmPBhwAAAAAMwAzMzMzMx2AAAAAAYMGAB8xv7AxnwAAAAAEDhsAHgMfMzMdgAAAAAAAMwAeAx8zMx2AAAAAMBgMAB4DHzMzHYAAAAAOGw4AHgMfMzMdgAAAAAAAAAAfMbAwMZ8GHAAABA4bAB8xv7AxnwAAAAAAADGAHzG/sDGfAAAAABgMBgAfMb+wMZ8AAAAAAAAZgA4GBgYGDwAAAAAGDxmADgYGBgYPAAAAABgMBgAOBgYGBg8AAAAxgAQOGzGxv7GxsYAADhsOBA4bMbG/sbGxgAADBgA/mZiaHhoYmb+AAAAAAAAAADsNnbc2G4AAAAAAD5szMz+zMzMzgAAAAAQOGwAfMbGxsZ8AAAAAAAAxgB8xsbGxnwAAAAAYDAYAHzGxsbGfAAAAAAweMwAzMzMzMx2AAAAAMBgMADMzMzMzHYAAAAAAADGAMbGxsbGfgZ8AMYAfMbGxsbGxsZ8AAAAxgDGxsbGxsbGxnwAAAAAABgYfMbAxnwYGAAAAAAAOGxkYPBgYGb8AAAAAABmZjwYfhh+GBgAAAAAAPxmZnxiZm9m8wAAAAAADhsYGH4YGNhwAAAAAAwYMAB4DHzMzHYAAAAABgwYADgYGBgYPAAAAAAGDBgAfMbGxsZ8AAAAAAwYMADMzMzMzHYAAAAAAHbcANxmZmZmZgAAdtwAxub2/t7OxsbGAAAAAAA8bGw2AH4AAAAAAAAAADhsbDgAfAAAAAAAAAAAMDAAMDBgxsZ8AAAAAAAAAAD+wMDAAAAAAAAAAAAAAP4GBgYAAAAAAGDgY2ZsGDBuwwYMHwAAYOBjZmwYNm7aPwYGAAAAABgYABgYPDw8GAAAAAAAAAAAADZs2Gw2AAAAAAAAAAAA2Gw2bNgAABFEEUQRRBFEEUQRRBFEVapVqlWqVapVqlWqVardd9133Xfdd9133XfddxgYGBgYGBgYGBgYGBgYGBgYGBgYGPgYGBgYGBgYGBgYGPgY+BgYGBgYGDY2NjY2Njb2NjY2NjY2AAAAAAAAAP42NjY2NjYAAAAAAPgY+BgYGBgYGDY2NjY29gb2NjY2NjY2NjY2NjY2NjY2NjY2NjYAAAAAAP4G9jY2NjY2NjY2NjY29gb+AAAAAAAANjY2NjY2Nv4AAAAAAAAYGBgYGPgY+AAAAAAAAAAAAAAAAAD4GBgYGBgYGBgYGBgYGB8AAAAAAAAYGBgYGBgY/wAAAAAAAAAAAAAAAAD/GBgYGBgYGBgYGBgYGB8YGBgYGBgAAAAAAAAA/wAAAAAAABgYGBgYGBj/GBgYGBgYGBgYGBgfGB8YGBgYGBg2NjY2NjY2NzY2NjY2NjY2NjY2NzA/AAAAAAAAAAAAAAA/MDc2NjY2NjY2NjY2NvcA/wAAAAAAAAAAAAAA/wD3NjY2NjY2NjY2NjY3MDc2NjY2NjYAAAAAAP8A/wAAAAAAADY2NjY29wD3NjY2NjY2GBgYGBj/AP8AAAAAAAA2NjY2NjY2/wAAAAAAAAAAAAAA/wD/GBgYGBgYAAAAAAAAAP82NjY2NjY2NjY2NjY2PwAAAAAAABgYGBgYHxgfAAAAAAAAAAAAAAAfGB8YGBgYGBgAAAAAAAAAPzY2NjY2NjY2NjY2Njb/NjY2NjY2GBgYGBj/GP8YGBgYGBgYGBgYGBgY+AAAAAAAAAAAAAAAAAAfGBgYGBgY//////////////////8AAAAAAAAA//////////Dw8PDw8PDw8PDw8PDwDw8PDw8PDw8PDw8PDw//////////AAAAAAAAAAAAAAAAAHbc2NjcdgAAAAAAeMzM2MzGxsbMAAAAAAD+xsbAwMDAwMAAAAAAAAAAAP5sbGxsbAAAAAAA/sZgMBgwYMb+AAAAAAAAAAB+2NjY2HAAAAAAAAAAAGZmZmZmfGDAAAAAAAAAdtwYGBgYAAAAAAB+GDxmZmY8GH4AAAAAADhsxsb+xsZsOAAAAAAAOGzGxsZsbGzuAAAAAAAeMBgMPmZmZjwAAAAAAAAAftvbfgAAAAAAAAAAAwZ+29vzfmDAAAAAAAAeMGBgfmBgMB4AAAAAAHzGxsbGxsbGAAAAAAAAAP4AAP4AAP4AAAAAAAAYGH4YGAAAfgAAAAAAADAYDAYMGDAAfgAAAAAADBgwYDAYDAB+AAAAAA4bGxgYGBgYGBgYGBgYGBgYGBgY2NhwAAAAAAAAAAAYAH4AGAAAAAAAAAAAAHbcAHbcAAAAAAAAADhsbDgAAAAAAAAAAAAAAAAAABgYAAAAAAAAAAAAAAAAGAAAAAAAAAAADwwMDAwM7Gw8HAAAAAAAbDY2NjY2AAAAAAAAAAA8ZgwYMn4AAAAAAAAAAAAAfn5+fn5+AAAAAAAAAAAAAAAAAAAAAAA=";
@@ -1,258 +1,3 @@
-var SCREEN8_DATA = [
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[1,0,6],[1,1,6],[0,2,1],[7,2,1],[0,3,1],[7,3,1],[0,4,1],[2,4,1],[5,4,1],[7,4,1],[0,5,1],[2,5,1],[5,5,1],[7,5,1],[0,6,1],[7,6,1],[0,7,1],[7,7,1],[0,8,1],[2,8,4],[7,8,1],[0,9,1],[2,9,4],[7,9,1],[0,10,1],[3,10,2],[7,10,1],[0,11,1],[3,11,2],[7,11,1],[0,12,1],[7,12,1],[0,13,1],[7,13,1],[1,14,6],[1,15,6]],
-[[1,0,6],[1,1,6],[0,2,8],[0,3,8],[0,4,2],[3,4,2],[6,4,2],[0,5,2],[3,5,2],[6,5,2],[0,6,8],[0,7,8],[0,8,2],[6,8,2],[0,9,2],[6,9,2],[0,10,3],[5,10,3],[0,11,3],[5,11,3],[0,12,8],[0,13,8],[1,14,6],[1,15,6]],
-[[1,0,2],[4,0,2],[1,1,2],[4,1,2],[0,2,7],[0,3,7],[0,4,7],[0,5,7],[0,6,7],[0,7,7],[1,8,5],[1,9,5],[2,10,3],[2,11,3],[3,12,1],[3,13,1]],
-[[3,0,1],[3,1,1],[2,2,3],[2,3,3],[1,4,5],[1,5,5],[0,6,7],[0,7,7],[1,8,5],[1,9,5],[2,10,3],[2,11,3],[3,12,1],[3,13,1]],
-[[2,0,3],[2,1,3],[1,2,5],[1,3,5],[2,4,3],[2,5,3],[0,6,7],[0,7,7],[0,8,7],[0,9,7],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2],[3,12,1],[3,13,1],[2,14,3],[2,15,3]],
-[[3,0,1],[3,1,1],[2,2,3],[2,3,3],[1,4,5],[1,5,5],[0,6,7],[0,7,7],[0,8,7],[0,9,7],[1,10,5],[1,11,5],[3,12,1],[3,13,1],[2,14,3],[2,15,3]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,3],[5,4,3],[0,5,3],[5,5,3],[0,6,2],[6,6,2],[0,7,2],[6,7,2],[0,8,2],[6,8,2],[0,9,2],[6,9,2],[0,10,3],[5,10,3],[0,11,3],[5,11,3],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[1,0,7],[1,1,7],[1,2,2],[6,2,2],[1,3,2],[6,3,2],[1,4,7],[1,5,7],[1,6,2],[6,6,2],[1,7,2],[6,7,2],[1,8,2],[6,8,2],[1,9,2],[6,9,2],[1,10,2],[5,10,3],[1,11,2],[5,11,3],[0,12,3],[5,12,2],[0,13,3],[5,13,2],[0,14,2],[0,15,2]],
-[[3,0,2],[3,1,2],[0,2,2],[3,2,2],[6,2,2],[0,3,2],[3,3,2],[6,3,2],[2,4,4],[2,5,4],[0,6,3],[5,6,3],[0,7,3],[5,7,3],[0,8,3],[5,8,3],[0,9,3],[5,9,3],[2,10,4],[2,11,4],[0,12,2],[3,12,2],[6,12,2],[0,13,2],[3,13,2],[6,13,2],[3,14,2],[3,15,2]],
-[[0,0,1],[0,1,1],[0,2,3],[0,3,3],[0,4,5],[0,5,5],[0,6,7],[0,7,7],[0,8,5],[0,9,5],[0,10,3],[0,11,3],[0,12,1],[0,13,1]],
-[[6,0,1],[6,1,1],[4,2,3],[4,3,3],[2,4,5],[2,5,5],[0,6,7],[0,7,7],[2,8,5],[2,9,5],[4,10,3],[4,11,3],[6,12,1],[6,13,1]],
-[[3,0,2],[3,1,2],[2,2,4],[2,3,4],[1,4,6],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[1,10,6],[1,11,6],[2,12,4],[2,13,4],[3,14,2],[3,15,2]],
-[[1,0,2],[5,0,2],[1,1,2],[5,1,2],[1,2,2],[5,2,2],[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2]],
-[[1,0,7],[1,1,7],[0,2,2],[3,2,2],[6,2,2],[0,3,2],[3,3,2],[6,3,2],[0,4,2],[3,4,2],[6,4,2],[0,5,2],[3,5,2],[6,5,2],[1,6,4],[6,6,2],[1,7,4],[6,7,2],[3,8,2],[6,8,2],[3,9,2],[6,9,2],[3,10,2],[6,10,2],[3,11,2],[6,11,2],[3,12,2],[6,12,2],[3,13,2],[6,13,2]],
-[[2,0,5],[2,1,5],[1,2,2],[7,2,1],[1,3,2],[7,3,1],[2,4,4],[2,5,4],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[2,10,4],[2,11,4],[0,12,1],[5,12,2],[0,13,1],[5,13,2],[1,14,5],[1,15,5]],
-[[1,8,6],[1,9,6],[1,10,6],[1,11,6],[1,12,6],[1,13,6]],
-[[3,0,2],[3,1,2],[2,2,4],[2,3,4],[1,4,6],[1,5,6],[3,6,2],[3,7,2],[1,8,6],[1,9,6],[2,10,4],[2,11,4],[3,12,2],[3,13,2],[0,14,8],[0,15,8]],
-[[3,0,2],[3,1,2],[2,2,4],[2,3,4],[1,4,6],[1,5,6],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[1,8,6],[1,9,6],[2,10,4],[2,11,4],[3,12,2],[3,13,2]],
-[[3,2,2],[3,3,2],[4,4,2],[4,5,2],[0,6,7],[0,7,7],[4,8,2],[4,9,2],[3,10,2],[3,11,2]],
-[[2,2,2],[2,3,2],[1,4,2],[1,5,2],[0,6,7],[0,7,7],[1,8,2],[1,9,2],[2,10,2],[2,11,2]],
-[],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[],
-[[3,2,2],[3,3,2],[2,4,4],[2,5,4],[2,6,4],[2,7,4],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,14,2],[3,15,2]],
-[[1,2,2],[5,2,2],[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[2,6,1],[5,6,1],[2,7,1],[5,7,1]],
-[[1,2,2],[4,2,2],[1,3,2],[4,3,2],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,7],[0,7,7],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[0,10,7],[0,11,7],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[1,14,2],[4,14,2],[1,15,2],[4,15,2]],
-[[3,2,2],[3,3,2],[2,4,5],[2,5,5],[1,6,2],[1,7,2],[2,8,4],[2,9,4],[5,10,2],[5,11,2],[1,12,5],[1,13,5],[3,14,2],[3,15,2]],
-[[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[3,8,2],[3,9,2],[2,10,2],[2,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[2,6,3],[2,7,3],[1,8,3],[5,8,2],[1,9,3],[5,9,2],[0,10,2],[3,10,3],[0,11,2],[3,11,3],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[3,2,2],[3,3,2],[3,4,2],[3,5,2],[2,6,2],[2,7,2]],
-[[4,2,2],[4,3,2],[3,4,2],[3,5,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[2,11,2],[3,12,2],[3,13,2],[4,14,2],[4,15,2]],
-[[2,2,2],[2,3,2],[3,4,2],[3,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[4,10,2],[4,11,2],[3,12,2],[3,13,2],[2,14,2],[2,15,2]],
-[[1,4,2],[5,4,2],[1,5,2],[5,5,2],[2,6,4],[2,7,4],[0,8,8],[0,9,8],[2,10,4],[2,11,4],[1,12,2],[5,12,2],[1,13,2],[5,13,2]],
-[[3,4,2],[3,5,2],[3,6,2],[3,7,2],[1,8,6],[1,9,6],[3,10,2],[3,11,2],[3,12,2],[3,13,2]],
-[[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,2],[2,15,2]],
-[[1,8,6],[1,9,6]],
-[[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[5,2,2],[5,3,2],[4,4,2],[4,5,2],[3,6,2],[3,7,2],[2,8,2],[2,9,2],[1,10,2],[1,11,2],[0,12,2],[0,13,2],[0,14,1],[0,15,1]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[2,14,3],[2,15,3]],
-[[3,2,2],[3,3,2],[2,4,3],[2,5,3],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[1,14,6],[1,15,6]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[5,6,2],[5,7,2],[3,8,3],[3,9,3],[2,10,2],[2,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,7],[0,15,7]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[5,6,2],[5,7,2],[2,8,4],[2,9,4],[5,10,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[3,2,3],[3,3,3],[2,4,4],[2,5,4],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,7],[0,11,7],[4,12,2],[4,13,2],[3,14,4],[3,15,4]],
-[[0,2,7],[0,3,7],[0,4,2],[0,5,2],[0,6,2],[0,7,2],[0,8,6],[0,9,6],[5,10,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[2,2,3],[2,3,3],[1,4,2],[1,5,2],[0,6,2],[0,7,2],[0,8,6],[0,9,6],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[0,2,7],[0,3,7],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[4,6,2],[4,7,2],[3,8,2],[3,9,2],[2,10,2],[2,11,2],[2,12,2],[2,13,2],[2,14,2],[2,15,2]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[1,8,5],[1,9,5],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[1,8,6],[1,9,6],[5,10,2],[5,11,2],[4,12,2],[4,13,2],[1,14,4],[1,15,4]],
-[[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,2],[2,15,2]],
-[[5,2,2],[5,3,2],[4,4,2],[4,5,2],[3,6,2],[3,7,2],[2,8,2],[2,9,2],[3,10,2],[3,11,2],[4,12,2],[4,13,2],[5,14,2],[5,15,2]],
-[[1,6,6],[1,7,6],[1,12,6],[1,13,6]],
-[[1,2,2],[1,3,2],[2,4,2],[2,5,2],[3,6,2],[3,7,2],[4,8,2],[4,9,2],[3,10,2],[3,11,2],[2,12,2],[2,13,2],[1,14,2],[1,15,2]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[4,6,2],[4,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,14,2],[3,15,2]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[3,6,4],[0,7,2],[3,7,4],[0,8,2],[3,8,4],[0,9,2],[3,9,4],[0,10,2],[3,10,4],[0,11,2],[3,11,4],[0,12,2],[0,13,2],[1,14,4],[1,15,4]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,7],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,6],[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,5],[1,9,5],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,6],[0,15,6]],
-[[2,2,4],[2,3,4],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[0,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[2,14,4],[2,15,4]],
-[[0,2,5],[0,3,5],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[0,14,5],[0,15,5]],
-[[0,2,7],[0,3,7],[1,4,2],[6,4,1],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,2],[4,7,1],[1,8,4],[1,9,4],[1,10,2],[4,10,1],[1,11,2],[4,11,1],[1,12,2],[6,12,1],[1,13,2],[6,13,1],[0,14,7],[0,15,7]],
-[[0,2,7],[0,3,7],[1,4,2],[6,4,1],[1,5,2],[6,5,1],[1,6,2],[4,6,1],[1,7,2],[4,7,1],[1,8,4],[1,9,4],[1,10,2],[4,10,1],[1,11,2],[4,11,1],[1,12,2],[1,13,2],[0,14,4],[0,15,4]],
-[[2,2,4],[2,3,4],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[4,10,3],[0,11,2],[4,11,3],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[2,14,3],[6,14,1],[2,15,3],[6,15,1]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,7],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[2,2,4],[2,3,4],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[3,2,4],[3,3,4],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,4],[1,15,4]],
-[[0,2,3],[5,2,2],[0,3,3],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[1,8,4],[1,9,4],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,3],[5,14,2],[0,15,3],[5,15,2]],
-[[0,2,4],[0,3,4],[1,4,2],[1,5,2],[1,6,2],[1,7,2],[1,8,2],[1,9,2],[1,10,2],[6,10,1],[1,11,2],[6,11,1],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,7],[0,15,7]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,3],[4,4,3],[0,5,3],[4,5,3],[0,6,7],[0,7,7],[0,8,7],[0,9,7],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,3],[5,4,2],[0,5,3],[5,5,2],[0,6,4],[5,6,2],[0,7,4],[5,7,2],[0,8,2],[3,8,4],[0,9,2],[3,9,4],[0,10,2],[4,10,3],[0,11,2],[4,11,3],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[0,2,6],[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,5],[1,9,5],[1,10,2],[1,11,2],[1,12,2],[1,13,2],[0,14,4],[0,15,4]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[4,10,3],[0,11,2],[4,11,3],[1,12,5],[1,13,5],[4,14,3],[4,15,3]],
-[[0,2,6],[0,3,6],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,5],[1,9,5],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,3],[5,14,2],[0,15,3],[5,15,2]],
-[[2,2,4],[2,3,4],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[2,6,2],[2,7,2],[3,8,2],[3,9,2],[4,10,2],[4,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[2,14,4],[2,15,4]],
-[[1,2,6],[1,3,6],[1,4,6],[1,5,6],[1,6,1],[3,6,2],[6,6,1],[1,7,1],[3,7,2],[6,7,1],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[2,14,3],[2,15,3]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2],[0,12,7],[0,13,7],[1,14,2],[4,14,2],[1,15,2],[4,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[1,2,2],[5,2,2],[1,3,2],[5,3,2],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[2,8,4],[2,9,4],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[0,2,7],[0,3,7],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,1],[4,6,2],[0,7,1],[4,7,2],[3,8,2],[3,9,2],[2,10,2],[6,10,1],[2,11,2],[6,11,1],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,7],[0,15,7]],
-[[2,2,4],[2,3,4],[2,4,2],[2,5,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[2,10,2],[2,11,2],[2,12,2],[2,13,2],[2,14,4],[2,15,4]],
-[[0,2,2],[0,3,2],[1,4,2],[1,5,2],[2,6,2],[2,7,2],[3,8,2],[3,9,2],[4,10,2],[4,11,2],[5,12,2],[5,13,2],[6,14,1],[6,15,1]],
-[[2,2,4],[2,3,4],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[4,8,2],[4,9,2],[4,10,2],[4,11,2],[4,12,2],[4,13,2],[2,14,4],[2,15,4]],
-[[3,0,1],[3,1,1],[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2]],
-[[0,14,8],[0,15,8]],
-[[2,0,2],[2,1,2],[3,2,2],[3,3,2],[4,4,2],[4,5,2]],
-[[1,6,4],[1,7,4],[4,8,2],[4,9,2],[1,10,5],[1,11,5],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[0,2,3],[0,3,3],[1,4,2],[1,5,2],[1,6,5],[1,7,5],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,2],[3,14,3],[0,15,2],[3,15,3]],
-[[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[0,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[3,2,3],[3,3,3],[4,4,2],[4,5,2],[1,6,5],[1,7,5],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[0,13,2],[1,14,5],[1,15,5]],
-[[2,2,4],[2,3,4],[1,4,2],[5,4,2],[1,5,2],[5,5,2],[1,6,2],[1,7,2],[0,8,5],[0,9,5],[1,10,2],[1,11,2],[1,12,2],[1,13,2],[0,14,4],[0,15,4]],
-[[1,6,3],[5,6,2],[1,7,3],[5,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[1,10,5],[1,11,5],[4,12,2],[4,13,2],[0,14,5],[0,15,5]],
-[[0,2,3],[0,3,3],[1,4,2],[1,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[1,8,3],[5,8,2],[1,9,3],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,3],[5,14,2],[0,15,3],[5,15,2]],
-[[3,2,2],[3,3,2],[2,6,3],[2,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[5,2,2],[5,3,2],[5,6,2],[5,7,2],[5,8,2],[5,9,2],[5,10,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[2,14,4],[2,15,4]],
-[[0,2,3],[0,3,3],[1,4,2],[1,5,2],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,4],[1,11,4],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[0,14,3],[5,14,2],[0,15,3],[5,15,2]],
-[[2,2,3],[2,3,3],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[0,6,3],[4,6,2],[0,7,3],[4,7,2],[0,8,7],[0,9,7],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2],[0,12,2],[3,12,1],[5,12,2],[0,13,2],[3,13,1],[5,13,2],[0,14,2],[3,14,1],[5,14,2],[0,15,2],[3,15,1],[5,15,2]],
-[[0,6,2],[3,6,3],[0,7,2],[3,7,3],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[1,14,2],[5,14,2],[1,15,2],[5,15,2]],
-[[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[0,6,2],[3,6,3],[0,7,2],[3,7,3],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,5],[1,11,5],[1,12,2],[1,13,2],[0,14,4],[0,15,4]],
-[[1,6,3],[5,6,2],[1,7,3],[5,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[1,10,5],[1,11,5],[4,12,2],[4,13,2],[3,14,4],[3,15,4]],
-[[0,6,2],[3,6,3],[0,7,2],[3,7,3],[1,8,3],[5,8,2],[1,9,3],[5,9,2],[1,10,2],[1,11,2],[1,12,2],[1,13,2],[0,14,4],[0,15,4]],
-[[1,6,6],[1,7,6],[0,8,2],[0,9,2],[1,10,5],[1,11,5],[5,12,2],[5,13,2],[0,14,6],[0,15,6]],
-[[2,2,2],[2,3,2],[2,4,2],[2,5,2],[0,6,6],[0,7,6],[2,8,2],[2,9,2],[2,10,2],[2,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[3,14,3],[3,15,3]],
-[[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[2,14,3],[2,15,3]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[3,8,1],[5,8,2],[0,9,2],[3,9,1],[5,9,2],[0,10,2],[3,10,1],[5,10,2],[0,11,2],[3,11,1],[5,11,2],[0,12,7],[0,13,7],[1,14,2],[4,14,2],[1,15,2],[4,15,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[2,10,3],[2,11,3],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,6],[1,11,6],[5,12,2],[5,13,2],[0,14,6],[0,15,6]],
-[[1,6,6],[1,7,6],[4,8,2],[4,9,2],[3,10,2],[3,11,2],[2,12,2],[2,13,2],[1,14,6],[1,15,6]],
-[[4,2,3],[4,3,3],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[1,8,3],[1,9,3],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[4,14,3],[4,15,3]],
-[[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[1,2,3],[1,3,3],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[4,8,3],[4,9,3],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[1,14,3],[1,15,3]],
-[[1,0,3],[5,0,2],[1,1,3],[5,1,2],[0,2,2],[3,2,3],[0,3,2],[3,3,3]],
-[[3,4,1],[3,5,1],[2,6,3],[2,7,3],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,7],[0,15,7]],
-[[2,0,4],[2,1,4],[1,2,2],[5,2,2],[1,3,2],[5,3,2],[0,4,2],[0,5,2],[0,6,2],[0,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[2,10,4],[2,11,4],[3,12,2],[3,13,2],[1,14,3],[1,15,3]],
-[[0,2,2],[4,2,2],[0,3,2],[4,3,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[4,0,2],[4,1,2],[3,2,2],[3,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[0,13,2],[1,14,5],[1,15,5]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[1,6,4],[1,7,4],[4,8,2],[4,9,2],[1,10,5],[1,11,5],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[0,2,2],[4,2,2],[0,3,2],[4,3,2],[1,6,4],[1,7,4],[4,8,2],[4,9,2],[1,10,5],[1,11,5],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[1,0,2],[1,1,2],[2,2,2],[2,3,2],[1,6,4],[1,7,4],[4,8,2],[4,9,2],[1,10,5],[1,11,5],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[2,4,3],[2,5,3],[1,6,4],[1,7,4],[4,8,2],[4,9,2],[1,10,5],[1,11,5],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[0,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,5],[1,11,5],[3,12,2],[3,13,2],[1,14,3],[1,15,3]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[0,13,2],[1,14,5],[1,15,5]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[0,13,2],[1,14,5],[1,15,5]],
-[[2,0,2],[2,1,2],[3,2,2],[3,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[0,13,2],[1,14,5],[1,15,5]],
-[[1,2,2],[5,2,2],[1,3,2],[5,3,2],[2,6,3],[2,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[2,6,3],[2,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[2,0,2],[2,1,2],[3,2,2],[3,3,2],[2,6,3],[2,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[0,0,2],[5,0,2],[0,1,2],[5,1,2],[3,2,1],[3,3,1],[2,4,3],[2,5,3],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[2,4,3],[2,5,3],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,7],[0,11,7],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[4,0,2],[4,1,2],[3,2,2],[3,3,2],[0,4,7],[0,5,7],[0,6,2],[0,7,2],[0,8,5],[0,9,5],[0,10,2],[0,11,2],[0,12,2],[0,13,2],[0,14,7],[0,15,7]],
-[[0,6,3],[4,6,2],[0,7,3],[4,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[1,10,6],[1,11,6],[0,12,2],[3,12,2],[0,13,2],[3,13,2],[1,14,2],[4,14,3],[1,15,2],[4,15,3]],
-[[2,2,5],[2,3,5],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,7],[0,9,7],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[0,14,2],[4,14,3],[0,15,2],[4,15,3]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[2,0,2],[2,1,2],[3,2,2],[3,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[1,0,4],[1,1,4],[0,2,2],[4,2,2],[0,3,2],[4,3,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[1,0,2],[1,1,2],[2,2,2],[2,3,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[0,2,2],[5,2,2],[0,3,2],[5,3,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,6],[1,11,6],[5,12,2],[5,13,2],[0,14,6],[0,15,6]],
-[[0,0,2],[5,0,2],[0,1,2],[5,1,2],[2,4,3],[2,5,3],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[2,14,3],[2,15,3]],
-[[0,0,2],[5,0,2],[0,1,2],[5,1,2],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[1,4,6],[1,5,6],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[1,10,6],[1,11,6],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,3],[2,1,3],[1,2,2],[4,2,2],[1,3,2],[4,3,2],[1,4,2],[5,4,1],[1,5,2],[5,5,1],[0,6,4],[0,7,4],[1,8,2],[1,9,2],[1,10,2],[1,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,6],[0,15,6]],
-[[1,0,2],[5,0,2],[1,1,2],[5,1,2],[1,2,2],[5,2,2],[1,3,2],[5,3,2],[2,4,4],[2,5,4],[1,6,6],[1,7,6],[3,8,2],[3,9,2],[1,10,6],[1,11,6],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,0,5],[0,1,5],[0,2,2],[4,2,2],[0,3,2],[4,3,2],[0,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,5],[6,6,1],[0,7,5],[6,7,1],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[4,10,4],[0,11,2],[4,11,4],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[5,14,3],[0,15,2],[5,15,3]],
-[[4,0,3],[4,1,3],[3,2,2],[6,2,2],[3,3,2],[6,3,2],[3,4,2],[3,5,2],[2,6,4],[2,7,4],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[0,12,2],[3,12,2],[0,13,2],[3,13,2],[1,14,3],[1,15,3]],
-[[3,0,2],[3,1,2],[2,2,2],[2,3,2],[1,6,4],[1,7,4],[4,8,2],[4,9,2],[1,10,5],[1,11,5],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[4,0,2],[4,1,2],[3,2,2],[3,3,2],[2,6,3],[2,7,3],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[2,14,4],[2,15,4]],
-[[4,0,2],[4,1,2],[3,2,2],[3,3,2],[1,6,5],[1,7,5],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[3,0,2],[3,1,2],[2,2,2],[2,3,2],[0,6,2],[4,6,2],[0,7,2],[4,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[1,0,3],[5,0,2],[1,1,3],[5,1,2],[0,2,2],[3,2,3],[0,3,2],[3,3,3],[0,6,2],[3,6,3],[0,7,2],[3,7,3],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[1,14,2],[5,14,2],[1,15,2],[5,15,2]],
-[[1,0,3],[5,0,2],[1,1,3],[5,1,2],[0,2,2],[3,2,3],[0,3,2],[3,3,3],[0,6,3],[5,6,2],[0,7,3],[5,7,2],[0,8,4],[5,8,2],[0,9,4],[5,9,2],[0,10,2],[3,10,4],[0,11,2],[3,11,4],[0,12,2],[4,12,3],[0,13,2],[4,13,3],[0,14,2],[5,14,2],[0,15,2],[5,15,2]],
-[[2,2,4],[2,3,4],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[1,12,6],[1,13,6]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3],[1,12,5],[1,13,5]],
-[[2,2,2],[2,3,2],[2,6,2],[2,7,2],[2,8,2],[2,9,2],[1,10,2],[1,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[1,14,5],[1,15,5]],
-[[0,6,7],[0,7,7],[0,8,2],[0,9,2],[0,10,2],[0,11,2]],
-[[0,6,7],[0,7,7],[5,8,2],[5,9,2],[5,10,2],[5,11,2]],
-[[1,0,2],[6,0,2],[1,1,2],[6,1,2],[0,2,3],[5,2,2],[0,3,3],[5,3,2],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[1,6,6],[1,7,6],[2,8,2],[6,8,2],[2,9,2],[6,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[0,12,2],[4,12,2],[0,13,2],[4,13,2],[4,14,4],[4,15,4]],
-[[1,0,2],[6,0,2],[1,1,2],[6,1,2],[0,2,3],[5,2,2],[0,3,3],[5,3,2],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[1,6,4],[6,6,1],[1,7,4],[6,7,1],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[1,10,2],[4,10,1],[6,10,1],[1,11,2],[4,11,1],[6,11,1],[0,12,2],[3,12,5],[0,13,2],[3,13,5],[5,14,2],[5,15,2]],
-[[3,2,2],[3,3,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[2,10,4],[2,11,4],[2,12,4],[2,13,4],[3,14,2],[3,15,2]],
-[[2,6,2],[6,6,2],[2,7,2],[6,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[0,10,2],[4,10,2],[0,11,2],[4,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[2,14,2],[6,14,2],[2,15,2],[6,15,2]],
-[[0,6,2],[4,6,2],[0,7,2],[4,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[2,10,2],[6,10,2],[2,11,2],[6,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[0,14,2],[4,14,2],[0,15,2],[4,15,2]],
-[[2,0,1],[6,0,1],[2,1,1],[6,1,1],[0,2,1],[4,2,1],[0,3,1],[4,3,1],[2,4,1],[6,4,1],[2,5,1],[6,5,1],[0,6,1],[4,6,1],[0,7,1],[4,7,1],[2,8,1],[6,8,1],[2,9,1],[6,9,1],[0,10,1],[4,10,1],[0,11,1],[4,11,1],[2,12,1],[6,12,1],[2,13,1],[6,13,1],[0,14,1],[4,14,1],[0,15,1],[4,15,1]],
-[[1,0,1],[3,0,1],[5,0,1],[7,0,1],[1,1,1],[3,1,1],[5,1,1],[7,1,1],[0,2,1],[2,2,1],[4,2,1],[6,2,1],[0,3,1],[2,3,1],[4,3,1],[6,3,1],[1,4,1],[3,4,1],[5,4,1],[7,4,1],[1,5,1],[3,5,1],[5,5,1],[7,5,1],[0,6,1],[2,6,1],[4,6,1],[6,6,1],[0,7,1],[2,7,1],[4,7,1],[6,7,1],[1,8,1],[3,8,1],[5,8,1],[7,8,1],[1,9,1],[3,9,1],[5,9,1],[7,9,1],[0,10,1],[2,10,1],[4,10,1],[6,10,1],[0,11,1],[2,11,1],[4,11,1],[6,11,1],[1,12,1],[3,12,1],[5,12,1],[7,12,1],[1,13,1],[3,13,1],[5,13,1],[7,13,1],[0,14,1],[2,14,1],[4,14,1],[6,14,1],[0,15,1],[2,15,1],[4,15,1],[6,15,1]],
-[[1,0,3],[5,0,3],[1,1,3],[5,1,3],[0,2,2],[3,2,3],[7,2,1],[0,3,2],[3,3,3],[7,3,1],[1,4,3],[5,4,3],[1,5,3],[5,5,3],[0,6,2],[3,6,3],[7,6,1],[0,7,2],[3,7,3],[7,7,1],[1,8,3],[5,8,3],[1,9,3],[5,9,3],[0,10,2],[3,10,3],[7,10,1],[0,11,2],[3,11,3],[7,11,1],[1,12,3],[5,12,3],[1,13,3],[5,13,3],[0,14,2],[3,14,3],[7,14,1],[0,15,2],[3,15,3],[7,15,1]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[0,8,5],[0,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[0,4,5],[0,5,5],[3,6,2],[3,7,2],[0,8,5],[0,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[0,8,4],[5,8,2],[0,9,4],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,8,7],[0,9,7],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,4,5],[0,5,5],[3,6,2],[3,7,2],[0,8,5],[0,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[0,4,4],[5,4,2],[0,5,4],[5,5,2],[5,6,2],[5,7,2],[0,8,4],[5,8,2],[0,9,4],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,4,7],[0,5,7],[5,6,2],[5,7,2],[0,8,4],[5,8,2],[0,9,4],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[0,4,4],[5,4,2],[0,5,4],[5,5,2],[5,6,2],[5,7,2],[0,8,7],[0,9,7]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[0,8,7],[0,9,7]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[0,4,5],[0,5,5],[3,6,2],[3,7,2],[0,8,5],[0,9,5]],
-[[0,8,5],[0,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,5],[3,9,5]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[0,8,8],[0,9,8]],
-[[0,8,8],[0,9,8],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,5],[3,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,8,8],[0,9,8]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[0,8,8],[0,9,8],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,5],[3,5,5],[3,6,2],[3,7,2],[3,8,5],[3,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,3],[2,9,2],[5,9,3],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,3],[2,5,2],[5,5,3],[2,6,2],[2,7,2],[2,8,6],[2,9,6]],
-[[2,4,6],[2,5,6],[2,6,2],[2,7,2],[2,8,2],[5,8,3],[2,9,2],[5,9,3],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[0,4,4],[5,4,3],[0,5,4],[5,5,3],[0,8,8],[0,9,8]],
-[[0,4,8],[0,5,8],[0,8,4],[5,8,3],[0,9,4],[5,9,3],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,3],[2,5,2],[5,5,3],[2,6,2],[2,7,2],[2,8,2],[5,8,3],[2,9,2],[5,9,3],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[0,4,8],[0,5,8],[0,8,8],[0,9,8]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[0,4,4],[5,4,3],[0,5,4],[5,5,3],[0,8,4],[5,8,3],[0,9,4],[5,9,3],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[0,4,8],[0,5,8],[0,8,8],[0,9,8]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[0,8,8],[0,9,8]],
-[[0,4,8],[0,5,8],[0,8,8],[0,9,8],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,8,8],[0,9,8],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,6],[2,9,6]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,5],[3,5,5],[3,6,2],[3,7,2],[3,8,5],[3,9,5]],
-[[3,4,5],[3,5,5],[3,6,2],[3,7,2],[3,8,5],[3,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[2,8,6],[2,9,6],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[2,0,2],[5,0,2],[2,1,2],[5,1,2],[2,2,2],[5,2,2],[2,3,2],[5,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[0,8,8],[0,9,8],[2,10,2],[5,10,2],[2,11,2],[5,11,2],[2,12,2],[5,12,2],[2,13,2],[5,13,2],[2,14,2],[5,14,2],[2,15,2],[5,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[0,4,8],[0,5,8],[3,6,2],[3,7,2],[0,8,8],[0,9,8],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[0,8,5],[0,9,5]],
-[[3,8,5],[3,9,5],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8],[0,7,8],[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[0,8,8],[0,9,8],[0,10,8],[0,11,8],[0,12,8],[0,13,8],[0,14,8],[0,15,8]],
-[[0,0,4],[0,1,4],[0,2,4],[0,3,4],[0,4,4],[0,5,4],[0,6,4],[0,7,4],[0,8,4],[0,9,4],[0,10,4],[0,11,4],[0,12,4],[0,13,4],[0,14,4],[0,15,4]],
-[[4,0,4],[4,1,4],[4,2,4],[4,3,4],[4,4,4],[4,5,4],[4,6,4],[4,7,4],[4,8,4],[4,9,4],[4,10,4],[4,11,4],[4,12,4],[4,13,4],[4,14,4],[4,15,4]],
-[[0,0,8],[0,1,8],[0,2,8],[0,3,8],[0,4,8],[0,5,8],[0,6,8],[0,7,8]],
-[[1,6,3],[5,6,2],[1,7,3],[5,7,2],[0,8,2],[3,8,3],[0,9,2],[3,9,3],[0,10,2],[4,10,1],[0,11,2],[4,11,1],[0,12,2],[3,12,3],[0,13,2],[3,13,3],[1,14,3],[5,14,2],[1,15,3],[5,15,2]],
-[[1,2,4],[1,3,4],[0,4,2],[4,4,2],[0,5,2],[4,5,2],[0,6,2],[3,6,2],[0,7,2],[3,7,2],[0,8,2],[4,8,2],[0,9,2],[4,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,2],[4,14,2],[0,15,2],[4,15,2]],
-[[0,2,7],[0,3,7],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[0,7,2],[0,8,2],[0,9,2],[0,10,2],[0,11,2],[0,12,2],[0,13,2],[0,14,2],[0,15,2]],
-[[0,6,7],[0,7,7],[1,8,2],[4,8,2],[1,9,2],[4,9,2],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[1,14,2],[4,14,2],[1,15,2],[4,15,2]],
-[[0,2,7],[0,3,7],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[1,6,2],[1,7,2],[2,8,2],[2,9,2],[1,10,2],[1,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2],[0,14,7],[0,15,7]],
-[[1,6,6],[1,7,6],[0,8,2],[3,8,2],[0,9,2],[3,9,2],[0,10,2],[3,10,2],[0,11,2],[3,11,2],[0,12,2],[3,12,2],[0,13,2],[3,13,2],[1,14,3],[1,15,3]],
-[[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,5],[1,13,5],[0,14,2],[0,15,2]],
-[[1,6,3],[5,6,2],[1,7,3],[5,7,2],[0,8,2],[3,8,3],[0,9,2],[3,9,3],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[1,0,6],[1,1,6],[3,2,2],[3,3,2],[2,4,4],[2,5,4],[1,6,2],[5,6,2],[1,7,2],[5,7,2],[1,8,2],[5,8,2],[1,9,2],[5,9,2],[2,10,4],[2,11,4],[3,12,2],[3,13,2],[1,14,6],[1,15,6]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,7],[0,9,7],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[2,14,3],[2,15,3]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[1,12,2],[4,12,2],[1,13,2],[4,13,2],[0,14,3],[4,14,3],[0,15,3],[4,15,3]],
-[[4,2,3],[4,3,3],[3,4,2],[3,5,2],[4,6,2],[4,7,2],[2,8,5],[2,9,5],[1,10,2],[5,10,2],[1,11,2],[5,11,2],[1,12,2],[5,12,2],[1,13,2],[5,13,2],[2,14,4],[2,15,4]],
-[[1,4,6],[1,5,6],[0,6,2],[3,6,2],[6,6,2],[0,7,2],[3,7,2],[6,7,2],[0,8,2],[3,8,2],[6,8,2],[0,9,2],[3,9,2],[6,9,2],[1,10,6],[1,11,6]],
-[[5,0,2],[5,1,2],[4,2,2],[4,3,2],[1,4,6],[1,5,6],[0,6,2],[3,6,2],[6,6,2],[0,7,2],[3,7,2],[6,7,2],[0,8,2],[3,8,2],[6,8,2],[0,9,2],[3,9,2],[6,9,2],[1,10,6],[1,11,6],[1,12,2],[1,13,2],[0,14,2],[0,15,2]],
-[[3,2,4],[3,3,4],[2,4,2],[2,5,2],[1,6,2],[1,7,2],[1,8,6],[1,9,6],[1,10,2],[1,11,2],[2,12,2],[2,13,2],[3,14,4],[3,15,4]],
-[[1,2,5],[1,3,5],[0,4,2],[5,4,2],[0,5,2],[5,5,2],[0,6,2],[5,6,2],[0,7,2],[5,7,2],[0,8,2],[5,8,2],[0,9,2],[5,9,2],[0,10,2],[5,10,2],[0,11,2],[5,11,2],[0,12,2],[5,12,2],[0,13,2],[5,13,2]],
-[[0,4,7],[0,5,7],[0,8,7],[0,9,7],[0,12,7],[0,13,7]],
-[[3,2,2],[3,3,2],[3,4,2],[3,5,2],[1,6,6],[1,7,6],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[1,14,6],[1,15,6]],
-[[2,2,2],[2,3,2],[3,4,2],[3,5,2],[4,6,2],[4,7,2],[3,8,2],[3,9,2],[2,10,2],[2,11,2],[1,14,6],[1,15,6]],
-[[4,2,2],[4,3,2],[3,4,2],[3,5,2],[2,6,2],[2,7,2],[3,8,2],[3,9,2],[4,10,2],[4,11,2],[1,14,6],[1,15,6]],
-[[4,0,3],[4,1,3],[3,2,2],[6,2,2],[3,3,2],[6,3,2],[3,4,2],[6,4,2],[3,5,2],[6,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[3,10,2],[3,11,2],[3,12,2],[3,13,2],[3,14,2],[3,15,2]],
-[[3,0,2],[3,1,2],[3,2,2],[3,3,2],[3,4,2],[3,5,2],[3,6,2],[3,7,2],[3,8,2],[3,9,2],[0,10,2],[3,10,2],[0,11,2],[3,11,2],[0,12,2],[3,12,2],[0,13,2],[3,13,2],[1,14,3],[1,15,3]],
-[[3,4,2],[3,5,2],[1,8,6],[1,9,6],[3,12,2],[3,13,2]],
-[[1,4,3],[5,4,2],[1,5,3],[5,5,2],[0,6,2],[3,6,3],[0,7,2],[3,7,3],[1,10,3],[5,10,2],[1,11,3],[5,11,2],[0,12,2],[3,12,3],[0,13,2],[3,13,3]],
-[[2,2,3],[2,3,3],[1,4,2],[4,4,2],[1,5,2],[4,5,2],[1,6,2],[4,6,2],[1,7,2],[4,7,2],[2,8,3],[2,9,3]],
-[[3,8,2],[3,9,2],[3,10,2],[3,11,2]],
-[[3,8,2],[3,9,2]],
-[[4,0,4],[4,1,4],[4,2,2],[4,3,2],[4,4,2],[4,5,2],[4,6,2],[4,7,2],[0,8,3],[4,8,2],[0,9,3],[4,9,2],[1,10,2],[4,10,2],[1,11,2],[4,11,2],[2,12,4],[2,13,4],[3,14,3],[3,15,3]],
-[[1,2,2],[4,2,2],[1,3,2],[4,3,2],[2,4,2],[5,4,2],[2,5,2],[5,5,2],[2,6,2],[5,6,2],[2,7,2],[5,7,2],[2,8,2],[5,8,2],[2,9,2],[5,9,2],[2,10,2],[5,10,2],[2,11,2],[5,11,2]],
-[[1,2,4],[1,3,4],[4,4,2],[4,5,2],[3,6,2],[3,7,2],[2,8,2],[2,9,2],[1,10,5],[1,11,5]],
-[[2,4,4],[2,5,4],[2,6,4],[2,7,4],[2,8,4],[2,9,4],[2,10,4],[2,11,4]],
-[]
-];
+/* Font of SCREEN 8 (screen_data_gen/fonts/generate.py): 256 glyphs
+ * of 8x16 pixels, packed one bit per pixel. */
+var SCREEN8_DATA = "AADGxsbGbGw4OGxsxsbGxn5+gYGlpYGBvb2ZmYGBfn5+fv//29v//8PD5+f//35+bGz+/v7+/v58fDg4EBAAABAQODh8fP7+fHw4OBAQAAA4OHx8ODj+/v7+1tYQEDg4EBA4OHx8/v7+/nx8EBA4OAAAxsbGxmxsODhsbMbGxsb/////5+fDw8PD5+f/////AADGxsbGbGw4OGxsxsbGxgAAxsbGxmxsODhsbMbGxsYAAMbGxsZsbDg4bGzGxsbGAADGxsbGbGw4OGxsxsbGxgAAxsbGxmxsODhsbMbGxsZ/f2Njf39jY2NjZ2fm5sDAGBjb2zw85+fn5zw829sYGICA4OD4+P7++Pjg4ICAAAACAg4OPj7+/j4+Dg4CAgAAGBg8PH5+GBgYGH5+PDwYGGZmZmZmZmZmZmYAAGZmAAB/f9vb29t7exsbGxsbGwAAPj5hYTw8ZmZmZjw8hoZ8fAAAAAAAAAAAfn5+fn5+AAAYGDw8fn4YGH5+PDwYGP//GBg8PH5+GBgYGBgYGBgAABgYGBgYGBgYfn48PBgYAAAAABgYDAz+/gwMGBgAAAAAAAAwMGBg/v5gYDAwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMbGxsZsbDg4bGzGxsbGAADGxsbGbGw4OGxsxsbGxgAAxsbGxmxsODhsbMbGxsYAAAAAAAAAAAAAAAAAAAAAAAAYGDw8PDwYGBgYAAAYGAAAZmZmZiQkAAAAAAAAAAAAAGxsbGz+/mxs/v5sbGxsAAAYGD4+YGA8PAYGfHwYGAAAAADGxszMGBgwMGZmxsYAADg4bGw4OHZ23NzMzHZ2AAAYGBgYMDAAAAAAAAAAAAAADAwYGDAwMDAwMBgYDAwAADAwGBgMDAwMDAwYGDAwAAAAAGZmPDz//zw8ZmYAAAAAAAAYGBgYfn4YGBgYAAAAAAAAAAAAAAAAGBgYGDAwAAAAAAAAAAB+fgAAAAAAAAAAAAAAAAAAAAAAABgYGBgAAAYGDAwYGDAwYGDAwICAAAA4OGxsxsbW1sbGbGw4OAAAGBg4OBgYGBgYGBgYfn4AAHx8xsYGBhwcMDBmZv7+AAB8fMbGBgY8PAYGxsZ8fAAAHBw8PGxszMz+/gwMHh4AAP7+wMDAwPz8BgbGxnx8AAA4OGBgwMD8/MbGxsZ8fAAA/v7GxgwMGBgwMDAwMDAAAHx8xsbGxnx8xsbGxnx8AAB8fMbGxsZ+fgYGDAx4eAAAAAAYGBgYAAAAABgYGBgAABgYGBgAAAAAGBgYGDAwAAAGBgwMGBgwMBgYDAwGBgAAAAAAAH5+AAAAAH5+AAAAAGBgMDAYGAwMGBgwMGBgAAB8fMbGDAwYGBgYAAAYGAAAfHzGxt7e3t7e3sDAeHgAADg4bGzGxv7+xsbGxsbGAAD8/GZmZmZ8fGZmZmb8/AAAPDxmZsDAwMDAwGZmPDwAAPj4bGxmZmZmZmZsbPj4AAD+/mJiaGh4eGhoYmL+/gAA/v5iYmhoeHhoaGBg8PAAADw8ZmbAwMDAzs5mZjo6AADGxsbGxsb+/sbGxsbGxgAAPDwYGBgYGBgYGBgYPDwAAB4eDAwMDAwMzMzMzHh4AADm5mZmbGx4eGxsZmbm5gAA8PBgYGBgYGBiYmZm/v4AAMbG7u7+/v7+1tbGxsbGAADGxubm9vbe3s7OxsbGxgAAfHzGxsbGxsbGxsbGfHwAAPz8ZmZmZnx8YGBgYPDwAAB8fMbGxsbGxs7OfHwODgAA/PxmZmZmfHxsbGZm5uYAADw8ZmYwMBgYDAxmZjw8AAB+fn5+WloYGBgYGBg8PAAAxsbGxsbGxsbGxsbGfHwAAMbGxsbGxsbGxsZsbDg4AADGxsbGxsbW1tbW/v5sbAAAxsbGxmxsODhsbMbGxsYAAGZmZmZmZjw8GBgYGDw8AAD+/sbGjIwYGDIyZmb+/gAAPDwwMDAwMDAwMDAwPDwAAMDAYGAwMBgYDAwGBgICAAA8PAwMDAwMDAwMDAw8PBAQODhsbAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//MDAYGAwMAAAAAAAAAAAAAAAAAAAAAHh4DAx8fMzMdnYAAODgYGB8fGZmZmZmZtzcAAAAAAAAfHzGxsDAxsZ8fAAAHBwMDHx8zMzMzMzMdnYAAAAAAAB8fMbG/v7AwHx8AAA8PGZmYGD4+GBgYGDw8AAAAAAAAHZ2zMx8fAwM+PgAAODgYGBsbHZ2ZmZmZubmAAAYGAAAODgYGBgYGBg8PAAABgYAAAYGBgYGBmZmPDwAAODgYGBmZmxseHhsbObmAAA4OBgYGBgYGBgYGBg8PAAAAAAAAOzs/v7W1tbW1tYAAAAAAADc3GZmZmZmZmZmAAAAAAAAfHzGxsbGxsZ8fAAAAAAAANzcZmZ8fGBg8PAAAAAAAAB2dszMfHwMDB4eAAAAAAAA3Nx2dmBgYGDw8AAAAAAAAH5+wMB8fAYG/PwAADAwMDD8/DAwMDA2NhwcAAAAAAAAzMzMzMzMzMx2dgAAAAAAAMbGxsbGxmxsODgAAAAAAADGxtbW1tb+/mxsAAAAAAAAxsZsbDg4bGzGxgAAAAAAAMbGxsZ+fgYG/PwAAAAAAAB+fgwMGBgwMH5+AAAODhgYGBhwcBgYGBgODgAAGBgYGBgYGBgYGBgYGBgAAHBwGBgYGA4OGBgYGHBwdnbc3AAAAAAAAAAAAAAAAAAAAAAQEDg4bGzGxsbG/v48PGZmwMDAwGZmPDwYGHBwAADMzAAAzMzMzMzMzMx2dgwMGBgAAHx8xsb+/sDAfHw4OGxsAAB4eAwMfHzMzHZ2AADMzAAAeHgMDHx8zMx2dmBgMDAAAHh4DAx8fMzMdnY4OGxsODh4eAwMfHzMzHZ2AAB8fMbGwMDGxnx8GBhwcDg4bGwAAHx8xsb+/sDAfHwAAMbGAAB8fMbG/v7AwHx8MDAYGAAAfHzGxv7+wMB8fAAAZmYAADg4GBgYGBgYPDw4OGxsAAA4OBgYGBgYGDw8MDAYGAAAODgYGBgYGBg8PMbGEBA4OGxsxsb+/sbGxsY4OGxsODh8fMbG/v7GxsbGDAwYGP7+wMD4+MDAwMD+/gAAAAAAAOzsNjZ+ftjYbm4AAD4+bGzMzP7+zMzMzM7OODhsbAAAfHzGxsbGxsZ8fAAAxsYAAHx8xsbGxsbGfHwwMBgYAAB8fMbGxsbGxnx8eHjMzAAAzMzMzMzMzMx2dmBgMDAAAMzMzMzMzMzMdnYAAMbGAADGxsbGfn4GBvz8xsYAADg4bGzGxsbGbGw4OMbGAADGxsbGxsbGxsbGfHwYGBgYfn7AwMDAfn4YGBgYODhsbGRk8PBgYGBgZmb8/GZmZmY8PH5+GBh+fhgYGBj4+MzMzMz6+sbGz8/GxsfHDg4bGxgYPDwYGBgY2NhwcBgYMDAAAHh4DAx8fMzMdnYMDBgYAAA4OBgYGBgYGDw8DAwYGAAAfHzGxsbGxsZ8fBgYMDAAAMzMzMzMzMzMdnZ2dtzcAADc3GZmZmZmZmZmdnbc3AAA5ub29t7ezs7GxgAAPDxsbGxsNjYAAH5+AAAAADg4bGxsbDg4AAB8fAAAAAAwMAAAMDAwMGBgxsZ8fAAAAAAAAP7+wMDAwAAAAAAAAAAAAAD+/gYGBgYAAAAAY2Pm5mxsfn4zM2ZmzMwPD2Nj5uZsbHp6NjZqat/fBgYAABgYAAAYGBgYPDw8PBgYAAAAAAAAMzNmZszMZmYzMwAAAAAAAMzMZmYzM2ZmzMwiIoiIIiKIiCIiiIgiIoiIVVWqqlVVqqpVVaqqVVWqqnd33d13d93dd3fd3Xd33d0YGBgYGBgYGBgYGBgYGBgYGBgYGBgYGBj4+BgYGBgYGBgYGBj4+BgY+PgYGBgYGBg2NjY2NjY2Nvb2NjY2NjY2AAAAAAAAAAD+/jY2NjY2NgAAAAD4+BgY+PgYGBgYGBg2NjY29vYGBvb2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NgAAAAD+/gYG9vY2NjY2NjY2NjY29vYGBv7+AAAAAAAANjY2NjY2Njb+/gAAAAAAABgYGBj4+BgY+PgAAAAAAAAAAAAAAAAAAPj4GBgYGBgYGBgYGBgYGBgfHwAAAAAAABgYGBgYGBgY//8AAAAAAAAAAAAAAAAAAP//GBgYGBgYGBgYGBgYGBgfHxgYGBgYGAAAAAAAAAAA//8AAAAAAAAYGBgYGBgYGP//GBgYGBgYGBgYGB8fGBgfHxgYGBgYGDY2NjY2NjY2Nzc2NjY2NjY2NjY2NzcwMD8/AAAAAAAAAAAAAD8/MDA3NzY2NjY2NjY2Njb39wAA//8AAAAAAAAAAAAA//8AAPf3NjY2NjY2NjY2Njc3MDA3NzY2NjY2NgAAAAD//wAA//8AAAAAAAA2NjY29/cAAPf3NjY2NjY2GBgYGP//AAD//wAAAAAAADY2NjY2NjY2//8AAAAAAAAAAAAA//8AAP//GBgYGBgYAAAAAAAAAAD//zY2NjY2NjY2NjY2NjY2Pz8AAAAAAAAYGBgYHx8YGB8fAAAAAAAAAAAAAB8fGBgfHxgYGBgYGAAAAAAAAAAAPz82NjY2NjY2NjY2NjY2Nv//NjY2NjY2GBgYGP//GBj//xgYGBgYGBgYGBgYGBgY+PgAAAAAAAAAAAAAAAAAAB8fGBgYGBgY/////////////////////wAAAAAAAAAA///////////w8PDw8PDw8PDw8PDw8PDwDw8PDw8PDw8PDw8PDw8PD///////////AAAAAAAAAAAAAAAAAAB2dtzcyMjc3HZ2AAB4eMzM2NjMzMbGxsbMzAAA/v7GxsDAwMDAwMDAwMAAAAAAAAD+/mxsbGxsbGxsAAD+/sbGYGAwMGBgxsb+/gAAAAAAAH5+2NjY2NjYcHAAAAAAAABmZmZmZmZ8fMDAAAAAAAAAdnbc3BgYGBgYGH5+GBg8PGZmZmY8PBgYfn4AADg4bGzGxv7+xsZsbDg4AAA4OGxsxsbGxmxsbGzu7gAADg4YGAwMPj5mZmZmPDwAAAAAfn7b29vbfn4AAAAABgYMDH5+29vb235+YGDAwAAAHh4wMGBgfn5gYDAwHh4AAHx8xsbGxsbGxsbGxgAAAAAAAP7+AAD+/gAA/v4AAAAAGBgYGH5+GBgYGAAAfn4AADAwGBgMDBgYMDAAAH5+AAAMDBgYMDAYGAwMAAB+fg4OGxsbGxgYGBgYGBgYGBgYGBgYGBgYGBgY2NjY2HBwAAAAABgYAAB+fgAAGBgAAAAAAAB2dtzcAAB2dtzcAAAAADg4bGxsbDg4AAAAAAAAAAAAAAAAAAAYGBgYAAAAAAAAAAAAAAAAGBgAAAAAAAAPDwwMDAwMDOzsbGw8PBwcAABsbDY2NjY2NjY2AAAAAAAAeHgMDBgYMDB8fAAAAAAAAAAAPDw8PDw8PDwAAAAAAAAAAAAAAAAAAAAAAAAAAA==";
@@ -0,0 +1,575 @@
+/* Headless host: runs a page written by lang.compiler (bundled or not)
+ * under Node, without a browser, e.g. for regression tests and
+ * benchmarks.
+ *
+ *   node runtime/headless.js [options] page.html
+ *
+ * The scripts of the page run in a sandbox (the vm module) whose document
+ * has an in-memory canvas, whose keyboard types a script of keys, and
+ * whose clock is virtual: it advances by the opcodes the VM runs (at
+ * --ops-per-ms) and, while the program waits (SLEEP, INPUT, the next
+ * animation frame), straight to the next timer. The same page and keys
+ * give the same run on any machine. The clock starts at --epoch, in UTC.
+ *
+ * At the end, the result of the run is printed as JSON, and the canvas
+ * (as PNG) and the text plane (one line per row, in the code page of the
+ * fonts) are written to the files given. The exit status is 1 if the
+ * program raised an error. */
+
+var fs = require('fs');
+var path = require('path');
+var vm = require('vm');
+var zlib = require('zlib');
+
+var HEADLESS_DEFAULTS = {
+    steps: 0,               /* stop after this many opcodes (0: no limit) */
+    time: 60000,            /* stop after this many virtual milliseconds */
+    ops_per_ms: 10000,      /* speed of the virtual machine */
+    keys: '',               /* script of keys (see parse_keys) */
+    key_delay: 500,         /* virtual milliseconds before the first key */
+    key_interval: 100,      /* virtual milliseconds between keys */
+    epoch: Date.UTC(2000, 0, 1),
+    runtime: null,          /* directory of the runtime (default: next to the page) */
+    screenshot: null,       /* PNG file for the canvas */
+    text: null              /* text file for the text plane */
+};
+
+var FRAME_INTERVAL = 1000 / 60;
+
+/* Browsers wait at least 4 ms for timers set by timers nested more than
+ * 5 deep (e.g. a loop of setTimeout(f, 0)). */
+var TIMER_NESTING_LEVEL = 5;
+var TIMER_MIN_DELAY = 4;
+
+var SCRIPT_RE = /<script type='text\/javascript'(?: src='([^']*)')?>([\s\S]*?)<\/script>/g;
+var RUNTIME_PREFIX = '../runtime/';
+
+/* Keys of the script that go through onkeydown (see runtime/input.js);
+ * the other characters go through onkeypress. */
+var SPECIAL_KEYS = {
+    'BACKSPACE': 8,
+    'ENTER': 13,
+    'ESC': 27,
+    'LEFT': 37,
+    'UP': 38,
+    'RIGHT': 39,
+    'DOWN': 40
+};
+
+/* Events of a script of keys: characters stand for themselves, and
+ * {NAME} for the keys of SPECIAL_KEYS, e.g. "2{ENTER}{UP}{UP}". */
+function parse_keys(script) {
+    var events = [];
+    var i = 0;
+    while (i < script.length) {
+        var match = /^\{([A-Z]+)\}/.exec(script.substring(i));
+        if (match !== null && SPECIAL_KEYS.hasOwnProperty(match[1])) {
+            events.push({type: 'keydown', keyCode: SPECIAL_KEYS[match[1]]});
+            i += match[0].length;
+        } else {
+            events.push({type: 'keypress', keyCode: script.charCodeAt(i)});
+            i++;
+        }
+    }
+    return events;
+}
+
+/* Timers, animation frames and messages of the sandbox, run in the order
+ * of their virtual time. */
+function Scheduler(clock) {
+    var that = this;
+
+    var tasks = [];
+    var sequence = 0;
+    /* Nesting level of the running timer, 0 for other tasks. */
+    var nesting = 0;
+
+    that.add = function (due, f, args, level) {
+        sequence++;
+        tasks.push({due: due, sequence: sequence, f: f, args: args || [], level: level || 0});
+        return sequence;
+    };
+
+    that.add_timer = function (delay, f, args) {
+        var level = nesting + 1;
+        delay = Math.max(delay || 0, 0);
+        if (level > TIMER_NESTING_LEVEL) {
+            delay = Math.max(delay, TIMER_MIN_DELAY);
+        }
+        return that.add(clock.now() + delay, f, args, level);
+    };
+
+    that.cancel = function (id) {
+        tasks = tasks.filter(function (task) { return task.sequence != id; });
+    };
+
+    that.empty = function () {
+        return tasks.length == 0;
+    };
+
+    that.next_due = function () {
+        var due = Infinity;
+        for (var i = 0; i < tasks.length; i++) {
+            due = Math.min(due, tasks[i].due);
+        }
+        return due;
+    };
+
+    /* Waits for the next task and runs it. */
+    that.run_next = function () {
+        var next = 0;
+        for (var i = 1; i < tasks.length; i++) {
+            if (tasks[i].due < tasks[next].due
+                || (tasks[i].due == tasks[next].due && tasks[i].sequence < tasks[next].sequence)) {
+                next = i;
+            }
+        }
+        var task = tasks.splice(next, 1)[0];
+        clock.wait_until(task.due);
+        nesting = task.level;
+        try {
+            task.f.apply(null, task.args);
+        } finally {
+            nesting = 0;
+        }
+    };
+}
+
+/* Milliseconds since the start of the run: the opcodes run so far, at
+ * ops_per_ms, plus the time spent waiting. */
+function VirtualClock(ops_per_ms) {
+    var that = this;
+
+    var waited = 0;
+    that.ops = function () { return 0; };
+
+    that.now = function () {
+        return waited + that.ops() / ops_per_ms;
+    };
+
+    that.wait_until = function (time) {
+        var now = that.now();
+        if (time > now) {
+            waited += time - now;
+        }
+    };
+}
+
+/* An element of the document; only what the runtime uses. */
+function HeadlessElement(tag) {
+    var that = this;
+
+    that.tagName = tag.toUpperCase();
+    that.childNodes = [];
+    that.firstChild = null;
+    that.innerHTML = '';
+    that.style = {};
+
+    that.appendChild = function (child) {
+        that.childNodes.push(child);
+        that.firstChild = that.childNodes[0];
+        return child;
+    };
+
+    that.removeChild = function (child) {
+        that.childNodes.splice(that.childNodes.indexOf(child), 1);
+        that.firstChild = that.childNodes.length > 0 ? that.childNodes[0] : null;
+        return child;
+    };
+}
+
+/* A canvas with its pixels in memory, as RGBA. Counts the draw calls of
+ * its 2D context. */
+function HeadlessCanvas(counters) {
+    var that = this;
+    HeadlessElement.call(that, 'canvas');
+
+    that.width = 300;
+    that.height = 150;
+    that.pixels = null;
+
+    function copy(source, sx, sy, w, h, dx, dy, source_width) {
+        /* Through a copy, as source and destination may overlap. */
+        var from = new Uint8ClampedArray(4 * w * h);
+        for (var y = 0; y < h; y++) {
+            var k = 4 * ((sy + y) * source_width + sx);
+            from.set(source.subarray(k, k + 4 * w), 4 * y * w);
+        }
+        for (var y = 0; y < h; y++) {
+            that.pixels.set(from.subarray(4 * y * w, 4 * (y + 1) * w), 4 * ((dy + y) * that.width + dx));
+        }
+    }
+
+    var context = {
+        canvas: that,
+
+        createImageData: function (w, h) {
+            return {width: w, height: h, data: new Uint8ClampedArray(4 * w * h)};
+        },
+
+        putImageData: function (image, dx, dy, x, y, w, h) {
+            if (x === undefined) {
+                x = y = 0;
+                w = image.width;
+                h = image.height;
+            }
+            counters.draw_calls++;
+            counters.frame();
+            copy(image.data, x, y, w, h, dx + x, dy + y, image.width);
+        },
+
+        drawImage: function (source, sx, sy, sw, sh, dx, dy) {
+            /* Only unscaled copies from a canvas, as the runtime does. */
+            counters.draw_calls++;
+            copy(source.pixels, sx, sy, sw, sh, dx, dy, source.width);
+        }
+    };
+
+    that.getContext = function (kind) {
+        if (that.pixels === null) {
+            that.pixels = new Uint8ClampedArray(4 * that.width * that.height);
+        }
+        return context;
+    };
+}
+
+function HeadlessDocument(counters) {
+    var that = this;
+
+    var elements = {
+        screen_container: new HeadlessElement('div'),
+        errmsg_container: new HeadlessElement('div')
+    };
+
+    that.onkeypress = null;
+    that.onkeydown = null;
+
+    that.getElementById = function (id) {
+        return elements.hasOwnProperty(id) ? elements[id] : null;
+    };
+
+    that.createElement = function (tag) {
+        return tag == 'canvas' ? new HeadlessCanvas(counters) : new HeadlessElement(tag);
+    };
+
+    /* The canvas the screen draws on, if any. */
+    that.canvas = function () {
+        var children = elements.screen_container.childNodes;
+        return children.length > 0 ? children[children.length - 1] : null;
+    };
+
+    /* The error the VM reported, if any (SYSTEM also writes a message,
+     * but not an error). */
+    that.error = function () {
+        var message = elements.errmsg_container.innerHTML;
+        return message.indexOf('Error: ') == 0 ? message : null;
+    };
+
+    that.type = function (event) {
+        var handler = event.type == 'keydown' ? that.onkeydown : that.onkeypress;
+        if (handler) {
+            handler({keyCode: event.keyCode});
+        }
+    };
+}
+
+/* Global object of the sandbox the page runs in. */
+function make_sandbox(document, clock, scheduler, epoch, counters) {
+    var sandbox = {};
+
+    function VirtualDate() {
+        if (arguments.length == 0) {
+            return new Date(epoch + clock.now());
+        }
+        var args = [null].concat(Array.prototype.slice.call(arguments));
+        return new (Function.prototype.bind.apply(Date, args))();
+    }
+    VirtualDate.now = function () { return epoch + clock.now(); };
+    VirtualDate.UTC = Date.UTC;
+    VirtualDate.parse = Date.parse;
+    VirtualDate.prototype = Date.prototype;
+
+    function MessageChannel() {
+        var channel = this;
+        channel.port1 = {onmessage: null};
+        channel.port2 = {
+            postMessage: function (data) {
+                scheduler.add(clock.now(), function () {
+                    channel.port1.onmessage({data: data});
+                });
+            }
+        };
+    }
+
+    function Audio(src) {
+        this.src = src;
+    }
+    Audio.prototype.play = function () {
+        counters.sounds++;
+    };
+
+    sandbox.document = document;
+    sandbox.window = sandbox;
+    sandbox.console = console;
+    sandbox.Date = VirtualDate;
+    sandbox.performance = {now: clock.now};
+    sandbox.setTimeout = function (f, delay) {
+        return scheduler.add_timer(delay, f, Array.prototype.slice.call(arguments, 2));
+    };
+    sandbox.clearTimeout = scheduler.cancel;
+    sandbox.requestAnimationFrame = function (f) {
+        var frame = (Math.floor(clock.now() / FRAME_INTERVAL) + 1) * FRAME_INTERVAL;
+        return scheduler.add(frame, function () { f(frame); });
+    };
+    sandbox.MessageChannel = MessageChannel;
+    sandbox.Audio = Audio;
+    sandbox.atob = function (s) {
+        return Buffer.from(s, 'base64').toString('binary');
+    };
+    return sandbox;
+}
+
+/* Source of the scripts of the page, with their names, in order. */
+function page_scripts(page_fn, runtime_dir) {
+    var html = fs.readFileSync(page_fn, 'utf8');
+    var scripts = [];
+    var match;
+    SCRIPT_RE.lastIndex = 0;
+    while ((match = SCRIPT_RE.exec(html)) !== null) {
+        var src = match[1];
+        if (src === undefined) {
+            scripts.push({name: page_fn, source: match[2]});
+            continue;
+        }
+        var fn;
+        if (runtime_dir !== null && src.indexOf(RUNTIME_PREFIX) == 0) {
+            fn = path.join(runtime_dir, src.substring(RUNTIME_PREFIX.length));
+        } else {
+            fn = path.join(path.dirname(page_fn), src);
+        }
+        scripts.push({name: fn, source: fs.readFileSync(fn, 'utf8')});
+    }
+    return scripts;
+}
+
+/* Text of an error message of the runtime, without the markup and the
+ * dump of the state. */
+function error_text(html) {
+    return html.replace(/<br>State:[\s\S]*/, '').replace(/<[^>]*>/g, '');
+}
+
+var CRC_TABLE = (function () {
+    var table = [];
+    for (var n = 0; n < 256; n++) {
+        var c = n;
+        for (var k = 0; k < 8; k++) {
+            c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+        }
+        table.push(c >>> 0);
+    }
+    return table;
+})();
+
+function crc32(buffer) {
+    var c = 0xffffffff;
+    for (var i = 0; i < buffer.length; i++) {
+        c = CRC_TABLE[(c ^ buffer[i]) & 0xff] ^ (c >>> 8);
+    }
+    return (c ^ 0xffffffff) >>> 0;
+}
+
+function png_chunk(type, data) {
+    var chunk = Buffer.alloc(12 + data.length);
+    chunk.writeUInt32BE(data.length, 0);
+    chunk.write(type, 4, 'ascii');
+    data.copy(chunk, 8);
+    chunk.writeUInt32BE(crc32(chunk.subarray(4, 8 + data.length)), 8 + data.length);
+    return chunk;
+}
+
+/* PNG file (8-bit RGBA) of the pixels of a canvas. */
+function encode_png(width, height, pixels) {
+    var header = Buffer.alloc(13);
+    header.writeUInt32BE(width, 0);
+    header.writeUInt32BE(height, 4);
+    header[8] = 8;      /* bits per sample */
+    header[9] = 6;      /* RGBA */
+    /* Rows with filter 0 (none). */
+    var rows = Buffer.alloc(height * (1 + 4 * width));
+    for (var y = 0; y < height; y++) {
+        Buffer.from(pixels.buffer, pixels.byteOffset + 4 * y * width, 4 * width)
+            .copy(rows, y * (1 + 4 * width) + 1);
+    }
+    return Buffer.concat([
+        Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a]),
+        png_chunk('IHDR', header),
+        png_chunk('IDAT', zlib.deflateSync(rows)),
+        png_chunk('IEND', Buffer.alloc(0))
+    ]);
+}
+
+/* Runs the page in page_fn with the given options (see
+ * HEADLESS_DEFAULTS), returning the result of the run. */
+function run_headless(page_fn, options) {
+    var settings = {};
+    for (var name in HEADLESS_DEFAULTS) {
+        settings[name] = options && options[name] !== undefined ? options[name] : HEADLESS_DEFAULTS[name];
+    }
+
+    var wall_start = process.hrtime.bigint();
+    function wall_ms() {
+        return Number(process.hrtime.bigint() - wall_start) / 1e6;
+    }
+
+    var clock = new VirtualClock(settings.ops_per_ms);
+    var scheduler = new Scheduler(clock);
+    var machine = null;
+    var state = null;
+    var first_frame = null;
+    var counters = {
+        draw_calls: 0,
+        sounds: 0,
+        frame: function () {
+            if (first_frame === null) {
+                first_frame = {wall_ms: wall_ms(), virtual_ms: clock.now(), ops: clock.ops()};
+            }
+        }
+    };
+    var document = new HeadlessDocument(counters);
+    var sandbox = make_sandbox(document, clock, scheduler, settings.epoch, counters);
+    vm.createContext(sandbox);
+
+    var scripts = page_scripts(page_fn, settings.runtime);
+    for (var i = 0; i < scripts.length; i++) {
+        vm.runInContext(scripts[i].source, sandbox, {filename: scripts[i].name});
+    }
+    var load_ms = wall_ms();
+
+    /* Keep the state and the VM the page creates. */
+    var PageState = sandbox.VirtualMachineState;
+    var PageMachine = sandbox.VirtualMachine;
+    sandbox.VirtualMachineState = function () {
+        state = Reflect.construct(PageState, arguments);
+        return state;
+    };
+    sandbox.VirtualMachine = function () {
+        machine = Reflect.construct(PageMachine, arguments);
+        clock.ops = function () { return machine.stats().ops; };
+        return machine;
+    };
+
+    var keys = parse_keys(settings.keys);
+    var typed = 0;
+
+    var stopped = null;
+    var run_start = wall_ms();
+    sandbox.init();
+    while (stopped === null) {
+        if (document.error() !== null) {
+            stopped = 'error';
+        } else if (settings.steps > 0 && clock.ops() >= settings.steps) {
+            stopped = 'steps';
+        } else if (scheduler.empty()) {
+            stopped = 'exit';
+        } else if (clock.now() >= settings.time) {
+            stopped = 'time';
+        } else {
+            /* Keys are typed between the tasks of the page, while it
+             * runs or waits. */
+            var key_time = settings.key_delay + typed * settings.key_interval;
+            if (typed < keys.length && key_time <= scheduler.next_due()) {
+                clock.wait_until(key_time);
+                document.type(keys[typed++]);
+            } else {
+                scheduler.run_next();
+            }
+        }
+    }
+    var run_ms = wall_ms() - run_start;
+    var stats = machine !== null ? machine.stats() : {ops: 0, slices: 0};
+
+    var canvas = document.canvas();
+    if (settings.screenshot !== null && canvas !== null && canvas.pixels !== null) {
+        fs.writeFileSync(settings.screenshot, encode_png(canvas.width, canvas.height, canvas.pixels));
+    }
+    if (settings.text !== null && state !== null) {
+        fs.writeFileSync(settings.text, state.screen.text_rows().join('\n') + '\n', 'latin1');
+    }
+
+    return {
+        page: page_fn,
+        stopped: stopped,
+        error: stopped == 'error' ? error_text(document.error()) : null,
+        ops: stats.ops,
+        slices: stats.slices,
+        virtual_ms: clock.now(),
+        load_ms: load_ms,
+        run_ms: run_ms,
+        ops_per_second: run_ms > 0 ? 1000 * stats.ops / run_ms : 0,
+        first_frame: first_frame,
+        draw_calls: counters.draw_calls,
+        sounds: counters.sounds
+    };
+}
+
+var USAGE = [
+    'usage: node runtime/headless.js [options] page.html',
+    '',
+    '  --steps N          stop after N opcodes (default: no limit)',
+    '  --time MS          stop after MS virtual milliseconds (default: 60000)',
+    '  --ops-per-ms N     opcodes per virtual millisecond (default: 10000)',
+    '  --keys KEYS        keys to type, {ENTER}, {ESC}, {BACKSPACE}, {UP}, ... for special keys',
+    '  --keys-file FILE   read the keys to type from FILE',
+    '  --key-delay MS     virtual milliseconds before the first key (default: 500)',
+    '  --key-interval MS  virtual milliseconds between keys (default: 100)',
+    '  --epoch MS         start of the virtual clock, in milliseconds since 1970 (UTC)',
+    '  --runtime DIR      read ../runtime/ scripts from DIR',
+    '  --screenshot FILE  write the canvas to FILE as PNG',
+    '  --text FILE        write the text plane to FILE'
+].join('\n');
+
+function main(argv) {
+    var options = {};
+    var numbers = {
+        '--steps': 'steps', '--time': 'time', '--ops-per-ms': 'ops_per_ms',
+        '--key-delay': 'key_delay', '--key-interval': 'key_interval', '--epoch': 'epoch'
+    };
+    var strings = {
+        '--keys': 'keys', '--runtime': 'runtime', '--screenshot': 'screenshot', '--text': 'text'
+    };
+    var page_fn = null;
+    for (var i = 0; i < argv.length; i++) {
+        var arg = argv[i];
+        if (numbers.hasOwnProperty(arg) && i + 1 < argv.length && !isNaN(+argv[i + 1])) {
+            options[numbers[arg]] = +argv[++i];
+        } else if (strings.hasOwnProperty(arg) && i + 1 < argv.length) {
+            options[strings[arg]] = argv[++i];
+        } else if (arg == '--keys-file' && i + 1 < argv.length) {
+            options.keys = fs.readFileSync(argv[++i], 'utf8').replace(/\r?\n$/, '');
+        } else if (arg.charAt(0) != '-' && page_fn === null) {
+            page_fn = arg;
+        } else {
+            process.stderr.write(USAGE + '\n');
+            return 2;
+        }
+    }
+    if (page_fn === null) {
+        process.stderr.write(USAGE + '\n');
+        return 2;
+    }
+    /* DATE$ and TIME$ read the local time. */
+    process.env.TZ = 'UTC';
+    var result = run_headless(page_fn, options);
+    process.stdout.write(JSON.stringify(result, null, 2) + '\n');
+    return result.error === null ? 0 : 1;
+}
+
+module.exports = {
+    HEADLESS_DEFAULTS: HEADLESS_DEFAULTS,
+    parse_keys: parse_keys,
+    run_headless: run_headless
+};
+
+if (require.main === module) {
+    process.exitCode = main(process.argv.slice(2));
+}
@@ -5,6 +5,8 @@ var SCREEN_PRINT_SEP_ENTER = 0;
 var SCREEN_PRINT_SEP_CONCAT = 1;
 var SCREEN_PRINT_SEP_TAB = 2;
 
+var GLYPH_CACHE_SIZE = 1024; /* rendered glyphs kept by GlyphCache */
+
 function default_palette() {
     return PALETTE;
 }
@@ -24,11 +26,140 @@ function make_screen_traits(width_in_chars, height_in_chars, char_width, char_he
     traits.mult_x = mult_x;
     traits.mult_y = mult_y;
 
-    traits.font_data = [];
+    traits.font_data = null;
+    traits.glyph_atlas = null;
     traits.palette = default_palette();
+    traits.rgba_palette = null;
     return traits;
 }
 
+/* The 256 glyphs of a font of runtime/fonts/ unpacked one after the
+ * other, one byte per pixel: 1 where the glyph is set, 0 elsewhere.
+ * Without font_data (the program did not use the screen) every glyph is
+ * blank. */
+function make_glyph_atlas(font_data, char_width, char_height) {
+    var row_bytes = (char_width + 7) >> 3;
+    var bits;
+    if (font_data === null) {
+        bits = new Uint8Array(256 * char_height * row_bytes);
+    } else {
+        bits = new Base64().decode_bytes(font_data);
+    }
+
+    var atlas = new Uint8Array(256 * char_height * char_width);
+    for (var row = 0; row < 256 * char_height; row++) {
+        for (var x = 0; x < char_width; x++) {
+            if (bits[row * row_bytes + (x >> 3)] & (0x80 >> (x & 7))) {
+                atlas[row * char_width + x] = 1;
+            }
+        }
+    }
+    return atlas;
+}
+
+/* Palette as 32-bit RGBA pixels in the byte order of ImageData, indexed
+ * by color number. */
+function make_rgba_palette(palette) {
+    var little_endian = new Uint8Array(new Uint32Array([1]).buffer)[0] == 1;
+    var rgba = new Uint32Array(256);
+    for (var color = 0; color < 256; color++) {
+        var hex = palette[color];
+        if (hex === undefined) {
+            continue;
+        }
+        var r = parseInt(hex.substring(1, 3), 16);
+        var g = parseInt(hex.substring(3, 5), 16);
+        var b = parseInt(hex.substring(5, 7), 16);
+        if (little_endian) {
+            rgba[color] = ((0xff << 24) | (b << 16) | (g << 8) | r) >>> 0;
+        } else {
+            rgba[color] = ((r << 24) | (g << 16) | (b << 8) | 0xff) >>> 0;
+        }
+    }
+    return rgba;
+}
+
+/* Glyphs rendered in a given color over a given background, as arrays of
+ * color numbers, one per row of pixels, ready to be copied to the
+ * framebuffer with set(), keyed by (screen mode, character, fg, bg). The least recently used glyph is evicted
+ * (and its array reused) when there are more than capacity. */
+function GlyphCache(capacity) {
+    var that = this;
+
+    var entries = {};
+    var size = 0;
+    /* Doubly linked list of the entries, most recently used first. */
+    var head = {key: null};
+    head.newer = head.older = head;
+
+    that.hits = 0;
+    that.misses = 0;
+    that.evictions = 0;
+
+    function unlink(entry) {
+        entry.newer.older = entry.older;
+        entry.older.newer = entry.newer;
+    }
+
+    function link_first(entry) {
+        entry.newer = head;
+        entry.older = head.older;
+        head.older.newer = entry;
+        head.older = entry;
+    }
+
+    function render(entry, traits, asc, fg, bg) {
+        var w = traits.char_width;
+        var n = w * traits.char_height;
+        if (entry.pixels === null || entry.pixels.length != n) {
+            entry.pixels = new Uint8Array(n);
+            /* Views of the rows, made once so that drawing allocates nothing. */
+            entry.rows = [];
+            for (var y = 0; y < traits.char_height; y++) {
+                entry.rows.push(entry.pixels.subarray(y * w, (y + 1) * w));
+            }
+        }
+        var atlas = traits.glyph_atlas;
+        var start = asc * n;
+        for (var k = 0; k < n; k++) {
+            entry.pixels[k] = atlas[start + k] ? fg : bg;
+        }
+    }
+
+    that.get = function (screen_number, traits, asc, fg, bg) {
+        var key = ((screen_number * 256 + fg) * 256 + bg) * 256 + asc;
+        var entry = entries[key];
+        if (entry !== undefined) {
+            that.hits++;
+            if (head.older !== entry) {
+                unlink(entry);
+                link_first(entry);
+            }
+            return entry.rows;
+        }
+
+        that.misses++;
+        if (size < capacity) {
+            entry = {key: key, newer: null, older: null, pixels: null, rows: null};
+            size++;
+        } else {
+            that.evictions++;
+            entry = head.newer;
+            unlink(entry);
+            delete entries[entry.key];
+            entry.key = key;
+        }
+        render(entry, traits, asc, fg, bg);
+        entries[key] = entry;
+        link_first(entry);
+        return entry.rows;
+    };
+
+    that.stats = function () {
+        return {hits: that.hits, misses: that.misses, evictions: that.evictions, size: size};
+    };
+}
+
 function default_screen_types(available_screens) {
   var types = {};
   types[0] = make_screen_traits(80, 24, 8, 16, 1, 1);
@@ -58,9 +189,23 @@ function Screen(parent_document, parent_screen_container, available_screens) {
     var current_bg = 0;
 
     var canvas, context;
+    var glyph_cache = new GlyphCache(GLYPH_CACHE_SIZE);
+
+    /* Everything is drawn on framebuffer, one color number per pixel of
+     * the canvas; present() copies the region changed since the last call
+     * (from dirty_x0, dirty_y0 to dirty_x1, dirty_y1, inclusive) to the
+     * canvas, through image. */
+    var framebuffer, image, image_pixels;
+    var dirty_x0, dirty_y0, dirty_x1, dirty_y1;
     var current_screen_number;
     var traits;
-    var content_matrix;
+    /* Text plane: one cell per character position, with the character
+     * in the low byte and the attribute (fg + 16 * bg) in the high byte.
+     * It is a ring buffer of rows: row j of the screen (from 1) is row
+     * (text_row_offset + j - 1) % height_in_chars of text_cells, so
+     * scrolling only clears one row. */
+    var text_cells;
+    var text_row_offset;
 
     var that = this;
 
@@ -70,17 +215,73 @@ function Screen(parent_document, parent_screen_container, available_screens) {
      *   chr$(10) --> linefeed
      *   etc.?
      */
+    function mark_dirty(x0, y0, x1, y1) {
+        if (x0 > x1 || y0 > y1) {
+            return;
+        }
+        dirty_x0 = Math.min(dirty_x0, x0);
+        dirty_y0 = Math.min(dirty_y0, y0);
+        dirty_x1 = Math.max(dirty_x1, x1);
+        dirty_y1 = Math.max(dirty_y1, y1);
+    }
+
+    /* Fills the rectangle of the framebuffer from (x0, y0) to (x1, y1),
+     * inclusive and clipped to the screen. */
+    function fill_rect(x0, y0, x1, y1, color) {
+        x0 = Math.max(x0, 0);
+        y0 = Math.max(y0, 0);
+        x1 = Math.min(x1, traits.total_width - 1);
+        y1 = Math.min(y1, traits.total_height - 1);
+        if (x0 > x1 || y0 > y1) {
+            return;
+        }
+        for (var y = y0; y <= y1; y++) {
+            framebuffer.fill(color, y * traits.total_width + x0, y * traits.total_width + x1 + 1);
+        }
+        mark_dirty(x0, y0, x1, y1);
+    }
+
     that._put_char = function (asc, i, j, fg, bg) {
-        var lst = traits.font_data[asc];
-        context.fillStyle = traits.palette[bg];
-        context.fillRect(traits.char_width * (i - 1), traits.char_height * (j - 1), traits.char_width, traits.char_height);
-        context.fillStyle = traits.palette[fg];
-		for (var k in lst) {
-          context.fillRect(traits.char_width * (i - 1) + lst[k][0], traits.char_height * (j - 1) + lst[k][1], lst[k][2], 1);
+        var rows = glyph_cache.get(current_screen_number, traits, asc, fg, bg);
+        var w = traits.char_width;
+        var h = traits.char_height;
+        var x0 = w * (i - 1);
+        var y0 = h * (j - 1);
+        for (var y = 0; y < h; y++) {
+            framebuffer.set(rows[y], (y0 + y) * traits.total_width + x0);
         }
-        content_matrix[i][j] = asc;
+        mark_dirty(x0, y0, x0 + w - 1, y0 + h - 1);
+        text_cells[text_cell(j, i)] = asc | (((fg & 0xf) | ((bg & 0xf) << 4)) << 8);
     };
 
+    /* Whether something was drawn since the last call to present(). */
+    that.dirty = function () {
+        return dirty_x0 <= dirty_x1;
+    };
+
+    /* Copies the dirty region of the framebuffer to the canvas. The VM
+     * calls it at the end of every time slice. */
+    that.present = function () {
+        if (dirty_x0 > dirty_x1) {
+            return;
+        }
+        var rgba = traits.rgba_palette;
+        var width = traits.total_width;
+        for (var y = dirty_y0; y <= dirty_y1; y++) {
+            for (var k = y * width + dirty_x0; k <= y * width + dirty_x1; k++) {
+                image_pixels[k] = rgba[framebuffer[k]];
+            }
+        }
+        context.putImageData(image, 0, 0,
+            dirty_x0, dirty_y0, dirty_x1 - dirty_x0 + 1, dirty_y1 - dirty_y0 + 1);
+        dirty_x0 = dirty_y0 = Infinity;
+        dirty_x1 = dirty_y1 = -Infinity;
+    };
+
+    function text_cell(row, col) {
+        return ((text_row_offset + row - 1) % traits.height_in_chars) * traits.width_in_chars + col - 1;
+    }
+
     that._check_in_screen_range = function (row, col) {
         if (  row < 1
            || row > traits.height_in_chars - 1
@@ -92,29 +293,42 @@ function Screen(parent_document, parent_screen_container, available_screens) {
 
     that._scroll_screen_up = function () {
         /* Move contents */
-        var old_content_matrix = content_matrix;
-        content_matrix = {};
-        for (var i = 1; i <= traits.width_in_chars; i++) {
-            content_matrix[i] = {};
-            for (var j = 1; j + 1 <= traits.height_in_chars; j++) {
-                content_matrix[i][j] = old_content_matrix[i][j + 1];
-            }
-            content_matrix[i][traits.height_in_chars] = SCREEN_EMPTY;
-        }
-
-        /* Move graphics */
+        var width = traits.width_in_chars;
+        var first = text_row_offset * width;
+        text_cells.fill(SCREEN_EMPTY, first, first + width);
+        text_row_offset = (text_row_offset + 1) % traits.height_in_chars;
+
+        /* Move graphics: the canvas is up to date but for the dirty
+         * region, so move both the framebuffer and the canvas, leaving
+         * only the last row to present. */
+        that.present();
+        var moved = traits.total_height - traits.char_height;
+        framebuffer.copyWithin(0, traits.char_height * traits.total_width);
         context.drawImage(canvas,
-            0, traits.char_height, traits.total_width, traits.total_height - traits.char_height,
-            0, 0, traits.total_width, traits.total_height - traits.char_height
+            0, traits.char_height, traits.total_width, moved,
+            0, 0, traits.total_width, moved
         );
         /* Clear last row */
-        context.fillStyle = traits.palette[current_bg];
-        context.fillRect(0, traits.total_height - traits.char_height, traits.total_width, traits.char_height);
+        fill_rect(0, moved, traits.total_width - 1, traits.total_height - 1, current_bg);
     };
 
     that.at = function (row, col) {
         that._check_in_screen_range(row, col);
-        return content_matrix[col][row];
+        return text_cells[text_cell(row, col)] & 0xff;
+    };
+
+    /* Characters of the text plane, one string per row from the top (for
+     * runtime/headless.js). */
+    that.text_rows = function () {
+        var rows = [];
+        for (var j = 1; j <= traits.height_in_chars; j++) {
+            var row = '';
+            for (var i = 1; i <= traits.width_in_chars; i++) {
+                row += String.fromCharCode(text_cells[text_cell(j, i)] & 0xff);
+            }
+            rows.push(row);
+        }
+        return rows;
     };
 
     that._move_forward_one_char = function () {
@@ -164,20 +378,25 @@ function Screen(parent_document, parent_screen_container, available_screens) {
         parent_screen_container.appendChild(canvas);
         context = canvas.getContext('2d');
 
+        if (traits.glyph_atlas === null) {
+            traits.glyph_atlas = make_glyph_atlas(traits.font_data, traits.char_width, traits.char_height);
+            traits.rgba_palette = make_rgba_palette(traits.palette);
+        }
+        framebuffer = new Uint8Array(traits.total_width * traits.total_height);
+        text_cells = new Uint16Array(traits.width_in_chars * traits.height_in_chars);
+        image = context.createImageData(traits.total_width, traits.total_height);
+        image_pixels = new Uint32Array(image.data.buffer);
+        dirty_x0 = dirty_y0 = Infinity;
+        dirty_x1 = dirty_y1 = -Infinity;
+
         that.cls();
     };
 
     that.cls = function () {
-        context.fillStyle = traits.palette[current_bg];
-        context.fillRect(0, 0, traits.mult_x * traits.total_width, traits.mult_y * traits.total_height);
-
-        content_matrix = {};
-        for (var i = 1; i <= traits.width_in_chars; i++) {
-            content_matrix[i] = {}
-            for (var j = 1; j <= traits.height_in_chars; j++) {
-                content_matrix[i][j] = SCREEN_EMPTY;
-            }
-        }
+        fill_rect(0, 0, traits.total_width - 1, traits.total_height - 1, current_bg);
+
+        text_cells.fill(SCREEN_EMPTY);
+        text_row_offset = 0;
         current_col = 1;
         current_row = 1;
 
@@ -225,67 +444,335 @@ function Screen(parent_document, parent_screen_container, available_screens) {
         }
     };
 
-    that.put_pixel = function (x, y, real_color) {
-        var rx0 = traits.mult_x * x;
-        var ry0 = traits.mult_y * y;
-        context.beginPath();
-        context.rect(rx0, ry0, traits.mult_x, traits.mult_y);
-        context.fillStyle = real_color;
-        context.fill();
-    };
+    /* Graphics coordinates: the screen is graphics_width by
+     * graphics_height points of mult_x by mult_y framebuffer pixels.
+     * Drawing commands round their coordinates to whole points. */
 
-    that.line = function (x0, y0, x1, y1, color) {
-        var rx0 = traits.mult_x * x0;
-        var ry0 = traits.mult_y * y0;
-        var rx1 = traits.mult_x * x1;
-        var ry1 = traits.mult_y * y1;
-        for (var i = 0; i < traits.mult_x; i++) {
-            for (var j = 0; j < traits.mult_y; j++) {
-                context.beginPath();
-                context.moveTo(rx0 + i, ry0 + j);
-                context.lineTo(rx1 + i, ry1 + j);
-                context.closePath();
-                context.strokeStyle = traits.palette[color];
-                context.stroke();
+    function graphics_width() {
+        return traits.total_width / traits.mult_x;
+    }
+
+    function graphics_height() {
+        return traits.total_height / traits.mult_y;
+    }
+
+    /* Sets the point (x, y), if it is on the screen, without marking it
+     * dirty. */
+    function plot(x, y, color) {
+        if (x < 0 || y < 0 || x >= graphics_width() || y >= graphics_height()) {
+            return;
+        }
+        var k = traits.mult_y * y * traits.total_width + traits.mult_x * x;
+        for (var j = 0; j < traits.mult_y; j++) {
+            for (var i = 0; i < traits.mult_x; i++) {
+                framebuffer[k + i] = color;
+            }
+            k += traits.total_width;
+        }
+    }
+
+    /* Marks the points from (x0, y0) to (x1, y1) dirty. */
+    function mark_points_dirty(x0, y0, x1, y1) {
+        mark_dirty(
+            Math.max(traits.mult_x * Math.min(x0, x1), 0),
+            Math.max(traits.mult_y * Math.min(y0, y1), 0),
+            Math.min(traits.mult_x * (Math.max(x0, x1) + 1), traits.total_width) - 1,
+            Math.min(traits.mult_y * (Math.max(y0, y1) + 1), traits.total_height) - 1
+        );
+    }
+
+    /* Fills the points from (x0, y0) to (x1, y1), inclusive. */
+    function fill_points(x0, y0, x1, y1, color) {
+        fill_rect(
+            traits.mult_x * Math.min(x0, x1),
+            traits.mult_y * Math.min(y0, y1),
+            traits.mult_x * (Math.max(x0, x1) + 1) - 1,
+            traits.mult_y * (Math.max(y0, y1) + 1) - 1,
+            color
+        );
+    }
+
+    /* The range of steps of a Bresenham line, from 0 to steps, at which
+     * the coordinate start + sign * offset is on a screen of the given
+     * size; the offset moves len times over the steps. Empty if the first
+     * step is past the last. */
+    function clip_steps(start, sign, len, steps, size) {
+        var lo = Math.max(sign > 0 ? -start : start - size + 1, 0);
+        var hi = Math.min(sign > 0 ? size - 1 - start : start, len);
+        if (lo > hi) {
+            return [1, 0];
+        }
+        if (len == 0) {
+            return [0, steps];
+        }
+        return [
+            Math.max(Math.ceil((2 * lo - 1) * steps / (2 * len)), 0),
+            Math.min(Math.ceil((2 * hi + 1) * steps / (2 * len)) - 1, steps)
+        ];
+    }
+
+    /* How far a Bresenham line has moved along an axis it moves len times
+     * over its steps, after step t. */
+    function line_offset(len, steps, t) {
+        return len == steps ? t : Math.floor((2 * len * t + steps) / (2 * steps));
+    }
+
+    /* Bresenham's line, both ends included, clipped to the screen: the
+     * loop starts at the first step on the screen, with the error term it
+     * would have had there, and stops after the last. */
+    function plot_line(x0, y0, x1, y1, color) {
+        var dx = Math.abs(x1 - x0);
+        var dy = -Math.abs(y1 - y0);
+        var sx = x0 < x1 ? 1 : -1;
+        var sy = y0 < y1 ? 1 : -1;
+        var steps = Math.max(dx, -dy);
+        var x_steps = clip_steps(x0, sx, dx, steps, graphics_width());
+        var y_steps = clip_steps(y0, sy, -dy, steps, graphics_height());
+        var first = Math.max(x_steps[0], y_steps[0]);
+        var last = Math.min(x_steps[1], y_steps[1]);
+        if (first > last) {
+            return;
+        }
+        var nx = line_offset(dx, steps, first);
+        var ny = line_offset(-dy, steps, first);
+        var err = dx + dy + nx * dy + ny * dx;
+        var x = x0 + sx * nx;
+        var y = y0 + sy * ny;
+        mark_points_dirty(x, y, x0 + sx * line_offset(dx, steps, last), y0 + sy * line_offset(-dy, steps, last));
+        for (var t = first; ; t++) {
+            plot(x, y, color);
+            if (t == last) {
+                break;
+            }
+            var e2 = 2 * err;
+            if (e2 >= dy) {
+                err += dy;
+                x += sx;
+            }
+            if (e2 <= dx) {
+                err += dx;
+                y += sy;
             }
         }
+    }
+
+    /* The least offset o >= d, or the greatest o <= d if down, for which
+     * c + o or c - o is on a screen of the given size; an infinity if
+     * there is none. */
+    function nearest_visible_offset(c, d, size, down) {
+        var best = down ? -Infinity : Infinity;
+        var ranges = [[-c, size - 1 - c], [c - size + 1, c]];
+        for (var i = 0; i < ranges.length; i++) {
+            var lo = ranges[i][0];
+            var hi = ranges[i][1];
+            var o = down ? Math.min(hi, d) : Math.max(lo, d);
+            if (o >= lo && o <= hi && (down ? o > best : o < best)) {
+                best = o;
+            }
+        }
+        return best;
+    }
+
+    that.put_pixel = function (x, y, color) {
+        x = Math.round(x);
+        y = Math.round(y);
+        plot(x, y, color);
+        mark_points_dirty(x, y, x, y);
+    };
+
+    that.line = function (x0, y0, x1, y1, color) {
+        plot_line(Math.round(x0), Math.round(y0), Math.round(x1), Math.round(y1), color);
     };
 
     that.rectangle = function (x0, y0, x1, y1, color, isFull) {
-        var rx0 = traits.mult_x * x0;
-        var ry0 = traits.mult_y * y0;
-        var rx1 = traits.mult_x * x1;
-        var ry1 = traits.mult_y * y1;
-
-        for (var i = 0; i < traits.mult_x; i++) {
-            for (var j = 0; j < traits.mult_y; j++) {
-                context.beginPath();
-                context.rect(x0 + i, y0 + j, x1 + i, y1 + j);
-                context.closePath();
-                if (isFull) {
-                    context.fillStyle = traits.palette[color];
-                    context.fill();
+        x0 = Math.round(x0);
+        y0 = Math.round(y0);
+        x1 = Math.round(x1);
+        y1 = Math.round(y1);
+        if (isFull) {
+            fill_points(x0, y0, x1, y1, color);
+        } else {
+            fill_points(x0, y0, x1, y0, color);
+            fill_points(x0, y1, x1, y1, color);
+            fill_points(x0, y0, x0, y1, color);
+            fill_points(x1, y0, x1, y1, color);
+        }
+    };
+
+    /* Default ratio of the vertical to the horizontal radius of CIRCLE,
+     * for circles to look round on a 4:3 display. */
+    that.default_aspect = function () {
+        return 4 / 3 * graphics_height() / graphics_width();
+    };
+
+    /* Arc of the ellipse centered at (x, y) with the given radius along
+     * its longer axis, from angle start to angle end (radians, counter
+     * clockwise from the positive x axis). A negative angle also draws a
+     * line from the center to that end of the arc. */
+    that.circle = function (x, y, radius, color, start, end, aspect) {
+        x = Math.round(x);
+        y = Math.round(y);
+        var rx, ry;
+        if (aspect <= 1) {
+            rx = Math.round(radius);
+            ry = Math.round(radius * aspect);
+        } else {
+            rx = Math.round(radius / aspect);
+            ry = Math.round(radius);
+        }
+
+        var start_line = start < 0;
+        var end_line = end < 0;
+        start = Math.abs(start);
+        end = Math.abs(end);
+        var whole = end - start >= 2 * Math.PI || (start == 0 && end == 2 * Math.PI);
+        if (rx == 0 || ry == 0) {
+            plot_line(x - rx, y - ry, x + rx, y + ry, color);
+            return;
+        }
+
+        function plot_arc(dx, dy) {
+            if (!whole) {
+                /* Angle of the point on the circle the ellipse is squashed from. */
+                var angle = Math.atan2(-dy * rx, dx * ry);
+                if (angle < 0) {
+                    angle += 2 * Math.PI;
+                }
+                if (start <= end ? (angle < start || angle > end) : (angle < start && angle > end)) {
+                    return;
                 }
-                context.strokeStyle = traits.palette[color];
-                context.stroke();
             }
+            plot(x + dx, y + dy, color);
+        }
+
+        function plot_quadrants(dx, dy) {
+            plot_arc(dx, dy);
+            if (dx != 0) {
+                plot_arc(-dx, dy);
+            }
+            if (dy != 0) {
+                plot_arc(dx, -dy);
+                if (dx != 0) {
+                    plot_arc(-dx, -dy);
+                }
+            }
+        }
+
+        /* Midpoint ellipse: the region where the slope is above -1, then
+         * the rest, in the first quadrant. The decision variable is
+         * f(dx + 1, dy - 1/2) in the first region and f(dx + 1/2, dy - 1)
+         * in the second, so the loops can jump over columns and rows with
+         * no point on the screen. */
+        var rx2 = rx * rx;
+        var ry2 = ry * ry;
+        var gw = graphics_width();
+        var gh = graphics_height();
+
+        function f(px, py) {
+            return ry2 * px * px + rx2 * py * py - rx2 * ry2;
+        }
+
+        /* The dy the first region plots in column k. */
+        function region1_dy(k) {
+            var m = Math.ceil(ry * Math.sqrt(Math.max(1 - k * k / rx2, 0)) - 0.5);
+            while (m > 0 && f(k, m - 0.5) >= 0) {
+                m--;
+            }
+            while (f(k, m + 0.5) < 0) {
+                m++;
+            }
+            return m;
+        }
+
+        /* The dx the second region plots in row k, once it has caught up
+         * with the ellipse. */
+        function region2_dx(k) {
+            var m = Math.ceil(rx * Math.sqrt(Math.max(1 - k * k / ry2, 0)) - 0.5);
+            while (m > 0 && f(m - 0.5, k) > 0) {
+                m--;
+            }
+            while (f(m + 0.5, k) <= 0) {
+                m++;
+            }
+            return m;
+        }
+
+        function past_region1(k) {
+            return ry2 * k > rx2 * region1_dy(k);
         }
-    };
 
-    that.circle = function (x, y, radius, color, start, end) {
-        var rx = traits.mult_x * x;
-        var ry = traits.mult_y * y;
-        var rradius = traits.mult_x * radius;
-        for (var i = 0; i < traits.mult_x; i++) {
-            for (var j = 0; j < traits.mult_y; j++) {
-                /* start and end are from 0 to 2 * Math.PI */
-                context.beginPath();
-                context.arc(rx + i, ry + j, rradius, start, end);
-                context.closePath();
-                context.strokeStyle = traits.palette[color];
-                context.stroke();
+        var visible = x + rx >= 0 && x - rx < gw && y + ry >= 0 && y - ry < gh;
+        var dx = 0;
+        var dy = ry;
+        var d = ry2 - rx2 * ry + rx2 / 4;
+        while (visible && ry2 * dx <= rx2 * dy) {
+            var next = nearest_visible_offset(x, dx, gw, false);
+            if (next > dx) {
+                /* Jump to the next column on the screen, or to the end of
+                 * the region if that comes first. */
+                var lo = dx;
+                var hi = Math.min(next, rx);
+                if (past_region1(hi)) {
+                    while (hi - lo > 1) {
+                        var mid = Math.floor((lo + hi) / 2);
+                        if (past_region1(mid)) {
+                            hi = mid;
+                        } else {
+                            lo = mid;
+                        }
+                    }
+                }
+                dx = hi;
+                dy = region1_dy(dx);
+                d = f(dx + 1, dy - 0.5);
+                continue;
+            }
+            plot_quadrants(dx, dy);
+            if (d < 0) {
+                d += ry2 * (2 * dx + 3);
+            } else {
+                d += ry2 * (2 * dx + 3) + rx2 * (2 - 2 * dy);
+                dy--;
+            }
+            dx++;
+        }
+        d = f(dx + 0.5, dy - 1);
+        while (visible && dy >= 0) {
+            var next_row = nearest_visible_offset(y, dy, gh, true);
+            if (next_row < dy && dx >= region2_dx(dy)) {
+                if (next_row < 0) {
+                    break;
+                }
+                dy = next_row;
+                dx = Math.max(dx, region2_dx(dy));
+                d = f(dx + 0.5, dy - 1);
+                continue;
             }
+            plot_quadrants(dx, dy);
+            if (d > 0) {
+                d += rx2 * (3 - 2 * dy);
+            } else {
+                d += ry2 * (2 * dx + 2) + rx2 * (3 - 2 * dy);
+                dx++;
+            }
+            dy--;
+        }
+        if (visible) {
+            mark_points_dirty(Math.max(x - rx, 0), Math.max(y - ry, 0), Math.min(x + rx, gw - 1), Math.min(y + ry, gh - 1));
         }
+
+        if (start_line) {
+            plot_line(x, y, x + Math.round(rx * Math.cos(start)), y - Math.round(ry * Math.sin(start)), color);
+        }
+        if (end_line) {
+            plot_line(x, y, x + Math.round(rx * Math.cos(end)), y - Math.round(ry * Math.sin(end)), color);
+        }
+    };
+
+    /* Hits, misses and evictions of the glyph cache, for tuning
+     * GLYPH_CACHE_SIZE. */
+    that.glyph_cache_stats = function () {
+        return glyph_cache.stats();
     };
 
     that.current_row = function () {
@@ -330,27 +817,14 @@ function Screen(parent_document, parent_screen_container, available_screens) {
         var x0 = box[0]; var y0 = box[1];
         var x1 = box[2]; var y1 = box[3];
         that._cursor_previous_contents = [];
-        for (var i = x0; i <= x1; i++) {
-            var lst = [];
-            for (var j = y0; j <= y1; j++) {
-                lst.push(context.getImageData(i, j, 1, 1).data);
-                that.put_pixel(i, j, traits.palette[current_fg]);
-            }
-            that._cursor_previous_contents.push(lst);
+        for (var j = y0; j <= y1; j++) {
+            var row = j * traits.total_width;
+            that._cursor_previous_contents.push(framebuffer.slice(row + x0, row + x1 + 1));
         }
+        fill_rect(x0, y0, x1, y1, current_fg);
         that._cursor_visible = true;
     };
 
-    function rgb_hex(pix) {
-        var r = pix[0].toString(16);
-        var g = pix[1].toString(16);
-        var b = pix[2].toString(16);
-        r = (r.length == 1) ? ('0' + r) : r;
-        g = (g.length == 1) ? ('0' + g) : g;
-        b = (b.length == 1) ? ('0' + b) : b;
-        return '#' + r + g + b;
-    }
-
     that.cursor_hide = function () {
         if (!that._cursor_visible) {
             return;
@@ -358,13 +832,10 @@ function Screen(parent_document, parent_screen_container, available_screens) {
         var box = that._cursor_box();
         var x0 = box[0]; var y0 = box[1];
         var x1 = box[2]; var y1 = box[3];
-        for (var i = x0; i <= x1; i++) {
-            for (var j = y0; j <= y1; j++) {
-                var pix = that._cursor_previous_contents[i - x0][j - y0];
-                var col = rgb_hex(pix);
-                that.put_pixel(i, j, col);
-            }
+        for (var j = y0; j <= y1; j++) {
+            framebuffer.set(that._cursor_previous_contents[j - y0], j * traits.total_width + x0);
         }
+        mark_dirty(x0, y0, x1, y1);
         that._cursor_visible = false;
     };
 
@@ -395,7 +866,7 @@ function Screen(parent_document, parent_screen_container, available_screens) {
     var current_draw_x, current_draw_y, current_draw_color;
 
     that.preset = function (x, y, color) {
-        that.put_pixel(x, y, traits.palette[Math.floor(color)]);
+        that.put_pixel(x, y, Math.floor(color));
         current_draw_x = x;
         current_draw_y = y;
         current_draw_color = color;
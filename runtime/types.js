@@ -62,6 +62,12 @@ function TypeFuncDomain(types) {
         return true;
     };
 
+    /* Types of the arguments of calls with n of them, or null if n is
+     * not a valid number of arguments. */
+    that.domain = function (n) {
+        return n == types.length ? types : null;
+    };
+
     that.description = function () {
         var res = '';
         for (var i = 0; i < types.length; i++) {
@@ -94,6 +100,16 @@ function TypeFuncDomainOptional(types, optional_domain_type) {
             || optional_domain_type.match(remaining_args);
     };
 
+    that.domain = function (n) {
+        if (n < types.length) {
+            return null;
+        } else if (n == types.length) {
+            return types;
+        }
+        var optional = optional_domain_type.domain(n - types.length);
+        return optional === null ? null : types.concat(optional);
+    };
+
     that.description = function () {
         var res = '';
         for (var i = 0; i < types.length; i++) {
@@ -1,353 +1,704 @@
 
-var VM_OK = 1;          /* for opcodes that perform computations */
-var VM_IO = 2;          /* for opcodes that perform I/O */
+/* Results of the primitives (and of the compiled blocks of lang/aot.py). */
+var VM_OK = 1;          /* for computations */
+var VM_IO = 2;          /* for I/O */
 var VM_EXIT = 3;        /* for SYSTEM, END, etc. */
-var VM_JUMP = 4;        /* for conditional and unconditional jumps */
-var VM_SLEEP = 5;       /* for sleeping a given amount of time */
-var VM_INPUT = 6;       /* for reading a string */
+var VM_SLEEP = 4;       /* for sleeping a given amount of time */
+var VM_INPUT = 5;       /* for reading a string */
 
-function OpPushConstant(constant) {
-    var that = this;
-    that.run = function (state) {
-        state.stack.push(constant);
-        return VM_OK;
-    };
+var SLICE_LENGTH = 1024; /* opcodes run between checks of the clock and the timer */
+var FRAME_BUDGET = 12;   /* milliseconds of work before yielding to the browser */
+
+/* Milliseconds, for measuring time slices. */
+var clock = (typeof performance !== 'undefined' && performance.now)
+    ? function () { return performance.now(); }
+    : function () { return new Date().getTime(); };
+
+/* Variable and array access, shared by the interpreter (VirtualMachine)
+ * and by the code of the ahead-of-time backend (lang/aot.py).
+ *
+ * Variables are numbered by the compiler: each has a slot in the frame
+ * of the running routine (state.locals) and, if it is SHARED, one in
+ * state.shared. A frame slot is unbound while it is undefined. */
+
+/* Frames are filled up front, so that the engine keeps them as packed
+ * arrays. */
+function new_frame(size) {
+    var frame = [];
+    for (var i = 0; i < size; i++) {
+        frame.push(undefined);
+    }
+    return frame;
 }
 
-function OpPushRetval(variable) {
-    var that = this;
-    that.run = function (state) {
-        var address = state.stack.pop();
-        state.stack.push(state.locals[variable]);
-        state.stack.push(address);
-        return VM_OK;
-    };
+function get_ref(state, variable) {
+    var value = state.locals[variable];
+    if (value !== undefined) {
+        return value;
+    } else if (state.shared_slots[variable]) {
+        return state.shared[variable];
+    } else {
+        /*throw new Exception('Unbound variable: ' + variable);*/
+        return 0;
+    }
+}
+
+function set_ref(state, variable, value) {
+    if (state.shared_slots[variable]) {
+        state.shared[variable] = value;
+    } else {
+        state.locals[variable] = value;
+    }
 }
 
-function OpSetArrayRef(variable) {
+/* Arrays, as created by DIM (see _MKARRAY in builtins.js): the elements
+ * are stored in row-major order in a flat array, typed after the suffix
+ * of the name. bounds holds the lower and the upper bound of each
+ * dimension. */
+var MAX_ARRAY_DIMENSIONS = 8;
+
+function BasicArray(value, suffix, bounds) {
     var that = this;
-    that.run = function (state) {
-        var value = state.stack.pop();
-        var index = state.stack.pop();
-        var arr;
-        if (variable in state.shared_names) {
-            arr = state.shared[variable];
-        } else if (variable in state.locals) {
-            arr = state.locals[variable];
-        } else {
-            throw new Exception('Unbound array: ' + variable);
+
+    that.dimensions = bounds.length / 2;
+    that.lower = [];
+    that.extents = [];
+    that.strides = [];
+    var size = 1;
+    for (var i = that.dimensions - 1; i >= 0; i--) {
+        var lower = Math.floor(bounds[2 * i]);
+        var extent = Math.max(Math.floor(bounds[2 * i + 1]) - lower + 1, 0);
+        that.lower.unshift(lower);
+        that.extents.unshift(extent);
+        that.strides.unshift(size);
+        size *= extent;
+    }
+    that.size = size;
+    that.element = typeof value;
+    /* Whether stores round to the nearest integer, as QBasic does, and
+     * the range of the integers, outside of which they overflow. */
+    that.integer = suffix == '%' || suffix == '&';
+    that.min = 0;
+    that.max = 0;
+
+    if (suffix == '%') {
+        that.data = new Int16Array(size);
+        that.min = -32768;
+        that.max = 32767;
+    } else if (suffix == '&') {
+        that.data = new Int32Array(size);
+        that.min = -2147483648;
+        that.max = 2147483647;
+    } else if (suffix == '!') {
+        that.data = new Float32Array(size);
+    } else if (that.element == 'number') {
+        /* Unsuffixed numbers are SINGLE in QBasic, but doubles in the
+         * VM: keep them exact. */
+        that.data = new Float64Array(size);
+    } else {
+        that.data = [];
+        for (var i = 0; i < size; i++) {
+            that.data.push(value);
         }
-        if (!(index in arr)) {
-            throw new Exception('Array index out of bounds, setting array ' + arr + ' at index: ' + index);
+    }
+    if (value !== 0 && that.element == 'number') {
+        for (var i = 0; i < size; i++) {
+            that.data[i] = value;
         }
-        arr[index] = value;
-        return VM_OK;
+    }
+
+    that.toString = function () {
+        return Array.prototype.join.call(that.data, ',');
     };
 }
 
-function OpSetRef(variable) {
-    var that = this;
-    that.run = function (state) {
-        var value = state.stack.pop();
-        if (variable in state.shared_names) {
-            state.shared[variable] = value;
-        } else {
-            state.locals[variable] = value;
-        }
-        return VM_OK;
-    };
+function find_array(state, variable) {
+    var arr = state.locals[variable];
+    if (arr !== undefined) {
+        return arr;
+    } else if (state.shared_slots[variable]) {
+        return state.shared[variable];
+    }
+    throw new Exception('Unbound variable: ' + state.variable_names[variable]);
 }
 
-function OpGetRef(variable) {
-    var that = this;
-    that.run = function (state) {
-        if (variable in state.locals) {
-            var value = state.locals[variable];
-            state.stack.push(value);
-            return VM_OK;
-        } else if (variable in state.shared_names) {
-            var value = state.shared[variable];
-            state.stack.push(value);
-            return VM_OK;
-        } else {
-            /*throw new Exception('Unbound variable: ' + variable);*/
-            state.stack.push(0);
-            return VM_OK;
-        }
-    };
+function array_index_error(state, variable, action, index) {
+    return new Exception('Array index out of bounds ' + action + ' array: ' + state.variable_names[variable] + ' at index: ' + index);
 }
 
-function OpMidAssign(variable, right_index) {
-    var that = this;
-    that.run = function (state) {
-        var orig, lower, repl_length, upper, replace;
-        if (variable in state.locals) {
-            orig = state.locals[variable];
-        } else {
-            orig = state.shared[variable];
-        }
+function array_dimensions_error(state, variable, action) {
+    return new Exception('Wrong number of dimensions ' + action + ' array: ' + state.variable_names[variable]);
+}
 
-        replace = state.stack.pop();
-        if (right_index) {
-            repl_length = state.stack.pop();
-        } else {
-            repl_length = null;
-        }
-        lower = state.stack.pop() - 1;
+/* Offset of an element of a one-dimensional array. k >>> 0 === k only for
+ * the integers from 0 to 2^32 - 1, so the bounds check is one
+ * comparison more. */
+function array_offset(state, arr, variable, index, action) {
+    var k = index - arr.lower[0];
+    if ((k >>> 0) !== k || k >= arr.size || arr.dimensions !== 1) {
+        throw arr.dimensions !== 1
+            ? array_dimensions_error(state, variable, action)
+            : array_index_error(state, variable, action, index);
+    }
+    return k;
+}
 
-        if (repl_length === null) {
-            upper = orig.length;
-        } else {
-            upper = lower + repl_length;
+/* Offset of an element of an array indexed by the top nargs values of the
+ * stack, popping them. */
+function array_offset_n(state, arr, variable, nargs, action) {
+    if (arr.dimensions !== nargs) {
+        throw array_dimensions_error(state, variable, action);
+    }
+    var offset = 0;
+    for (var i = nargs - 1; i >= 0; i--) {
+        var index = state.stack.pop();
+        var k = index - arr.lower[i];
+        if ((k >>> 0) !== k || k >= arr.extents[i]) {
+            throw array_index_error(state, variable, action, index);
         }
+        offset += k * arr.strides[i];
+    }
+    return offset;
+}
 
-        var new_value =
-            orig.substring(0, lower) +
-            replace +
-            orig.substring(upper, orig.length);
+/* Nearest integer, and the even one for halves, as QBasic rounds. */
+function round_half_even(x) {
+    var r = Math.round(x);
+    if (r - x === 0.5 && r % 2 !== 0) {
+        r--;
+    }
+    return r;
+}
 
-        if (variable in state.locals) {
-            state.locals[variable] = new_value;
-        } else {
-            state.shared[variable] = new_value;
+function store_element(state, arr, variable, k, value) {
+    if (typeof value !== arr.element) {
+        throw new Exception('Type mismatch setting array: ' + state.variable_names[variable]);
+    }
+    if (arr.integer) {
+        value = round_half_even(value);
+        if (value < arr.min || value > arr.max) {
+            throw new Exception('Overflow setting array: ' + state.variable_names[variable]);
         }
-        return VM_OK;
-    };
+    }
+    arr.data[k] = value;
 }
 
-function OpMidArrayAssign(variable, right_index) {
-    var that = this;
-    that.run = function (state) {
-        var arr, orig, index, lower, repl_length, upper, replace;
-        if (variable in state.locals) {
-            arr = state.locals[variable];
-        } else {
-            arr = state.shared[variable];
-        }
+function get_array_ref(state, variable, index) {
+    var arr = find_array(state, variable);
+    return arr.data[array_offset(state, arr, variable, index, 'reading')];
+}
 
-        replace = state.stack.pop();
-        if (right_index) {
-            repl_length = state.stack.pop();
-        } else {
-            repl_length = null;
-        }
-        lower = state.stack.pop() - 1;
-        index = state.stack.pop();
-        if (!(index in arr)) {
-            throw new Exception('Array index out of bounds setting MID$ of array ' + arr + ' at index: ' + index);
-        }
-        orig = arr[index];
+function get_array_ref_n(state, variable, nargs) {
+    var arr = find_array(state, variable);
+    return arr.data[array_offset_n(state, arr, variable, nargs, 'reading')];
+}
 
-        if (repl_length === null) {
-            upper = orig.length;
-        } else {
-            upper = lower + repl_length;
-        }
+function set_array_ref(state, variable, index, value) {
+    var arr = find_array(state, variable);
+    store_element(state, arr, variable, array_offset(state, arr, variable, index, 'setting'), value);
+}
 
-        var new_value =
-            orig.substring(0, lower) +
-            replace +
-            orig.substring(upper, orig.length);
+function set_array_ref_n(state, variable, nargs, value) {
+    var arr = find_array(state, variable);
+    store_element(state, arr, variable, array_offset_n(state, arr, variable, nargs, 'setting'), value);
+}
 
-        arr[index] = new_value;
-        return VM_OK;
-    };
+function mid_replace(orig, lower, repl_length, replace) {
+    var upper;
+    if (repl_length === null) {
+        upper = orig.length;
+    } else {
+        upper = lower + repl_length;
+    }
+    return orig.substring(0, lower) + replace + orig.substring(upper, orig.length);
 }
 
+function mid_assign(state, variable, lower, repl_length, replace) {
+    if (state.locals[variable] !== undefined) {
+        state.locals[variable] = mid_replace(state.locals[variable], lower, repl_length, replace);
+    } else {
+        state.shared[variable] = mid_replace(state.shared[variable], lower, repl_length, replace);
+    }
+}
 
-function OpGetArrayRef(variable, nargs) {
-    var that = this;
-    that.run = function (state) {
-        var args = [];
-        for (var i = 0; i < nargs; i++) {
-            args.push(state.stack.pop());
-        }
-        if (variable in state.locals) {
-            var arr = state.locals[variable];
-            if (!(args[0] in arr)) {
-                throw new Exception('Array index out of bounds reading local array: ' + variable + ' at index: ' + args[0]);
-            }
-            var value = arr[args[0]];
-            state.stack.push(value);
-            return VM_OK;
-        } else if (variable in state.shared_names) {
-            var arr = state.shared[variable];
-            if (!(args[0] in arr)) {
-                throw new Exception('Array index out of bounds reading global array: ' + variable + ' at index: ' + args[0]);
-            }
-            var value = arr[args[0]];
-            state.stack.push(value);
-            return VM_OK;
-        } else {
-            throw new Exception('Unbound variable: ' + variable);
-        }
-    };
+function mid_array_assign(state, variable, index, lower, repl_length, replace) {
+    var arr = find_array(state, variable);
+    var k = array_offset(state, arr, variable, index, 'setting MID$ of');
+    store_element(state, arr, variable, k, mid_replace(arr.data[k], lower, repl_length, replace));
 }
 
-function OpWaitIO(constant) {
-    var that = this;
-    that.run = function (state) {
-        return VM_IO;
-    };
+function mid_array_assign_n(state, variable, nargs, lower, repl_length, replace) {
+    var arr = find_array(state, variable);
+    var k = array_offset_n(state, arr, variable, nargs, 'setting MID$ of');
+    store_element(state, arr, variable, k, mid_replace(arr.data[k], lower, repl_length, replace));
 }
 
-function call_primitive(state, primitive_name, nargs) {
-    var args = []
-    for (var i = 0; i < nargs; i++) {
-        args.unshift(state.stack.pop());
+/* Calls the entry point of a primitive (see primitive_entry_point) with
+ * the top nargs values of the stack, popping them. */
+function call_primitive(state, entry, nargs) {
+    var stack = state.stack;
+    var a, b, c, d, e, f, g;
+    switch (nargs) {
+    case 0:
+        return entry(state);
+    case 1:
+        a = stack.pop();
+        return entry(state, a);
+    case 2:
+        b = stack.pop();
+        a = stack.pop();
+        return entry(state, a, b);
+    case 3:
+        c = stack.pop();
+        b = stack.pop();
+        a = stack.pop();
+        return entry(state, a, b, c);
+    case 4:
+        d = stack.pop();
+        c = stack.pop();
+        b = stack.pop();
+        a = stack.pop();
+        return entry(state, a, b, c, d);
+    case 5:
+        e = stack.pop();
+        d = stack.pop();
+        c = stack.pop();
+        b = stack.pop();
+        a = stack.pop();
+        return entry(state, a, b, c, d, e);
+    case 6:
+        f = stack.pop();
+        e = stack.pop();
+        d = stack.pop();
+        c = stack.pop();
+        b = stack.pop();
+        a = stack.pop();
+        return entry(state, a, b, c, d, e, f);
+    case 7:
+        g = stack.pop();
+        f = stack.pop();
+        e = stack.pop();
+        d = stack.pop();
+        c = stack.pop();
+        b = stack.pop();
+        a = stack.pop();
+        return entry(state, a, b, c, d, e, f, g);
+    default:
+        var args = stack.splice(stack.length - nargs, nargs);
+        args.unshift(state);
+        return entry.apply(null, args);
     }
-    if (primitive_name in state.primitives) {
-        state.context.current_primitive = primitive_name; 
-        return state.primitives[primitive_name](state, args);
+}
+
+/* Frames have a slot for every variable of the program, so that ON TIMER
+ * code running inside a SUB sees its frame; instead of allocating one on
+ * every call, the frames of the routines that returned are cleared and
+ * kept in state.free_frames for the next calls. */
+function enter(state, local_names) {
+    state.environment.push(state.locals);
+    if (state.free_frames.length > 0) {
+        state.locals = state.free_frames.pop();
     } else {
-        throw new Exception('Unknown primitive: ' + primitive_name);
+        state.locals = new_frame(state.variable_names.length);
     }
+    var address = state.stack.pop();
+    if (state.stack.length < local_names.length) {
+        throw new Exception("Too few arguments.");
+    }
+    for (var i = local_names.length; i > 0; i--) {
+        state.locals[local_names[i - 1]] = state.stack.pop();
+    }
+    state.stack.push(address);
+}
+
+function leave(state) {
+    var frame = state.locals;
+    state.locals = state.environment.pop();
+    frame.fill(undefined);
+    state.free_frames.push(frame);
+}
+
+/* Opcode numbers (see lang/bytecode.py, which must list them in the
+ * same order). */
+var OP_PUSH_CONSTANT = 0;
+var OP_PUSH_RETVAL = 1;
+var OP_SET_ARRAY_REF = 2;
+var OP_SET_REF = 3;
+var OP_GET_REF = 4;
+var OP_MID_ASSIGN = 5;
+var OP_MID_ARRAY_ASSIGN = 6;
+var OP_GET_ARRAY_REF = 7;
+var OP_WAIT_IO = 8;
+var OP_CALL_PRIMITIVE_STATEMENT = 9;
+var OP_CALL_PRIMITIVE_FUNCTION = 10;
+var OP_SET_REF_CONSTANT = 11;
+var OP_GET_ARRAY_REF_CONSTANT = 12;
+var OP_CALL_PRIMITIVE_REF_CONSTANT = 13;
+var OP_CALL_PRIMITIVE_REF_REF = 14;
+var OP_JUMP_IF_FALSE_REF_CONSTANT = 15;
+var OP_JUMP = 16;
+var OP_JUMP_IF_FALSE = 17;
+var OP_GOSUB = 18;
+var OP_RETURN = 19;
+var OP_ENTER = 20;
+var OP_LEAVE = 21;
+var OP_FOR_START = 22;
+var OP_FOR_CHECK = 23;
+var OP_FOR_NEXT = 24;
+
+/* Number of operands of each opcode, by number. */
+var OPCODE_ARITY = [1, 1, 2, 1, 1, 2, 3, 2, 1, 2, 2, 2, 2, 3, 3, 4, 1, 1, 1, 0, 1, 0, 3, 4, 3];
+var MAX_OPERANDS = 4;
+
+/* Instructions as the compiler writes them (new OpX(...)). They are only
+ * read once, by Program, which flattens them for the interpreter. */
+
+function OpPushConstant(constant) {
+    this.opcode = OP_PUSH_CONSTANT;
+    this.operands = [constant];
+}
+
+function OpPushRetval(variable) {
+    this.opcode = OP_PUSH_RETVAL;
+    this.operands = [variable];
+}
+
+function OpSetArrayRef(variable, nargs) {
+    this.opcode = OP_SET_ARRAY_REF;
+    this.operands = [variable, nargs];
+}
+
+function OpSetRef(variable) {
+    this.opcode = OP_SET_REF;
+    this.operands = [variable];
+}
+
+function OpGetRef(variable) {
+    this.opcode = OP_GET_REF;
+    this.operands = [variable];
+}
+
+function OpMidAssign(variable, right_index) {
+    this.opcode = OP_MID_ASSIGN;
+    this.operands = [variable, right_index];
+}
+
+function OpMidArrayAssign(variable, right_index, nargs) {
+    this.opcode = OP_MID_ARRAY_ASSIGN;
+    this.operands = [variable, right_index, nargs];
+}
+
+function OpGetArrayRef(variable, nargs) {
+    this.opcode = OP_GET_ARRAY_REF;
+    this.operands = [variable, nargs];
+}
+
+function OpWaitIO(constant) {
+    this.opcode = OP_WAIT_IO;
+    this.operands = [constant];
 }
 
 function OpCallPrimitiveStatement(primitive_name, nargs) {
-    var that = this;
-    that.run = function (state) {
-        return call_primitive(state, primitive_name, nargs);
-    };
+    this.opcode = OP_CALL_PRIMITIVE_STATEMENT;
+    this.operands = [primitive_name, nargs];
 }
 
 function OpCallPrimitiveFunction(primitive_name, nargs) {
-    var that = this;
-    that.run = function (state) {
-        var result = call_primitive(state, primitive_name, nargs);
-        state.stack.push(result);
-        return VM_IO;
-    };
+    this.opcode = OP_CALL_PRIMITIVE_FUNCTION;
+    this.operands = [primitive_name, nargs];
+}
+
+/* Superinstructions (see lang/fusion.py): each of them does the same as
+ * the sequence of opcodes it replaces, without going through the stack. */
+
+function OpSetRefConstant(variable, constant) {
+    this.opcode = OP_SET_REF_CONSTANT;
+    this.operands = [variable, constant];
+}
+
+function OpGetArrayRefConstant(variable, index) {
+    this.opcode = OP_GET_ARRAY_REF_CONSTANT;
+    this.operands = [variable, index];
+}
+
+function OpCallPrimitiveRefConstant(variable, constant, primitive_name) {
+    this.opcode = OP_CALL_PRIMITIVE_REF_CONSTANT;
+    this.operands = [variable, constant, primitive_name];
+}
+
+function OpCallPrimitiveRefRef(variable1, variable2, primitive_name) {
+    this.opcode = OP_CALL_PRIMITIVE_REF_REF;
+    this.operands = [variable1, variable2, primitive_name];
+}
+
+function OpJumpIfFalseRefConstant(variable, constant, primitive_name, address) {
+    this.opcode = OP_JUMP_IF_FALSE_REF_CONSTANT;
+    this.operands = [variable, constant, primitive_name, address];
 }
 
 function OpJump(address) {
-    var that = this;
-    that.run = function (state) {
-        state.ip = address;
-        return VM_JUMP;
-    };
+    this.opcode = OP_JUMP;
+    this.operands = [address];
 }
 
 function OpJumpIfFalse(address) {
-    var that = this;
-    that.run = function (state) {
-        var condition = state.stack.pop();
-        if (condition == 0) {
-            state.ip = address;
-            return VM_JUMP;
-        } else {
-            return VM_OK;
-        }
-    };
+    this.opcode = OP_JUMP_IF_FALSE;
+    this.operands = [address];
 }
 
 function OpGosub(address) {
-    var that = this;
-    that.run = function (state) {
-        state.stack.push(state.ip + 1);
-        state.ip = address;
-        return VM_JUMP;
-    };
+    this.opcode = OP_GOSUB;
+    this.operands = [address];
 }
 
 function OpReturn() {
-    var that = this;
-    that.run = function (state) {
-        if (state.stack.length == 0) {
-            throw new Exception('RETURN without GOSUB');
-        }
-        state.ip = state.stack.pop();
-        return VM_JUMP;
-    };
+    this.opcode = OP_RETURN;
+    this.operands = [];
 }
 
 function OpEnter(local_names) {
-    var that = this;
-    that.run = function (state) {
-        state.environment.push(state.locals);
-        state.locals = {};
-        var address = state.stack.pop();
-        if (state.stack.length < local_names.length) {
-            throw new Exception("Too few arguments.");
-        }
-        for (var i = local_names.length; i > 0; i--) {
-            state.locals[local_names[i - 1]] = state.stack.pop();
-        }
-        state.stack.push(address);
-        return VM_OK;
-    };
+    this.opcode = OP_ENTER;
+    this.operands = [local_names];
 }
 
 function OpLeave() {
-    var that = this;
-    that.run = function (state) {
-        state.locals = state.environment.pop();
-        return VM_OK;
-    };
+    this.opcode = OP_LEAVE;
+    this.operands = [];
 }
 
 function OpForStart(index, index_upper, index_step) {
-    var that = this;
-    that.run = function (state) {
-        state.locals[index_step] = state.stack.pop();
-        state.locals[index_upper] = state.stack.pop();
-        state.locals[index] = state.stack.pop(); /* lower */
-        return VM_OK;
-    };
+    this.opcode = OP_FOR_START;
+    this.operands = [index, index_upper, index_step];
 }
 
 function OpForCheck(index, index_upper, index_step, end_address) {
+    this.opcode = OP_FOR_CHECK;
+    this.operands = [index, index_upper, index_step, end_address];
+}
+
+function OpForNext(index, index_step, start_address) {
+    this.opcode = OP_FOR_NEXT;
+    this.operands = [index, index_step, start_address];
+}
+
+
+/* The program as the interpreter runs it: opcodes[ip] is the opcode number
+ * of instruction ip, and its operands are operands[ip * MAX_OPERANDS] and
+ * on. */
+function Program(ops) {
     var that = this;
-    that.run = function (state) {
-        var upper = state.locals[index_upper];
-        var step = state.locals[index_step];
-        var current = state.locals[index];
-        var should_stop;
-        if (step > 0) {
-            should_stop = current > upper;
-        } else {
-            should_stop = current < upper;
-        }
-        if (should_stop) {
-            state.ip = end_address;
-            return VM_JUMP;
-        } else {
-            return VM_OK;
+    that.opcodes = new Uint8Array(ops.length);
+    that.operands = new_operands(ops.length);
+    for (var ip = 0; ip < ops.length; ip++) {
+        that.opcodes[ip] = ops[ip].opcode;
+        for (var i = 0; i < ops[ip].operands.length; i++) {
+            that.operands[ip * MAX_OPERANDS + i] = ops[ip].operands[i];
         }
-    };
+    }
 }
 
-function OpForNext(index, index_step, start_address) {
+/* Filled up front like the frames (see new_frame): a large new Array(n)
+ * would be a slow dictionary. */
+function new_operands(count) {
+    var operands = [];
+    for (var i = 0; i < count * MAX_OPERANDS; i++) {
+        operands.push(null);
+    }
+    return operands;
+}
+
+/* Program in the packed format of lang/bytecode.py, decoded into the same
+ * arrays as Program. */
+function Bytecode(data, constants) {
     var that = this;
-    that.run = function (state) {
-        state.locals[index] = state.locals[index] + state.locals[index_step];
-        state.ip = start_address;
-        return VM_JUMP;
-    };
+    var words = new Base64().decode_words(data);
+
+    var count = 0;
+    for (var i = 0; i < words.length; i += Math.max(OPCODE_ARITY[words[i] & 0xff], 1)) {
+        count++;
+    }
+
+    that.opcodes = new Uint8Array(count);
+    that.operands = new_operands(count);
+    for (var i = 0, ip = 0; ip < count; ip++) {
+        var opcode = words[i] & 0xff;
+        var arity = OPCODE_ARITY[opcode];
+        that.opcodes[ip] = opcode;
+        if (arity > 0) {
+            that.operands[ip * MAX_OPERANDS] = constants[words[i] >>> 8];
+        }
+        for (var j = 1; j < arity; j++) {
+            that.operands[ip * MAX_OPERANDS + j] = constants[words[i + j]];
+        }
+        i += Math.max(arity, 1);
+    }
 }
 
+/* Primitives (runtime/builtins.js) take their arguments as parameters,
+ * f(state, x, y, ...), so that calling one allocates nothing; those with
+ * optional arguments get undefined for the ones left out. Each call site
+ * goes through the entry point of the primitive for its number of
+ * arguments, resolved once, when the program is loaded. */
 function fix_type(type, f) {
-    return function (state, args) {
-        if (!type.match(args)) {
-            var msg = '';
-            msg += 'Type mismatch.';
-            msg += ' Primitive ' + state.context.current_primitive;
-            msg += ' expected: ' + '(' + type.description() + ') ';
-            msg += ' but got: ' + pprint_args(args) + '.';
-            throw new Exception(msg);
+    f.type = type;
+    return f;
+}
+
+function type_mismatch(name, type, args) {
+    var msg = '';
+    msg += 'Type mismatch.';
+    msg += ' Primitive ' + name;
+    msg += ' expected: ' + '(' + type.description() + ') ';
+    msg += ' but got: ' + pprint_args(args) + '.';
+    throw new Exception(msg);
+}
+
+/* Entry points checking that the arguments have the given types, by
+ * number of arguments. */
+var CHECKED_ENTRY_POINTS = [
+    function (name, type, types, f) {
+        return f;
+    },
+    function (name, type, types, f) {
+        return function (state, a) {
+            if (!types[0].match(a)) {
+                type_mismatch(name, type, [a]);
+            }
+            return f(state, a);
+        };
+    },
+    function (name, type, types, f) {
+        return function (state, a, b) {
+            if (!types[0].match(a) || !types[1].match(b)) {
+                type_mismatch(name, type, [a, b]);
+            }
+            return f(state, a, b);
+        };
+    },
+    function (name, type, types, f) {
+        return function (state, a, b, c) {
+            if (!types[0].match(a) || !types[1].match(b) || !types[2].match(c)) {
+                type_mismatch(name, type, [a, b, c]);
+            }
+            return f(state, a, b, c);
+        };
+    },
+    function (name, type, types, f) {
+        return function (state, a, b, c, d) {
+            if (!types[0].match(a) || !types[1].match(b) || !types[2].match(c)
+                || !types[3].match(d)) {
+                type_mismatch(name, type, [a, b, c, d]);
+            }
+            return f(state, a, b, c, d);
+        };
+    },
+    function (name, type, types, f) {
+        return function (state, a, b, c, d, e) {
+            if (!types[0].match(a) || !types[1].match(b) || !types[2].match(c)
+                || !types[3].match(d) || !types[4].match(e)) {
+                type_mismatch(name, type, [a, b, c, d, e]);
+            }
+            return f(state, a, b, c, d, e);
+        };
+    },
+    function (name, type, types, f) {
+        return function (state, a, b, c, d, e, g) {
+            if (!types[0].match(a) || !types[1].match(b) || !types[2].match(c)
+                || !types[3].match(d) || !types[4].match(e) || !types[5].match(g)) {
+                type_mismatch(name, type, [a, b, c, d, e, g]);
+            }
+            return f(state, a, b, c, d, e, g);
+        };
+    },
+    function (name, type, types, f) {
+        return function (state, a, b, c, d, e, g, h) {
+            if (!types[0].match(a) || !types[1].match(b) || !types[2].match(c)
+                || !types[3].match(d) || !types[4].match(e) || !types[5].match(g)
+                || !types[6].match(h)) {
+                type_mismatch(name, type, [a, b, c, d, e, g, h]);
+            }
+            return f(state, a, b, c, d, e, g, h);
+        };
+    }
+];
+
+/* The compiler calls the primitives whose arguments it proved to have
+ * the right types (see lang/inference.py) by their name followed by
+ * UNCHECKED_SUFFIX, which skips the checks. */
+var UNCHECKED_SUFFIX = '!';
+
+function make_entry_point(primitives, name, nargs) {
+    var checked = true;
+    var f = primitives[name];
+    if (f === undefined && name.charAt(name.length - 1) == UNCHECKED_SUFFIX) {
+        checked = false;
+        f = primitives[name.substring(0, name.length - 1)];
+    }
+    if (f === undefined) {
+        return function (state) {
+            throw new Exception('Unknown primitive: ' + name);
+        };
+    }
+    var types = f.type.domain(nargs);
+    if (types === null) {
+        return function (state) {
+            type_mismatch(name, f.type, Array.prototype.slice.call(arguments, 1));
+        };
+    }
+    if (!checked) {
+        return f;
+    }
+    if (nargs >= CHECKED_ENTRY_POINTS.length) {
+        return function (state) {
+            var args = Array.prototype.slice.call(arguments, 1);
+            if (!f.type.match(args)) {
+                type_mismatch(name, f.type, args);
+            }
+            return f.apply(null, arguments);
+        };
+    }
+    return CHECKED_ENTRY_POINTS[nargs](name, f.type, types, f);
+}
+
+/* Entry point of the primitive called name (with UNCHECKED_SUFFIX, if
+ * unchecked) for calls with nargs arguments. */
+function primitive_entry_point(state, name, nargs) {
+    var key = name + '/' + nargs;
+    if (!(key in state.entry_points)) {
+        state.entry_points[key] = make_entry_point(state.primitives, name, nargs);
+    }
+    return state.entry_points[key];
+}
+
+/* Replaces the names of the primitives in the operands of the program
+ * by their entry points. */
+function link_primitives(state, opcodes, operands) {
+    for (var ip = 0; ip < opcodes.length; ip++) {
+        var k = ip * MAX_OPERANDS;
+        switch (opcodes[ip]) {
+        case OP_CALL_PRIMITIVE_STATEMENT:
+        case OP_CALL_PRIMITIVE_FUNCTION:
+            operands[k] = primitive_entry_point(state, operands[k], operands[k + 1]);
+            break;
+        case OP_CALL_PRIMITIVE_REF_CONSTANT:
+        case OP_CALL_PRIMITIVE_REF_REF:
+        case OP_JUMP_IF_FALSE_REF_CONSTANT:
+            operands[k + 2] = primitive_entry_point(state, operands[k + 2], 2);
+            break;
         }
-        return f(state, args);
-    };
+    }
 }
 
 function VirtualMachineState(
                 parent_document,
                 parent_screen_container,
                 parent_errmsg_container,
-                shared_names,
+                variable_names,
+                shared_variables,
                 available_screens,
                 code,
-                entry_point
+                entry_point,
+                blocks
         ) {
 
     var that = this;
@@ -356,21 +707,42 @@ function VirtualMachineState(
     that.input = new Input(parent_document);
 
     that.error_handler = new ErrorHandler(parent_document, parent_errmsg_container);
-    that.code = code;
+    /* Not instanceof, so that bundles of programs written as opcodes
+     * can leave Bytecode out (see lang/bundle.py). */
+    var program = code.opcodes !== undefined ? code : new Program(code);
+    that.opcodes = program.opcodes;
+    that.operands = program.operands;
     that.ip = entry_point;
 
     that.primitives = global_primitives();
+    that.entry_points = {};
+    link_primitives(that, that.opcodes, that.operands);
+
+    /* Compiled basic blocks (see lang/aot.py), if any: blocks(state)[ip]
+     * is the function that runs the code from ip on. */
+    that.blocks = blocks ? blocks(that) : null;
+    that.budget = 0;
     that.rng = new RandomNumberGenerator();
 
-    that.shared_names = shared_names;
+    /* Names of the variables by slot, for error messages. */
+    that.variable_names = variable_names;
+    /* Whether each variable is SHARED. */
+    that.shared_slots = [];
+    for (var i = 0; i < variable_names.length; i++) {
+        that.shared_slots.push(false);
+    }
+    for (var i = 0; i < shared_variables.length; i++) {
+        that.shared_slots[shared_variables[i]] = true;
+    }
 
     that.run_delay = 10;      /* milliseconds */
 
     that.reset = function () {
         that.stack = [];
-        that.shared = {};
-        that.locals = {};
+        that.shared = new_frame(variable_names.length);
+        that.locals = new_frame(variable_names.length);
         that.environment = [];
+        that.free_frames = [];
 
         that.timer_on = false;
         that.timer_interval = 0; /* milliseconds */
@@ -384,14 +756,12 @@ function VirtualMachineState(
     that.reset();
     that.input_read_string_data = '';
 
-    /* Context for error reporting */
-    that.context = {};
-    that.context.current_primitive = ''; 
-
-    function string_dict(dict) {
+    function string_slots(slots) {
         var s = [];
-        for (var k in dict) {
-            s.push(' || ' + k + ': ' + String(dict[k]) + '\n');
+        for (var i = 0; i < slots.length; i++) {
+            if (slots[i] !== undefined) {
+                s.push(' || ' + variable_names[i] + ': ' + String(slots[i]) + '\n');
+            }
         }
         return '{\n' + s.join('') + '}';
     }
@@ -406,11 +776,11 @@ function VirtualMachineState(
         msg += 'Timer routine: ' + that.timer_routine + '\n';
         msg += 'Timer last: ' + that.timer_last + '\n';
         msg += 'Timer gosub: ' + that.timer_gosub + '\n';
-        msg += 'Globals: ' + string_dict(that.shared) + '\n';
-        msg += 'Locals: ' + string_dict(that.locals) + '\n';
+        msg += 'Globals: ' + string_slots(that.shared) + '\n';
+        msg += 'Locals: ' + string_slots(that.locals) + '\n';
         msg += 'Environment: [' + '\n';
         for (var i = that.environment.length; i-- > 0;) {
-            msg += string_dict(that.environment[i]);
+            msg += string_slots(that.environment[i]);
         }
         msg += ']';
         return msg;
@@ -420,15 +790,15 @@ function VirtualMachineState(
 function VirtualMachine(state) {
     var that = this;
 
-    that.step = function () {
-        if (state.ip >= state.code.length) {
-            throw new Exception('Program ended without SYSTEM.');
+    that.input_read_string = function () {
+        try {
+            return that._input_read_key();
+        } finally {
+            state.screen.present();
         }
-        var op = state.code[state.ip];
-        return op.run(state);
     };
 
-    that.input_read_string = function () {
+    that._input_read_key = function () {
         var key = state.input.inkey();
         state.screen.cursor_blink();
         if (key == '') {
@@ -469,42 +839,259 @@ function VirtualMachine(state) {
         }
     };
 
-    that.run = function () {
+    /* Runs up to SLICE_LENGTH opcodes. Returns the result that stopped
+     * them (VM_SLEEP, VM_INPUT or VM_EXIT) or VM_OK if all of them ran.
+     *
+     * Where a compiled block (see lang/aot.py) starts, it runs instead of
+     * the opcodes, but only if all of it fits in the budget of the slice,
+     * so that a slice executes the same opcodes either way. */
+    that.run_chunk = function () {
+        var opcodes = state.opcodes;
+        var operands = state.operands;
+        var blocks = state.blocks;
+        var ip = state.ip;
+        var budget = SLICE_LENGTH;
+        var in_block = false;
+        var result, k, x, y, z;
         try {
-            for (var i = 0; i < 1024; i++) {
-                var result = that.step();
-                if (result == VM_OK || result == VM_IO) {
-                    state.ip++;
-                } else if (result == VM_JUMP) {
-                    /* Do not increase the IP. */
-                } else if (result == VM_SLEEP) {
-                    state.ip++;
-                    state.input.clear_buffer();
-                    return setTimeout(that.sleep, state.run_delay);
-                } else if (result == VM_INPUT) {
-                    state.ip++;
-                    state.input.clear_buffer();
-                    that.input_read_string_data = '';
-                    return setTimeout(that.input_read_string, state.run_delay);
-                } else if (result == VM_EXIT) {
-                    /* End, do not setTimeout again. */
-                    return;
+            while (budget > 0) {
+                if (blocks !== null && blocks[ip] !== undefined) {
+                    state.ip = ip;
+                    state.budget = budget;
+                    in_block = true;
+                    result = blocks[ip](state);
+                    in_block = false;
+                    if (state.budget != budget) {
+                        ip = state.ip;
+                        budget = state.budget;
+                        if (result == VM_SLEEP || result == VM_INPUT) {
+                            ip++;
+                            return result;
+                        } else if (result == VM_EXIT) {
+                            return result;
+                        }
+                        continue;
+                    }
+                }
+                if (ip >= opcodes.length) {
+                    throw new Exception('Program ended without SYSTEM.');
+                }
+                budget--;
+                k = ip * MAX_OPERANDS;
+                /* Literal cases, which the engine can turn into a jump
+                 * table. */
+                switch (opcodes[ip]) {
+                case 0: /* OP_PUSH_CONSTANT */
+                    state.stack.push(operands[k]);
+                    break;
+                case 1: /* OP_PUSH_RETVAL */
+                    x = state.stack.pop();
+                    state.stack.push(state.locals[operands[k]]);
+                    state.stack.push(x);
+                    break;
+                case 2: /* OP_SET_ARRAY_REF */
+                    x = state.stack.pop();
+                    if (operands[k + 1] == 1) {
+                        set_array_ref(state, operands[k], state.stack.pop(), x);
+                    } else {
+                        set_array_ref_n(state, operands[k], operands[k + 1], x);
+                    }
+                    break;
+                case 3: /* OP_SET_REF */
+                    set_ref(state, operands[k], state.stack.pop());
+                    break;
+                case 4: /* OP_GET_REF */
+                    state.stack.push(get_ref(state, operands[k]));
+                    break;
+                case 5: /* OP_MID_ASSIGN */
+                    x = state.stack.pop();
+                    y = operands[k + 1] ? state.stack.pop() : null;
+                    mid_assign(state, operands[k], state.stack.pop() - 1, y, x);
+                    break;
+                case 6: /* OP_MID_ARRAY_ASSIGN */
+                    x = state.stack.pop();
+                    y = operands[k + 1] ? state.stack.pop() : null;
+                    z = state.stack.pop() - 1;
+                    if (operands[k + 2] == 1) {
+                        mid_array_assign(state, operands[k], state.stack.pop(), z, y, x);
+                    } else {
+                        mid_array_assign_n(state, operands[k], operands[k + 2], z, y, x);
+                    }
+                    break;
+                case 7: /* OP_GET_ARRAY_REF */
+                    if (operands[k + 1] == 1) {
+                        x = get_array_ref(state, operands[k], state.stack.pop());
+                    } else {
+                        x = get_array_ref_n(state, operands[k], operands[k + 1]);
+                    }
+                    state.stack.push(x);
+                    break;
+                case 8: /* OP_WAIT_IO */
+                    break;
+                case 9: /* OP_CALL_PRIMITIVE_STATEMENT */
+                    result = call_primitive(state, operands[k], operands[k + 1]);
+                    if (result == VM_SLEEP || result == VM_INPUT) {
+                        ip++;
+                        return result;
+                    } else if (result == VM_EXIT) {
+                        return result;
+                    }
+                    break;
+                case 10: /* OP_CALL_PRIMITIVE_FUNCTION */
+                    state.stack.push(call_primitive(state, operands[k], operands[k + 1]));
+                    break;
+                case 11: /* OP_SET_REF_CONSTANT */
+                    set_ref(state, operands[k], operands[k + 1]);
+                    break;
+                case 12: /* OP_GET_ARRAY_REF_CONSTANT */
+                    state.stack.push(get_array_ref(state, operands[k], operands[k + 1]));
+                    break;
+                case 13: /* OP_CALL_PRIMITIVE_REF_CONSTANT */
+                    x = get_ref(state, operands[k]);
+                    state.stack.push(operands[k + 2](state, x, operands[k + 1]));
+                    break;
+                case 14: /* OP_CALL_PRIMITIVE_REF_REF */
+                    x = get_ref(state, operands[k]);
+                    y = get_ref(state, operands[k + 1]);
+                    state.stack.push(operands[k + 2](state, x, y));
+                    break;
+                case 15: /* OP_JUMP_IF_FALSE_REF_CONSTANT */
+                    x = get_ref(state, operands[k]);
+                    if (operands[k + 2](state, x, operands[k + 1]) == 0) {
+                        ip = operands[k + 3];
+                        continue;
+                    }
+                    break;
+                case 16: /* OP_JUMP */
+                    ip = operands[k];
+                    continue;
+                case 17: /* OP_JUMP_IF_FALSE */
+                    if (state.stack.pop() == 0) {
+                        ip = operands[k];
+                        continue;
+                    }
+                    break;
+                case 18: /* OP_GOSUB */
+                    state.stack.push(ip + 1);
+                    ip = operands[k];
+                    continue;
+                case 19: /* OP_RETURN */
+                    if (state.stack.length == 0) {
+                        throw new Exception('RETURN without GOSUB');
+                    }
+                    ip = state.stack.pop();
+                    continue;
+                case 20: /* OP_ENTER */
+                    enter(state, operands[k]);
+                    break;
+                case 21: /* OP_LEAVE */
+                    leave(state);
+                    break;
+                case 22: /* OP_FOR_START */
+                    state.locals[operands[k + 2]] = state.stack.pop();
+                    state.locals[operands[k + 1]] = state.stack.pop();
+                    state.locals[operands[k]] = state.stack.pop(); /* lower */
+                    break;
+                case 23: /* OP_FOR_CHECK */
+                    x = state.locals[operands[k]];
+                    y = state.locals[operands[k + 1]];
+                    if (state.locals[operands[k + 2]] > 0 ? x > y : x < y) {
+                        ip = operands[k + 3];
+                        continue;
+                    }
+                    break;
+                case 24: /* OP_FOR_NEXT */
+                    state.locals[operands[k]] = state.locals[operands[k]] + state.locals[operands[k + 1]];
+                    ip = operands[k + 2];
+                    continue;
+                default:
+                    throw new Exception('Unknown opcode: ' + opcodes[ip]);
                 }
+                ip++;
             }
+            return VM_OK;
+        } finally {
+            /* Also for errors, which report the IP of the opcode that
+             * raised them (compiled blocks set it themselves). */
+            if (!in_block) {
+                state.ip = ip;
+            }
+            stats.ops += SLICE_LENGTH - budget;
+        }
+    };
 
-            /* Timer */
-            if (state.timer_on && state.timer_interval > 0 && state.timer_routine > -1) {
-                var now = new Date().getTime();
-                if (now - state.timer_last > state.timer_interval) {
-                    if (state.timer_gosub) {
-                        state.stack.push(state.ip);
+    /* Continuations of the program after a time slice: the next animation
+     * frame if the slice drew something, so that the browser shows it,
+     * and right away otherwise (setTimeout would wait at least 4 ms). */
+    var pending = null;
+    var channel = null;
+    if (typeof MessageChannel !== 'undefined') {
+        channel = new MessageChannel();
+        channel.port1.onmessage = function () {
+            var f = pending;
+            pending = null;
+            f();
+        };
+    }
+
+    that.continue_later = function (f) {
+        if (state.screen.dirty() && typeof requestAnimationFrame !== 'undefined') {
+            return requestAnimationFrame(f);
+        } else if (channel !== null) {
+            pending = f;
+            return channel.port2.postMessage(null);
+        } else {
+            return setTimeout(f, 0);
+        }
+    };
+
+    var stats = {ops: 0, slices: 0, time: 0, max_slice_time: 0};
+
+    /* Opcodes per second and length of the time slices so far. */
+    that.stats = function () {
+        return {
+            ops: stats.ops,
+            slices: stats.slices,
+            ops_per_second: stats.time > 0 ? 1000 * stats.ops / stats.time : 0,
+            mean_slice_ops: stats.slices > 0 ? stats.ops / stats.slices : 0,
+            mean_slice_time: stats.slices > 0 ? stats.time / stats.slices : 0,
+            max_slice_time: stats.max_slice_time
+        };
+    };
+
+    /* Runs the program for up to FRAME_BUDGET milliseconds. */
+    that.run = function () {
+        var start = clock();
+        try {
+            var result;
+            do {
+                result = that.run_chunk();
+
+                /* Timer */
+                if (result == VM_OK && state.timer_on && state.timer_interval > 0 && state.timer_routine > -1) {
+                    var now = new Date().getTime();
+                    if (now - state.timer_last > state.timer_interval) {
+                        if (state.timer_gosub) {
+                            state.stack.push(state.ip);
+                        }
+                        state.ip = state.timer_routine;
+                        state.timer_last = now;
                     }
-                    state.ip = state.timer_routine;
-                    state.timer_last = now;
                 }
-            }
+            } while (result == VM_OK && clock() - start < FRAME_BUDGET);
 
-            return setTimeout(that.run, that.run_delay);
+            if (result == VM_SLEEP) {
+                state.input.clear_buffer();
+                return setTimeout(that.sleep, state.run_delay);
+            } else if (result == VM_INPUT) {
+                state.input.clear_buffer();
+                that.input_read_string_data = '';
+                return setTimeout(that.input_read_string, state.run_delay);
+            } else if (result == VM_EXIT) {
+                /* End, do not continue. */
+                return;
+            }
+            return that.continue_later(that.run);
         } catch (exception) {
             if (exception instanceof Exception) {
                 state.error_handler.handle(
@@ -516,6 +1103,12 @@ function VirtualMachine(state) {
             } else {
                 throw exception;
             }
+        } finally {
+            var time = clock() - start;
+            stats.slices++;
+            stats.time += time;
+            stats.max_slice_time = Math.max(stats.max_slice_time, time);
+            state.screen.present();
         }
     };
 }
@@ -1,4 +1,5 @@
-import sys
+import base64
+import numpy
 import PIL.Image
 
 screen_types = [
@@ -20,54 +21,29 @@ class Screen(object):
         self.w = self.wc * self.wp
         self.h = self.hc * self.hp
 
-def character(screen, screen_img, asc):
-  out = PIL.Image.new('RGB', (screen.wp, screen.hp))
-  jc0 = asc // screen.wc
-  ic0 = asc % screen.wc
-  i0 = ic0 * screen.wp
-  j0 = jc0 * screen.hp
-  for i in range(screen.wp):
-    for j in range(screen.hp):
-      p = screen_img.getpixel((i0 + i, j0 + j))
-      out.putpixel((i, j), (0, 0, 0) if p in [0] else (255, 255, 255))
-  return out
+def glyphs(screen, screen_img):
+  # The screenshot has the 256 characters in order, screen.wc per row:
+  # cut it into a (256, hp, wp) array of booleans, True where the glyph
+  # is set (any color but 0).
+  rows = (256 + screen.wc - 1) // screen.wc
+  pixels = numpy.asarray(screen_img) != 0
+  pixels = pixels[:rows * screen.hp, :screen.wc * screen.wp]
+  cells = pixels.reshape(rows, screen.hp, screen.wc, screen.wp).swapaxes(1, 2)
+  return cells.reshape(rows * screen.wc, screen.hp, screen.wp)[:256]
 
-def coordinates(char_img):
-  w, h = char_img.size
-  filas = []
-  for j in range(h):
-    subseq = []
-    anterior = True
-    for i in range(w):
-      p = char_img.getpixel((i, j))
-      actual = (p == (255, 255, 255))
-      if actual:
-        subseq.append(i)
-      else:
-        filas.append((j, subseq))
-        subseq = []
-      anterior = actual
-    filas.append((j, subseq))
-  coords = []
-  for j, subseq in filas:
-    if len(subseq) == 0: continue
-    coords.append('[%u,%u,%u]' % (subseq[0], j, subseq[-1] - subseq[0] + 1))
-  return '[%s]' % (','.join(coords),)
+def packed(glyphs):
+  # One bit per pixel, most significant bit leftmost, each row of each
+  # glyph padded to whole bytes (see make_glyph_atlas in runtime/screen.js).
+  return base64.b64encode(numpy.packbits(glyphs, axis=2).tobytes()).decode('ascii')
 
 for screen_type in screen_types:
     screen = Screen(*screen_type)
 
     img = PIL.Image.open('screen%u.png' % (screen.num,))
-     
+
     f = open('../../runtime/fonts/screen%u.js' % (screen.num,), 'w')
-    f.write('var SCREEN%u_DATA = [\n' % (screen.num,));
-    for asc in range(256):
-        char_img = character(screen, img, asc)
-        f.write(coordinates(char_img))
-        if asc != 255:
-            f.write(',')
-        f.write('\n')
-    f.write('];\n');
+    f.write('/* Font of SCREEN %u (screen_data_gen/fonts/generate.py): 256 glyphs\n' % (screen.num,))
+    f.write(' * of %ux%u pixels, packed one bit per pixel. */\n' % (screen.wp, screen.hp))
+    f.write('var SCREEN%u_DATA = "%s";\n' % (screen.num, packed(glyphs(screen, img))))
     f.close()
-    print 'screen ', screen.num, ' ok!'
-
+    print('screen %u ok!' % (screen.num,))